@@ -189,7 +189,30 @@ const sidebars: SidebarsConfig = {
           items: [
             {type: 'doc', id: 'sdk/operations/index', label: "Overview"},
             {type: 'doc', id: 'sdk/operations/local_config', label: "Local Config"},
+            {type: 'doc', id: 'sdk/operations/config_parser', label: "Config Parser"},
+            {type: 'doc', id: 'sdk/operations/config_diff', label: "Config Diff"},
+            {type: 'doc', id: 'sdk/operations/config_backup', label: "Config Backup"},
             {type: 'doc', id: 'sdk/operations/device_operations', label: "Device Operations"},
+            {type: 'doc', id: 'sdk/operations/route_index', label: "Route Index"},
+            {type: 'doc', id: 'sdk/operations/jobs', label: "Job Watcher"},
+            {type: 'doc', id: 'sdk/operations/job_history', label: "Job History"},
+            {type: 'doc', id: 'sdk/operations/commit_scheduler', label: "Commit Scheduler"},
+          ],
+        },
+        {
+          type: 'category',
+          label: "Sync",
+          items: [
+            {type: 'doc', id: 'sdk/sync/index', label: "Overview"},
+            {type: 'doc', id: 'sdk/sync/watcher', label: "Watcher"},
+            {type: 'doc', id: 'sdk/sync/bulk', label: "Bulk Operations"},
+            {type: 'doc', id: 'sdk/sync/plan', label: "Plan and Apply"},
+            {type: 'doc', id: 'sdk/sync/reorder', label: "Rule Reordering"},
+            {type: 'doc', id: 'sdk/sync/transaction', label: "Transactions"},
+            {type: 'doc', id: 'sdk/sync/buffer', label: "Write Buffer"},
+            {type: 'doc', id: 'sdk/sync/validate', label: "Bulk Validation"},
+            {type: 'doc', id: 'sdk/sync/preflight', label: "Pre-flight Checks"},
+            {type: 'doc', id: 'sdk/sync/collision', label: "Name Collisions"},
           ],
         },
         {
@@ -7,11 +7,15 @@ HTTP operations for interacting with the Palo Alto Networks Strata Cloud Manager
 # scm/client.py
 
 # Standard library imports
+from collections import Counter
+import copy
 import importlib
+import json
 import logging
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 # External libraries
 # trunk-ignore(mypy/note)
@@ -28,6 +32,10 @@ from scm.models.operations import (
     JobListResponse,
     JobStatusResponse,
 )
+from scm.utils.backoff import Backoff
+from scm.utils.cache import ConditionalCache, ConditionalEntry, TTLCache
+from scm.utils.serialization import JsonBody, dumps, loads
+from scm.utils.singleflight import SingleFlight
 
 # External dependency for HTTP
 
@@ -54,6 +62,18 @@ class Scm:
             Token refresh is the caller's responsibility when using this mode.
         verify_ssl: Whether to verify TLS certificates for all requests (default: True). Set to False to bypass TLS verification (insecure!).
         region: Default region for APIs requiring X-PANW-Region header (default: "americas")
+        fetch_miss_ttl: Seconds to remember name lookups that found nothing (default: 0, disabled).
+            While remembered, an identical lookup is answered locally instead of hitting the API.
+            A create or update of the same name on the same endpoint forgets the miss.
+        coalesce_requests: Share one HTTP exchange between concurrent identical GET requests
+            (same URL, params, and headers) made from different threads (default: True).
+        conditional_requests: Remember ETag/Last-Modified validators of GET responses and
+            revalidate with If-None-Match/If-Modified-Since (default: False). A 304 response
+            returns the previously decoded body without downloading or parsing it again.
+            Bodies are shared with the cache while this is enabled, so treat them as read-only.
+        fast_json: Encode JSON request bodies once, straight to bytes, and decode responses
+            with orjson when it is installed (default: False). Services that support it
+            then send models with model_dump_json() instead of building a dictionary first.
 
     """
 
@@ -69,6 +89,10 @@ class Scm:
         access_token: Optional[str] = None,
         verify_ssl: bool = True,
         region: str = "americas",
+        fetch_miss_ttl: float = 0,
+        coalesce_requests: bool = True,
+        conditional_requests: bool = False,
+        fast_json: bool = False,
     ):
         """Initialize the ScmClient with the provided client_id, client_secret, tsg_id, API URLs, log level, access token, and TLS verification flag."""
         self.api_base_url = api_base_url
@@ -76,6 +100,18 @@ class Scm:
         self.default_region = region
         self.oauth_client = None
 
+        # Request-layer caches and counters shared by every service on this client
+        self.fetch_miss_cache = TTLCache(ttl=fetch_miss_ttl)
+        self.coalesce_requests = coalesce_requests
+        self._in_flight = SingleFlight()
+        self.conditional_requests = conditional_requests
+        self.conditional_cache = ConditionalCache()
+        self.fast_json = fast_json
+        self._job_watcher = None
+        self._job_watcher_lock = threading.Lock()
+        self.request_stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+
         # Map string log level to numeric level
         numeric_level = getattr(logging, log_level.upper(), None)
         if not isinstance(numeric_level, int):
@@ -170,9 +206,72 @@ class Scm:
 
         """
         raw_response = kwargs.pop("raw_response", False)
+        is_get = method.upper() == "GET"
+        is_write = method.upper() in ("POST", "PUT", "PATCH")
+
+        miss_key = None
+        if is_get and not raw_response and self.fetch_miss_cache.enabled:
+            miss_key = self._fetch_miss_key(endpoint, kwargs.get("params"))
+            if miss_key is not None:
+                cached_miss = self.fetch_miss_cache.get(miss_key)
+                if cached_miss is not None:
+                    self._count("fetch_miss_hits")
+                    self.logger.debug(f"Answering {method} {endpoint} from the fetch miss cache")
+                    return self._replay_fetch_miss(cached_miss)
+
+        try:
+            if is_get and not raw_response and self.coalesce_requests:
+                result = self._send_coalesced(method, endpoint, **kwargs)
+            else:
+                result = self._send(method, endpoint, raw_response, **kwargs)
+        except APIError as e:
+            if miss_key is not None and e.http_status_code == 404:
+                self.fetch_miss_cache.set(
+                    miss_key,
+                    (
+                        "error",
+                        (type(e), e.message, e.error_code, e.http_status_code, e.details),
+                    ),
+                )
+            raise
+        finally:
+            if is_write and self.fetch_miss_cache.enabled:
+                self._forget_fetch_misses(endpoint, kwargs.get("json"))
+
+        if miss_key is not None and isinstance(result, dict) and result.get("data") == []:
+            self.fetch_miss_cache.set(miss_key, ("body", copy.deepcopy(result)))
+
+        return result
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        raw_response: bool,
+        **kwargs,
+    ):
+        """Perform the HTTP exchange for request() and map HTTP errors to SDK exceptions."""
         url = f"{self.api_base_url}{endpoint}"
         self.logger.debug(f"Making {method} request to {url} with params {kwargs}")
 
+        # Replay stored validators so the server can answer 304 Not Modified
+        conditional_key = None
+        entry = None
+        if not raw_response and self.conditional_requests and method.upper() == "GET":
+            conditional_key = self._conditional_key(endpoint, kwargs.get("params"))
+            entry = self.conditional_cache.get(conditional_key)
+            if entry is not None:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.headers()}
+
+        # Send JSON bodies as bytes encoded once, rather than letting requests encode them
+        payload = kwargs.get("json")
+        if isinstance(payload, JsonBody) or (self.fast_json and payload is not None):
+            kwargs["data"] = dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": "application/json",
+            }
+
         # Always pass verify unless explicitly set by caller
         if "verify" not in kwargs:
             kwargs["verify"] = self.verify_ssl
@@ -182,15 +281,25 @@ class Scm:
                 url,
                 **kwargs,
             )
+
+            if entry is not None and response.status_code == 304:
+                self._count("not_modified")
+                self.logger.debug(f"{url} not modified, serving the cached body")
+                return entry.body
+
             response.raise_for_status()
 
             if raw_response:
                 return response
 
             if response.content and response.content.strip():
-                return response.json()
+                body = loads(response.content) if self.fast_json else response.json()
             else:
-                return None  # Return None or an empty dict
+                body = None  # Return None or an empty dict
+
+            if conditional_key is not None:
+                self._remember_validators(conditional_key, response, body)
+            return body
 
         except HTTPError as e:
             # Handle HTTP errors
@@ -202,7 +311,121 @@ class Scm:
                     response.status_code,
                 )
             else:
-                raise APIError(f"HTTP error occurred: {e}") from e
+                raise APIError(
+                    f"HTTP error occurred: {e}",
+                    http_status_code=response.status_code if response is not None else None,
+                ) from e
+
+    def _send_coalesced(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs,
+    ):
+        """Perform a GET through _send, sharing it with identical GETs already in flight.
+
+        Every caller of a shared exchange receives its own deep copy of the decoded JSON.
+        """
+        key = (
+            method.upper(),
+            endpoint,
+            json.dumps(kwargs.get("params"), sort_keys=True, default=str),
+            json.dumps(kwargs.get("headers"), sort_keys=True, default=str),
+            json.dumps(
+                {k: v for k, v in kwargs.items() if k not in ("params", "headers")},
+                sort_keys=True,
+                default=str,
+            ),
+        )
+        led = []
+
+        def send():
+            led.append(True)
+            return self._send(method, endpoint, False, **kwargs)
+
+        result, shared = self._in_flight.do(key, send)
+        if not shared:
+            return result
+        if not led:
+            self._count("coalesced")
+        return copy.deepcopy(result)
+
+    def conditional_entry(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[ConditionalEntry]:
+        """Return the validators and body remembered for a GET, if conditional_requests stored any.
+
+        The entry's body is the very object the last such GET returned, which lets
+        callers recognise a response served from a 304 Not Modified.
+        """
+        return self.conditional_cache.get(self._conditional_key(endpoint, params))
+
+    @staticmethod
+    def _conditional_key(endpoint: str, params: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        """Build the conditional cache key of a GET."""
+        return endpoint, json.dumps(params, sort_keys=True, default=str)
+
+    def _remember_validators(self, key: Hashable, response: Any, body: Any) -> None:
+        """Store the ETag/Last-Modified validators of a GET response, if it sent any."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        if etag or last_modified:
+            self.conditional_cache.set(key, ConditionalEntry(etag, last_modified, body))
+        else:
+            self.conditional_cache.discard(key)
+
+    def _count(self, stat: str, amount: int = 1) -> None:
+        """Increment a request_stats counter."""
+        with self._stats_lock:
+            self.request_stats[stat] += amount
+
+    @staticmethod
+    def _fetch_miss_key(
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Optional[Tuple[str, Tuple[Tuple[str, str], ...]]]:
+        """Build the fetch miss cache key for a GET, or None if it is not a name lookup."""
+        if not params or not params.get("name"):
+            return None
+        return endpoint, tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+    @staticmethod
+    def _replay_fetch_miss(cached_miss: Tuple[str, Any]) -> Any:
+        """Reproduce the outcome of a remembered fetch miss."""
+        kind, value = cached_miss
+        if kind == "body":
+            return copy.deepcopy(value)
+        exception_cls, message, error_code, http_status_code, details = value
+        raise exception_cls(
+            message=message,
+            error_code=error_code,
+            http_status_code=http_status_code,
+            details=copy.deepcopy(details),
+        )
+
+    def _forget_fetch_misses(self, endpoint: str, payload: Any) -> None:
+        """Drop remembered misses that a write to endpoint may have made stale.
+
+        Writes to a collection (POST) or one of its members (PUT) forget the misses
+        recorded for that collection, restricted to the written name when known.
+        """
+        path = endpoint.split("?", 1)[0]
+        if isinstance(payload, JsonBody):
+            name = payload.name
+        else:
+            name = payload.get("name") if isinstance(payload, dict) else None
+
+        def is_stale(key: Hashable) -> bool:
+            cached_endpoint, params = key  # type: ignore[misc]
+            if path != cached_endpoint and not path.startswith(f"{cached_endpoint}/"):
+                return False
+            return name is None or ("name", str(name)) in params
+
+        self.fetch_miss_cache.discard_where(is_stale)
 
     def get(
         self,
@@ -311,8 +534,11 @@ class Scm:
     ) -> JobListResponse:
         """List jobs in SCM with pagination support and optional parent ID filtering.
 
+        With parent_id, pages of limit jobs are read from offset on until the
+        list ends, and every child of that job found on them is returned.
+
         Args:
-            limit: Maximum number of jobs to return (default: 100)
+            limit: Maximum number of jobs to return, or to read per page with parent_id (default: 100)
             offset: Number of jobs to skip (default: 0)
             parent_id: Filter jobs by parent job ID (default: None)
 
@@ -332,9 +558,19 @@ class Scm:
         # Convert to Pydantic model
         jobs_response = JobListResponse(**response)
 
-        # If parent_id filter is specified, filter the jobs
+        # If parent_id filter is specified, filter the jobs of every page
         if parent_id is not None:
             filtered_data = [job for job in jobs_response.data if job.parent_id == parent_id]
+            page = jobs_response
+            next_offset = offset + limit
+            while page.data and len(page.data) >= limit and next_offset < page.total:
+                response = self.get(
+                    "/config/operations/v1/jobs",
+                    params={"limit": limit, "offset": next_offset},
+                )
+                page = JobListResponse(**response)
+                filtered_data.extend(job for job in page.data if job.parent_id == parent_id)
+                next_offset += limit
             jobs_response.data = filtered_data
             jobs_response.total = len(filtered_data)
 
@@ -354,14 +590,15 @@ class Scm:
         return JobStatusResponse(**response)
 
     def wait_for_job(
-        self, job_id: str, timeout: int = 300, poll_interval: int = 10
+        self, job_id: str, timeout: int = 300, poll_interval: Optional[float] = None
     ) -> Optional[JobStatusResponse]:
         """Wait for a job to complete.
 
         Args:
             job_id: The ID of the job to check
             timeout: Maximum time to wait in seconds (default: 300)
-            poll_interval: Time between status checks in seconds (default: 10)
+            poll_interval: Time between status checks in seconds (default: None, adaptive:
+                0.5 seconds at first, backing off with jitter to 10 seconds)
 
         Returns:
             JobStatusResponse: The final job status response
@@ -370,21 +607,54 @@ class Scm:
             TimeoutError: If the job doesn't complete within the timeout period
 
         """
+        delays = Backoff().delays()
         start_time = time.time()
         while True:
             if time.time() - start_time > timeout:
                 raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
 
+            delay = next(delays) if poll_interval is None else poll_interval
             status = self.get_job_status(job_id)
             if not status.data:
-                time.sleep(poll_interval)
+                time.sleep(delay)
                 continue
 
             job_status = status.data[0]
             if job_status.status_str == "FIN":
                 return status
 
-            time.sleep(poll_interval)
+            time.sleep(delay)
+
+    @property
+    def job_watcher(self):
+        """The client's shared JobWatcher, created on first use.
+
+        It tracks many jobs from one background thread, reading their statuses in
+        bulk from list_jobs() pages with adaptive polling intervals; see
+        scm.operations.jobs.JobWatcher.
+        """
+        with self._job_watcher_lock:
+            if self._job_watcher is None:
+                from scm.operations.jobs import JobWatcher
+
+                self._job_watcher = JobWatcher(self)
+            return self._job_watcher
+
+    def wait_for_jobs(self, job_ids: List[str], timeout: float = 300) -> Dict[str, Any]:
+        """Wait for several jobs to finish, polling for all of them together.
+
+        Args:
+            job_ids: The IDs of the jobs to wait for
+            timeout: Maximum time to wait for each job in seconds (default: 300)
+
+        Returns:
+            Dict[str, JobListItem]: The final status of each job, by job ID
+
+        Raises:
+            JobTimeoutError: If a job doesn't finish within the timeout period
+
+        """
+        return self.job_watcher.wait(job_ids, timeout=timeout)
 
     def commit(
         self,
@@ -406,6 +676,71 @@ class Scm:
         Returns:
             CandidatePushResponseModel: Response containing job information
 
+        """
+        commit_response = self._push_candidate(folders, description, admin)
+
+        if sync and commit_response.success and commit_response.job_id:
+            try:
+                final_status = self.wait_for_job(commit_response.job_id, timeout=timeout)
+                if final_status:
+                    self.logger.info(
+                        f"Commit job {commit_response.job_id} completed: "
+                        f"{final_status.data[0].result_str}"
+                    )
+            except TimeoutError as e:
+                self.logger.error(f"Commit job timed out: {str(e)}")
+                raise
+
+        return commit_response
+
+    def commit_async(
+        self,
+        folders: List[str],
+        description: str,
+        admin: Optional[List[str]] = None,
+        timeout: float = 300,
+        on_progress: Optional[Callable[[Any], None]] = None,
+    ):
+        """Commit configuration changes and return at once with a future for the push.
+
+        The push job and the child jobs it spawns (found by parent_id once it
+        finishes) are tracked by the client's shared job watcher, so any number of
+        commits can be in flight without a thread blocked on each:
+
+            futures = [client.commit_async([folder], "nightly") for folder in folders]
+            for future in as_completed(futures):
+                print(future.job_id, future.result().ok)
+
+        Args:
+            folders: List of folder names to commit changes from
+            description: Description of the commit
+            admin: List of admin emails. Defaults to client_id if not provided
+            timeout: Maximum time to wait for the job and its child jobs in seconds
+            on_progress: Called with each JobListItem status seen for the job or a child job
+
+        Returns:
+            CommitFuture: Resolves to a CommitResult; also awaitable from asyncio
+
+        """
+        response = self._push_candidate(folders, description, admin)
+        return self.job_watcher.watch_commit(response, timeout=timeout, on_progress=on_progress)
+
+    def candidate_push_request(
+        self,
+        folders: List[str],
+        description: str,
+        admin: Optional[List[str]] = None,
+    ) -> CandidatePushRequestModel:
+        """Build and validate the candidate push request that commit() sends.
+
+        Args:
+            folders: List of folder names to commit changes from
+            description: Description of the commit
+            admin: List of admin emails. Defaults to client_id if not provided
+
+        Returns:
+            CandidatePushRequestModel: The validated push request
+
         """
         # If using bearer token mode and admin is None, we need to specify an admin
         if admin is None:
@@ -417,12 +752,21 @@ class Scm:
                     "When using bearer token authentication, 'admin' must be provided for commit operations"
                 )
 
-        commit_request = CandidatePushRequestModel(
+        return CandidatePushRequestModel(
             folders=folders,
             admin=admin,
             description=description,
         )
 
+    def _push_candidate(
+        self,
+        folders: List[str],
+        description: str,
+        admin: Optional[List[str]],
+    ) -> CandidatePushResponseModel:
+        """Send a candidate push request and return the response."""
+        commit_request = self.candidate_push_request(folders, description, admin)
+
         self.logger.debug(f"Commit request: {commit_request.model_dump()}")
 
         response = self.post(
@@ -430,21 +774,29 @@ class Scm:
             json=commit_request.model_dump(),
         )
 
-        commit_response = CandidatePushResponseModel(**response)
+        return CandidatePushResponseModel(**response)
 
-        if sync and commit_response.success and commit_response.job_id:
-            try:
-                final_status = self.wait_for_job(commit_response.job_id, timeout=timeout)
-                if final_status:
-                    self.logger.info(
-                        f"Commit job {commit_response.job_id} completed: "
-                        f"{final_status.data[0].result_str}"
-                    )
-            except TimeoutError as e:
-                self.logger.error(f"Commit job timed out: {str(e)}")
-                raise
+    def transaction(self, journal_path: Optional[str] = None, max_workers: int = 8):
+        """Start a batch transaction that rolls back its applied changes on failure.
 
-        return commit_response
+        Use it as a context manager; queued operations are committed when the block
+        exits cleanly:
+
+            with client.transaction(journal_path="changes.journal") as txn:
+                txn.create("address", {...})
+                txn.update("address_group", {...})
+
+        Args:
+            journal_path: Journal file location (default: a new file in the temp directory).
+            max_workers: Maximum concurrent requests (default: 8).
+
+        Returns:
+            Transaction: The transaction, see scm.sync.transaction.
+
+        """
+        from scm.sync.transaction import Transaction
+
+        return Transaction(self, journal_path=journal_path, max_workers=max_workers)
 
     def __getattr__(self, name: str) -> Any:
         """Dynamic attribute access to support unified client access pattern (api_client.service).
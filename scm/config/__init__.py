@@ -1,14 +1,21 @@
 """scm.config: Service classes by resource category."""
 # scm/config/__init__.py
 
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from scm.client import Scm
+from scm.exceptions import InvalidObjectError, NameNotUniqueError
 from scm.models.operations import (
     CandidatePushResponseModel,
     JobListResponse,
     JobStatusResponse,
 )
+from scm.utils.serialization import JsonBody
+
+logger = logging.getLogger(__name__)
 
 
 class BaseObject:
@@ -43,6 +50,10 @@ class BaseObject:
 
         self.api_client = api_client
 
+        # Name indexes used by upsert(), keyed by (container, value, rulebase)
+        self._name_indexes: Dict[Tuple[str, str, Optional[str]], Dict[str, Any]] = {}
+        self._name_index_lock = threading.Lock()
+
     # CRUD methods
     def create(
         self,
@@ -133,6 +144,194 @@ class BaseObject:
         )
         return response.get("data", [])
 
+    # Idempotent writes
+    def name_index(
+        self,
+        folder: Optional[str] = None,
+        snippet: Optional[str] = None,
+        device: Optional[str] = None,
+        rulebase: Optional[str] = None,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Return the objects of one container keyed by name, listing them only once.
+
+        The index is built with a single list() call the first time a container is
+        requested and kept up to date by upsert(). Pass refresh=True to rebuild it.
+
+        Args:
+            folder: Folder to index.
+            snippet: Snippet to index.
+            device: Device to index.
+            rulebase: Rulebase ("pre" or "post") for rule services.
+            refresh: Discard the cached index and list the container again.
+
+        Returns:
+            Dict[str, Any]: Response models keyed by object name.
+
+        Raises:
+            InvalidObjectError: If not exactly one container is provided.
+
+        """
+        container = {
+            k: v
+            for k, v in {"folder": folder, "snippet": snippet, "device": device}.items()
+            if v is not None
+        }
+        if len(container) != 1:
+            raise InvalidObjectError(
+                message="Exactly one of 'folder', 'snippet', or 'device' must be provided.",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Invalid container parameters"},
+            )
+        from scm.sync.plan import list_container
+
+        container_key, container_value = next(iter(container.items()))
+        key = (container_key, container_value, rulebase)
+
+        with self._name_index_lock:
+            if refresh or key not in self._name_indexes:
+                self._name_indexes[key] = {
+                    obj.name: obj for obj in list_container(self, container, rulebase)
+                }
+            return self._name_indexes[key]
+
+    def upsert(
+        self,
+        data: Dict[str, Any],
+        rulebase: Optional[str] = None,
+    ) -> Any:
+        """Create an object, or update it if an object with the same name exists.
+
+        Existence is resolved from the container's name index (see name_index()), so
+        no lookup request is made per object. An existing object whose fields already
+        match data is returned as is, without a request; otherwise only the create or
+        the update is sent. If the index is stale and the create hits a name
+        conflict, the object is fetched and updated instead.
+
+        Args:
+            data: The desired object, including its name and container.
+            rulebase: Rulebase ("pre" or "post") for rule services.
+
+        Returns:
+            The created, updated, or unchanged object's response model.
+
+        Raises:
+            InvalidObjectError: If data does not validate or names no single container.
+
+        """
+        from scm.sync.bulk import rulebase_kwargs, update_model
+        from scm.sync.plan import CONTAINER_FIELDS, changed_fields, desired_fields, update_payload
+
+        desired = desired_fields(self, data)
+        container = {k: data[k] for k in CONTAINER_FIELDS if data.get(k)}
+        index = self.name_index(**container, rulebase=rulebase)
+        name = desired["name"]
+
+        existing = index.get(name)
+        if existing is None:
+            try:
+                created = self.create(data, **rulebase_kwargs(self.create, rulebase))
+            except NameNotUniqueError:
+                existing = self.fetch(name, **container, **rulebase_kwargs(self.fetch, rulebase))
+            else:
+                index[name] = created
+                return created
+
+        changes = changed_fields(desired, existing)
+        if not changes:
+            logger.debug(f"Upsert of '{name}' skipped: already up to date")
+            return existing
+
+        model = update_model(self)(**update_payload(self, existing, changes))
+        updated = self.update(model, **rulebase_kwargs(self.update, rulebase))
+        index[name] = updated
+        return updated
+
+    def upsert_many(
+        self,
+        items: Iterable[Dict[str, Any]],
+        rulebase: Optional[str] = None,
+        max_workers: int = 1,
+    ) -> List[Any]:
+        """Upsert several objects, prefetching one name index per container.
+
+        Args:
+            items: The desired objects.
+            rulebase: Rulebase ("pre" or "post") for rule services.
+            max_workers: Number of objects written concurrently (default: 1, in order).
+
+        Returns:
+            List[Any]: The response models, in the order of items.
+
+        """
+        from scm.sync.plan import CONTAINER_FIELDS
+
+        items = list(items)
+        containers = {(k, item[k]) for item in items for k in CONTAINER_FIELDS if item.get(k)}
+        for container_key, container_value in containers:
+            self.name_index(**{container_key: container_value}, rulebase=rulebase)
+
+        if max_workers <= 1:
+            return [self.upsert(item, rulebase=rulebase) for item in items]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.upsert(item, rulebase=rulebase), items))
+
+    def buffered(
+        self,
+        window: Optional[float] = 1.0,
+        max_pending: int = 100,
+        max_workers: int = 1,
+    ):
+        """Return a write-behind buffer that coalesces repeated updates to the same object.
+
+        Only the last update queued for each object id is sent, as one PUT per
+        object, when the buffer flushes (see WriteBuffer):
+
+            with client.address_group.buffered(window=2.0) as buffer:
+                for member in new_members:
+                    group.static.append(member)
+                    buffer.update(AddressGroupUpdateModel(**group.model_dump()))
+
+        Args:
+            window: Seconds to hold updates before a background flush; None disables it.
+            max_pending: Number of pending objects that triggers a flush.
+            max_workers: Number of updates sent concurrently on flush.
+
+        Returns:
+            WriteBuffer: The buffer, flushed when its ``with`` block exits; see
+                scm.sync.buffer.
+
+        """
+        from scm.sync.buffer import WriteBuffer
+
+        return WriteBuffer(self, window=window, max_pending=max_pending, max_workers=max_workers)
+
+    def _json_body(
+        self,
+        model: Any,
+        exclude: Optional[Iterable[str]] = None,
+        by_alias: bool = False,
+    ) -> Any:
+        """Return the request body for a model, dumped without its unset fields.
+
+        Clients created with fast_json=True get a JsonBody, which is encoded straight
+        to bytes with model_dump_json(); other clients get the model_dump() dictionary.
+
+        Args:
+            model: The create or update model.
+            exclude: Top-level fields to leave out, e.g. ("id",) for updates.
+            by_alias: Dump with field aliases.
+
+        Returns:
+            Any: A JsonBody or a dictionary, to pass as the json argument.
+
+        """
+        excluded = set(exclude) if exclude else None
+        if getattr(self.api_client, "fast_json", False) is True:
+            return JsonBody(model, frozenset(excluded) if excluded else None, by_alias)
+        return model.model_dump(exclude_unset=True, exclude=excluded, by_alias=by_alias)
+
     def list_jobs(
         self,
         limit: int = 100,
@@ -198,3 +397,34 @@ class BaseObject:
             sync=sync,
             timeout=timeout,
         )
+
+    def commit_async(
+        self,
+        folders: List[str],
+        description: str,
+        admin: Optional[List[str]] = None,
+        timeout: float = 300,
+        on_progress: Optional[Callable[[Any], None]] = None,
+    ):
+        """Commit configuration changes without waiting for the push to finish.
+
+        This method proxies to the api_client's commit_async method.
+
+        Args:
+            folders: List of folder names to commit changes from
+            description: Description of the commit
+            admin: List of admin emails
+            timeout: Maximum time to wait for the job and its child jobs in seconds
+            on_progress: Called with each status seen for the job or a child job
+
+        Returns:
+            CommitFuture: Resolves to a CommitResult once all of the commit's jobs end
+
+        """
+        return self.api_client.commit_async(
+            folders=folders,
+            description=description,
+            admin=admin,
+            timeout=timeout,
+            on_progress=on_progress,
+        )
@@ -123,6 +123,9 @@ class BGPRouting(BaseObject):
                 details={"error": "Response is not a dictionary"},
             )
 
+        # Work on a copy; the client may share response bodies between callers
+        response = dict(response)
+
         try:
             routing_model = self._process_routing_preference(response)
             if routing_model is not None:
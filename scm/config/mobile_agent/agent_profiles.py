@@ -156,11 +156,9 @@ class AgentProfiles(BaseObject):
         # Use the dictionary "data" to pass into Pydantic and return a modeled object
         profile = AgentProfilesCreateModel(**data)
 
-        # Convert back to a Python dictionary, removing any unset fields and using aliases
-        payload = profile.model_dump(
-            exclude_unset=True,
-            by_alias=True,
-        )
+        # Dump the model without its unset fields, using aliases (straight to JSON on
+        # fast_json clients)
+        payload = self._json_body(profile, by_alias=True)
 
         # Send the new object to the remote API as JSON; folder is a query parameter
         response: Dict[str, Any] = self.api_client.post(
@@ -193,11 +191,9 @@ class AgentProfiles(BaseObject):
         # Use the dictionary "data" to pass into Pydantic and return a modeled object
         profile = AgentProfilesUpdateModel(**data)
 
-        # Convert back to a Python dictionary, removing any unset fields and using aliases
-        payload = profile.model_dump(
-            exclude_unset=True,
-            by_alias=True,
-        )
+        # Dump the model without its unset fields, using aliases (straight to JSON on
+        # fast_json clients)
+        payload = self._json_body(profile, by_alias=True)
 
         # Send the updated object to the remote API as JSON; folder is a query parameter
         response = self.api_client.put(
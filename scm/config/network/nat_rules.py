@@ -8,12 +8,14 @@ Provides service class for managing NAT rule objects via the SCM API.
 # Standard library imports
 import logging
 from typing import Any, Dict, List, Optional
+from uuid import UUID
 
 # Local SDK imports
 from scm.config import BaseObject
 from scm.exceptions import InvalidObjectError, MissingQueryParameterError
 from scm.models.network import (
     NatRuleCreateModel,
+    NatRuleMoveModel,
     NatRuleResponseModel,
     NatRuleUpdateModel,
 )
@@ -589,3 +591,50 @@ class NatRule(BaseObject):
         """
         endpoint = f"{self.ENDPOINT}/{object_id}"
         self.api_client.delete(endpoint)
+
+    def move(
+        self,
+        rule_id: UUID,
+        data: Dict[str, Any],
+    ) -> None:
+        """Move a NAT rule to a new position within the rulebase.
+
+        Args:
+            rule_id (UUID): The UUID of the rule to move
+            data (Dict[str, Any]): Dictionary containing move parameters:
+                - destination: Where to move the rule ('top', 'bottom', 'before', 'after')
+                - rulebase: Which rulebase to use ('pre', 'post')
+                - destination_rule: UUID of reference rule (required for 'before'/'after')
+
+
+        Returns:
+            None: The moved resource.
+
+        """
+        rule_id_str = str(rule_id)
+        move_config = NatRuleMoveModel(**data)
+
+        # Get the dictionary representation of the model
+        payload = move_config.model_dump(exclude_none=True)
+
+        # Convert UUID to string for JSON serialization if present
+        if payload.get("destination_rule") is not None:
+            payload["destination_rule"] = str(payload["destination_rule"])
+
+        endpoint = f"{self.ENDPOINT}/{rule_id_str}:move"
+        self.api_client.post(
+            endpoint,
+            json=payload,
+        )
+
+    def reorder(
+        self,
+        folder: str,
+        rulebase: str,
+        desired_order: List[str],
+        dry_run: bool = False,
+    ):
+        """Reorder a folder's rules with the fewest moves; see scm.sync.reorder.reorder_rules."""
+        from scm.sync.reorder import reorder_rules
+
+        return reorder_rules(self, folder, rulebase, desired_order, dry_run=dry_run)
@@ -131,8 +131,8 @@ class AddressGroup(BaseObject):
         # Use the dictionary "data" to pass into Pydantic and return a modeled object
         address_group = AddressGroupCreateModel(**data)
 
-        # Convert back to a Python dictionary, removing any unset fields
-        payload = address_group.model_dump(exclude_unset=True)
+        # Dump the model without its unset fields (straight to JSON on fast_json clients)
+        payload = self._json_body(address_group)
 
         # Send the updated object to the remote API as JSON, expecting a dictionary object to be returned.
         response: Dict[str, Any] = self.api_client.post(
@@ -176,12 +176,9 @@ class AddressGroup(BaseObject):
             AddressGroupResponseModel
 
         """
-        # Convert to dict for API request, excluding unset fields
-        payload = address_group.model_dump(exclude_unset=True)
-
-        # Extract ID and remove from payload since it's in the URL
+        # Dump the model without its unset fields or its ID, which goes in the URL
+        payload = self._json_body(address_group, exclude=("id",))
         object_id = str(address_group.id)
-        payload.pop("id", None)
 
         # Send the updated object to the remote API as JSON
         endpoint = f"{self.ENDPOINT}/{object_id}"
@@ -140,8 +140,8 @@ class ExternalDynamicLists(BaseObject):
         # Use the dictionary "data" to pass into Pydantic and return a modeled object
         edl = ExternalDynamicListsCreateModel(**data)
 
-        # Convert back to a Python dictionary, removing any unset fields
-        payload = edl.model_dump(exclude_unset=True)
+        # Dump the model without its unset fields (straight to JSON on fast_json clients)
+        payload = self._json_body(edl)
 
         # Send the updated object to the remote API as JSON, expecting a dictionary object to be returned.
         response: Dict[str, Any] = self.api_client.post(
@@ -185,12 +185,9 @@ class ExternalDynamicLists(BaseObject):
             ExternalDynamicListsResponseModel
 
         """
-        # Convert to dict for API request, excluding unset fields
-        payload = edl.model_dump(exclude_unset=True)
-
-        # Extract ID and remove from payload since it's in the URL
+        # Dump the model without its unset fields or its ID, which goes in the URL
+        payload = self._json_body(edl, exclude=("id",))
         edl_id = str(edl.id)
-        payload.pop("id", None)
 
         # Send the updated object to the remote API as JSON
         endpoint = f"{self.ENDPOINT}/{edl_id}"
@@ -770,3 +770,15 @@ class AuthenticationRule(BaseObject):
             endpoint,
             json=payload,
         )
+
+    def reorder(
+        self,
+        folder: str,
+        rulebase: str,
+        desired_order: List[str],
+        dry_run: bool = False,
+    ):
+        """Reorder a folder's rules with the fewest moves; see scm.sync.reorder.reorder_rules."""
+        from scm.sync.reorder import reorder_rules
+
+        return reorder_rules(self, folder, rulebase, desired_order, dry_run=dry_run)
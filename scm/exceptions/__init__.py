@@ -239,6 +239,30 @@ class JobTimeoutError(APIError):
         )
 
 
+class ChecksumMismatchError(APIError):
+    """Raised when downloaded content does not match its published checksum."""
+
+    def __init__(self, name: str, expected: str, actual: str, **kwargs):
+        """Initialize ChecksumMismatchError with both checksums."""
+        self.name = name
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            message=f"Checksum of {name} is {actual}, expected {expected}",
+            **kwargs,
+        )
+
+
+class TransactionError(APIError):
+    """Raised when a transaction fails and its applied operations have been rolled back."""
+
+    def __init__(self, message: str, report: Any = None, rollback: Any = None, **kwargs):
+        """Initialize TransactionError with the batch and rollback reports."""
+        self.report = report
+        self.rollback = rollback
+        super().__init__(message=message, **kwargs)
+
+
 class ErrorHandler:
     """Handles mapping of API error responses to appropriate exceptions."""
 
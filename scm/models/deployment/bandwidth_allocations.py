@@ -9,6 +9,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class QosModel(BaseModel):
     """QoS configuration for bandwidth allocations."""
@@ -74,7 +76,7 @@ class BandwidthAllocationUpdateModel(BandwidthAllocationBaseModel):
     pass
 
 
-class BandwidthAllocationResponseModel(BandwidthAllocationBaseModel):
+class BandwidthAllocationResponseModel(FingerprintMixin, BandwidthAllocationBaseModel):
     """Model for Bandwidth Allocation API responses."""
 
     model_config = ConfigDict(
@@ -89,7 +91,7 @@ class BandwidthAllocationResponseModel(BandwidthAllocationBaseModel):
     pass
 
 
-class BandwidthAllocationListResponseModel(BaseModel):
+class BandwidthAllocationListResponseModel(FingerprintMixin, BaseModel):
     """Model for the list response from the Bandwidth Allocations API."""
 
     model_config = ConfigDict(
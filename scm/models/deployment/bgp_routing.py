@@ -17,6 +17,8 @@ from pydantic import (
     model_validator,
 )
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class BackboneRoutingEnum(str, Enum):
     """Enum representing the possible backbone routing options."""
@@ -124,7 +126,7 @@ class BGPRoutingUpdateModel(BGPRoutingBaseModel):
         return self
 
 
-class BGPRoutingResponseModel(BGPRoutingBaseModel):
+class BGPRoutingResponseModel(FingerprintMixin, BGPRoutingBaseModel):
     """Model for BGP routing API responses.
 
     All fields optional per OpenAPI spec - API may return partial data
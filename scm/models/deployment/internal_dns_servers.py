@@ -18,6 +18,8 @@ from pydantic import (
     model_validator,
 )
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class InternalDnsServersBaseModel(BaseModel):
     """Base model for Internal DNS Servers containing fields common to all operations.
@@ -162,7 +164,7 @@ class InternalDnsServersUpdateModel(InternalDnsServersBaseModel):
         return self
 
 
-class InternalDnsServersResponseModel(InternalDnsServersBaseModel):
+class InternalDnsServersResponseModel(FingerprintMixin, InternalDnsServersBaseModel):
     """Model for Internal DNS Servers API responses.
 
     Includes id as a required field.
@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class EcmpLoadBalancingEnum(str, Enum):
     """Enumeration of ECMP load balancing states for remote networks."""
@@ -234,7 +236,7 @@ class RemoteNetworkUpdateModel(RemoteNetworkBaseModel):
     )
 
 
-class RemoteNetworkResponseModel(RemoteNetworkBaseModel):
+class RemoteNetworkResponseModel(FingerprintMixin, RemoteNetworkBaseModel):
     """Model for Remote Network API responses.
 
     Includes id as a required field.
@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class OnboardingType(str, Enum):
     """Types of onboarding for service connections."""
@@ -140,7 +142,7 @@ class ServiceConnectionUpdateModel(ServiceConnectionBaseModel):
     )
 
 
-class ServiceConnectionResponseModel(ServiceConnectionBaseModel):
+class ServiceConnectionResponseModel(FingerprintMixin, ServiceConnectionBaseModel):
     """Model for Service Connection responses."""
 
     model_config = ConfigDict(
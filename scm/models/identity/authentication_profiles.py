@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Nested Models for Method
 class AuthProfileMethodSamlIdp(BaseModel):
@@ -336,7 +338,7 @@ class AuthenticationProfileUpdateModel(AuthenticationProfileBaseModel):
     )
 
 
-class AuthenticationProfileResponseModel(AuthenticationProfileBaseModel):
+class AuthenticationProfileResponseModel(FingerprintMixin, AuthenticationProfileBaseModel):
     """Model for Authentication Profile API responses.
 
     Includes all base fields plus the id field.
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Component Models
 class KerberosServer(BaseModel):
@@ -123,7 +125,7 @@ class KerberosServerProfileUpdateModel(KerberosServerProfileBaseModel):
     )
 
 
-class KerberosServerProfileResponseModel(KerberosServerProfileBaseModel):
+class KerberosServerProfileResponseModel(FingerprintMixin, KerberosServerProfileBaseModel):
     """Model for Kerberos Server Profile API responses.
 
     Includes all base fields plus the id field.
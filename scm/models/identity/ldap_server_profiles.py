@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class LdapType(str, Enum):
@@ -173,7 +175,7 @@ class LdapServerProfileUpdateModel(LdapServerProfileBaseModel):
     )
 
 
-class LdapServerProfileResponseModel(LdapServerProfileBaseModel):
+class LdapServerProfileResponseModel(FingerprintMixin, LdapServerProfileBaseModel):
     """Model for LDAP Server Profile API responses.
 
     Includes all base fields plus the id field.
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Component Models
 class RadiusProtocol(BaseModel):
@@ -185,7 +187,7 @@ class RadiusServerProfileUpdateModel(RadiusServerProfileBaseModel):
     )
 
 
-class RadiusServerProfileResponseModel(RadiusServerProfileBaseModel):
+class RadiusServerProfileResponseModel(FingerprintMixin, RadiusServerProfileBaseModel):
     """Model for RADIUS Server Profile API responses.
 
     Includes all base fields plus the id field.
@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class SamlSsoBindings(str, Enum):
@@ -140,7 +142,7 @@ class SamlServerProfileUpdateModel(SamlServerProfileBaseModel):
     )
 
 
-class SamlServerProfileResponseModel(SamlServerProfileBaseModel):
+class SamlServerProfileResponseModel(FingerprintMixin, SamlServerProfileBaseModel):
     """Model for SAML Server Profile API responses.
 
     Includes all base fields plus the id field.
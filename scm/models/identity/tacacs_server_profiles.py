@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class TacacsProtocol(str, Enum):
@@ -151,7 +153,7 @@ class TacacsServerProfileUpdateModel(TacacsServerProfileBaseModel):
     )
 
 
-class TacacsServerProfileResponseModel(TacacsServerProfileBaseModel):
+class TacacsServerProfileResponseModel(FingerprintMixin, TacacsServerProfileBaseModel):
     """Model for TACACS+ Server Profile API responses.
 
     Includes all base fields plus the id field.
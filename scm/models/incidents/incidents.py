@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class FilterRuleModel(BaseModel):
     """A single filter rule for incident search."""
@@ -169,7 +171,7 @@ class IncidentSearchResponseHeaderModel(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class IncidentSearchResponseModel(BaseModel):
+class IncidentSearchResponseModel(FingerprintMixin, BaseModel):
     """Full response from incident search."""
 
     header: IncidentSearchResponseHeaderModel = Field(..., description="Response metadata.")
@@ -14,6 +14,8 @@ from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class AgentProfileOperatingSystem(str, Enum):
     """Available operating systems for GlobalProtect agent profiles."""
@@ -1015,7 +1017,7 @@ class AgentProfilesUpdateModel(AgentProfilesBaseModel):
         return self
 
 
-class AgentProfilesResponseModel(AgentProfilesBaseModel):
+class AgentProfilesResponseModel(FingerprintMixin, AgentProfilesBaseModel):
     """Represents the response model for GlobalProtect Agent Profiles.
 
     This class defines the structure for agent profiles returned by the API.
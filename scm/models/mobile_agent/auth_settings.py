@@ -12,6 +12,8 @@ from typing import Optional
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class OperatingSystem(str, Enum):
     """Available operating systems for GlobalProtect authentication settings."""
@@ -170,7 +172,7 @@ class AuthSettingsUpdateModel(BaseModel):
         return v
 
 
-class AuthSettingsResponseModel(AuthSettingsBaseModel):
+class AuthSettingsResponseModel(FingerprintMixin, AuthSettingsBaseModel):
     """Represents the response model for GlobalProtect Authentication Settings.
 
     This class defines the structure for authentication settings returned by the API.
@@ -13,6 +13,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # IP address with wildcards and CIDR notation support, per the SCM mobile-agent API spec
 IP_ENTRY_PATTERN = (
     r"^(\*|25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
@@ -146,7 +148,10 @@ class ForwardingProfileDestinationUpdateModel(ForwardingProfileDestinationBaseMo
     )
 
 
-class ForwardingProfileDestinationResponseModel(ForwardingProfileDestinationBaseModel):
+class ForwardingProfileDestinationResponseModel(
+    FingerprintMixin,
+    ForwardingProfileDestinationBaseModel,
+):
     """Represents the response model for GlobalProtect Forwarding Profile Destinations.
 
     This class defines the structure for destinations returned by the API.
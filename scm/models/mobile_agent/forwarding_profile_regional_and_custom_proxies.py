@@ -14,6 +14,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class RegionalProxyType(str, Enum):
     """Available types for GlobalProtect regional and custom proxies."""
@@ -227,7 +229,8 @@ class ForwardingProfileRegionalAndCustomProxyUpdateModel(
 
 
 class ForwardingProfileRegionalAndCustomProxyResponseModel(
-    ForwardingProfileRegionalAndCustomProxyBaseModel
+    FingerprintMixin,
+    ForwardingProfileRegionalAndCustomProxyBaseModel,
 ):
     """Represents a GlobalProtect Regional and Custom Proxy returned by the API.
 
@@ -13,6 +13,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class ForwardingProfileSourceApplicationBaseModel(BaseModel):
     """Base model for GlobalProtect Forwarding Profile Source Applications.
@@ -78,7 +80,8 @@ class ForwardingProfileSourceApplicationUpdateModel(
 
 
 class ForwardingProfileSourceApplicationResponseModel(
-    ForwardingProfileSourceApplicationBaseModel
+    FingerprintMixin,
+    ForwardingProfileSourceApplicationBaseModel,
 ):
     """Represents a GlobalProtect Forwarding Profile Source Application returned by the API.
 
@@ -13,6 +13,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # Pattern for user location IP addresses (IPv4 with optional wildcards or CIDR suffix)
 USER_LOCATION_IP_PATTERN = (
     r"^(\*|25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
@@ -176,7 +178,10 @@ class ForwardingProfileUserLocationUpdateModel(ForwardingProfileUserLocationBase
     )
 
 
-class ForwardingProfileUserLocationResponseModel(ForwardingProfileUserLocationBaseModel):
+class ForwardingProfileUserLocationResponseModel(
+    FingerprintMixin,
+    ForwardingProfileUserLocationBaseModel,
+):
     """Represents a GlobalProtect Forwarding Profile User Location returned by the API.
 
     Attributes:
@@ -13,6 +13,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class DefinitionMethod(str, Enum):
     """Available definition methods for GlobalProtect forwarding profiles."""
@@ -470,7 +472,7 @@ class ForwardingProfileUpdateModel(ForwardingProfileBaseModel):
     )
 
 
-class ForwardingProfileResponseModel(ForwardingProfileBaseModel):
+class ForwardingProfileResponseModel(FingerprintMixin, ForwardingProfileBaseModel):
     """Represents the response model for GlobalProtect Forwarding Profiles.
 
     This class defines the structure for forwarding profiles returned by the API.
@@ -11,6 +11,8 @@ from typing import List, Optional
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class ManualGatewayRegion(BaseModel):
     """Manual gateway region entry for GlobalProtect global settings.
@@ -94,7 +96,7 @@ class GlobalSettingsUpdateModel(GlobalSettingsBaseModel):
     """Represents the update of the GlobalProtect Global Settings singleton."""
 
 
-class GlobalSettingsResponseModel(GlobalSettingsBaseModel):
+class GlobalSettingsResponseModel(FingerprintMixin, GlobalSettingsBaseModel):
     """Represents the response model for GlobalProtect Global Settings."""
 
     model_config = ConfigDict(
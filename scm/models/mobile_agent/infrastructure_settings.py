@@ -12,6 +12,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class DnsServerSelection(BaseModel):
     """Primary or secondary DNS server selection for an internal DNS match entry.
@@ -514,7 +516,7 @@ class InfrastructureSettingsUpdateModel(InfrastructureSettingsBaseModel):
     """
 
 
-class InfrastructureSettingsResponseModel(InfrastructureSettingsBaseModel):
+class InfrastructureSettingsResponseModel(FingerprintMixin, InfrastructureSettingsBaseModel):
     """Represents the response model for GlobalProtect Infrastructure Settings.
 
     Attributes:
@@ -13,6 +13,8 @@ from typing import List, Optional
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class TunnelOperatingSystem(str, Enum):
     """Available operating systems for GlobalProtect tunnel profiles."""
@@ -316,7 +318,7 @@ class TunnelProfileUpdateModel(TunnelProfileBaseModel):
     """
 
 
-class TunnelProfileResponseModel(TunnelProfileBaseModel):
+class TunnelProfileResponseModel(FingerprintMixin, TunnelProfileBaseModel):
     """Represents the response model for GlobalProtect Tunnel Profiles.
 
     This class defines the structure for tunnel profiles returned by the API.
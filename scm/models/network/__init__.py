@@ -336,7 +336,9 @@ from .nat_rules import (
     DynamicIp,
     DynamicIpAndPort,
     InterfaceAddress,
+    NatMoveDestination,
     NatRuleCreateModel,
+    NatRuleMoveModel,
     NatRuleResponseModel,
     NatRuleUpdateModel,
     SourceTranslation,
@@ -539,6 +541,8 @@ __all__ = [
     "NatRuleCreateModel",
     "NatRuleUpdateModel",
     "NatRuleResponseModel",
+    "NatRuleMoveModel",
+    "NatMoveDestination",
     "DynamicIpAndPort",
     "StaticIp",
     "InterfaceAddress",
@@ -16,6 +16,7 @@ from scm.models.network._interface_common import (
     LacpConfig,
     StaticIpEntry,
 )
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class AggregateLayer2(BaseModel):
@@ -192,7 +193,7 @@ class AggregateInterfaceUpdateModel(AggregateInterfaceBaseModel):
     )
 
 
-class AggregateInterfaceResponseModel(AggregateInterfaceBaseModel):
+class AggregateInterfaceResponseModel(FingerprintMixin, AggregateInterfaceBaseModel):
     """Model for Aggregate Interface responses from the API."""
 
     model_config = ConfigDict(
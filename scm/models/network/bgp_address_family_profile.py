@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Nested Models ---
 
 
@@ -384,7 +386,7 @@ class BgpAddressFamilyProfileUpdateModel(BgpAddressFamilyProfileBaseModel):
     )
 
 
-class BgpAddressFamilyProfileResponseModel(BgpAddressFamilyProfileBaseModel):
+class BgpAddressFamilyProfileResponseModel(FingerprintMixin, BgpAddressFamilyProfileBaseModel):
     """Model for BGP Address Family Profile responses."""
 
     model_config = ConfigDict(
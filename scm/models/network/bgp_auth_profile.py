@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Main Models ---
 
 
@@ -82,7 +84,7 @@ class BgpAuthProfileUpdateModel(BgpAuthProfileBaseModel):
     )
 
 
-class BgpAuthProfileResponseModel(BgpAuthProfileBaseModel):
+class BgpAuthProfileResponseModel(FingerprintMixin, BgpAuthProfileBaseModel):
     """Model for BGP Authentication Profile responses."""
 
     model_config = ConfigDict(
@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Nested Models ---
 
 
@@ -281,7 +283,7 @@ class BgpFilteringProfileUpdateModel(BgpFilteringProfileBaseModel):
     )
 
 
-class BgpFilteringProfileResponseModel(BgpFilteringProfileBaseModel):
+class BgpFilteringProfileResponseModel(FingerprintMixin, BgpFilteringProfileBaseModel):
     """Model for BGP Filtering Profile responses."""
 
     model_config = ConfigDict(
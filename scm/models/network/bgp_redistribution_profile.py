@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Nested Models ---
 
 
@@ -148,7 +150,7 @@ class BgpRedistributionProfileUpdateModel(BgpRedistributionProfileBaseModel):
     )
 
 
-class BgpRedistributionProfileResponseModel(BgpRedistributionProfileBaseModel):
+class BgpRedistributionProfileResponseModel(FingerprintMixin, BgpRedistributionProfileBaseModel):
     """Model for BGP Redistribution Profile responses."""
 
     model_config = ConfigDict(
@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Nested Models ---
 
 
@@ -333,7 +335,7 @@ class BgpRouteMapUpdateModel(BgpRouteMapBaseModel):
     )
 
 
-class BgpRouteMapResponseModel(BgpRouteMapBaseModel):
+class BgpRouteMapResponseModel(FingerprintMixin, BgpRouteMapBaseModel):
     """Model for BGP Route Map responses."""
 
     model_config = ConfigDict(
@@ -13,6 +13,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Match Models ---
 
 
@@ -846,7 +848,7 @@ class BgpRouteMapRedistributionUpdateModel(BgpRouteMapRedistributionBaseModel):
     )
 
 
-class BgpRouteMapRedistributionResponseModel(BgpRouteMapRedistributionBaseModel):
+class BgpRouteMapRedistributionResponseModel(FingerprintMixin, BgpRouteMapRedistributionBaseModel):
     """Model for BGP Route Map Redistribution responses."""
 
     model_config = ConfigDict(
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class DhcpServerMode(str, Enum):
     """DHCP server operation modes."""
@@ -300,7 +302,7 @@ class DhcpInterfaceUpdateModel(DhcpInterfaceBaseModel):
     )
 
 
-class DhcpInterfaceResponseModel(DhcpInterfaceBaseModel):
+class DhcpInterfaceResponseModel(FingerprintMixin, DhcpInterfaceBaseModel):
     """Model for DHCP Interface responses."""
 
     model_config = ConfigDict(
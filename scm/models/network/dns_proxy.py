@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Sub-Models ---
 
 
@@ -297,7 +299,7 @@ class DnsProxyUpdateModel(DnsProxyBaseModel):
     )
 
 
-class DnsProxyResponseModel(DnsProxyBaseModel):
+class DnsProxyResponseModel(FingerprintMixin, DnsProxyBaseModel):
     """Model for DNS Proxy responses."""
 
     model_config = ConfigDict(
@@ -22,6 +22,7 @@ from scm.models.network._interface_common import (
     PppoeConfig,
     StaticIpEntry,
 )
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class EthernetLayer2(BaseModel):
@@ -274,7 +275,7 @@ class EthernetInterfaceUpdateModel(EthernetInterfaceBaseModel):
     )
 
 
-class EthernetInterfaceResponseModel(EthernetInterfaceBaseModel):
+class EthernetInterfaceResponseModel(FingerprintMixin, EthernetInterfaceBaseModel):
     """Model for Ethernet Interface responses from the API."""
 
     model_config = ConfigDict(
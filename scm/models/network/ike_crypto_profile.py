@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class HashAlgorithm(str, Enum):
     """Hash algorithm options for IKE crypto profiles."""
@@ -203,7 +205,7 @@ class IKECryptoProfileUpdateModel(IKECryptoProfileBaseModel):
     )
 
 
-class IKECryptoProfileResponseModel(IKECryptoProfileBaseModel):
+class IKECryptoProfileResponseModel(FingerprintMixin, IKECryptoProfileBaseModel):
     """Model for IKE Crypto Profile responses."""
 
     model_config = ConfigDict(
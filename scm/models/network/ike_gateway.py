@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class PeerIdType(str, Enum):
     """Types of peer IDs supported for IKE Gateway authentication."""
@@ -468,7 +470,7 @@ class IKEGatewayUpdateModel(IKEGatewayBaseModel):
     )
 
 
-class IKEGatewayResponseModel(IKEGatewayBaseModel):
+class IKEGatewayResponseModel(FingerprintMixin, IKEGatewayBaseModel):
     """Model for IKE Gateway responses."""
 
     model_config = ConfigDict(
@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class InterfaceManagementProfileBaseModel(BaseModel):
     """Base model for Interface Management Profiles containing fields common to all operations."""
@@ -132,7 +134,10 @@ class InterfaceManagementProfileUpdateModel(InterfaceManagementProfileBaseModel)
     )
 
 
-class InterfaceManagementProfileResponseModel(InterfaceManagementProfileBaseModel):
+class InterfaceManagementProfileResponseModel(
+    FingerprintMixin,
+    InterfaceManagementProfileBaseModel,
+):
     """Model for Interface Management Profile responses."""
 
     model_config = ConfigDict(
@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class DhGroup(str, Enum):
     """DH group options for IPsec crypto profiles."""
@@ -354,7 +356,7 @@ class IPsecCryptoProfileUpdateModel(IPsecCryptoProfileBaseModel):
     )
 
 
-class IPsecCryptoProfileResponseModel(IPsecCryptoProfileBaseModel):
+class IPsecCryptoProfileResponseModel(FingerprintMixin, IPsecCryptoProfileBaseModel):
     """Model for IPsec Crypto Profile responses."""
 
     model_config = ConfigDict(
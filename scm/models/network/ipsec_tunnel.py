@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class IkeGatewayRef(BaseModel):
     """Reference to an IKE gateway."""
@@ -250,7 +252,7 @@ class IPsecTunnelUpdateModel(IPsecTunnelBaseModel):
     )
 
 
-class IPsecTunnelResponseModel(IPsecTunnelBaseModel):
+class IPsecTunnelResponseModel(FingerprintMixin, IPsecTunnelBaseModel):
     """Model for IPsec Tunnel responses."""
 
     model_config = ConfigDict(
@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class Layer2SubinterfaceBaseModel(BaseModel):
     """Base model for Layer2 Subinterface resources containing common fields."""
@@ -88,7 +90,7 @@ class Layer2SubinterfaceUpdateModel(Layer2SubinterfaceBaseModel):
     )
 
 
-class Layer2SubinterfaceResponseModel(Layer2SubinterfaceBaseModel):
+class Layer2SubinterfaceResponseModel(FingerprintMixin, Layer2SubinterfaceBaseModel):
     """Model for Layer2 Subinterface responses from the API."""
 
     model_config = ConfigDict(
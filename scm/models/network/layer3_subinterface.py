@@ -15,6 +15,7 @@ from scm.models.network._interface_common import (
     DhcpClient,
     StaticIpEntry,
 )
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class Layer3SubinterfaceBaseModel(BaseModel):
@@ -137,7 +138,7 @@ class Layer3SubinterfaceUpdateModel(Layer3SubinterfaceBaseModel):
     )
 
 
-class Layer3SubinterfaceResponseModel(Layer3SubinterfaceBaseModel):
+class Layer3SubinterfaceResponseModel(FingerprintMixin, Layer3SubinterfaceBaseModel):
     """Model for Layer3 Subinterface responses from the API."""
 
     model_config = ConfigDict(
@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Admin Distance Models ---
 
 
@@ -1858,7 +1860,7 @@ class LogicalRouterUpdateModel(LogicalRouterBaseModel):
     )
 
 
-class LogicalRouterResponseModel(LogicalRouterBaseModel):
+class LogicalRouterResponseModel(FingerprintMixin, LogicalRouterBaseModel):
     """Model for Logical Router responses."""
 
     model_config = ConfigDict(
@@ -10,6 +10,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from scm.models.network._interface_common import Ipv6Config, StaticIpEntry
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class LoopbackInterfaceBaseModel(BaseModel):
@@ -105,7 +106,7 @@ class LoopbackInterfaceUpdateModel(LoopbackInterfaceBaseModel):
     )
 
 
-class LoopbackInterfaceResponseModel(LoopbackInterfaceBaseModel):
+class LoopbackInterfaceResponseModel(FingerprintMixin, LoopbackInterfaceBaseModel):
     """Model for Loopback Interface responses from the API."""
 
     model_config = ConfigDict(
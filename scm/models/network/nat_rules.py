@@ -10,6 +10,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class NatType(str, Enum):
@@ -445,7 +446,7 @@ class NatRuleUpdateModel(NatRuleBaseModel):
     )
 
 
-class NatRuleResponseModel(NatRuleBaseModel):
+class NatRuleResponseModel(FingerprintMixin, NatRuleBaseModel):
     """Model for NAT Rule responses."""
 
     model_config = ConfigDict(
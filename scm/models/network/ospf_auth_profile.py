@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Nested Models ---
 
 
@@ -145,7 +147,7 @@ class OspfAuthProfileUpdateModel(OspfAuthProfileBaseModel):
     )
 
 
-class OspfAuthProfileResponseModel(BaseModel):
+class OspfAuthProfileResponseModel(FingerprintMixin, BaseModel):
     """Model for OSPF Authentication Profile responses."""
 
     model_config = ConfigDict(
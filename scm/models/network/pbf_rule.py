@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Sub-Models ---
 
 
@@ -277,7 +279,7 @@ class PbfRuleUpdateModel(PbfRuleBaseModel):
     )
 
 
-class PbfRuleResponseModel(PbfRuleBaseModel):
+class PbfRuleResponseModel(FingerprintMixin, PbfRuleBaseModel):
     """Model for PBF Rule responses."""
 
     model_config = ConfigDict(
@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Main Models ---
 
 
@@ -87,7 +89,7 @@ class QosProfileUpdateModel(QosProfileBaseModel):
     )
 
 
-class QosProfileResponseModel(QosProfileBaseModel):
+class QosProfileResponseModel(FingerprintMixin, QosProfileBaseModel):
     """Model for QoS Profile responses."""
 
     model_config = ConfigDict(
@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class QosMoveDestination(str, Enum):
     """Valid destination values for QoS rule movement."""
@@ -116,7 +118,7 @@ class QosRuleUpdateModel(QosRuleBaseModel):
     )
 
 
-class QosRuleResponseModel(QosRuleBaseModel):
+class QosRuleResponseModel(FingerprintMixin, QosRuleBaseModel):
     """Model for QoS Rule responses."""
 
     model_config = ConfigDict(
@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Nested Models ---
 
 
@@ -182,7 +184,7 @@ class RouteAccessListUpdateModel(RouteAccessListBaseModel):
     )
 
 
-class RouteAccessListResponseModel(RouteAccessListBaseModel):
+class RouteAccessListResponseModel(FingerprintMixin, RouteAccessListBaseModel):
     """Model for Route Access List responses."""
 
     model_config = ConfigDict(
@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Nested Models ---
 
 
@@ -180,7 +182,7 @@ class RoutePrefixListUpdateModel(RoutePrefixListBaseModel):
     )
 
 
-class RoutePrefixListResponseModel(RoutePrefixListBaseModel):
+class RoutePrefixListResponseModel(FingerprintMixin, RoutePrefixListBaseModel):
     """Model for Route Prefix List responses."""
 
     model_config = ConfigDict(
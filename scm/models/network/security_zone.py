@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class NetworkInterfaceType(str, Enum):
     """Types of network interfaces for security zones."""
@@ -205,7 +207,7 @@ class SecurityZoneUpdateModel(SecurityZoneBaseModel):
     )
 
 
-class SecurityZoneResponseModel(SecurityZoneBaseModel):
+class SecurityZoneResponseModel(FingerprintMixin, SecurityZoneBaseModel):
     """Model for Security Zone responses."""
 
     model_config = ConfigDict(
@@ -10,6 +10,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from scm.models.network._interface_common import StaticIpEntry
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class TunnelInterfaceBaseModel(BaseModel):
@@ -100,7 +101,7 @@ class TunnelInterfaceUpdateModel(TunnelInterfaceBaseModel):
     )
 
 
-class TunnelInterfaceResponseModel(TunnelInterfaceBaseModel):
+class TunnelInterfaceResponseModel(FingerprintMixin, TunnelInterfaceBaseModel):
     """Model for Tunnel Interface responses from the API."""
 
     model_config = ConfigDict(
@@ -15,6 +15,7 @@ from scm.models.network._interface_common import (
     DhcpClient,
     StaticIpEntry,
 )
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class VlanInterfaceBaseModel(BaseModel):
@@ -137,7 +138,7 @@ class VlanInterfaceUpdateModel(VlanInterfaceBaseModel):
     )
 
 
-class VlanInterfaceResponseModel(VlanInterfaceBaseModel):
+class VlanInterfaceResponseModel(FingerprintMixin, VlanInterfaceBaseModel):
     """Model for VLAN Interface responses from the API."""
 
     model_config = ConfigDict(
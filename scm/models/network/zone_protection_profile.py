@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # --- Flood Protection Models ---
 
 
@@ -664,7 +666,7 @@ class ZoneProtectionProfileUpdateModel(ZoneProtectionProfileBaseModel):
     )
 
 
-class ZoneProtectionProfileResponseModel(ZoneProtectionProfileBaseModel):
+class ZoneProtectionProfileResponseModel(FingerprintMixin, ZoneProtectionProfileBaseModel):
     """Model for Zone Protection Profile responses."""
 
     model_config = ConfigDict(
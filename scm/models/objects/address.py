@@ -19,6 +19,8 @@ from pydantic import (
     model_validator,
 )
 
+from scm.utils.fingerprint import FingerprintMixin
+
 TagString = constr(max_length=127)
 
 
@@ -231,7 +233,7 @@ class AddressUpdateModel(AddressBaseModel):
     )
 
 
-class AddressResponseModel(AddressBaseModel):
+class AddressResponseModel(FingerprintMixin, AddressBaseModel):
     """Represents the response representation of an Address object for Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for an AddressResponseModel object,
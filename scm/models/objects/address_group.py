@@ -17,6 +17,8 @@ from pydantic import (
     model_validator,
 )
 
+from scm.utils.fingerprint import FingerprintMixin
+
 TagString = constr(max_length=127)
 
 
@@ -194,7 +196,7 @@ class AddressGroupUpdateModel(AddressGroupBaseModel):
     )
 
 
-class AddressGroupResponseModel(AddressGroupBaseModel):
+class AddressGroupResponseModel(FingerprintMixin, AddressGroupBaseModel):
     """Represents the creation of a new AddressGroup object for Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for an AddressGroupResponseModel object,
@@ -11,6 +11,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class ApplicationBaseModel(BaseModel):
@@ -178,7 +179,7 @@ class ApplicationUpdateModel(ApplicationBaseModel):
     )
 
 
-class ApplicationResponseModel(ApplicationBaseModel):
+class ApplicationResponseModel(FingerprintMixin, ApplicationBaseModel):
     """Model for Application responses.
 
     Includes all base fields plus the id field.
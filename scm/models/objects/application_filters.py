@@ -11,6 +11,7 @@ from uuid import UUID
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class ApplicationFiltersBaseModel(BaseModel):
@@ -198,7 +199,7 @@ class ApplicationFiltersUpdateModel(ApplicationFiltersBaseModel):
     )
 
 
-class ApplicationFiltersResponseModel(ApplicationFiltersBaseModel):
+class ApplicationFiltersResponseModel(FingerprintMixin, ApplicationFiltersBaseModel):
     """Model for application filter responses.
 
     Includes all base fields plus the (optional!) id field.
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class ApplicationGroupBaseModel(BaseModel):
     """Base model for Application Group objects containing fields common to all CRUD operations.
@@ -112,7 +114,7 @@ class ApplicationGroupUpdateModel(ApplicationGroupBaseModel):
     )
 
 
-class ApplicationGroupResponseModel(ApplicationGroupBaseModel):
+class ApplicationGroupResponseModel(FingerprintMixin, ApplicationGroupBaseModel):
     """Model for Application Group responses.
 
     Includes all base fields plus the id field.
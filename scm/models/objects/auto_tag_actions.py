@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class TaggingModel(BaseModel):
     """Model for tagging action settings."""
@@ -155,7 +157,7 @@ class AutoTagActionUpdateModel(AutoTagActionBaseModel):
     )
 
 
-class AutoTagActionResponseModel(AutoTagActionBaseModel):
+class AutoTagActionResponseModel(FingerprintMixin, AutoTagActionBaseModel):
     """Model for Auto Tag Action responses."""
 
     model_config = ConfigDict(
@@ -19,6 +19,8 @@ from pydantic import (
     model_validator,
 )
 
+from scm.utils.fingerprint import FingerprintMixin
+
 TagString = constr(max_length=127)
 
 
@@ -153,7 +155,7 @@ class DynamicUserGroupUpdateModel(DynamicUserGroupBaseModel):
     )
 
 
-class DynamicUserGroupResponseModel(DynamicUserGroupBaseModel):
+class DynamicUserGroupResponseModel(FingerprintMixin, DynamicUserGroupBaseModel):
     """Represents the response model for a Dynamic User Group object from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for a DynamicUserGroupResponseModel object,
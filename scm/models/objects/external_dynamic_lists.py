@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class FiveMinuteRecurringModel(BaseModel):
     """Model for a recurring schedule that updates every five minutes."""
@@ -519,7 +521,7 @@ class ExternalDynamicListsUpdateModel(ExternalDynamicListsBaseModel):
     )
 
 
-class ExternalDynamicListsResponseModel(ExternalDynamicListsBaseModel):
+class ExternalDynamicListsResponseModel(FingerprintMixin, ExternalDynamicListsBaseModel):
     """Model for responses representing an external dynamic list resource."""
 
     model_config = ConfigDict(
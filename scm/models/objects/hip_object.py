@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class BaseHIPModel(BaseModel):
     """Base model with common configuration for all HIP object models."""
@@ -799,7 +801,7 @@ class HIPObjectUpdateModel(HIPObjectBaseModel):
     )
 
 
-class HIPObjectResponseModel(HIPObjectBaseModel):
+class HIPObjectResponseModel(FingerprintMixin, HIPObjectBaseModel):
     """Model for HIP object responses."""
 
     model_config = ConfigDict(
@@ -12,6 +12,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class HIPProfileBaseModel(BaseModel):
     """Base model for HIP Profile objects containing fields common to all CRUD operations.
@@ -121,7 +123,7 @@ class HIPProfileUpdateModel(HIPProfileBaseModel):
     )
 
 
-class HIPProfileResponseModel(HIPProfileBaseModel):
+class HIPProfileResponseModel(FingerprintMixin, HIPProfileBaseModel):
     """Represents the response model for a HIP Profile object from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for a HIPProfileResponseModel object,
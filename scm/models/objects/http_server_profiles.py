@@ -12,6 +12,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Server model for HTTP server profile
 class ServerModel(BaseModel):
@@ -194,7 +196,7 @@ class HTTPServerProfileUpdateModel(HTTPServerProfileBaseModel):
     )
 
 
-class HTTPServerProfileResponseModel(HTTPServerProfileBaseModel):
+class HTTPServerProfileResponseModel(FingerprintMixin, HTTPServerProfileBaseModel):
     """Represents the response model for a HTTP Server Profile object from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for an HTTPServerProfileResponseModel object,
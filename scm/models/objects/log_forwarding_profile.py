@@ -12,6 +12,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class MatchListItem(BaseModel):
     """Represents a match profile configuration within a log forwarding profile.
@@ -174,7 +176,7 @@ class LogForwardingProfileUpdateModel(LogForwardingProfileBaseModel):
     )
 
 
-class LogForwardingProfileResponseModel(LogForwardingProfileBaseModel):
+class LogForwardingProfileResponseModel(FingerprintMixin, LogForwardingProfileBaseModel):
     """Represents the response model for a Log Forwarding Profile object from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for a LogForwardingProfileResponseModel object,
@@ -11,6 +11,8 @@ from typing import Optional
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class QuarantinedDevicesBaseModel(BaseModel):
     """Base model for Quarantined Devices objects containing fields common to all CRUD operations.
@@ -46,7 +48,7 @@ class QuarantinedDevicesCreateModel(QuarantinedDevicesBaseModel):
     """Represents the creation of a new Quarantined Devices object for Palo Alto Networks' Strata Cloud Manager."""
 
 
-class QuarantinedDevicesResponseModel(QuarantinedDevicesBaseModel):
+class QuarantinedDevicesResponseModel(FingerprintMixin, QuarantinedDevicesBaseModel):
     """Represents the response from creating or retrieving a Quarantined Devices object."""
 
     model_config = ConfigDict(
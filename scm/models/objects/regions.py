@@ -13,6 +13,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class GeoLocation(BaseModel):
@@ -181,7 +182,7 @@ class RegionUpdateModel(RegionBaseModel):
     )
 
 
-class RegionResponseModel(RegionBaseModel):
+class RegionResponseModel(FingerprintMixin, RegionBaseModel):
     """Represents a Region object response from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for an RegionResponseModel object,
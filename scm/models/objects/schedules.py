@@ -13,6 +13,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # Regular expression to validate time range in format hh:mm-hh:mm
 # This pattern ensures:
 # - Hours from 00-23 (first digit can only be 0, 1, or 2)
@@ -370,7 +372,7 @@ class ScheduleUpdateModel(ScheduleBaseModel):
     )
 
 
-class ScheduleResponseModel(ScheduleBaseModel):
+class ScheduleResponseModel(FingerprintMixin, ScheduleBaseModel):
     """Represents a response containing a Schedule object from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for a Schedule response model.
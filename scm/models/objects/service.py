@@ -11,6 +11,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class Override(BaseModel):
@@ -191,7 +192,7 @@ class ServiceUpdateModel(ServiceBaseModel):
     )
 
 
-class ServiceResponseModel(ServiceBaseModel):
+class ServiceResponseModel(FingerprintMixin, ServiceBaseModel):
     """Model for Service responses.
 
     Includes all base fields plus the optional id field.
@@ -13,6 +13,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 class ServiceGroupBaseModel(BaseModel):
@@ -146,7 +147,7 @@ class ServiceGroupUpdateModel(ServiceGroupBaseModel):
     )
 
 
-class ServiceGroupResponseModel(ServiceGroupBaseModel):
+class ServiceGroupResponseModel(FingerprintMixin, ServiceGroupBaseModel):
     """Represents the creation of a new ServiceGroup object for Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for a ServiceGroupResponseModel object,
@@ -12,6 +12,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class EscapingModel(BaseModel):
     """Model for character escaping configuration in syslog server profiles.
@@ -218,7 +220,7 @@ class SyslogServerProfileUpdateModel(SyslogServerProfileBaseModel):
     )
 
 
-class SyslogServerProfileResponseModel(SyslogServerProfileBaseModel):
+class SyslogServerProfileResponseModel(FingerprintMixin, SyslogServerProfileBaseModel):
     """Represents a Syslog Server Profile object response from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for a SyslogServerProfileResponseModel object,
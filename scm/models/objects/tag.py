@@ -11,6 +11,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
 from scm.utils.tag_colors import normalize_color_name
 
 # Pattern allows: alphanumeric, spaces, underscores, dots, hyphens, brackets, ampersands, parentheses, colons
@@ -232,7 +233,7 @@ class TagUpdateModel(TagBaseModel):
     )
 
 
-class TagResponseModel(TagBaseModel):
+class TagResponseModel(FingerprintMixin, TagBaseModel):
     """Represents the creation of a new Tag object for Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure and validation rules for an TagResponseModel object,
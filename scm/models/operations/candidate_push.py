@@ -9,6 +9,8 @@ from typing import List
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class CandidatePushRequestModel(BaseModel):
     """Represents a commit request for Palo Alto Networks' Strata Cloud Manager.
@@ -84,7 +86,7 @@ class CandidatePushRequestModel(BaseModel):
         return [admin.lower() if admin.lower() == "all" else admin for admin in v]
 
 
-class CandidatePushResponseModel(BaseModel):
+class CandidatePushResponseModel(FingerprintMixin, BaseModel):
     """Represents a commit response from Palo Alto Networks' Strata Cloud Manager.
 
     This class defines the structure for commit operation responses,
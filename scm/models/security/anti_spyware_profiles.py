@@ -18,6 +18,8 @@ from pydantic import (
     model_validator,
 )
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class AntiSpywareInlinePolicyAction(str, Enum):
@@ -458,7 +460,7 @@ class AntiSpywareProfileUpdateModel(AntiSpywareProfileBase):
     )
 
 
-class AntiSpywareProfileResponseModel(AntiSpywareProfileBase):
+class AntiSpywareProfileResponseModel(FingerprintMixin, AntiSpywareProfileBase):
     """Model for Anti-Spyware Profile API responses.
 
     Includes all base fields plus the id field.
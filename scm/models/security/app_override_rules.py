@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class AppOverrideRuleMoveDestination(str, Enum):
@@ -226,7 +228,7 @@ class AppOverrideRuleUpdateModel(AppOverrideRuleBaseModel):
     )
 
 
-class AppOverrideRuleResponseModel(AppOverrideRuleBaseModel):
+class AppOverrideRuleResponseModel(FingerprintMixin, AppOverrideRuleBaseModel):
     """Model for App Override Rule responses, including the id field."""
 
     model_config = ConfigDict(
@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class AuthenticationRuleMoveDestination(str, Enum):
@@ -228,7 +230,7 @@ class AuthenticationRuleUpdateModel(AuthenticationRuleBaseModel):
     )
 
 
-class AuthenticationRuleResponseModel(AuthenticationRuleBaseModel):
+class AuthenticationRuleResponseModel(FingerprintMixin, AuthenticationRuleBaseModel):
     """Model for Authentication Rule responses, including the id field."""
 
     model_config = ConfigDict(
@@ -13,6 +13,8 @@ from uuid import UUID
 # External libraries
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class SSLVersion(str, Enum):
@@ -303,7 +305,7 @@ class DecryptionProfileUpdateModel(DecryptionProfileBaseModel):
     )
 
 
-class DecryptionProfileResponseModel(DecryptionProfileBaseModel):
+class DecryptionProfileResponseModel(FingerprintMixin, DecryptionProfileBaseModel):
     """Model for Decryption Profile API responses."""
 
     model_config = ConfigDict(
@@ -12,6 +12,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 # Enums
@@ -275,7 +276,7 @@ class DecryptionRuleUpdateModel(DecryptionRuleBaseModel):
     )
 
 
-class DecryptionRuleResponseModel(DecryptionRuleBaseModel):
+class DecryptionRuleResponseModel(FingerprintMixin, DecryptionRuleBaseModel):
     """Model for Decryption Rule responses, including the id field."""
 
     model_config = ConfigDict(
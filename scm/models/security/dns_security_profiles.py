@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, RootModel, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class ActionEnum(str, Enum):
@@ -295,7 +297,7 @@ class DNSSecurityProfileUpdateModel(DNSSecurityProfileBaseModel):
     )
 
 
-class DNSSecurityProfileResponseModel(DNSSecurityProfileBaseModel):
+class DNSSecurityProfileResponseModel(FingerprintMixin, DNSSecurityProfileBaseModel):
     """Model for DNS Security Profile API responses."""
 
     model_config = ConfigDict(
@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class FileBlockingAction(str, Enum):
@@ -153,7 +155,7 @@ class FileBlockingProfileUpdateModel(FileBlockingProfileBaseModel):
     )
 
 
-class FileBlockingProfileResponseModel(FileBlockingProfileBaseModel):
+class FileBlockingProfileResponseModel(FingerprintMixin, FileBlockingProfileBaseModel):
     """Model for File Blocking Profile API responses.
 
     Includes all base fields plus the id field.
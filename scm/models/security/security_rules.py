@@ -12,6 +12,7 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from scm.models.objects.tag import TagName
+from scm.utils.fingerprint import FingerprintMixin
 
 
 # Enums
@@ -272,7 +273,7 @@ class SecurityRuleUpdateModel(SecurityRuleBaseModel):
     )
 
 
-class SecurityRuleResponseModel(SecurityRuleBaseModel):
+class SecurityRuleResponseModel(FingerprintMixin, SecurityRuleBaseModel):
     """Model for Security Rule responses, including the id field."""
 
     model_config = ConfigDict(
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Component Models
 class CredentialEnforcementMode(BaseModel):
@@ -229,7 +231,7 @@ class URLAccessProfileUpdateModel(URLAccessProfileBaseModel):
     )
 
 
-class URLAccessProfileResponseModel(URLAccessProfileBaseModel):
+class URLAccessProfileResponseModel(FingerprintMixin, URLAccessProfileBaseModel):
     """Model for URL Access Profile API responses.
 
     Includes all base fields plus the id field.
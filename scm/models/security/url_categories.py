@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class URLCategoriesListTypeEnum(str, Enum):
@@ -108,7 +110,7 @@ class URLCategoriesUpdateModel(URLCategoriesBaseModel):
     )
 
 
-class URLCategoriesResponseModel(URLCategoriesBaseModel):
+class URLCategoriesResponseModel(FingerprintMixin, URLCategoriesBaseModel):
     """Model for URL Category API responses."""
 
     model_config = ConfigDict(
@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, RootModel, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Keep all original Enums
 class VulnerabilityProfileSeverity(str, Enum):
@@ -447,7 +449,7 @@ class VulnerabilityProfileUpdateModel(VulnerabilityProfileBaseModel):
     )
 
 
-class VulnerabilityProfileResponseModel(VulnerabilityProfileBaseModel):
+class VulnerabilityProfileResponseModel(FingerprintMixin, VulnerabilityProfileBaseModel):
     """Model for Vulnerability Protection Profile responses."""
 
     model_config = ConfigDict(
@@ -11,6 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 # Enums
 class WildfireAvAnalysis(str, Enum):
@@ -166,7 +168,7 @@ class WildfireAvProfileUpdateModel(WildfireAvProfileBase):
 
 
 # Response Model
-class WildfireAvProfileResponseModel(WildfireAvProfileBase):
+class WildfireAvProfileResponseModel(FingerprintMixin, WildfireAvProfileBase):
     """Model for Wildfire Antivirus Profile API responses.
 
     Includes all base fields plus the id field.
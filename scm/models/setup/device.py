@@ -7,6 +7,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 # TODO: These placeholder models were defined in the incorrect location
 # - scm/models/config/setup/devices.py. They need proper implementation:
 # class InstalledLicenseModel(BaseModel):
@@ -112,7 +114,7 @@ class DeviceUpdateModel(BaseModel):
     snippets: Optional[List[str]] = Field(None, description="Snippets associated with the device.")
 
 
-class DeviceResponseModel(DeviceBaseModel):
+class DeviceResponseModel(FingerprintMixin, DeviceBaseModel):
     """Model for Device responses from the API.
 
     Attributes:
@@ -214,7 +216,7 @@ class DeviceResponseModel(DeviceBaseModel):
     )
 
 
-class DeviceListResponseModel(BaseModel):
+class DeviceListResponseModel(FingerprintMixin, BaseModel):
     """Model for the paginated response from GET /devices."""
 
     model_config = ConfigDict(
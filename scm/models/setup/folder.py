@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class FolderBaseModel(BaseModel):
     """Base model for Folder resources containing common fields.
@@ -94,7 +96,7 @@ class FolderUpdateModel(FolderBaseModel):
     )
 
 
-class FolderResponseModel(FolderBaseModel):
+class FolderResponseModel(FingerprintMixin, FolderBaseModel):
     """Model for Folder responses from the API.
 
     Attributes:
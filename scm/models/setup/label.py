@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class LabelBaseModel(BaseModel):
     """Base model for Label resources per OpenAPI spec."""
@@ -45,7 +47,7 @@ class LabelUpdateModel(LabelBaseModel):
     )
 
 
-class LabelResponseModel(LabelBaseModel):
+class LabelResponseModel(FingerprintMixin, LabelBaseModel):
     """Model for Label responses from the API."""
 
     model_config = ConfigDict(
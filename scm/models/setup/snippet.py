@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class FolderReference(BaseModel):
     """Reference to a folder that a snippet is applied to."""
@@ -95,7 +97,7 @@ class SnippetUpdateModel(SnippetBaseModel):
     )
 
 
-class SnippetResponseModel(SnippetBaseModel):
+class SnippetResponseModel(FingerprintMixin, SnippetBaseModel):
     """Model for Snippet responses from the API.
 
     Attributes:
@@ -9,6 +9,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from scm.utils.fingerprint import FingerprintMixin
+
 
 class VariableBaseModel(BaseModel):
     """Base model for Variable resources per OpenAPI spec."""
@@ -140,7 +142,7 @@ class VariableUpdateModel(VariableBaseModel):
         return model
 
 
-class VariableResponseModel(VariableBaseModel):
+class VariableResponseModel(FingerprintMixin, VariableBaseModel):
     """Model for Variable responses from the API."""
 
     model_config = ConfigDict(
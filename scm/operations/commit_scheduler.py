@@ -0,0 +1,296 @@
+"""Commit scheduler that coalesces bursts of commit requests into few pushes.
+
+Gathers commit requests over a debounce window, merges their folders and
+descriptions into one candidate push, and holds new pushes back while the
+previous push and its child jobs are still running.
+"""
+
+# scm/operations/commit_scheduler.py
+
+# Standard library imports
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Local SDK imports
+from scm.models.operations import CandidatePushRequestModel
+from scm.operations.jobs import CommitResult
+
+logger = logging.getLogger(__name__)
+
+# Longest description a candidate push accepts
+MAX_DESCRIPTION_LENGTH = 255
+
+
+def merge_push_requests(requests: Sequence[CandidatePushRequestModel]) -> CandidatePushRequestModel:
+    """Merge push requests into one covering all of their folders.
+
+    Folders, admins and descriptions are combined in first-seen order without
+    duplicates; "all" among the admins stands for every admin. Descriptions are
+    joined with "; " and cut to the longest length a push accepts.
+
+    Args:
+        requests: The requests to merge, at least one.
+
+    Returns:
+        CandidatePushRequestModel: The merged request.
+
+    """
+    folders = list(dict.fromkeys(folder for request in requests for folder in request.folders))
+    admin = list(dict.fromkeys(name for request in requests for name in request.admin))
+    if "all" in admin:
+        admin = ["all"]
+    description = "; ".join(dict.fromkeys(request.description for request in requests))
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        description = description[: MAX_DESCRIPTION_LENGTH - 3] + "..."
+    return CandidatePushRequestModel(folders=folders, admin=admin, description=description)
+
+
+@dataclass
+class CommitBatch:
+    """One push made by the scheduler and the callers whose changes it carried.
+
+    Attributes:
+        request: The merged push request.
+        callers: Labels of the callers merged into the push, in submission order.
+        job_id: The push job id, once the push was accepted.
+        result: The push job and its child jobs, once they have ended.
+
+    """
+
+    request: CandidatePushRequestModel
+    callers: List[str]
+    job_id: Optional[str] = None
+    result: Optional[CommitResult] = None
+
+
+@dataclass
+class _Submitted:
+    """A caller's commit request waiting for a push."""
+
+    request: CandidatePushRequestModel
+    caller: str
+    future: Future
+
+
+class CommitScheduler:
+    """Coalesce frequent commit requests into as few candidate pushes as possible.
+
+    Requests submitted within window seconds of each other are merged into one
+    push; a steady stream of requests is still pushed at least every max_delay
+    seconds. While a push job or its child jobs are running no new push starts,
+    so requests arriving meanwhile are merged into the next one. Pushes are sent
+    with api_client.commit_async() and tracked by the client's job watcher.
+
+    Each submit() returns a future that resolves to the CommitBatch its changes
+    went into, once that push has ended; history lists every push made so far.
+
+    Args:
+        api_client: The Scm client.
+        window: Quiet period in seconds that ends a burst of requests (default: 2.0).
+        max_delay: Longest time in seconds a request waits before a push starts,
+            unless a push is already running (default: 30.0).
+        admin: Admins whose changes are pushed (default: as for commit()).
+        timeout: Seconds to wait for each push and its child jobs (default: 300).
+
+    """
+
+    def __init__(
+        self,
+        api_client,
+        window: float = 2.0,
+        max_delay: float = 30.0,
+        admin: Optional[List[str]] = None,
+        timeout: float = 300,
+    ):
+        """Initialize the scheduler; its thread starts with the first request."""
+        if window < 0 or max_delay < window:
+            raise ValueError("CommitScheduler needs 0 <= window <= max_delay")
+        self.api_client = api_client
+        self.window = window
+        self.max_delay = max_delay
+        self.admin = admin
+        self.timeout = timeout
+        self.history: List[CommitBatch] = []
+        self._pending: List[_Submitted] = []
+        self._first = 0.0
+        self._last = 0.0
+        self._count = 0
+        self._pushing = False
+        self._flush = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(
+        self,
+        folders: List[str],
+        description: str,
+        caller: Optional[str] = None,
+    ) -> "Future[CommitBatch]":
+        """Queue a commit of folders for the next push.
+
+        Args:
+            folders: Folder names to commit changes from.
+            description: Description of the changes.
+            caller: Label identifying the caller in reports (default: "request-<n>").
+
+        Returns:
+            Future[CommitBatch]: Resolved with the push that carried the changes once it
+            has ended, or failed with the push's error.
+
+        Raises:
+            RuntimeError: If the scheduler is closed.
+
+        """
+        request = self.api_client.candidate_push_request(
+            folders=folders, description=description, admin=self.admin
+        )
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("CommitScheduler is closed")
+            self._count += 1
+            now = time.monotonic()
+            if not self._pending:
+                self._first = now
+            self._last = now
+            self._pending.append(_Submitted(request, caller or f"request-{self._count}", future))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="scm-commit-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+        return future
+
+    def flush(self) -> None:
+        """Push the waiting requests without waiting out the window."""
+        with self._cond:
+            self._flush = True
+            self._cond.notify_all()
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting for a push."""
+        with self._cond:
+            return len(self._pending)
+
+    def jobs(self) -> Dict[str, List[str]]:
+        """Return the callers merged into each accepted push, by job id."""
+        with self._cond:
+            return {batch.job_id: list(batch.callers) for batch in self.history if batch.job_id}
+
+    def close(self, wait: bool = True) -> None:
+        """Push the waiting requests and stop accepting new ones.
+
+        Args:
+            wait: Block until the last push and its child jobs have ended.
+
+        """
+        with self._cond:
+            self._closed = True
+            self._flush = True
+            thread = self._thread
+            self._cond.notify_all()
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __enter__(self) -> "CommitScheduler":
+        """Return the scheduler."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Close the scheduler, waiting for the last push."""
+        self.close()
+
+    def _run(self) -> None:
+        """Push batches of requests until closed with nothing left to push."""
+        while True:
+            with self._cond:
+                batch = self._next_batch()
+                if batch is None:
+                    self._thread = None
+                    return
+            self._push(batch)
+
+    def _next_batch(self) -> Optional[List[_Submitted]]:
+        """Wait, holding the lock, until a batch is due; None once closed and idle."""
+        while True:
+            if self._pushing:
+                self._cond.wait()
+                continue
+            # Callers may cancel their futures while waiting
+            self._pending = [s for s in self._pending if not s.future.cancelled()]
+            if not self._pending:
+                if self._closed:
+                    return None
+                self._flush = False
+                self._cond.wait()
+                continue
+            due = min(self._last + self.window, self._first + self.max_delay)
+            remaining = due - time.monotonic()
+            if remaining > 0 and not self._flush:
+                self._cond.wait(remaining)
+                continue
+            self._flush = False
+            self._pushing = True
+            batch, self._pending = self._pending, []
+            return batch
+
+    def _push(self, batch: List[_Submitted]) -> None:
+        """Send one merged push for a batch; its callers resolve when it ends."""
+        commit = CommitBatch(
+            request=merge_push_requests([s.request for s in batch]),
+            callers=[s.caller for s in batch],
+        )
+        with self._cond:
+            self.history.append(commit)
+        try:
+            future = self.api_client.commit_async(
+                folders=commit.request.folders,
+                description=commit.request.description,
+                admin=commit.request.admin,
+                timeout=self.timeout,
+            )
+        except Exception as e:
+            logger.error(f"Push for {', '.join(commit.callers)} failed: {e}")
+            self._finish(batch, commit, e)
+            return
+        commit.job_id = future.job_id or None
+        logger.debug(f"Push job {commit.job_id} carries {', '.join(commit.callers)}")
+
+        def done(push: Future) -> None:
+            if push.cancelled():
+                for submitted in batch:
+                    submitted.future.cancel()
+                self._finish(batch, commit, None)
+                return
+            error = push.exception()
+            if error is None:
+                commit.result = push.result()
+            self._finish(batch, commit, error)
+
+        future.add_done_callback(done)
+
+    def _finish(
+        self,
+        batch: List[_Submitted],
+        commit: CommitBatch,
+        error: Optional[BaseException],
+    ) -> None:
+        """Resolve the callers of a push and let the next push start."""
+        for submitted in batch:
+            try:
+                if error is not None:
+                    submitted.future.set_exception(error)
+                else:
+                    submitted.future.set_result(commit)
+            except InvalidStateError:  # cancelled by its caller
+                pass
+        with self._cond:
+            self._pushing = False
+            self._cond.notify_all()
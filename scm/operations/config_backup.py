@@ -0,0 +1,255 @@
+"""Concurrent fleet backup of device local configurations.
+
+Lists configuration versions for many devices at once, downloads only the
+versions not already stored, and keeps each distinct configuration once as a
+content-addressed blob, writing a manifest of every run with per-device
+timings.
+"""
+
+# scm/operations/config_backup.py
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+# Local SDK imports
+from scm.models.operations import LocalConfigVersionModel
+
+logger = logging.getLogger(__name__)
+
+NEW = "new"
+DUPLICATE = "duplicate"
+STORED = "stored"
+
+
+@dataclass
+class VersionBackup:
+    """One configuration version in a backup run.
+
+    Attributes:
+        version: Configuration version ID.
+        local_version: The device's local version identifier.
+        sha256: SHA-256 of the content, which names its blob.
+        size: Size of the content in bytes.
+        outcome: "new" if a new blob was written, "duplicate" if the content was
+            already stored under another version, "stored" if this version was
+            backed up by an earlier run and not downloaded again.
+
+    """
+
+    version: str
+    local_version: str
+    sha256: str
+    size: int
+    outcome: str
+
+
+@dataclass
+class DeviceBackup:
+    """The backup of one device, with how long each step took.
+
+    Attributes:
+        device: Device serial number.
+        versions: The versions backed up.
+        list_seconds: Time spent listing the device's versions.
+        download_seconds: Time spent downloading and storing content.
+        error: Why the backup failed, if it did.
+
+    """
+
+    device: str
+    versions: List[VersionBackup] = field(default_factory=list)
+    list_seconds: float = 0.0
+    download_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the device was backed up without error."""
+        return self.error is None
+
+
+@dataclass
+class BackupManifest:
+    """The record of one backup run.
+
+    Attributes:
+        started: When the run started (UTC, ISO 8601).
+        finished: When the run finished (UTC, ISO 8601).
+        devices: One entry per device, in the order given.
+        path: Where the manifest was saved.
+
+    """
+
+    started: str
+    finished: str
+    devices: List[DeviceBackup]
+    path: Optional[str] = None
+
+    def summary(self) -> Dict[str, int]:
+        """Count devices that failed and versions by outcome."""
+        counts = {"devices": len(self.devices), "failed": 0, NEW: 0, DUPLICATE: 0, STORED: 0}
+        for device in self.devices:
+            counts["failed"] += not device.ok
+            for version in device.versions:
+                counts[version.outcome] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the manifest as JSON-compatible data."""
+        data = asdict(self)
+        data.pop("path")
+        data["summary"] = self.summary()
+        return data
+
+
+class ConfigBackup:
+    """Back up the local configurations of a fleet into a content-addressed store.
+
+    Layout under root:
+
+        blobs/ab/abcdef....xml   one file per distinct configuration, named by SHA-256
+        index.json               "<device>/<version>" -> SHA-256 of every stored version
+        manifests/*.json         one manifest per run
+        tmp/                     downloads in progress, resumed by the next run
+
+    Devices are processed concurrently. Versions already in the index are not
+    downloaded again, and content identical to a stored blob (the same config on
+    several devices, or unchanged across versions) is stored only once. Downloads
+    stream to disk through LocalConfig.download_to(), so memory stays bounded.
+
+    Args:
+        api_client: The Scm client.
+        root: Directory of the backup store; created if missing.
+        max_workers: Devices processed at the same time (default: 8).
+
+    """
+
+    def __init__(self, api_client, root: str, max_workers: int = 8):
+        """Open the store at root, loading its index."""
+        self.api_client = api_client
+        self.root = os.fspath(root)
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        for directory in ("blobs", "manifests", "tmp"):
+            os.makedirs(os.path.join(self.root, directory), exist_ok=True)
+        self._index_path = os.path.join(self.root, "index.json")
+        try:
+            with open(self._index_path) as f:
+                self._index: Dict[str, str] = json.load(f)
+        except FileNotFoundError:
+            self._index = {}
+
+    def run(self, devices: Iterable[str], latest_only: bool = True) -> BackupManifest:
+        """Back up devices and save the run's manifest.
+
+        A device whose versions cannot be listed or downloaded is reported in the
+        manifest with its error; the other devices are still backed up.
+
+        Args:
+            devices: Device serial numbers.
+            latest_only: Back up only each device's newest version (default: True);
+                False backs up every version listed.
+
+        Returns:
+            BackupManifest: The record of the run, also saved under manifests/.
+
+        """
+        devices = list(dict.fromkeys(devices))
+        started = datetime.now(timezone.utc)
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix="scm-backup") as pool:
+            results = list(pool.map(lambda device: self._backup(device, latest_only), devices))
+        self._save_json(self._index_path, self._index)
+
+        manifest = BackupManifest(
+            started=started.isoformat(),
+            finished=datetime.now(timezone.utc).isoformat(),
+            devices=results,
+        )
+        manifest.path = os.path.join(
+            self.root, "manifests", f"backup-{started.strftime('%Y%m%dT%H%M%S%fZ')}.json"
+        )
+        self._save_json(manifest.path, manifest.to_dict())
+        logger.info(f"Backup of {len(devices)} devices: {manifest.summary()}")
+        return manifest
+
+    def lookup(self, device: str, version: str) -> Optional[str]:
+        """Return the blob path of a stored version, or None."""
+        with self._lock:
+            sha256 = self._index.get(f"{device}/{version}")
+        return self.blob_path(sha256) if sha256 else None
+
+    def blob_path(self, sha256: str) -> str:
+        """Return the path of the blob holding content with this SHA-256."""
+        return os.path.join(self.root, "blobs", sha256[:2], f"{sha256}.xml")
+
+    def _backup(self, device: str, latest_only: bool) -> DeviceBackup:
+        """List and store one device's versions, timing each step."""
+        backup = DeviceBackup(device)
+        start = time.perf_counter()
+        try:
+            versions = self.api_client.local_config.list_versions(device)
+        except Exception as e:
+            backup.error = _describe(e)
+            backup.list_seconds = time.perf_counter() - start
+            return backup
+        backup.list_seconds = time.perf_counter() - start
+        if latest_only and versions:
+            versions = [max(versions, key=lambda v: v.timestamp)]
+
+        start = time.perf_counter()
+        try:
+            for version in versions:
+                backup.versions.append(self._store(device, version))
+        except Exception as e:
+            logger.warning(f"Backup of {device} failed: {_describe(e)}")
+            backup.error = _describe(e)
+        backup.download_seconds = time.perf_counter() - start
+        return backup
+
+    def _store(self, device: str, version: LocalConfigVersionModel) -> VersionBackup:
+        """Download a version unless already stored, keeping its content once."""
+        key = f"{device}/{version.id}"
+        with self._lock:
+            sha256 = self._index.get(key)
+        if sha256 is not None and os.path.exists(self.blob_path(sha256)):
+            size = os.path.getsize(self.blob_path(sha256))
+            return VersionBackup(str(version.id), version.local_version, sha256, size, STORED)
+
+        temporary = os.path.join(self.root, "tmp", f"{device}-{version.id}.xml")
+        result = self.api_client.local_config.download_to(
+            device, str(version.id), temporary, md5=version.md5
+        )
+        blob = self.blob_path(result.sha256)
+        with self._lock:
+            if os.path.exists(blob):
+                outcome = DUPLICATE
+                os.remove(temporary)
+            else:
+                outcome = NEW
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                os.replace(temporary, blob)
+            os.remove(f"{temporary}.meta.json")
+            self._index[key] = result.sha256
+        return VersionBackup(
+            str(version.id), version.local_version, result.sha256, result.size, outcome
+        )
+
+    def _save_json(self, path: str, data: Any) -> None:
+        """Write JSON to path atomically."""
+        with self._lock:
+            with open(f"{path}.tmp", "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(f"{path}.tmp", path)
+
+
+def _describe(error: Exception) -> str:
+    """Describe an error for the manifest, using an APIError's message when set."""
+    return f"{type(error).__name__}: {getattr(error, 'message', None) or error}"
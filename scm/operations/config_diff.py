@@ -0,0 +1,377 @@
+"""Structural diff of device local-configuration XML.
+
+Hashes a PAN-OS configuration into a Merkle tree keyed by xpath step and entry
+name, then compares two trees top-down, descending only into subtrees whose
+hashes differ. Unchanged parts of a configuration, which are usually nearly all
+of it, are skipped in one comparison each.
+"""
+
+# scm/operations/config_diff.py
+
+# Standard library imports
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree.ElementTree import Element, fromstring
+from xml.parsers import expat
+
+ADDED = "added"
+REMOVED = "removed"
+MODIFIED = "modified"
+REORDERED = "reordered"
+
+# A child is a container Node, a subtree not yet parsed (Raw), a leaf's text,
+# or a tuple for a member list or other repeated children
+Value = Union["Node", "Raw", str, Tuple[Any, ...]]
+
+
+class Node:
+    """A container element: its children by xpath step, and the hash of its subtree.
+
+    digest covers the children and the order of named entries among them; order
+    is the hash of that order alone, so a reorder is only looked for when it differs.
+    """
+
+    __slots__ = ("children", "digest", "order")
+
+    def __init__(self, children: Dict[str, Value]):
+        """Hold children in document order and hash them."""
+        self.children = children
+        self.order, self.digest = _digest(children)
+
+
+class Raw:
+    """A subtree holding no named entries, kept as its bytes and their hash."""
+
+    __slots__ = ("data", "digest")
+
+    def __init__(self, data: memoryview):
+        """Hash the subtree's bytes."""
+        self.data = data
+        self.digest = hashlib.blake2b(data, digest_size=16).digest()
+
+
+@dataclass
+class ConfigChange:
+    """One difference between two configurations.
+
+    Attributes:
+        action: "added", "removed", "modified" or "reordered".
+        xpath: Where the change is, e.g.
+            /config/shared/address/entry[@name='web']/ip-netmask.
+        entry: Xpath of the named entry holding the change (or the entry itself,
+            when an entry was added or removed); "" outside any entry.
+        old: The old value, or None when added. Containers are dictionaries,
+            lists of members are lists, leaves are strings; for "reordered", the
+            entry names in their old order.
+        new: The new value, or None when removed.
+
+    """
+
+    action: str
+    xpath: str
+    entry: str
+    old: Any = None
+    new: Any = None
+
+
+@dataclass
+class EntryChange:
+    """The changes to one named entry.
+
+    Attributes:
+        xpath: Xpath of the entry.
+        action: "added" or "removed" if the whole entry was, else "modified".
+        changes: The changes within the entry.
+
+    """
+
+    xpath: str
+    action: str
+    changes: List[ConfigChange] = field(default_factory=list)
+
+
+@dataclass
+class ConfigDiff:
+    """The differences between two configurations, in document order.
+
+    Attributes:
+        changes: Every change found.
+
+    """
+
+    changes: List[ConfigChange] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[ConfigChange]:
+        """Iterate over the changes."""
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        """Return the number of changes."""
+        return len(self.changes)
+
+    def summary(self) -> Dict[str, int]:
+        """Count changes by action."""
+        counts = {ADDED: 0, REMOVED: 0, MODIFIED: 0, REORDERED: 0}
+        for change in self.changes:
+            counts[change.action] += 1
+        return counts
+
+    def entries(self) -> List[EntryChange]:
+        """Group the changes by the named entry holding them, in document order."""
+        grouped: Dict[str, EntryChange] = {}
+        for change in self.changes:
+            entry = grouped.get(change.entry)
+            if entry is None:
+                whole = change.xpath == change.entry and change.action in (ADDED, REMOVED)
+                entry = grouped[change.entry] = EntryChange(
+                    change.entry, change.action if whole else MODIFIED
+                )
+            entry.changes.append(change)
+        return list(grouped.values())
+
+
+class ConfigTree:
+    """A configuration reduced to a hash tree, ready to diff.
+
+    Elements holding named entries (address, rules, vsys, device groups and
+    their ancestors) become nodes keyed by xpath step. Every other subtree, such
+    as a single address or rule, is hashed straight from its bytes and only
+    parsed if it differs from its counterpart, so building the tree costs little
+    more than scanning the XML. A tree can be kept and compared against several
+    versions:
+
+        current = ConfigTree.parse("running.xml")
+        diff = ConfigTree.parse("previous.xml").diff(current)
+
+    Attributes:
+        root: The root element's node.
+        tag: The root element's tag.
+        size: Size of the configuration in bytes; the tree keeps these bytes.
+
+    """
+
+    def __init__(self, root: Node, tag: str, size: int):
+        """Hold a parsed tree."""
+        self.root = root
+        self.tag = tag
+        self.size = size
+
+    @property
+    def digest(self) -> str:
+        """Hex digest of the whole configuration's structure and values."""
+        return self.root.digest.hex()
+
+    @classmethod
+    def parse(cls, source: Union[bytes, str, "os.PathLike[str]", BinaryIO]) -> "ConfigTree":
+        """Build the hash tree of a configuration.
+
+        Args:
+            source: The XML as bytes (e.g. LocalConfig.download() output), a file path,
+                or a binary file-like object.
+
+        Returns:
+            ConfigTree: The parsed tree.
+
+        Raises:
+            xml.parsers.expat.ExpatError: If the XML is not well-formed.
+
+        """
+        if isinstance(source, bytes):
+            data = source
+        elif hasattr(source, "read"):
+            data = source.read()
+        else:
+            with open(source, "rb") as f:
+                data = f.read()
+        view = memoryview(data)
+        parser = expat.ParserCreate()
+
+        # One frame per open element: [xpath step, start offset, holds named entries,
+        # children as (step, start, end, Node or None), attributes]
+        stack: List[list] = [["", 0, False, [], {}]]
+
+        def start(tag: str, attrs: Dict[str, str]) -> None:
+            name = attrs.get("name")
+            if name is None:
+                step = tag
+            else:
+                step = _step(tag, name)
+                stack[-1][2] = True
+            stack.append([step, parser.CurrentByteIndex, False, [], attrs])
+
+        def end(tag: str) -> None:
+            step, begin, nested, children, attrs = stack.pop()
+            index = parser.CurrentByteIndex
+            tail = index - 2
+            if not children and data[tail:index] == b"/>":
+                # Self-closing: expat reports the offset just past the tag
+                finish = index
+            else:
+                finish = data.index(b">", index) + 1
+            node = _node(children, attrs, view) if nested else None
+            if node is not None:
+                stack[-1][2] = True
+            stack[-1][3].append((step, begin, finish, node))
+
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.Parse(data, True)
+
+        step, begin, finish, root = stack[0][3][0]
+        if root is None:
+            expanded = _expand(Raw(view[begin:finish]))
+            root = expanded if isinstance(expanded, Node) else Node({})
+        return cls(root, step.split("[", 1)[0], len(data))
+
+    def diff(self, other: "ConfigTree") -> ConfigDiff:
+        """Compare this (older) configuration with other (newer) one.
+
+        Returns:
+            ConfigDiff: What other adds, removes, modifies and reorders.
+
+        """
+        result = ConfigDiff()
+        path = f"/{self.tag}"
+        if self.tag != other.tag:
+            result.changes.append(
+                ConfigChange(MODIFIED, path, "", _plain(self.root), _plain(other.root))
+            )
+        else:
+            _compare(self.root, other.root, path, "", result.changes)
+        return result
+
+
+def diff_configs(
+    old: Union[bytes, str, "os.PathLike[str]", BinaryIO, ConfigTree],
+    new: Union[bytes, str, "os.PathLike[str]", BinaryIO, ConfigTree],
+) -> ConfigDiff:
+    """Diff two configurations, given as sources for ConfigTree.parse() or parsed trees.
+
+    Returns:
+        ConfigDiff: What new adds, removes, modifies and reorders relative to old.
+
+    """
+    if not isinstance(old, ConfigTree):
+        old = ConfigTree.parse(old)
+    if not isinstance(new, ConfigTree):
+        new = ConfigTree.parse(new)
+    return old.diff(new)
+
+
+def _step(tag: str, name: Optional[str]) -> str:
+    """Return the xpath step for an element, keyed by name when it has one."""
+    if name is None:
+        return tag
+    quote = '"' if "'" in name else "'"
+    return f"{tag}[@name={quote}{name}{quote}]"
+
+
+def _node(
+    children: List[Tuple[str, int, int, Optional[Node]]],
+    attrs: Dict[str, str],
+    view: memoryview,
+) -> Optional[Node]:
+    """Build the node of an element holding named entries, or None if its keys repeat."""
+    mapping: Dict[str, Value] = {
+        f"@{name}": value for name, value in attrs.items() if name != "name"
+    }
+    for step, begin, finish, node in children:
+        if step in mapping:
+            return None
+        mapping[step] = Raw(view[begin:finish]) if node is None else node
+    return Node(mapping)
+
+
+def _expand(value: Value) -> Value:
+    """Parse a Raw subtree into nodes and values; other values are returned as is."""
+    if value.__class__ is not Raw:
+        return value
+    return _reduce(fromstring(bytes(value.data)))
+
+
+def _reduce(element: Element) -> Value:
+    """Reduce a parsed element to its text, a tuple of repeated children, or a Node."""
+    children = [(f"@{name}", value) for name, value in element.attrib.items() if name != "name"]
+    children.extend((_step(child.tag, child.get("name")), _reduce(child)) for child in element)
+    text = (element.text or "").strip()
+    if not children:
+        return text
+    if text:
+        children.append(("#text", text))
+    if all(key == "member" and value.__class__ is str for key, value in children):
+        return tuple(value for _, value in children)
+    mapping = dict(children)
+    if len(mapping) < len(children):
+        # Repeated unnamed children: an ordered value rather than a keyed node
+        return tuple((key, _plain(value)) for key, value in children)
+    return Node(mapping)
+
+
+def _digest(children: Dict[str, Value]) -> Tuple[bytes, bytes]:
+    """Hash the order of named entries, then the children by key together with that order."""
+    named = [key for key in children if _named(key)]
+    order = hashlib.blake2b("\0".join(named).encode(), digest_size=16).digest() if named else b""
+    parts = [order.hex()]
+    for key in sorted(children):
+        value = children[key]
+        if value.__class__ is str:
+            parts.append(f"{key}\0S{value}")
+        elif value.__class__ is Raw or value.__class__ is Node:
+            parts.append(f"{key}\0H{value.digest.hex()}")
+        else:
+            parts.append(f"{key}\0J{json.dumps(_plain(value))}")
+    return order, hashlib.blake2b("\1".join(parts).encode(), digest_size=16).digest()
+
+
+def _plain(value: Value) -> Any:
+    """Convert a value to plain data: dictionaries, lists and strings."""
+    value = _expand(value)
+    if isinstance(value, Node):
+        return {key: _plain(child) for key, child in value.children.items()}
+    if isinstance(value, tuple):
+        return [list(item) if isinstance(item, tuple) else item for item in value]
+    return value
+
+
+def _compare(old: Node, new: Node, path: str, entry: str, changes: List[ConfigChange]) -> None:
+    """Append the differences between two nodes, skipping subtrees with equal digests."""
+    if old.digest == new.digest:
+        return
+    for key, value in new.children.items():
+        xpath = f"{path}/{key}"
+        within = xpath if _named(key) else entry
+        if key not in old.children:
+            changes.append(ConfigChange(ADDED, xpath, within, new=_plain(value)))
+            continue
+        previous = old.children[key]
+        if previous.__class__ is Raw and value.__class__ is Raw and previous.digest == value.digest:
+            continue
+        previous, value = _expand(previous), _expand(value)
+        if isinstance(previous, Node) and isinstance(value, Node):
+            _compare(previous, value, xpath, within, changes)
+        elif previous != value:
+            changes.append(ConfigChange(MODIFIED, xpath, within, _plain(previous), _plain(value)))
+    for key, value in old.children.items():
+        if key not in new.children:
+            xpath = f"{path}/{key}"
+            within = xpath if _named(key) else entry
+            changes.append(ConfigChange(REMOVED, xpath, within, old=_plain(value)))
+
+    if old.order != new.order:
+        before = [_name(key) for key in old.children if _named(key) and key in new.children]
+        after = [_name(key) for key in new.children if _named(key) and key in old.children]
+        if before != after:
+            changes.append(ConfigChange(REORDERED, path, entry, before, after))
+
+
+def _named(step: str) -> bool:
+    """Whether an xpath step is keyed by entry name."""
+    return "[@name=" in step
+
+
+def _name(step: str) -> str:
+    """Return the entry name of a keyed xpath step."""
+    return step.split("[@name=", 1)[1][1:-2]
@@ -0,0 +1,245 @@
+"""Streaming parser for device local-configuration XML.
+
+Reads a PAN-OS configuration with iterparse and yields one typed record per
+address, address group, service, security rule and NAT rule, removing every
+element from the tree once it has been read, so that memory use stays flat
+whatever the size of the file.
+"""
+
+# scm/operations/config_parser.py
+
+# Standard library imports
+from dataclasses import dataclass
+import io
+import logging
+import os
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from xml.etree.ElementTree import Element, iterparse
+
+# External libraries
+from pydantic import BaseModel, ValidationError
+
+# Local SDK imports
+from scm.models.network import NatRuleCreateModel
+from scm.models.objects import AddressCreateModel, AddressGroupCreateModel, ServiceCreateModel
+from scm.models.security import SecurityRuleCreateModel
+
+logger = logging.getLogger(__name__)
+
+# Elements holding objects by kind, keyed by unified client service name
+OBJECT_TAGS: Dict[str, str] = {
+    "address": "address",
+    "address-group": "address_group",
+    "service": "service",
+}
+RULE_TAGS: Dict[str, str] = {
+    "security": "security_rule",
+    "nat": "nat_rule",
+}
+RULEBASE_TAGS: Dict[str, Optional[str]] = {
+    "rulebase": None,
+    "pre-rulebase": "pre",
+    "post-rulebase": "post",
+}
+# Containers of entries that hold objects and rules
+LOCATION_PARENTS = ("vsys", "device-group")
+
+
+@dataclass
+class ConfigRecord:
+    """One object or rule read from a configuration.
+
+    Attributes:
+        kind: Unified client service name: "address", "address_group", "service",
+            "security_rule" or "nat_rule".
+        name: The entry's name.
+        location: "shared", or the vsys or device group holding the entry.
+        model: The entry as the matching scm.models create model, if it validated.
+        rulebase: "pre" or "post" for rules in a Panorama pre- or post-rulebase.
+        error: Why the entry did not validate, if it did not.
+
+    """
+
+    kind: str
+    name: str
+    location: str
+    model: Optional[BaseModel] = None
+    rulebase: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the entry was converted to a model."""
+        return self.model is not None
+
+
+def _to_data(element: Element) -> Any:
+    """Convert an element to plain data: text, a list of members, or a dictionary."""
+    children = list(element)
+    if not children:
+        return (element.text or "").strip()
+    if all(child.tag == "member" for child in children):
+        return [(child.text or "").strip() for child in children]
+    return {child.tag.replace("-", "_"): _to_data(child) for child in children}
+
+
+def _fields(model: Type[BaseModel], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the entries of data that model has a field (or alias) for."""
+    names = set(model.model_fields)
+    names.update(field.alias for field in model.model_fields.values() if field.alias)
+    return {key: value for key, value in data.items() if key in names}
+
+
+def _service(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a service entry's protocol, keeping override timeouts when set."""
+    protocol = {}
+    for name, settings in (data.get("protocol") or {}).items():
+        if name not in ("tcp", "udp") or not isinstance(settings, dict):
+            continue
+        protocol[name] = {"port": settings.get("port")}
+        override = settings.get("override")
+        if isinstance(override, dict) and isinstance(override.get("yes"), dict):
+            protocol[name]["override"] = override["yes"]
+    return {**_fields(ServiceCreateModel, data), "protocol": protocol}
+
+
+def _security_rule(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a security rule entry; only profile groups carry over as profile settings."""
+    fields = _fields(SecurityRuleCreateModel, data)
+    profile = fields.pop("profile_setting", None)
+    if isinstance(profile, dict) and "group" in profile:
+        fields["profile_setting"] = {"group": profile["group"]}
+    return fields
+
+
+MODELS: Dict[str, Tuple[Type[BaseModel], Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "address": (AddressCreateModel, lambda data: _fields(AddressCreateModel, data)),
+    "address_group": (
+        AddressGroupCreateModel,
+        lambda data: _fields(AddressGroupCreateModel, data),
+    ),
+    "service": (ServiceCreateModel, _service),
+    "security_rule": (SecurityRuleCreateModel, _security_rule),
+    "nat_rule": (NatRuleCreateModel, lambda data: _fields(NatRuleCreateModel, data)),
+}
+
+
+def _match(stack: List[Element]) -> Optional[Tuple[str, str, Optional[str]]]:
+    """Return (kind, location, rulebase) if the top of the stack is a wanted entry."""
+    tags = [element.tag for element in stack]
+    if len(tags) >= 3 and tags[-1] == "entry" and tags[-2] in OBJECT_TAGS:
+        location = _location(stack[:-2])
+        if location is not None:
+            return OBJECT_TAGS[tags[-2]], location, None
+    if (
+        len(tags) >= 5
+        and tags[-1] == "entry"
+        and tags[-2] == "rules"
+        and tags[-3] in RULE_TAGS
+        and tags[-4] in RULEBASE_TAGS
+    ):
+        location = _location(stack[:-4])
+        if location is not None:
+            return RULE_TAGS[tags[-3]], location, RULEBASE_TAGS[tags[-4]]
+    return None
+
+
+def _location(ancestors: List[Element]) -> Optional[str]:
+    """Name the location an entry's container sits in, or None if it is not one."""
+    if not ancestors:
+        return None
+    if ancestors[-1].tag == "shared":
+        return "shared"
+    if (
+        len(ancestors) >= 2
+        and ancestors[-1].tag == "entry"
+        and ancestors[-2].tag in LOCATION_PARENTS
+    ):
+        return ancestors[-1].get("name")
+    return None
+
+
+def iter_config_records(
+    source: Union[bytes, str, "os.PathLike[str]", BinaryIO],
+    kinds: Optional[Iterable[str]] = None,
+    device: Optional[str] = None,
+) -> Iterator[ConfigRecord]:
+    """Stream the objects and rules of a configuration as typed records.
+
+    Elements are removed from the tree as soon as they have been read, so memory
+    use stays flat however large the configuration. Entries that do not validate
+    against their model are yielded with error set rather than raised.
+
+    Args:
+        source: The XML as bytes (e.g. LocalConfig.download() output), a file path,
+            or a binary file-like object.
+        kinds: Kinds to yield (default: all of MODELS).
+        device: Device container for the models (default: the record's location).
+
+    Yields:
+        ConfigRecord: One per entry, in document order.
+
+    """
+    wanted = set(MODELS) if kinds is None else set(kinds)
+    unknown = wanted - set(MODELS)
+    if unknown:
+        raise ValueError(f"Unknown kinds: {', '.join(sorted(unknown))}")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    stack: List[Element] = []
+    collecting: Optional[Element] = None
+    found: Optional[Tuple[str, str, Optional[str]]] = None
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(element)
+            if collecting is None:
+                found = _match(stack)
+                if found is not None and found[0] in wanted:
+                    collecting = element
+            continue
+
+        stack.pop()
+        if element is collecting:
+            kind, location, rulebase = found
+            yield _record(element, kind, location, rulebase, device)
+            collecting = None
+        if collecting is None and stack:
+            # Drop what has been read; the parent holds at most this one child
+            stack[-1].remove(element)
+
+
+def _record(
+    element: Element,
+    kind: str,
+    location: str,
+    rulebase: Optional[str],
+    device: Optional[str],
+) -> ConfigRecord:
+    """Convert an entry element into a record holding its model, or its error."""
+    name = element.get("name", "")
+    model_class, mapper = MODELS[kind]
+    data = _to_data(element)
+    fields = mapper(data if isinstance(data, dict) else {})
+    try:
+        model = model_class(**fields, name=name, device=device or location)
+    except ValidationError as e:
+        logger.debug(f"Skipping {kind} {name} in {location}: {e}")
+        error = "; ".join(
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+            for err in e.errors()
+        )
+        return ConfigRecord(kind, name, location, rulebase=rulebase, error=error)
+    return ConfigRecord(kind, name, location, model, rulebase)
@@ -1,15 +1,54 @@
 """DeviceOperations service for Operations API."""
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import logging
 import time
-from typing import List, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from scm.exceptions import JobTimeoutError
+from pydantic import ValidationError
+
+from scm.exceptions import APIError, JobTimeoutError
 from scm.models.operations.device_operations import (
+    DeviceJobResultModel,
     DeviceJobStatusModel,
     DeviceOperationsRequestModel,
     JobCreatedModel,
 )
 from scm.services import ServiceBase
+from scm.utils.backoff import Backoff
+from scm.utils.ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Most devices a single device operations job accepts
+MAX_DEVICES_PER_JOB = 5
+
+
+@dataclass
+class DeviceResult:
+    """The outcome of a fleet operation for one device.
+
+    Attributes:
+        device: Device serial number.
+        job_id: The job that covered the device, if it was dispatched.
+        state: The device's state in the job, or "error" if it was never dispatched
+            and "timeout" if its job did not finish in time.
+        result: The device's result from the job, if the job reported one.
+        error: Why the device has no result: a validation, API or timeout error.
+
+    """
+
+    device: str
+    job_id: Optional[str]
+    state: str
+    result: Optional[DeviceJobResultModel] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the device completed the operation."""
+        return self.state == "complete" and self.error is None
 
 
 class DeviceOperations(ServiceBase):
@@ -22,7 +61,7 @@ class DeviceOperations(ServiceBase):
         endpoint: str,
         devices: List[str],
         sync: bool = False,
-        poll_interval: int = 10,
+        poll_interval: Optional[float] = None,
         timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Dispatch a device operation job.
@@ -31,7 +70,8 @@ class DeviceOperations(ServiceBase):
             endpoint: Job endpoint path (e.g., "jobs/route-table").
             devices: List of 1-5 device serial numbers.
             sync: If True, poll until job completes or times out.
-            poll_interval: Seconds between polls when sync=True.
+            poll_interval: Seconds between polls when sync=True. None (the default) polls
+                adaptively: 0.5 seconds at first, backing off with jitter to 10 seconds.
             timeout: Max seconds to wait when sync=True.
 
         Returns:
@@ -52,6 +92,7 @@ class DeviceOperations(ServiceBase):
         if not sync:
             return job
 
+        delays = Backoff().delays()
         start_time = time.time()
         while True:
             status = self.get_job_status(job.job_id)
@@ -65,7 +106,111 @@ class DeviceOperations(ServiceBase):
                     timeout=timeout,
                 )
 
-            time.sleep(poll_interval)
+            time.sleep(next(delays) if poll_interval is None else poll_interval)
+
+    def _dispatch_fleet(
+        self,
+        endpoint: str,
+        devices: List[str],
+        timeout: int = 300,
+        max_workers: int = 4,
+        rate: float = 2.0,
+        backoff: Optional[Backoff] = None,
+    ) -> Iterator[DeviceResult]:
+        """Dispatch a device operation to any number of devices, five per job.
+
+        Devices are split into jobs of at most MAX_DEVICES_PER_JOB, dispatched from
+        max_workers threads at no more than rate jobs per second. One poll loop then
+        reads the status of every running job each round, backing off between rounds,
+        and results are yielded per device as each job finishes.
+
+        Args:
+            endpoint: Job endpoint path (e.g., "jobs/route-table").
+            devices: Device serial numbers; duplicates are dropped.
+            timeout: Max seconds to wait for each job after its dispatch.
+            max_workers: Threads dispatching jobs and reading their statuses.
+            rate: Most jobs dispatched per second.
+            backoff: Intervals between poll rounds (default: Backoff()).
+
+        Yields:
+            DeviceResult: One per device, in the order their jobs finish. Invalid
+            serials, failed dispatches and timeouts are reported, not raised.
+
+        """
+        backoff = backoff or Backoff()
+        valid = []
+        for device in dict.fromkeys(devices):
+            try:
+                DeviceOperationsRequestModel(devices=[device])
+            except ValidationError as e:
+                yield DeviceResult(device, None, "error", error=e)
+                continue
+            valid.append(device)
+        chunks = []
+        for start in range(0, len(valid), MAX_DEVICES_PER_JOB):
+            end = start + MAX_DEVICES_PER_JOB
+            chunks.append(valid[start:end])
+        limiter = RateLimiter(rate)
+
+        def dispatch(chunk: List[str]) -> JobCreatedModel:
+            limiter.acquire()
+            return self._dispatch_job(endpoint, chunk)
+
+        with ThreadPoolExecutor(max_workers, thread_name_prefix="scm-device-ops") as dispatcher:
+            with ThreadPoolExecutor(max_workers, thread_name_prefix="scm-device-poll") as poller:
+                dispatching: Dict[Future, List[str]] = {
+                    dispatcher.submit(dispatch, chunk): chunk for chunk in chunks
+                }
+                running: Dict[str, Tuple[List[str], float]] = {}
+                attempt = 0
+                try:
+                    while dispatching or running:
+                        for future in [f for f in dispatching if f.done()]:
+                            chunk = dispatching.pop(future)
+                            try:
+                                job = future.result()
+                            except Exception as e:
+                                logger.warning(f"Dispatch to {', '.join(chunk)} failed: {e}")
+                                for device in chunk:
+                                    yield DeviceResult(device, None, "error", error=e)
+                                continue
+                            running[job.job_id] = (chunk, time.monotonic() + timeout)
+                            attempt = 0
+
+                        if running:
+                            job_ids = list(running)
+                            for job_id, status in zip(job_ids, poller.map(self._poll, job_ids)):
+                                chunk, deadline = running[job_id]
+                                if status is not None and status.state in ("complete", "failed"):
+                                    del running[job_id]
+                                    yield from _device_results(job_id, chunk, status)
+                                elif time.monotonic() >= deadline:
+                                    del running[job_id]
+                                    last_state = status.state if status else "unknown"
+                                    error = JobTimeoutError(job_id, last_state, timeout)
+                                    for device in chunk:
+                                        yield DeviceResult(device, job_id, "timeout", error=error)
+
+                        if dispatching or running:
+                            delay = backoff.delay(attempt)
+                            attempt += 1
+                            if dispatching:
+                                # Wake early when another job has been dispatched
+                                wait(dispatching, timeout=delay, return_when=FIRST_COMPLETED)
+                            else:
+                                time.sleep(delay)
+                finally:
+                    # Stop dispatching if the caller stops iterating early
+                    for future in dispatching:
+                        future.cancel()
+
+    def _poll(self, job_id: str) -> Optional[DeviceJobStatusModel]:
+        """Read a job's status, or None if it could not be read this round."""
+        try:
+            return self.get_job_status(job_id)
+        except APIError as e:
+            logger.debug(f"Status of device job {job_id} unavailable: {e}")
+            return None
 
     def get_job_status(self, job_id: str) -> DeviceJobStatusModel:
         """Get the status of a device operations job.
@@ -82,51 +227,116 @@ class DeviceOperations(ServiceBase):
 
     def route_table(
         self, devices: List[str], sync: bool = False,
-        poll_interval: int = 10, timeout: int = 300,
+        poll_interval: Optional[float] = None, timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Retrieve route table from device(s)."""
         return self._dispatch_job("jobs/route-table", devices, sync, poll_interval, timeout)
 
     def fib_table(
         self, devices: List[str], sync: bool = False,
-        poll_interval: int = 10, timeout: int = 300,
+        poll_interval: Optional[float] = None, timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Retrieve FIB table from device(s)."""
         return self._dispatch_job("jobs/fib-table", devices, sync, poll_interval, timeout)
 
     def dns_proxy(
         self, devices: List[str], sync: bool = False,
-        poll_interval: int = 10, timeout: int = 300,
+        poll_interval: Optional[float] = None, timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Retrieve DNS proxy configuration from device(s)."""
         return self._dispatch_job("jobs/dns-proxy", devices, sync, poll_interval, timeout)
 
     def device_interfaces(
         self, devices: List[str], sync: bool = False,
-        poll_interval: int = 10, timeout: int = 300,
+        poll_interval: Optional[float] = None, timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Retrieve network interfaces from device(s)."""
         return self._dispatch_job("jobs/device-interfaces", devices, sync, poll_interval, timeout)
 
     def device_rules(
         self, devices: List[str], sync: bool = False,
-        poll_interval: int = 10, timeout: int = 300,
+        poll_interval: Optional[float] = None, timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Retrieve security rules from device(s)."""
         return self._dispatch_job("jobs/device-rules", devices, sync, poll_interval, timeout)
 
     def bgp_policy_export(
         self, devices: List[str], sync: bool = False,
-        poll_interval: int = 10, timeout: int = 300,
+        poll_interval: Optional[float] = None, timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Retrieve BGP policy export from device(s)."""
         return self._dispatch_job("jobs/bgp-policy-export", devices, sync, poll_interval, timeout)
 
     def logging_service_status(
         self, devices: List[str], sync: bool = False,
-        poll_interval: int = 10, timeout: int = 300,
+        poll_interval: Optional[float] = None, timeout: int = 300,
     ) -> Union[JobCreatedModel, DeviceJobStatusModel]:
         """Retrieve logging service forwarding status from device(s)."""
         return self._dispatch_job(
             "jobs/logging-service-forwarding-status", devices, sync, poll_interval, timeout
         )
+
+    def route_table_fleet(
+        self, devices: List[str], timeout: int = 300,
+        max_workers: int = 4, rate: float = 2.0,
+    ) -> Iterator[DeviceResult]:
+        """Retrieve route tables from a fleet of devices."""
+        return self._dispatch_fleet("jobs/route-table", devices, timeout, max_workers, rate)
+
+    def fib_table_fleet(
+        self, devices: List[str], timeout: int = 300,
+        max_workers: int = 4, rate: float = 2.0,
+    ) -> Iterator[DeviceResult]:
+        """Retrieve FIB tables from a fleet of devices."""
+        return self._dispatch_fleet("jobs/fib-table", devices, timeout, max_workers, rate)
+
+    def dns_proxy_fleet(
+        self, devices: List[str], timeout: int = 300,
+        max_workers: int = 4, rate: float = 2.0,
+    ) -> Iterator[DeviceResult]:
+        """Retrieve DNS proxy configuration from a fleet of devices."""
+        return self._dispatch_fleet("jobs/dns-proxy", devices, timeout, max_workers, rate)
+
+    def device_interfaces_fleet(
+        self, devices: List[str], timeout: int = 300,
+        max_workers: int = 4, rate: float = 2.0,
+    ) -> Iterator[DeviceResult]:
+        """Retrieve network interfaces from a fleet of devices."""
+        return self._dispatch_fleet("jobs/device-interfaces", devices, timeout, max_workers, rate)
+
+    def device_rules_fleet(
+        self, devices: List[str], timeout: int = 300,
+        max_workers: int = 4, rate: float = 2.0,
+    ) -> Iterator[DeviceResult]:
+        """Retrieve security rules from a fleet of devices."""
+        return self._dispatch_fleet("jobs/device-rules", devices, timeout, max_workers, rate)
+
+    def bgp_policy_export_fleet(
+        self, devices: List[str], timeout: int = 300,
+        max_workers: int = 4, rate: float = 2.0,
+    ) -> Iterator[DeviceResult]:
+        """Retrieve BGP policy exports from a fleet of devices."""
+        return self._dispatch_fleet("jobs/bgp-policy-export", devices, timeout, max_workers, rate)
+
+    def logging_service_status_fleet(
+        self, devices: List[str], timeout: int = 300,
+        max_workers: int = 4, rate: float = 2.0,
+    ) -> Iterator[DeviceResult]:
+        """Retrieve logging service forwarding status from a fleet of devices."""
+        return self._dispatch_fleet(
+            "jobs/logging-service-forwarding-status", devices, timeout, max_workers, rate
+        )
+
+
+def _device_results(
+    job_id: str, chunk: List[str], status: DeviceJobStatusModel
+) -> Iterator[DeviceResult]:
+    """Split a finished job's status into one result per device."""
+    by_device = {result.device: result for result in status.results}
+    for device in chunk:
+        result = by_device.get(device)
+        if result is None:
+            error = APIError(f"Job {job_id} has no result for device {device}")
+            yield DeviceResult(device, job_id, status.state, error=error)
+        else:
+            yield DeviceResult(device, job_id, result.state, result=result)
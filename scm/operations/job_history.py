@@ -0,0 +1,242 @@
+"""Streaming job history with a local index for Strata Cloud Manager jobs.
+
+Pages through the whole job list instead of one page, indexes every job it
+sees by id, parent, type, status and start time, and refreshes incrementally
+by reading only the pages that hold jobs newer than those already indexed.
+"""
+
+# scm/operations/job_history.py
+
+# Standard library imports
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timezone
+import logging
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# Local SDK imports
+from scm.models.operations import JobListItem
+
+logger = logging.getLogger(__name__)
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a job timestamp into a naive UTC datetime, or None."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return _naive(parsed)
+
+
+def _naive(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC; naive values are returned as is."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class JobHistory:
+    """Stream every SCM job page by page and index the jobs locally.
+
+    list_jobs() returns one page, newest first, and its parent_id filter only
+    applies to that page. JobHistory reads as many pages as needed and keeps
+    each job it sees, so that children, types, statuses and time windows are
+    answered from memory:
+
+        history = JobHistory(client)
+        for job in history.stream():  # pages through all jobs
+            ...
+        history.children("1586")
+        history.find(type_str="CommitAndPush", status_str="FIN", since=yesterday)
+        new_jobs = history.refresh()  # reads only the newest pages
+
+    A job seen again replaces its earlier entry, so statuses stay current for
+    the jobs on the pages read.
+
+    Args:
+        api_client: The Scm client.
+        page_size: Jobs per list_jobs() page (default: 200).
+
+    """
+
+    def __init__(self, api_client, page_size: int = 200):
+        """Initialize an empty history."""
+        self.api_client = api_client
+        self.page_size = page_size
+        self.pages = 0
+        self._jobs: Dict[str, JobListItem] = {}
+        self._by_parent: Dict[str, Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_start: List[Tuple[datetime, str]] = []
+        self._newest: Optional[JobListItem] = None
+
+    def stream(self, limit: Optional[int] = None) -> Iterator[JobListItem]:
+        """Yield jobs newest first, reading pages until the list ends.
+
+        Each job is indexed as it is yielded, so stopping early keeps what was read.
+
+        Args:
+            limit: Stop after this many jobs (default: all of them).
+
+        Yields:
+            JobListItem: Each job in the order list_jobs() returns them.
+
+        """
+        count = 0
+        for page in self._pages():
+            for job in page:
+                self._add(job)
+                yield job
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def load(self) -> int:
+        """Read and index every job.
+
+        Returns:
+            int: Number of jobs in the index.
+
+        """
+        for _ in self.stream():
+            pass
+        return len(self._jobs)
+
+    def refresh(self) -> List[JobListItem]:
+        """Read only the pages holding jobs newer than the newest one indexed.
+
+        Pages are read from the newest job on until a page reaches a job at or
+        below the previous newest id (or start time, for non-numeric ids). Jobs
+        already indexed on those pages are updated. With nothing indexed yet
+        every job is read.
+
+        Returns:
+            List[JobListItem]: The jobs not indexed before, newest first.
+
+        """
+        newest = self._newest
+        added = []
+        for page in self._pages():
+            reached = False
+            for job in page:
+                if newest is not None and not _newer(job, newest):
+                    reached = True
+                if job.id not in self._jobs:
+                    added.append(job)
+                self._add(job)
+            if reached:
+                break
+        logger.debug(f"Job history refresh found {len(added)} new jobs")
+        return added
+
+    def get(self, job_id: str) -> Optional[JobListItem]:
+        """Return an indexed job by id, or None."""
+        return self._jobs.get(job_id)
+
+    def children(self, parent_id: str) -> List[JobListItem]:
+        """Return the indexed jobs whose parent is parent_id, newest first."""
+        return self._sorted(self._by_parent.get(parent_id, set()))
+
+    def find(
+        self,
+        type_str: Optional[str] = None,
+        status_str: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[JobListItem]:
+        """Return the indexed jobs matching every given criterion, newest first.
+
+        Args:
+            type_str: Job type, e.g. "CommitAndPush".
+            status_str: Job status, e.g. "FIN".
+            parent_id: Parent job id.
+            since: Earliest start time, inclusive; naive times are taken as UTC.
+            until: Latest start time, inclusive; naive times are taken as UTC.
+
+        Returns:
+            List[JobListItem]: The matching jobs.
+
+        """
+        candidates: Optional[Set[str]] = None
+        for index, key in (
+            (self._by_type, type_str),
+            (self._by_status, status_str),
+            (self._by_parent, parent_id),
+        ):
+            if key is not None:
+                ids = index.get(key, set())
+                candidates = ids if candidates is None else candidates & ids
+        if since is not None or until is not None:
+            low = bisect_left(self._by_start, (_naive(since), "")) if since else 0
+            high = (
+                bisect_right(self._by_start, (_naive(until), "\uffff"))
+                if until
+                else len(self._by_start)
+            )
+            in_window = {job_id for _, job_id in self._by_start[low:high]}
+            candidates = in_window if candidates is None else candidates & in_window
+        return self._sorted(set(self._jobs) if candidates is None else candidates)
+
+    def __len__(self) -> int:
+        """Return the number of indexed jobs."""
+        return len(self._jobs)
+
+    def __contains__(self, job_id: object) -> bool:
+        """Return whether a job id is indexed."""
+        return job_id in self._jobs
+
+    def __iter__(self) -> Iterator[JobListItem]:
+        """Iterate over the indexed jobs, newest first."""
+        return iter(self._sorted(set(self._jobs)))
+
+    def _pages(self) -> Iterator[List[JobListItem]]:
+        """Yield list_jobs() pages from the newest job on until the list ends."""
+        offset = 0
+        while True:
+            page = self.api_client.list_jobs(limit=self.page_size, offset=offset)
+            self.pages += 1
+            if page.data:
+                yield page.data
+            offset += self.page_size
+            if len(page.data) < self.page_size or offset >= page.total:
+                return
+
+    def _add(self, job: JobListItem) -> None:
+        """Index a job, replacing an earlier entry for the same id."""
+        old = self._jobs.get(job.id)
+        if old is not None:
+            self._by_parent[old.parent_id].discard(job.id)
+            self._by_type[old.type_str].discard(job.id)
+            self._by_status[old.status_str].discard(job.id)
+            started = _timestamp(old.start_ts)
+            if started is not None:
+                self._by_start.remove((started, job.id))
+        self._jobs[job.id] = job
+        self._by_parent.setdefault(job.parent_id, set()).add(job.id)
+        self._by_type.setdefault(job.type_str, set()).add(job.id)
+        self._by_status.setdefault(job.status_str, set()).add(job.id)
+        started = _timestamp(job.start_ts)
+        if started is not None:
+            insort(self._by_start, (started, job.id))
+        if self._newest is None or _newer(job, self._newest):
+            self._newest = job
+
+    def _sorted(self, job_ids: Set[str]) -> List[JobListItem]:
+        """Return jobs by id, newest first."""
+        return sorted((self._jobs[job_id] for job_id in job_ids), key=_order, reverse=True)
+
+
+def _order(job: JobListItem) -> Tuple[int, str, str]:
+    """Sort key placing newer jobs later: numeric id, then start time."""
+    return (int(job.id) if job.id.isdigit() else -1, job.start_ts or "", job.id)
+
+
+def _newer(job: JobListItem, than: JobListItem) -> bool:
+    """Whether job was created after than, by numeric id or else start time."""
+    if job.id.isdigit() and than.id.isdigit():
+        return int(job.id) > int(than.id)
+    return (job.start_ts or "") > (than.start_ts or "")
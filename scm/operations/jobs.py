@@ -0,0 +1,446 @@
+"""Multi-job watcher for Strata Cloud Manager configuration jobs.
+
+Tracks many job ids from one background thread that polls with adaptive
+intervals and reads statuses in bulk from list_jobs() pages, resolving one
+future per job as it reaches a terminal state. Commits are tracked the same
+way, together with the child jobs their push spawns.
+"""
+
+# scm/operations/jobs.py
+
+# Standard library imports
+import asyncio
+from collections import Counter
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+# Local SDK imports
+from scm.exceptions import APIError, JobTimeoutError
+from scm.models.operations import CandidatePushResponseModel, JobListItem
+from scm.utils.backoff import Backoff
+
+logger = logging.getLogger(__name__)
+
+# status_str values after which a job no longer changes
+TERMINAL_STATUSES: FrozenSet[str] = frozenset({"FIN", "FAIL", "ABORTED"})
+
+
+@dataclass
+class _Watched:
+    """A job being watched and the future resolved when it ends."""
+
+    future: Future
+    deadline: float
+    timeout: float
+    last: Optional[JobListItem] = None
+    callbacks: List[Callable[[JobListItem], None]] = field(default_factory=list)
+
+
+@dataclass
+class CommitResult:
+    """The outcome of a commit: its push job and the child jobs it spawned.
+
+    Attributes:
+        response: The response to the candidate push request.
+        job: Final status of the push job.
+        children: Final status of each child job (found by parent_id).
+
+    """
+
+    response: CandidatePushResponseModel
+    job: JobListItem
+    children: List[JobListItem] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the push job and all of its child jobs succeeded."""
+        return all(job.result_str == "OK" for job in [self.job, *self.children])
+
+
+class CommitFuture(Future):
+    """A future for a commit, resolved with a CommitResult once all its jobs end.
+
+    Cancelling it stops monitoring the commit's jobs; the SCM API has no way to
+    cancel the jobs themselves. The future can also be awaited from asyncio code.
+
+    Attributes:
+        response: The response to the candidate push request.
+        job_id: The push job id.
+        progress: Latest percent complete of the push job and each child job, by job id.
+
+    """
+
+    def __init__(self, response: CandidatePushResponseModel):
+        """Initialize the future for an accepted push request."""
+        super().__init__()
+        self.response = response
+        self.job_id = response.job_id
+        self.progress: Dict[str, int] = {}
+        self._jobs: List[Future] = []
+        self._jobs_lock = threading.Lock()
+
+    def cancel(self) -> bool:
+        """Cancel the future and stop watching the jobs behind it."""
+        cancelled = super().cancel()
+        if cancelled:
+            with self._jobs_lock:
+                jobs = list(self._jobs)
+            for future in jobs:
+                future.cancel()
+        return cancelled
+
+    def __await__(self):
+        """Wait for the commit from a coroutine."""
+        return asyncio.wrap_future(self).__await__()
+
+    def _track(self, future: Future) -> None:
+        """Tie a job's future to this one, so that cancelling this cancels it."""
+        with self._jobs_lock:
+            self._jobs.append(future)
+        if self.cancelled():
+            future.cancel()
+
+
+class JobWatcher:
+    """Watch many SCM jobs at once and resolve a future for each as it finishes.
+
+    One background thread polls for every watched job. Each poll reads list_jobs()
+    pages, newest first, until all watched jobs have been seen; jobs not found in
+    the first max_pages pages are read one by one with get_job_status(). Polls
+    follow the backoff: short right after a job is added, then exponentially longer
+    with jitter. The thread stops when nothing is left to watch.
+
+    Futures resolve to the job's JobListItem once its status_str is terminal (see
+    TERMINAL_STATUSES), whether the job succeeded or not; check result_str. A job
+    still running at its deadline fails its future with JobTimeoutError.
+
+    Args:
+        api_client: The Scm client.
+        backoff: Polling intervals (default: Backoff(), 0.5s growing to 10s).
+        page_size: Jobs per list_jobs() page (default: 100).
+        max_pages: Pages read per poll before falling back to per-job lookups (default: 5).
+        timeout: Default seconds to wait for a job (default: 300).
+        terminal: status_str values that end a job (default: TERMINAL_STATUSES).
+
+    """
+
+    def __init__(
+        self,
+        api_client,
+        backoff: Optional[Backoff] = None,
+        page_size: int = 100,
+        max_pages: int = 5,
+        timeout: float = 300,
+        terminal: Iterable[str] = TERMINAL_STATUSES,
+    ):
+        """Initialize the watcher; its thread starts with the first watched job."""
+        self.api_client = api_client
+        self.backoff = backoff or Backoff()
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.terminal = frozenset(terminal)
+        self.stats: Counter = Counter()
+        self._jobs: Dict[str, _Watched] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def watch(
+        self,
+        job_id: str,
+        timeout: Optional[float] = None,
+        on_update: Optional[Callable[[JobListItem], None]] = None,
+    ) -> "Future[JobListItem]":
+        """Start watching a job.
+
+        Watching a job that is already watched returns the same future.
+
+        Args:
+            job_id: The job to watch.
+            timeout: Seconds to wait for it (default: the watcher's timeout).
+            on_update: Called from the watcher thread with each status seen for the job.
+
+        Returns:
+            Future[JobListItem]: Resolved with the job's final status.
+
+        """
+        return self._watch_all([job_id], timeout, on_update)[job_id]
+
+    def wait(
+        self,
+        job_ids: Iterable[str],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, JobListItem]:
+        """Watch several jobs and block until all of them have finished.
+
+        Args:
+            job_ids: The jobs to wait for.
+            timeout: Seconds to wait for each job (default: the watcher's timeout).
+
+        Returns:
+            Dict[str, JobListItem]: The final status of each job.
+
+        Raises:
+            JobTimeoutError: If a job is still running at its deadline.
+
+        """
+        futures = self._watch_all(list(job_ids), timeout)
+        return {job_id: future.result() for job_id, future in futures.items()}
+
+    def watch_commit(
+        self,
+        response: CandidatePushResponseModel,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[JobListItem], None]] = None,
+    ) -> CommitFuture:
+        """Watch a commit's push job, then the child jobs it spawned.
+
+        Once the push job ends, its child jobs are listed by parent_id and watched
+        in turn; the commit's future resolves when the last of them ends. The
+        listing runs on a thread of its own, so polling for other jobs goes on
+        meanwhile, and an error it raises fails the future. A push request that
+        was not accepted fails the future straight away.
+
+        Args:
+            response: The response to the candidate push request.
+            timeout: Seconds to wait for the push job and its child jobs together
+                (default: the watcher's timeout).
+            on_progress: Called from the watcher thread with each status seen for the
+                push job or a child job.
+
+        Returns:
+            CommitFuture: Resolved with a CommitResult.
+
+        """
+        commit = CommitFuture(response)
+        if not (response.success and response.job_id):
+            commit.set_exception(APIError(f"Commit was not accepted: {response.message}"))
+            return commit
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        def update(job: JobListItem) -> None:
+            commit.progress[job.id] = int(job.percent) if job.percent.isdigit() else 0
+            if on_progress is not None:
+                on_progress(job)
+
+        def parent_done(parent: Future) -> None:
+            if parent.cancelled():  # e.g. the watcher was closed
+                commit.cancel()
+                return
+            if parent.exception() is not None:
+                _resolve(commit, None, parent.exception())
+                return
+            # Listing child jobs reads every page; keep it off the watcher thread
+            threading.Thread(
+                target=find_children,
+                args=(parent.result(),),
+                name="scm-commit-children",
+                daemon=True,
+            ).start()
+
+        def find_children(job: JobListItem) -> None:
+            try:
+                watch_children(job)
+            except Exception as e:  # e.g. a connection error, or the watcher was closed
+                _resolve(commit, None, e)
+
+        def watch_children(job: JobListItem) -> None:
+            try:
+                # With parent_id, list_jobs() reads every page, page_size jobs at a time
+                listing = self.api_client.list_jobs(limit=self.page_size, parent_id=job.id)
+                child_ids = [child.id for child in listing.data if child.id != job.id]
+            except APIError as e:
+                logger.warning(f"Child jobs of commit {job.id} unavailable: {e}")
+                child_ids = []
+            if not child_ids:
+                _resolve(commit, CommitResult(response, job), None)
+                return
+            children = self._watch_all(child_ids, max(0.0, deadline - time.monotonic()), update)
+
+            def child_done(_: Future) -> None:
+                if not all(future.done() for future in children.values()):
+                    return
+                if any(future.cancelled() for future in children.values()):
+                    commit.cancel()
+                    return
+                errors = [f.exception() for f in children.values() if f.exception() is not None]
+                if errors:
+                    _resolve(commit, None, errors[0])
+                else:
+                    results = [future.result() for future in children.values()]
+                    _resolve(commit, CommitResult(response, job, results), None)
+
+            for future in children.values():
+                commit._track(future)
+                future.add_done_callback(child_done)
+
+        parent = self.watch(response.job_id, timeout, update)
+        commit._track(parent)
+        parent.add_done_callback(parent_done)
+        return commit
+
+    @property
+    def watching(self) -> int:
+        """Number of jobs still being watched."""
+        with self._lock:
+            return len(self._jobs)
+
+    def close(self) -> None:
+        """Stop watching; jobs still running have their futures cancelled."""
+        with self._lock:
+            self._closed = True
+            jobs, self._jobs = self._jobs, {}
+            thread = self._thread
+        for watched in jobs.values():
+            watched.future.cancel()
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __enter__(self) -> "JobWatcher":
+        """Return the watcher."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Close the watcher."""
+        self.close()
+
+    def _watch_all(
+        self,
+        job_ids: List[str],
+        timeout: Optional[float],
+        on_update: Optional[Callable[[JobListItem], None]] = None,
+    ) -> Dict[str, Future]:
+        """Register jobs together, so that they are first polled together."""
+        timeout = self.timeout if timeout is None else timeout
+        futures = {}
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JobWatcher is closed")
+            for job_id in job_ids:
+                watched = self._jobs.get(job_id)
+                if watched is None:
+                    watched = _Watched(Future(), time.monotonic() + timeout, timeout)
+                    self._jobs[job_id] = watched
+                if on_update is not None:
+                    watched.callbacks.append(on_update)
+                futures[job_id] = watched.future
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="scm-job-watcher", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+        return futures
+
+    def _run(self) -> None:
+        """Poll until nothing is left to watch, backing off between polls."""
+        attempt = 0
+        while True:
+            self._wake.clear()
+            with self._lock:
+                if not self._jobs or self._closed:
+                    self._thread = None
+                    return
+            try:
+                self._poll()
+            except Exception as e:  # keep watching; deadlines bound the retries
+                logger.warning(f"Job poll failed: {e}")
+            if self._wake.wait(self.backoff.delay(attempt)):
+                attempt = 0
+            else:
+                attempt += 1
+
+    def _poll(self) -> None:
+        """Read the status of every watched job and resolve the finished ones."""
+        with self._lock:
+            pending = {job_id for job_id, w in self._jobs.items() if not w.future.cancelled()}
+        self.stats["polls"] += 1
+
+        seen: Dict[str, JobListItem] = {}
+        offset = 0
+        for _ in range(self.max_pages):
+            if not pending - set(seen):
+                break
+            try:
+                page = self.api_client.list_jobs(limit=self.page_size, offset=offset)
+            except APIError as e:
+                logger.debug(f"Job listing unavailable, looking jobs up one by one: {e}")
+                break
+            self.stats["pages"] += 1
+            seen.update((job.id, job) for job in page.data if job.id in pending)
+            offset += self.page_size
+            if len(page.data) < self.page_size or offset >= page.total:
+                break
+
+        for job_id in pending - set(seen):
+            try:
+                status = self.api_client.get_job_status(job_id)
+            except APIError as e:
+                logger.debug(f"Status of job {job_id} unavailable: {e}")
+                continue
+            self.stats["lookups"] += 1
+            if status.data:
+                seen[job_id] = _list_item(status.data[0])
+
+        now = time.monotonic()
+        updates = []
+        finished = []
+        with self._lock:
+            for job_id in pending:
+                watched = self._jobs.get(job_id)
+                if watched is None:
+                    continue
+                job = seen.get(job_id)
+                if job is not None:
+                    watched.last = job
+                    updates.extend((callback, job) for callback in watched.callbacks)
+                if job is not None and job.status_str in self.terminal:
+                    finished.append((self._jobs.pop(job_id).future, job, None))
+                elif now >= watched.deadline:
+                    last_state = watched.last.status_str if watched.last else "unknown"
+                    error = JobTimeoutError(job_id, last_state, watched.timeout)
+                    finished.append((self._jobs.pop(job_id).future, None, error))
+            # Drop futures cancelled by their callers
+            for job_id in [j for j, w in self._jobs.items() if w.future.cancelled()]:
+                del self._jobs[job_id]
+
+        # Callbacks run without the lock, so they may watch further jobs
+        for callback, job in updates:
+            _call(callback, job)
+        for future, result, error in finished:
+            _resolve(future, result, error)
+
+
+def _list_item(status: Any) -> JobListItem:
+    """Convert a get_job_status() entry into the list_jobs() item shape."""
+    data = status.model_dump(mode="json")
+    return JobListItem(
+        **{name: data[name] for name in JobListItem.model_fields if data.get(name) is not None}
+    )
+
+
+def _resolve(future: Future, result: Any, error: Optional[BaseException]) -> None:
+    """Resolve a future, unless its caller cancelled it meanwhile."""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+def _call(callback: Callable[[JobListItem], None], job: JobListItem) -> None:
+    """Run a status callback, logging instead of raising its errors."""
+    try:
+        callback(job)
+    except Exception as e:
+        logger.warning(f"Job status callback failed: {e}")
@@ -1,10 +1,71 @@
 """LocalConfig service for Operations API."""
 
-from typing import List
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import logging
+import os
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
 
+from scm.exceptions import APIError, ChecksumMismatchError
 from scm.models.operations.local_config import LocalConfigVersionModel
+from scm.operations.config_diff import ConfigDiff, ConfigTree
+from scm.operations.config_parser import ConfigRecord, iter_config_records
 from scm.services import ServiceBase
 
+logger = logging.getLogger(__name__)
+
+# Bytes read from the response, and from disk when hashing, at a time
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class DownloadResult:
+    """The outcome of a streamed configuration download.
+
+    Attributes:
+        device: Device serial number.
+        version: Configuration version ID.
+        size: Size of the configuration in bytes.
+        sha256: SHA-256 hex digest of the configuration.
+        md5: MD5 hex digest of the configuration, comparable to the version's md5.
+        path: File the configuration was written to, when downloading to a path.
+        skipped: Whether the local copy already matched, so nothing was downloaded.
+        resumed_from: Bytes kept from an earlier, interrupted download.
+
+    """
+
+    device: str
+    version: str
+    size: int
+    sha256: str
+    md5: str
+    path: Optional[str] = None
+    skipped: bool = False
+    resumed_from: int = 0
+
+
+class _Hashes:
+    """SHA-256 and MD5 digests computed together over a stream."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.sha256 = hashlib.sha256()
+        self.md5 = hashlib.md5(usedforsecurity=False)
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        self.sha256.update(chunk)
+        self.md5.update(chunk)
+        self.size += len(chunk)
+
+    def update_from_file(self, path: str, chunk_size: int) -> None:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                self.update(chunk)
+
 
 class LocalConfig(ServiceBase):
     """Service for retrieving local device configuration versions and downloads."""
@@ -32,6 +93,9 @@ class LocalConfig(ServiceBase):
     def download(self, device: str, version: str) -> bytes:
         """Download a local configuration file for a device.
 
+        The whole file is held in memory; use download_to() for large
+        configurations.
+
         Args:
             device: Device serial number (14-15 digits).
             version: Configuration version ID.
@@ -46,3 +110,230 @@ class LocalConfig(ServiceBase):
             raw_response=True,
         )
         return response.content
+
+    def download_to(
+        self,
+        device: str,
+        version: str,
+        destination: Union[str, "os.PathLike[str]", BinaryIO],
+        md5: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = True,
+    ) -> DownloadResult:
+        """Stream a local configuration file to disk, or to a file-like sink.
+
+        The response is read chunk_size bytes at a time and written as it
+        arrives, so memory use stays bounded whatever the size of the file;
+        SHA-256 and MD5 digests are computed while writing.
+
+        When destination is a path, the file is first written to
+        "<path>.part" and moved into place once complete, and a
+        "<path>.meta.json" record of the device, version, size and digests is
+        written next to it. A later call for the same device and version
+        skips the download if the file still matches that record. An
+        interrupted download is resumed from the end of the .part file with
+        an HTTP Range request; if the server answers with the whole file, or
+        rejects the range because the .part file is already complete, the
+        download starts over.
+
+        Args:
+            device: Device serial number (14-15 digits).
+            version: Configuration version ID.
+            destination: File path, or a binary file-like object with write().
+            md5: Expected MD5 hex digest, e.g. LocalConfigVersionModel.md5.
+            chunk_size: Bytes read at a time (default: 1 MiB).
+            resume: Continue an interrupted download to a path (default: True).
+
+        Returns:
+            DownloadResult: Size, digests and how the download went.
+
+        Raises:
+            ChecksumMismatchError: If md5 is given and the content does not match it.
+
+        """
+        if hasattr(destination, "write"):
+            hashes = _Hashes()
+            self._stream(device, version, destination, hashes, chunk_size, 0)
+            self._verify(device, version, hashes, md5)
+            return DownloadResult(
+                device, version, hashes.size, hashes.sha256.hexdigest(), hashes.md5.hexdigest()
+            )
+
+        path = os.fspath(destination)
+        local = self._local_copy(path, device, version, md5, chunk_size)
+        if local is not None:
+            logger.debug(f"{path} already holds version {version} of {device}")
+            return local
+
+        part = f"{path}.part"
+        hashes = _Hashes()
+        offset = os.path.getsize(part) if resume and os.path.exists(part) else 0
+        if offset:
+            hashes.update_from_file(part, chunk_size)
+        with open(part, "ab" if offset else "wb") as f:
+            try:
+                resumed = self._stream(device, version, f, hashes, chunk_size, offset)
+            except APIError as e:
+                if not offset or e.http_status_code != 416:
+                    raise
+                # Nothing is left past the end of the .part file: start over
+                logger.debug(f"{part} cannot be resumed from byte {offset}")
+                f.seek(0)
+                f.truncate()
+                hashes.reset()
+                resumed = self._stream(device, version, f, hashes, chunk_size, 0)
+        try:
+            self._verify(device, version, hashes, md5)
+        except ChecksumMismatchError:
+            os.remove(part)
+            raise
+        os.replace(part, path)
+
+        result = DownloadResult(
+            device,
+            version,
+            hashes.size,
+            hashes.sha256.hexdigest(),
+            hashes.md5.hexdigest(),
+            path=path,
+            resumed_from=offset if resumed else 0,
+        )
+        with open(f"{path}.meta.json", "w") as f:
+            json.dump(
+                {k: v for k, v in asdict(result).items() if k not in ("path", "skipped")}, f
+            )
+        return result
+
+    def diff_versions(
+        self,
+        device: str,
+        old: Union[str, LocalConfigVersionModel],
+        new: Union[str, LocalConfigVersionModel],
+    ) -> ConfigDiff:
+        """Compare two configuration versions of a device.
+
+        Both versions are downloaded and hashed into trees keyed by xpath and
+        entry name; only subtrees whose hashes differ are compared.
+
+        Args:
+            device: Device serial number (14-15 digits).
+            old: The earlier version, as an ID or a listed version.
+            new: The later version, as an ID or a listed version.
+
+        Returns:
+            ConfigDiff: The entries added, removed, modified and reordered in new.
+
+        """
+        old_tree, new_tree = (
+            ConfigTree.parse(self.download(device, str(getattr(version, "id", version))))
+            for version in (old, new)
+        )
+        return old_tree.diff(new_tree)
+
+    def iter_records(
+        self,
+        device: str,
+        version: str,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> Iterator[ConfigRecord]:
+        """Stream the objects and rules of a local configuration as typed records.
+
+        The download is parsed as it arrives, without holding the file in memory;
+        see iter_config_records() for the records yielded.
+
+        Args:
+            device: Device serial number (14-15 digits).
+            version: Configuration version ID.
+            kinds: Kinds to yield, e.g. ["address", "security_rule"] (default: all).
+
+        Yields:
+            ConfigRecord: One per object or rule, with models whose device is the
+                serial number.
+
+        """
+        response = self.api_client.get(
+            f"{self.ENDPOINT}/download",
+            params={"device": device, "version": version},
+            raw_response=True,
+            stream=True,
+        )
+        try:
+            response.raw.decode_content = True
+            yield from iter_config_records(response.raw, kinds=kinds, device=device)
+        finally:
+            response.close()
+
+    def _stream(
+        self,
+        device: str,
+        version: str,
+        sink: BinaryIO,
+        hashes: _Hashes,
+        chunk_size: int,
+        offset: int,
+    ) -> bool:
+        """Write the download to sink from offset; return whether the server resumed it."""
+        kwargs = {"headers": {"Range": f"bytes={offset}-"}} if offset else {}
+        response = self.api_client.get(
+            f"{self.ENDPOINT}/download",
+            params={"device": device, "version": version},
+            raw_response=True,
+            stream=True,
+            **kwargs,
+        )
+        try:
+            resumed = bool(offset) and response.status_code == 206
+            if offset and not resumed:
+                # The server sent the whole file: start over
+                logger.debug(f"Download of {device} version {version} cannot resume")
+                sink.seek(0)
+                sink.truncate()
+                hashes.reset()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    sink.write(chunk)
+                    hashes.update(chunk)
+            return resumed
+        finally:
+            response.close()
+
+    @staticmethod
+    def _verify(device: str, version: str, hashes: _Hashes, md5: Optional[str]) -> None:
+        """Raise ChecksumMismatchError if the content does not match md5."""
+        actual = hashes.md5.hexdigest()
+        if md5 is not None and actual != md5.lower():
+            raise ChecksumMismatchError(f"{device} version {version}", md5.lower(), actual)
+
+    @staticmethod
+    def _local_copy(
+        path: str,
+        device: str,
+        version: str,
+        md5: Optional[str],
+        chunk_size: int,
+    ) -> Optional[DownloadResult]:
+        """Return the recorded download at path if the file still matches it, else None."""
+        try:
+            with open(f"{path}.meta.json") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("device") != device or meta.get("version") != version:
+            return None
+        if md5 is not None and meta.get("md5") != md5.lower():
+            return None
+        if not os.path.exists(path) or os.path.getsize(path) != meta.get("size"):
+            return None
+        hashes = _Hashes()
+        hashes.update_from_file(path, chunk_size)
+        if hashes.sha256.hexdigest() != meta.get("sha256"):
+            return None
+        return DownloadResult(
+            device,
+            version,
+            hashes.size,
+            meta["sha256"],
+            hashes.md5.hexdigest(),
+            path=path,
+            skipped=True,
+        )
@@ -0,0 +1,443 @@
+"""Route and FIB table index with longest-prefix-match lookups.
+
+Parses route_table() and fib_table() device results into one radix trie per
+device, virtual router and address family, so that lookups of many addresses
+across many devices, and comparisons of tables, do not scan result lists.
+"""
+
+# scm/operations/route_index.py
+
+# Standard library imports
+from dataclasses import dataclass, field
+import ipaddress
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Local SDK imports
+from scm.models.operations.device_operations import DeviceJobResultModel, DeviceJobStatusModel
+from scm.operations.device_operations import DeviceResult
+from scm.utils.radix import Network, RadixTrie
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VR = "default"
+
+# Result keys naming a route's fields, as reported by the legacy and the
+# advanced routing engines
+DESTINATION_KEYS = ("destination", "prefix", "dst", "network")
+VR_KEYS = ("virtual-router", "logical-router", "vr", "vrf", "vrfName", "vrf-name")
+NEXTHOP_KEYS = ("nexthop", "next-hop", "nh", "gateway")
+INTERFACE_KEYS = ("interface", "interfaceName", "egress-interface", "ifname")
+PROTOCOL_KEYS = ("protocol", "proto", "type")
+
+TableKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Route:
+    """One route (or FIB entry) to a prefix through one next hop.
+
+    Attributes:
+        prefix: The destination prefix, normalized, e.g. "10.1.0.0/16".
+        vr: Virtual or logical router holding the route.
+        nexthop: Next-hop address, if any.
+        interface: Egress interface, if reported.
+        protocol: How the route was learned, e.g. "static" or "bgp", if reported.
+        metric: Route metric, if reported.
+        flags: Route flags as reported, e.g. "A S".
+        attributes: The whole record from the result; not used in comparisons.
+
+    """
+
+    prefix: str
+    vr: str = DEFAULT_VR
+    nexthop: Optional[str] = None
+    interface: Optional[str] = None
+    protocol: Optional[str] = None
+    metric: Optional[str] = None
+    flags: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+
+@dataclass
+class RouteChange:
+    """The routes to one prefix in two tables that differ.
+
+    Attributes:
+        prefix: The destination prefix.
+        old: Its routes in the first table (empty if it had none).
+        new: Its routes in the second table (empty if it has none).
+
+    """
+
+    prefix: str
+    old: List[Route]
+    new: List[Route]
+
+    @property
+    def action(self) -> str:
+        """Return "added", "removed" or "changed"."""
+        if not self.old:
+            return "added"
+        if not self.new:
+            return "removed"
+        return "changed"
+
+
+def parse_routes(result: Dict[str, Any], vr: str = DEFAULT_VR) -> Iterator[Route]:
+    """Extract the routes from a route-table or fib-table device result.
+
+    Records are recognized by a destination prefix ("destination", "prefix",
+    "dst" or "network", or a prefix used as the record's key) wherever they are
+    nested. A record's virtual router is taken from the record, from the nearest
+    enclosing object naming one, or from a key holding prefix-keyed records. A
+    record listing several next hops yields one route per next hop. Multicast
+    route-table records are skipped.
+
+    Args:
+        result: DeviceJobResultModel.details.result of a route or FIB job.
+        vr: Virtual router for records that do not name one.
+
+    Yields:
+        Route: Each route found.
+
+    """
+    yield from _walk(result, vr, None)
+
+
+class RouteTable:
+    """The routes of one virtual router on one device, indexed by prefix.
+
+    Each address family has its own radix trie, so longest-prefix match
+    visits only the branching points above the matching prefix.
+
+    Args:
+        device: Device serial number.
+        vr: Virtual or logical router name.
+
+    """
+
+    def __init__(self, device: str, vr: str = DEFAULT_VR):
+        """Initialize an empty table."""
+        self.device = device
+        self.vr = vr
+        self._tries: Dict[int, RadixTrie[List[Route]]] = {4: RadixTrie(4), 6: RadixTrie(6)}
+
+    def add(self, route: Route) -> None:
+        """Add a route; routes to the same prefix are kept together (ECMP)."""
+        network = ipaddress.ip_network(route.prefix, strict=False)
+        trie = self._tries[network.version]
+        routes = trie.get(network)
+        if routes is None:
+            trie[network] = [route]
+        elif route not in routes:
+            routes.append(route)
+
+    def __len__(self) -> int:
+        """Return the number of prefixes."""
+        return len(self._tries[4]) + len(self._tries[6])
+
+    def routes(self) -> Iterator[Route]:
+        """Yield every route, IPv4 first, in address order."""
+        for version in (4, 6):
+            for _, routes in self._tries[version].items():
+                yield from routes
+
+    def get(self, prefix: Union[str, Network]) -> List[Route]:
+        """Return the routes to exactly prefix."""
+        network = ipaddress.ip_network(prefix, strict=False)
+        return list(self._tries[network.version].get(network) or [])
+
+    def lookup(self, address: str) -> List[Route]:
+        """Return the routes of the longest prefix containing address, or [] if none does."""
+        return self._longest(ipaddress.ip_address(address))
+
+    def lookup_many(self, addresses: Iterable[str]) -> Dict[str, List[Route]]:
+        """Look up many addresses; each distinct address is looked up once."""
+        return {address: self.lookup(address) for address in dict.fromkeys(addresses)}
+
+    def matches(self, address: str) -> List[Route]:
+        """Return the routes of every prefix containing address, least specific first."""
+        parsed = ipaddress.ip_address(address)
+        return [
+            route
+            for _, routes in self._tries[parsed.version].matches(int(parsed))
+            for route in routes
+        ]
+
+    def diff(self, other: "RouteTable") -> List[RouteChange]:
+        """Compare with another table (another device, or the same one later).
+
+        Routes are compared by prefix, next hop, interface, protocol, metric and
+        flags; the order of routes to a prefix does not matter.
+
+        Returns:
+            List[RouteChange]: The prefixes whose routes differ, in address order.
+
+        """
+        return _diff_tables(self, other)
+
+    def _longest(self, address: Union[ipaddress.IPv4Address, ipaddress.IPv6Address]) -> List[Route]:
+        """Return the routes of the longest prefix containing a parsed address."""
+        match = self._tries[address.version].longest_match(int(address))
+        return [] if match is None else list(match[1])
+
+    def _prefixes(self) -> Dict[Network, List[Route]]:
+        """Return the routes by prefix, IPv4 first, in address order."""
+        return {
+            network: routes
+            for version in (4, 6)
+            for network, routes in self._tries[version].items()
+        }
+
+
+class RouteIndex:
+    """Route or FIB tables of many devices, indexed for longest-prefix match.
+
+        index = RouteIndex()
+        index.add_results(client.device_operations.route_table_fleet(serials))
+        index.lookup("10.1.2.3")  # {(serial, vr): [Route(...)], ...}
+        index.lookup_many(addresses, vr="default")
+        changes = old_index.diff(index)  # over time
+
+    Tables are keyed by (device, virtual router).
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._tables: Dict[TableKey, RouteTable] = {}
+
+    def add(self, device: str, result: Dict[str, Any]) -> int:
+        """Parse one device's route or FIB result into its tables.
+
+        Args:
+            device: Device serial number.
+            result: DeviceJobResultModel.details.result.
+
+        Returns:
+            int: Number of routes parsed.
+
+        """
+        count = 0
+        for route in parse_routes(result):
+            table = self._tables.get((device, route.vr))
+            if table is None:
+                table = self._tables[(device, route.vr)] = RouteTable(device, route.vr)
+            table.add(route)
+            count += 1
+        if not count:
+            logger.debug(f"No routes found in the result for {device}")
+        return count
+
+    def add_results(
+        self,
+        results: Iterable[Union[DeviceResult, DeviceJobResultModel, DeviceJobStatusModel]],
+    ) -> int:
+        """Add fleet results, job results or whole job statuses.
+
+        Devices without a completed result (failed, timed out) are skipped.
+
+        Returns:
+            int: Number of routes parsed.
+
+        """
+        count = 0
+        for item in results:
+            if isinstance(item, DeviceJobStatusModel):
+                count += self.add_results(item.results)
+            elif isinstance(item, DeviceResult):
+                if item.ok and item.result is not None:
+                    count += self.add(item.device, item.result.details.result)
+            elif item.state == "complete":
+                count += self.add(item.device, item.details.result)
+        return count
+
+    def table(self, device: str, vr: str = DEFAULT_VR) -> Optional[RouteTable]:
+        """Return a device's table for a virtual router, or None."""
+        return self._tables.get((device, vr))
+
+    def tables(self) -> List[RouteTable]:
+        """Return every table, by device and virtual router."""
+        return [self._tables[key] for key in sorted(self._tables)]
+
+    @property
+    def devices(self) -> List[str]:
+        """Return the devices with at least one table."""
+        return sorted({device for device, _ in self._tables})
+
+    def __len__(self) -> int:
+        """Return the number of tables."""
+        return len(self._tables)
+
+    def lookup(
+        self,
+        address: str,
+        devices: Optional[Iterable[str]] = None,
+        vr: Optional[str] = None,
+    ) -> Dict[TableKey, List[Route]]:
+        """Return the longest-prefix-match routes for address in every selected table.
+
+        Args:
+            address: IPv4 or IPv6 address.
+            devices: Only these devices (default: all).
+            vr: Only this virtual router (default: all).
+
+        Returns:
+            Dict[TableKey, List[Route]]: Matching routes by (device, vr); tables
+                with no route to address are left out.
+
+        """
+        return self.lookup_many([address], devices, vr)[address]
+
+    def lookup_many(
+        self,
+        addresses: Iterable[str],
+        devices: Optional[Iterable[str]] = None,
+        vr: Optional[str] = None,
+    ) -> Dict[str, Dict[TableKey, List[Route]]]:
+        """Look up many addresses in every selected table.
+
+        Each distinct address is parsed once and then walked down each table's
+        trie for its family.
+
+        Returns:
+            Dict[str, Dict[TableKey, List[Route]]]: For each address, the matching
+                routes by (device, vr).
+
+        """
+        wanted = None if devices is None else set(devices)
+        tables = [
+            table
+            for table in self.tables()
+            if (wanted is None or table.device in wanted) and (vr is None or table.vr == vr)
+        ]
+        results: Dict[str, Dict[TableKey, List[Route]]] = {}
+        for address in dict.fromkeys(addresses):
+            parsed = ipaddress.ip_address(address)
+            found = results[address] = {}
+            for table in tables:
+                routes = table._longest(parsed)
+                if routes:
+                    found[(table.device, table.vr)] = routes
+        return results
+
+    def diff(self, other: "RouteIndex") -> Dict[TableKey, List[RouteChange]]:
+        """Compare with another index, e.g. the same devices' tables read later.
+
+        A table present on one side only is reported with all its routes added
+        or removed.
+
+        Returns:
+            Dict[TableKey, List[RouteChange]]: The changes of each table that changed.
+
+        """
+        changes = {}
+        for key in sorted(set(self._tables) | set(other._tables)):
+            device, vr = key
+            empty = RouteTable(device, vr)
+            table_changes = _diff_tables(
+                self._tables.get(key, empty), other._tables.get(key, empty)
+            )
+            if table_changes:
+                changes[key] = table_changes
+        return changes
+
+
+def _diff_tables(old: RouteTable, new: RouteTable) -> List[RouteChange]:
+    """Compare two tables prefix by prefix."""
+    before = old._prefixes()
+    after = new._prefixes()
+    changes = []
+    for network in sorted(set(before) | set(after), key=_order):
+        old_routes = before.get(network, [])
+        new_routes = after.get(network, [])
+        if set(_comparable(old_routes)) != set(_comparable(new_routes)):
+            changes.append(RouteChange(str(network), old_routes, new_routes))
+    return changes
+
+
+def _comparable(routes: List[Route]) -> Iterator[Tuple[Optional[str], ...]]:
+    """Reduce routes to what a comparison across devices or time should see."""
+    for route in routes:
+        yield (route.nexthop, route.interface, route.protocol, route.metric, route.flags)
+
+
+def _order(network: Network) -> Tuple[int, int, int]:
+    """Sort key: IPv4 first, then address, then prefix length."""
+    return (network.version, int(network.network_address), network.prefixlen)
+
+
+def _walk(value: Any, vr: str, key: Optional[str]) -> Iterator[Route]:
+    """Find route records in nested result data."""
+    if isinstance(value, list):
+        for item in value:
+            yield from _walk(item, vr, key)
+        return
+    if not isinstance(value, dict):
+        return
+    vr = _first(value, VR_KEYS) or vr
+    network = _network(_first(value, DESTINATION_KEYS)) or _network(key)
+    if network is not None:
+        if value.get("route-table") != "multicast":
+            yield from _routes(value, network, vr)
+        return
+    for child_key, child in value.items():
+        if not isinstance(child, (dict, list)):
+            continue
+        child_vr = vr
+        if isinstance(child, dict) and _network(child_key) is None and any(
+            _network(k) is not None for k in child
+        ):
+            # {"<vr>": {"<prefix>": [...]}}: the key names the virtual router
+            child_vr = child_key
+        yield from _walk(child, child_vr, child_key)
+
+
+def _routes(record: Dict[str, Any], network: Network, vr: str) -> Iterator[Route]:
+    """Build one route per next hop of a record."""
+    common = {
+        "prefix": str(network),
+        "vr": vr,
+        "protocol": _first(record, PROTOCOL_KEYS),
+        "metric": _first(record, ("metric",)),
+        "flags": _first(record, ("flags",)),
+        "attributes": record,
+    }
+    nexthops = record.get("nexthops")
+    if isinstance(nexthops, dict):
+        nexthops = nexthops.get("entry", [nexthops])
+    if isinstance(nexthops, list) and nexthops:
+        for nexthop in nexthops:
+            if not isinstance(nexthop, dict):
+                yield Route(nexthop=str(nexthop), **common)
+                continue
+            yield Route(
+                nexthop=_first(nexthop, ("ip", "afi-address") + NEXTHOP_KEYS),
+                interface=_first(nexthop, INTERFACE_KEYS) or _first(record, INTERFACE_KEYS),
+                **common,
+            )
+        return
+    yield Route(
+        nexthop=_first(record, NEXTHOP_KEYS),
+        interface=_first(record, INTERFACE_KEYS),
+        **common,
+    )
+
+
+def _first(record: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    """Return the first of keys present in record with a scalar value, as a string."""
+    for key in keys:
+        value = record.get(key)
+        if value is not None and value != "" and not isinstance(value, (dict, list)):
+            return str(value)
+    return None
+
+
+def _network(value: Optional[str]) -> Optional[Network]:
+    """Parse a prefix such as "10.0.0.0/8", or return None if value is not one."""
+    if not value or "/" not in value:
+        return None
+    try:
+        return ipaddress.ip_network(value.strip(), strict=False)
+    except ValueError:
+        return None
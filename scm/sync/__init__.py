@@ -0,0 +1,29 @@
+"""scm.sync: Change detection and state synchronization for SCM configuration."""
+# scm/sync/__init__.py
+
+from .buffer import WriteBuffer
+from .bulk import BulkEngine, BulkOperation, BulkReport, BulkResult
+from .collision import CollisionChecker, CollisionReport
+from .plan import Plan, PlannedChange, Planner
+from .preflight import PreflightReport, ReferenceChecker
+from .transaction import Transaction
+from .watcher import ChangeEvent, Watcher, WatchTarget
+
+__all__ = [
+    "BulkEngine",
+    "BulkOperation",
+    "BulkReport",
+    "BulkResult",
+    "ChangeEvent",
+    "CollisionChecker",
+    "CollisionReport",
+    "Plan",
+    "PlannedChange",
+    "Planner",
+    "PreflightReport",
+    "ReferenceChecker",
+    "Transaction",
+    "WatchTarget",
+    "Watcher",
+    "WriteBuffer",
+]
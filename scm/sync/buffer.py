@@ -0,0 +1,202 @@
+"""Write-behind update buffer for Strata Cloud Manager SDK.
+
+Collects updates per object and sends only the last one as a single PUT per
+object when the buffer is flushed, instead of one PUT per update.
+"""
+
+# scm/sync/buffer.py
+
+# Standard library imports
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# External libraries
+from pydantic import BaseModel
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError
+
+logger = logging.getLogger(__name__)
+
+_Key = Tuple[str, Tuple[Tuple[str, Hashable], ...]]
+
+
+class WriteBuffer:
+    """Coalesce repeated updates to the same object and send them as one PUT.
+
+    update() queues an update model instead of sending it. An update to an object
+    that is already pending replaces the pending model. Each PUT replaces the whole
+    object with its payload, so after a series of PUTs only the last payload
+    remains; sending just the last update leaves the object exactly as the serial
+    updates would, including fields the last update leaves out.
+
+    Pending updates are sent when flush() is called, when the buffer is closed or
+    its ``with`` block exits, when max_pending objects are pending, and, if window
+    is set, that many seconds after the first update queued since the last flush.
+
+    Reads through the service do not see pending updates until they are flushed.
+
+    Args:
+        service: The service whose update() sends the updates.
+        window: Seconds to hold updates before a background flush; None disables it.
+        max_pending: Number of pending objects that triggers a flush.
+        max_workers: Number of updates sent concurrently on flush.
+
+    Attributes:
+        stats: Counts of "updates" queued, updates "merged" into (replaced by) a
+            later one, and "puts" sent.
+        errors: Errors of background flushes, by object id.
+
+    """
+
+    def __init__(
+        self,
+        service,
+        window: Optional[float] = 1.0,
+        max_pending: int = 100,
+        max_workers: int = 1,
+    ):
+        """Initialize the buffer."""
+        if max_pending < 1 or max_workers < 1 or (window is not None and window <= 0):
+            raise InvalidObjectError(
+                message="window must be positive, and max_pending and max_workers at least 1",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Invalid write buffer settings"},
+            )
+        self.service = service
+        self.window = window
+        self.max_pending = max_pending
+        self.max_workers = max_workers
+        self.stats: Counter = Counter()
+        self.errors: Dict[str, Exception] = {}
+        self._pending: Dict[_Key, BaseModel] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of objects with updates waiting to be sent."""
+        return len(self._pending)
+
+    def update(self, model: BaseModel, **kwargs: Any) -> None:
+        """Queue an update, replacing any pending update of the same object.
+
+        Args:
+            model: The service's update model; its id identifies the object.
+            **kwargs: Extra keyword arguments for update(), e.g. rulebase. Updates with
+                different arguments are kept apart.
+
+        Raises:
+            InvalidObjectError: If the buffer is closed or the model has no id.
+
+        """
+        if self._closed:
+            raise InvalidObjectError(
+                message="Cannot queue updates on a closed write buffer",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Write buffer is closed"},
+            )
+        if getattr(model, "id", None) is None:
+            raise InvalidObjectError(
+                message="Buffered updates require the object's id",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Missing object id"},
+            )
+
+        key = (str(model.id), tuple(sorted(kwargs.items())))
+        with self._lock:
+            self.stats["updates"] += 1
+            if key in self._pending:
+                self.stats["merged"] += 1
+            self._pending[key] = model
+            full = len(self._pending) >= self.max_pending
+            if self.window is not None and self._timer is None and not full:
+                self._timer = threading.Timer(self.window, self._flush_in_background)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self.flush()
+
+    def flush(self) -> Dict[str, Any]:
+        """Send every pending update as one PUT per object.
+
+        Returns:
+            Dict[str, Any]: The response models, by object id.
+
+        Raises:
+            Exception: The first error raised by update(), after every pending
+                update has been attempted.
+
+        """
+        results, errors = self._flush()
+        if errors:
+            raise next(iter(errors.values()))
+        return results
+
+    def close(self) -> None:
+        """Flush pending updates and stop accepting new ones."""
+        self._closed = True
+        self.flush()
+
+    def __enter__(self) -> "WriteBuffer":
+        """Return the buffer."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Flush pending updates, including when the block raised."""
+        self.close()
+
+    def _flush(self) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        # One flush at a time, so a later batch never overtakes an earlier one
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                batch = list(self._pending.items())
+                self._pending.clear()
+            if not batch:
+                return {}, {}
+            return self._send(batch)
+
+    def _flush_in_background(self) -> None:
+        with self._lock:
+            if self._timer is threading.current_thread():
+                self._timer = None
+        _, errors = self._flush()
+        self.errors.update(errors)
+
+    def _send(
+        self,
+        batch: List[Tuple[_Key, BaseModel]],
+    ) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        def send(item):
+            (object_id, kwargs), model = item
+            try:
+                result = self.service.update(model, **dict(kwargs))
+            except Exception as e:
+                logger.error(f"Buffered update of {object_id} failed: {e}")
+                return object_id, None, e
+            finally:
+                with self._lock:
+                    self.stats["puts"] += 1
+            return object_id, result, None
+
+        if self.max_workers <= 1 or len(batch) == 1:
+            outcomes = [send(item) for item in batch]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                outcomes = list(executor.map(send, batch))
+
+        results = {object_id: result for object_id, result, error in outcomes if error is None}
+        errors = {object_id: error for object_id, _, error in outcomes if error is not None}
+        return results, errors
@@ -0,0 +1,610 @@
+"""Bulk create/update/delete engine for Strata Cloud Manager SDK.
+
+Runs a mixed batch of operations across services in dependency order, executing
+each dependency layer concurrently and reporting the outcome of every item.
+"""
+
+# scm/sync/bulk.py
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import inspect
+import logging
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+# External libraries
+from pydantic import BaseModel
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+ACTIONS = (CREATE, UPDATE, DELETE)
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+_ADDRESSES = ("address", "address_group", "external_dynamic_list", "region")
+_SERVICES = ("service", "service_group")
+_APPLICATIONS = ("application", "application_filter", "application_group")
+_ZONES = ("security_zone",)
+_HIP = ("hip_object", "hip_profile")
+_RULE_BASE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "tag": ("tag",),
+    "from": _ZONES,
+    "from_": _ZONES,
+    "to": _ZONES,
+    "to_": _ZONES,
+    "source": _ADDRESSES,
+    "destination": _ADDRESSES,
+}
+
+# Fields that reference other objects by name, and the services those names live in
+REFERENCE_FIELDS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "address": {"tag": ("tag",)},
+    "address_group": {
+        "tag": ("tag",),
+        "static": ("address", "address_group"),
+        "dynamic": ("tag",),
+    },
+    "service": {"tag": ("tag",)},
+    "service_group": {"tag": ("tag",), "members": _SERVICES},
+    "application_group": {"members": _APPLICATIONS},
+    "application_filter": {"tag": ("tag",)},
+    "external_dynamic_list": {"tag": ("tag",)},
+    "security_rule": {
+        **_RULE_BASE_FIELDS,
+        "service": _SERVICES,
+        "application": _APPLICATIONS,
+        "category": ("url_category",),
+        "source_hip": _HIP,
+        "destination_hip": _HIP,
+        "schedule": ("schedule",),
+        "log_setting": ("log_forwarding_profile",),
+    },
+    "nat_rule": {
+        **_RULE_BASE_FIELDS,
+        "service": _SERVICES,
+        "source_translation": _ADDRESSES,
+        "destination_translation": _ADDRESSES,
+    },
+    "decryption_rule": {**_RULE_BASE_FIELDS, "service": _SERVICES, "category": ("url_category",)},
+    "authentication_rule": {
+        **_RULE_BASE_FIELDS,
+        "service": _SERVICES,
+        "category": ("url_category",),
+    },
+    "app_override_rule": {**_RULE_BASE_FIELDS, "application": _APPLICATIONS},
+}
+
+# Coarse dependency tiers, used to order deletes whose content is unknown
+SERVICE_TIERS: Dict[str, int] = {
+    "tag": 0,
+    "address_group": 2,
+    "service_group": 2,
+    "application_group": 2,
+    "security_rule": 3,
+    "nat_rule": 3,
+    "decryption_rule": 3,
+    "authentication_rule": 3,
+    "app_override_rule": 3,
+    "qos_rule": 3,
+    "pbf_rule": 3,
+}
+DEFAULT_TIER = 1
+
+_QUOTED = re.compile(r"'([^']+)'|\"([^\"]+)\"")
+
+
+@dataclass
+class BulkOperation:
+    """One create, update, or delete of an object.
+
+    Attributes:
+        action: One of "create", "update", or "delete".
+        service: Unified client attribute of the service, e.g. "address" or "security_rule".
+        data: Object data as a dictionary or pydantic model. Updates must include the id;
+            deletes may include the object's name and references to refine ordering.
+        object_id: Id of the object to delete (defaults to data["id"]).
+        rulebase: Rulebase ("pre" or "post") for rule services.
+
+    """
+
+    action: str
+    service: str
+    data: Union[Dict[str, Any], BaseModel] = field(default_factory=dict)
+    object_id: Optional[str] = None
+    rulebase: Optional[str] = None
+
+    def __post_init__(self):
+        """Validate the action and the presence of an object id where one is needed."""
+        if self.action not in ACTIONS:
+            raise InvalidObjectError(
+                message=f"action must be one of {', '.join(ACTIONS)}",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": f"Invalid action '{self.action}'"},
+            )
+        if self.action in (UPDATE, DELETE) and self.target_id is None:
+            raise InvalidObjectError(
+                message=f"{self.action} operations require an object id",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Missing object id"},
+            )
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        """The operation's data as a plain dictionary."""
+        if isinstance(self.data, BaseModel):
+            return self.data.model_dump(exclude_unset=True)
+        return dict(self.data)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name of the object the operation applies to, if known."""
+        return self.fields.get("name")
+
+    @property
+    def target_id(self) -> Optional[str]:
+        """Id of the object the operation applies to, if known."""
+        object_id = self.object_id or self.fields.get("id")
+        return None if object_id is None else str(object_id)
+
+    def references(self) -> Set[Tuple[str, str]]:
+        """Return (service, name) pairs the operation's data refers to."""
+        referenced = set()
+        fields = self.fields
+        for field_name, services in REFERENCE_FIELDS.get(self.service, {}).items():
+            for name in _names(fields.get(field_name)):
+                referenced.update((service, name) for service in services)
+        return referenced
+
+    def execute(self, api_client) -> Any:
+        """Run the operation against the API.
+
+        Args:
+            api_client: The Scm client.
+
+        Returns:
+            The service's response model for creates and updates, None for deletes.
+
+        """
+        service = getattr(api_client, self.service)
+        method = getattr(service, self.action)
+        kwargs = rulebase_kwargs(method, self.rulebase)
+
+        if self.action == DELETE:
+            method(self.target_id, **kwargs)
+            return None
+        if self.action == CREATE:
+            if isinstance(self.data, BaseModel):
+                return method(self.data.model_dump(exclude_unset=True, by_alias=True), **kwargs)
+            return method(dict(self.data), **kwargs)
+        if isinstance(self.data, BaseModel):
+            return method(self.data, **kwargs)
+        return method(update_model(service)(**self.data), **kwargs)
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one operation of a batch.
+
+    Attributes:
+        index: Position of the operation in the submitted batch.
+        operation: The operation.
+        status: One of "succeeded", "failed", or "skipped".
+        result: The service's return value, for succeeded creates and updates.
+        error: The exception raised, or the reason an operation was skipped.
+        layer: Index of the dependency layer the operation ran in.
+        elapsed: Seconds spent executing the operation.
+
+    """
+
+    index: int
+    operation: BulkOperation
+    status: str
+    result: Any = None
+    error: Optional[Exception] = None
+    layer: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.status == SUCCEEDED
+
+
+@dataclass
+class BulkReport:
+    """Per-item outcome of a batch, in submission order.
+
+    Attributes:
+        results: One result per submitted operation.
+        layers: The dependency layers, as lists of operation indexes, in execution order.
+        elapsed: Seconds spent running the whole batch.
+
+    """
+
+    results: List[BulkResult]
+    layers: List[List[int]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> List[BulkResult]:
+        """Results of the operations that succeeded."""
+        return [r for r in self.results if r.status == SUCCEEDED]
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        """Results of the operations that raised an error."""
+        return [r for r in self.results if r.status == FAILED]
+
+    @property
+    def skipped(self) -> List[BulkResult]:
+        """Results of the operations skipped because a dependency did not succeed."""
+        return [r for r in self.results if r.status == SKIPPED]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every operation succeeded."""
+        return all(r.ok for r in self.results)
+
+    def summary(self) -> Dict[str, int]:
+        """Return the number of results per status."""
+        return {
+            SUCCEEDED: len(self.succeeded),
+            FAILED: len(self.failed),
+            SKIPPED: len(self.skipped),
+        }
+
+    def __iter__(self) -> Iterator[BulkResult]:
+        """Iterate over the results in submission order."""
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        """Return the number of results."""
+        return len(self.results)
+
+
+class BulkEngine:
+    """Run a batch of create, update, and delete operations in dependency order.
+
+    Creates and updates are ordered by the references in their data (tags before
+    the addresses that use them, addresses before the groups and rules that contain
+    them), so an object is only written once everything it refers to exists.
+    Deletes run after all creates and updates, in reverse order: rules before
+    groups, groups before their members, members before their tags. Operations in
+    the same layer have no dependency on each other and run concurrently.
+
+    An operation whose dependency failed is skipped rather than sent, since the API
+    would reject it anyway. Errors never abort the batch unless stop_on_error is set;
+    every item's outcome is reported in the returned BulkReport.
+
+    Args:
+        api_client: The Scm client.
+        max_workers: Maximum number of operations in flight at once (default: 8).
+        stop_on_error: Skip all remaining layers after a layer with a failure (default: False).
+
+    """
+
+    def __init__(
+        self,
+        api_client,
+        max_workers: int = 8,
+        stop_on_error: bool = False,
+    ):
+        """Initialize the engine."""
+        if max_workers < 1:
+            raise InvalidObjectError(
+                message="max_workers must be at least 1",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Invalid max_workers value"},
+            )
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self.stop_on_error = stop_on_error
+        self.logger = logging.getLogger(__name__)
+
+    def plan(self, operations: Iterable[BulkOperation]) -> List[List[int]]:
+        """Compute the execution layers of a batch without running it.
+
+        Args:
+            operations: The operations of the batch.
+
+        Returns:
+            List[List[int]]: Layers of operation indexes, in execution order.
+
+        Raises:
+            InvalidObjectError: If the operations reference each other in a cycle.
+
+        """
+        layers, _ = self._graph(list(operations))
+        return layers
+
+    def run(
+        self,
+        operations: Iterable[BulkOperation],
+        on_start: Optional[Callable[[int, BulkOperation], None]] = None,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+    ) -> BulkReport:
+        """Run a batch and report the outcome of every operation.
+
+        Args:
+            operations: The operations of the batch.
+            on_start: Called with the index and operation just before an operation is sent.
+            on_result: Called with each result as soon as it is known, including skips.
+
+        Returns:
+            BulkReport: One result per operation, in submission order.
+
+        Raises:
+            InvalidObjectError: If the operations reference each other in a cycle.
+
+        """
+        started = time.monotonic()
+        operations = list(operations)
+        layers, depends_on = self._graph(operations)
+        results: Dict[int, BulkResult] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for layer_index, layer in enumerate(layers):
+                runnable = []
+                for index in layer:
+                    blocker = next(
+                        (d for d in depends_on[index] if results[d].status != SUCCEEDED), None
+                    )
+                    if blocker is not None:
+                        results[index] = self._skipped(
+                            index,
+                            operations[index],
+                            layer_index,
+                            f"dependency {self._describe(operations[blocker])} "
+                            f"was {results[blocker].status}",
+                        )
+                        if on_result is not None:
+                            on_result(results[index])
+                    else:
+                        runnable.append(index)
+
+                futures = {
+                    index: executor.submit(
+                        self._execute, index, operations[index], layer_index, on_start, on_result
+                    )
+                    for index in runnable
+                }
+                for index, future in futures.items():
+                    results[index] = future.result()
+
+                if self.stop_on_error and any(
+                    results[index].status == FAILED for index in layer
+                ):
+                    remaining = layer_index + 1
+                    for later in layers[remaining:]:
+                        for index in later:
+                            results[index] = self._skipped(
+                                index, operations[index], layer_index, "batch stopped on error"
+                            )
+                            if on_result is not None:
+                                on_result(results[index])
+                    break
+
+        return BulkReport(
+            results=[results[index] for index in range(len(operations))],
+            layers=layers,
+            elapsed=time.monotonic() - started,
+        )
+
+    def _execute(
+        self,
+        index: int,
+        operation: BulkOperation,
+        layer: int,
+        on_start: Optional[Callable[[int, BulkOperation], None]] = None,
+        on_result: Optional[Callable[[BulkResult], None]] = None,
+    ) -> BulkResult:
+        """Run one operation, capturing its result or error."""
+        if on_start is not None:
+            on_start(index, operation)
+        started = time.monotonic()
+        try:
+            outcome = BulkResult(
+                index,
+                operation,
+                SUCCEEDED,
+                result=operation.execute(self.api_client),
+                layer=layer,
+            )
+        except Exception as e:
+            self.logger.error(f"Bulk {self._describe(operation)} failed: {e}")
+            outcome = BulkResult(index, operation, FAILED, error=e, layer=layer)
+        outcome.elapsed = time.monotonic() - started
+        if on_result is not None:
+            on_result(outcome)
+        return outcome
+
+    @staticmethod
+    def _skipped(index: int, operation: BulkOperation, layer: int, reason: str) -> BulkResult:
+        """Build the result of an operation that is not sent."""
+        return BulkResult(
+            index,
+            operation,
+            SKIPPED,
+            error=InvalidObjectError(
+                message=f"Skipped: {reason}",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": reason},
+            ),
+            layer=layer,
+        )
+
+    @staticmethod
+    def _describe(operation: BulkOperation) -> str:
+        """Describe an operation for log and skip messages."""
+        subject = operation.name or operation.target_id or "<unnamed>"
+        return f"{operation.action} {operation.service} '{subject}'"
+
+    def _graph(self, operations: List[BulkOperation]) -> Tuple[List[List[int]], List[Set[int]]]:
+        """Build the dependency graph and its execution layers.
+
+        Returns:
+            The layers, and for every operation the set of operations it depends on.
+
+        """
+        depends_on: List[Set[int]] = [set() for _ in operations]
+        writes = [i for i, op in enumerate(operations) if op.action != DELETE]
+        deletes = [i for i, op in enumerate(operations) if op.action == DELETE]
+
+        # A write depends on the writes of the objects it references
+        written = self._by_name(operations, writes)
+        for index in writes:
+            for reference in operations[index].references():
+                depends_on[index].update(d for d in written.get(reference, ()) if d != index)
+
+        # A delete waits for the deletes of the objects that reference it
+        deleted = self._by_name(operations, deletes)
+        for index in deletes:
+            for reference in operations[index].references():
+                for dependant in deleted.get(reference, ()):
+                    if dependant != index:
+                        depends_on[dependant].add(index)
+
+        layers = self._layers(writes, depends_on, operations)
+        by_tier: Dict[int, List[int]] = {}
+        for index in deletes:
+            tier = SERVICE_TIERS.get(operations[index].service, DEFAULT_TIER)
+            by_tier.setdefault(tier, []).append(index)
+        for tier in sorted(by_tier, reverse=True):
+            layers.extend(self._layers(by_tier[tier], depends_on, operations))
+        return layers, depends_on
+
+    @staticmethod
+    def _by_name(
+        operations: List[BulkOperation],
+        indexes: List[int],
+    ) -> Dict[Tuple[str, str], List[int]]:
+        """Index operations by the (service, name) of the object they apply to."""
+        index_by_name: Dict[Tuple[str, str], List[int]] = {}
+        for index in indexes:
+            name = operations[index].name
+            if name is not None:
+                index_by_name.setdefault((operations[index].service, name), []).append(index)
+        return index_by_name
+
+    @staticmethod
+    def _layers(
+        nodes: List[int],
+        depends_on: List[Set[int]],
+        operations: List[BulkOperation],
+    ) -> List[List[int]]:
+        """Group nodes into layers whose members only depend on earlier layers."""
+        members = set(nodes)
+        pending = {node: depends_on[node] & members for node in nodes}
+        layers = []
+        while pending:
+            ready = sorted(node for node, deps in pending.items() if not deps)
+            if not ready:
+                cycle = sorted(BulkEngine._describe(operations[node]) for node in pending)
+                raise InvalidObjectError(
+                    message="Operations reference each other in a cycle",
+                    error_code="E003",
+                    http_status_code=400,
+                    details={"error": "Circular reference", "operations": cycle},
+                )
+            layers.append(ready)
+            for node in ready:
+                del pending[node]
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return layers
+
+
+def update_model(service) -> type:
+    """Return the pydantic model class a service's update() method accepts.
+
+    Args:
+        service: A service instance, e.g. client.address.
+
+    Returns:
+        type: The *UpdateModel class.
+
+    Raises:
+        InvalidObjectError: If update() does not take a pydantic model.
+
+    """
+    for parameter in inspect.signature(service.update).parameters.values():
+        annotation = parameter.annotation
+        if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+            return annotation
+    raise InvalidObjectError(
+        message=f"{type(service).__name__}.update() does not accept a model",
+        error_code="E003",
+        http_status_code=400,
+        details={"error": "Pass the update data as a model instance"},
+    )
+
+
+def create_model(service) -> type:
+    """Return the pydantic model class a service's create() method validates against.
+
+    Args:
+        service: A service instance, e.g. client.address.
+
+    Returns:
+        type: The *CreateModel class defined next to the service's *UpdateModel.
+
+    Raises:
+        InvalidObjectError: If the service has no matching create model.
+
+    """
+    updater = update_model(service)
+    module = sys.modules[updater.__module__]
+    model = getattr(module, updater.__name__.replace("UpdateModel", "CreateModel"), None)
+    if model is None:
+        raise InvalidObjectError(
+            message=f"No create model found for {type(service).__name__}",
+            error_code="E003",
+            http_status_code=400,
+            details={"error": f"{updater.__name__} has no matching CreateModel"},
+        )
+    return model
+
+
+def rulebase_kwargs(method, rulebase: Optional[str]) -> Dict[str, str]:
+    """Map a rulebase onto whichever keyword a service method uses for it.
+
+    Security, decryption, authentication, and app override rules take "rulebase",
+    NAT rules take "position", and other services take neither.
+    """
+    if rulebase is None:
+        return {}
+    parameters = inspect.signature(method).parameters
+    for keyword in ("rulebase", "position"):
+        if keyword in parameters:
+            return {keyword: rulebase}
+    return {}
+
+
+def _names(value: Any) -> Iterator[str]:
+    """Yield every name a reference field value may contain."""
+    if isinstance(value, str):
+        yield value
+        for match in _QUOTED.finditer(value):
+            yield match.group(1) or match.group(2)
+    elif isinstance(value, BaseModel):
+        yield from _names(value.model_dump())
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _names(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            yield from _names(item)
@@ -0,0 +1,249 @@
+"""Pre-create name collision detection for Strata Cloud Manager SDK.
+
+Indexes the names defined in a target folder's ancestors and descendants, so every
+name in a batch that the API would reject as not unique is reported in one pass,
+before anything is created.
+"""
+
+# scm/sync/collision.py
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Local SDK imports
+from scm.exceptions import NameNotUniqueError
+from scm.sync.bulk import rulebase_kwargs
+from scm.sync.plan import CONTAINER_FIELDS, DesiredState, list_container
+from scm.sync.preflight import KIND_SERVICES
+
+logger = logging.getLogger(__name__)
+
+RULEBASES = ("pre", "post")
+
+_Scope = Tuple[Tuple[str, str], ...]
+
+
+def namespace_services(service_name: str) -> Tuple[str, ...]:
+    """Return the services whose names share a namespace with a service's names.
+
+    Addresses, address groups, external dynamic lists, and regions share one
+    namespace, as do services and service groups; every other service has its own.
+    """
+    for services in KIND_SERVICES.values():
+        if service_name in services:
+            return services
+    return (service_name,)
+
+
+@dataclass
+class NameCollision:
+    """A batch object whose name is already taken in a related container.
+
+    Attributes:
+        service: Service of the batch object, e.g. "address".
+        name: The colliding name.
+        container: The batch object's container, e.g. {"folder": "Texas"}.
+        other_service: Service of the object that holds the name.
+        other_container: Container of the object that holds the name.
+        relation: Where the other object lives relative to the batch object:
+            "same", "ancestor", or "descendant".
+        in_batch: Whether the other object is part of the same batch.
+
+    """
+
+    service: str
+    name: str
+    container: Dict[str, str]
+    other_service: str
+    other_container: Dict[str, str]
+    relation: str
+    in_batch: bool = False
+
+
+@dataclass
+class CollisionReport:
+    """Outcome of a collision check.
+
+    Attributes:
+        collisions: Every collision, in input order.
+        checked: Number of objects checked.
+        listings: Number of list() calls made to build the index.
+
+    """
+
+    collisions: List[NameCollision] = field(default_factory=list)
+    checked: int = 0
+    listings: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether no name collides."""
+        return not self.collisions
+
+    def raise_for_errors(self) -> None:
+        """Raise NameNotUniqueError listing the collisions, if there are any."""
+        if self.ok:
+            return
+        raise NameNotUniqueError(
+            message=f"Name collision check failed: {len(self.collisions)} names are not unique",
+            error_code="E006",
+            http_status_code=409,
+            details={
+                "collisions": [
+                    f"{c.service} '{c.name}' in {_label(c.container)} collides with "
+                    f"{c.other_service} in {_label(c.other_container)} ({c.relation})"
+                    for c in self.collisions
+                ]
+            },
+        )
+
+
+class CollisionChecker:
+    """Detect name collisions of a batch of new objects before they are created.
+
+    A folder inherits the objects of its ancestors and passes its own down to its
+    descendants, so a name must be unique across that whole line of folders among
+    the services sharing its namespace (see namespace_services()). Snippets and
+    devices are checked against their own contents only.
+
+    check() builds a hashed index of name -> holders from one folder list() for the
+    tree (parent links) and one exact-match list() per service and related folder,
+    run concurrently. Rule services are listed in both rulebases. Every name in the
+    batch, including names repeated within the batch, is then checked locally.
+
+    Args:
+        api_client: The Scm client.
+        max_workers: Maximum concurrent listings (default: 8).
+
+    """
+
+    def __init__(self, api_client, max_workers: int = 8):
+        """Initialize the checker."""
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self._parents: Optional[Dict[str, str]] = None
+
+    def check(self, batch: DesiredState) -> CollisionReport:
+        """Check every name of a batch against its related containers and the batch.
+
+        Args:
+            batch: Objects by unified client service name; each names its container.
+
+        Returns:
+            CollisionReport: The colliding names.
+
+        """
+        report = CollisionReport()
+        objects: List[Tuple[str, str, Dict[str, str]]] = []
+        for service_name, items in batch.items():
+            for item in items:
+                container = {k: item[k] for k in CONTAINER_FIELDS if item.get(k)}
+                objects.append((service_name, item["name"], container))
+        report.checked = len(objects)
+
+        if self._parents is None and any("folder" in container for *_, container in objects):
+            self._parents = {folder.name: folder.parent for folder in self.api_client.folder.list()}
+            report.listings += 1
+
+        related = {_scope(container): self._related(container) for _, _, container in objects}
+        jobs = {
+            (service, scope)
+            for service_name, _, container in objects
+            for service in namespace_services(service_name)
+            for scope, _ in related[_scope(container)]
+        }
+        index = self._index(sorted(jobs), report)
+
+        # Names claimed by the batch itself, in input order
+        claimed: Dict[Tuple[Tuple[str, ...], str], List[Tuple[str, _Scope]]] = {}
+        for service_name, name, container in objects:
+            namespace = namespace_services(service_name)
+            for scope, relation in related[_scope(container)]:
+                for service in namespace:
+                    if (service, scope, name) in index:
+                        report.collisions.append(
+                            NameCollision(
+                                service_name, name, container, service, dict(scope), relation
+                            )
+                        )
+                for other_service, other_scope in claimed.get((namespace, name), []):
+                    if other_scope == scope:
+                        report.collisions.append(
+                            NameCollision(
+                                service_name,
+                                name,
+                                container,
+                                other_service,
+                                dict(other_scope),
+                                relation,
+                                in_batch=True,
+                            )
+                        )
+            claimed.setdefault((namespace, name), []).append((service_name, _scope(container)))
+
+        logger.info(
+            f"Collision check of {report.checked} objects with {report.listings} listings: "
+            f"{len(report.collisions)} collisions"
+        )
+        return report
+
+    def _index(self, jobs: List[Tuple[str, _Scope]], report: CollisionReport) -> Set[Any]:
+        """List each service in each scope and index the names as (service, scope, name)."""
+
+        def load(job):
+            service_name, scope = job
+            service = getattr(self.api_client, service_name)
+            rulebases = RULEBASES if rulebase_kwargs(service.list, "pre") else (None,)
+            return [
+                obj.name
+                for rulebase in rulebases
+                for obj in list_container(service, dict(scope), rulebase)
+            ], len(rulebases)
+
+        index: Set[Any] = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for (service_name, scope), (names, listings) in zip(jobs, executor.map(load, jobs)):
+                index.update((service_name, scope, name) for name in names)
+                report.listings += listings
+        return index
+
+    def _related(self, container: Dict[str, str]) -> List[Tuple[_Scope, str]]:
+        """Return a container and every container related to it, with the relation."""
+        if "folder" not in container:
+            return [(_scope(container), "same")]
+        parents = self._parents or {}
+        folder = container["folder"]
+        related = [((("folder", folder),), "same")]
+        seen = {folder}
+
+        ancestor = parents.get(folder)
+        while ancestor and ancestor not in seen:
+            seen.add(ancestor)
+            related.append(((("folder", ancestor),), "ancestor"))
+            ancestor = parents.get(ancestor)
+
+        children: Dict[str, List[str]] = {}
+        for child, parent in parents.items():
+            children.setdefault(parent, []).append(child)
+        pending = list(children.get(folder, []))
+        while pending:
+            child = pending.pop(0)
+            if child in seen:
+                continue
+            seen.add(child)
+            related.append(((("folder", child),), "descendant"))
+            pending.extend(children.get(child, []))
+        return related
+
+
+def _scope(container: Dict[str, str]) -> _Scope:
+    """Return a container as a hashable scope."""
+    return tuple(sorted(container.items()))
+
+
+def _label(container: Dict[str, str]) -> str:
+    """Describe a container, e.g. "folder 'Texas'"."""
+    return ", ".join(f"{kind} '{name}'" for kind, name in container.items())
@@ -0,0 +1,475 @@
+"""Declarative plan/apply engine for Strata Cloud Manager SDK.
+
+Compares a desired-state document with the current configuration, loaded with
+one bulk listing per service and container, and computes the minimal set of
+creates, updates, and deletes needed to converge.
+"""
+
+# scm/sync/plan.py
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+import inspect
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError
+from scm.sync.bulk import (
+    CREATE,
+    DELETE,
+    UPDATE,
+    BulkEngine,
+    BulkOperation,
+    BulkReport,
+    create_model,
+    rulebase_kwargs,
+    update_model,
+)
+from scm.utils.fingerprint import VOLATILE_FIELDS
+
+CONTAINER_FIELDS = ("folder", "snippet", "device")
+
+# Fields owned by the server that never count as a difference
+_UNCOMPARED = frozenset({"id", *CONTAINER_FIELDS, *VOLATILE_FIELDS})
+
+DesiredState = Dict[str, List[Dict[str, Any]]]
+_Scope = Tuple[str, str, str, Optional[str]]
+
+
+@dataclass
+class PlannedChange:
+    """One change of a plan.
+
+    Attributes:
+        action: One of "create", "update", or "delete".
+        service: Unified client attribute of the service, e.g. "address".
+        name: Name of the object.
+        container: The object's container, e.g. {"folder": "Texas"}.
+        rulebase: Rulebase ("pre" or "post") for rule services.
+        object_id: Id of the existing object, for updates and deletes.
+        changes: Field differences as {field: {"from": current, "to": desired}}.
+        data: The payload sent when the change is applied.
+
+    """
+
+    action: str
+    service: str
+    name: str
+    container: Dict[str, str]
+    rulebase: Optional[str] = None
+    object_id: Optional[str] = None
+    changes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_operation(self) -> BulkOperation:
+        """Convert the change into a BulkOperation."""
+        return BulkOperation(
+            action=self.action,
+            service=self.service,
+            data=self.data,
+            object_id=self.object_id,
+            rulebase=self.rulebase,
+        )
+
+
+@dataclass
+class Plan:
+    """An ordered, serializable list of changes.
+
+    Changes are listed in the order they are applied: creates and updates in
+    dependency order, followed by deletes in reverse dependency order.
+
+    Attributes:
+        changes: The planned changes.
+        unchanged: Number of desired objects that already match.
+
+    """
+
+    changes: List[PlannedChange] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def empty(self) -> bool:
+        """Whether applying the plan would change nothing."""
+        return not self.changes
+
+    def summary(self) -> Dict[str, int]:
+        """Return the number of changes per action, and the unchanged count."""
+        counts = {CREATE: 0, UPDATE: 0, DELETE: 0}
+        for change in self.changes:
+            counts[change.action] += 1
+        return {**counts, "unchanged": self.unchanged}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the plan as JSON-serializable data."""
+        return {
+            "changes": [asdict(change) for change in self.changes],
+            "unchanged": self.unchanged,
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Serialize the plan to JSON; keyword arguments are passed to json.dumps."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Plan":
+        """Rebuild a plan from to_dict() output."""
+        return cls(
+            changes=[PlannedChange(**change) for change in data.get("changes", [])],
+            unchanged=data.get("unchanged", 0),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "Plan":
+        """Rebuild a plan from to_json() output."""
+        return cls.from_dict(json.loads(text))
+
+    def __iter__(self):
+        """Iterate over the changes in apply order."""
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        """Return the number of changes."""
+        return len(self.changes)
+
+
+class Planner:
+    """Compute and apply the changes that converge SCM onto a desired state.
+
+    The desired state maps unified client service names to lists of objects:
+
+        address:
+          - name: web1
+            folder: Texas
+            ip_netmask: 10.0.0.1/32
+        security_rule:
+          - name: allow-web
+            folder: Texas
+            rulebase: pre
+            ...
+
+    Every object names exactly one container, and rule objects may set a rulebase
+    (default "pre"). The current state of each (service, container, rulebase)
+    combination is loaded with a single paginated list() call, so planning costs
+    one request per page rather than one per object. Objects are matched by name
+    and compared field by field after validation with the service's create model;
+    only fields present in the desired object are compared. Applying a plan runs
+    it through BulkEngine, so only changed objects cost a request.
+
+    Args:
+        api_client: The Scm client.
+        max_workers: Maximum concurrent listings and writes (default: 8).
+        prune: Also delete objects that exist in a listed container but are absent
+            from the desired state (default: False).
+
+    """
+
+    def __init__(
+        self,
+        api_client,
+        max_workers: int = 8,
+        prune: bool = False,
+    ):
+        """Initialize the planner."""
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self.prune = prune
+        self.logger = logging.getLogger(__name__)
+
+    def plan(self, desired: DesiredState) -> Plan:
+        """Compute the changes between the current and the desired state.
+
+        Args:
+            desired: Desired objects keyed by service name.
+
+        Returns:
+            Plan: The changes in apply order.
+
+        Raises:
+            InvalidObjectError: If a desired object is invalid or lacks a container.
+
+        """
+        wanted: Dict[_Scope, Dict[str, Dict[str, Any]]] = {}
+        for service_name, objects in desired.items():
+            for obj in objects:
+                scope, data = self._scope(service_name, obj)
+                wanted.setdefault(scope, {})[data["name"]] = data
+
+        current = self._load(list(wanted))
+        changes: List[PlannedChange] = []
+        unchanged = 0
+        for scope, objects in wanted.items():
+            existing = current[scope]
+            for name, data in objects.items():
+                change = self._compare(scope, data, existing.get(name))
+                if change is None:
+                    unchanged += 1
+                else:
+                    changes.append(change)
+            if self.prune:
+                changes.extend(
+                    self._delete(scope, obj)
+                    for name, obj in existing.items()
+                    if name not in objects
+                )
+
+        layers = BulkEngine(self.api_client).plan(change.to_operation() for change in changes)
+        ordered = [changes[index] for layer in layers for index in layer]
+        return Plan(changes=ordered, unchanged=unchanged)
+
+    def apply(self, plan: Plan, stop_on_error: bool = False) -> BulkReport:
+        """Apply a plan concurrently in dependency order.
+
+        Args:
+            plan: A plan from plan() or Plan.from_json().
+            stop_on_error: Skip all remaining layers after a layer with a failure.
+
+        Returns:
+            BulkReport: One result per planned change, in plan order.
+
+        """
+        engine = BulkEngine(
+            self.api_client,
+            max_workers=self.max_workers,
+            stop_on_error=stop_on_error,
+        )
+        return engine.run(change.to_operation() for change in plan.changes)
+
+    def _scope(self, service_name: str, obj: Dict[str, Any]) -> Tuple[_Scope, Dict[str, Any]]:
+        """Validate a desired object and return its scope and normalized fields."""
+        service = getattr(self.api_client, service_name)
+        data = dict(obj)
+        rulebase = data.pop("rulebase", None)
+        if rulebase is None and rulebase_kwargs(service.list, "pre"):
+            rulebase = "pre"
+
+        containers = [key for key in CONTAINER_FIELDS if data.get(key)]
+        if len(containers) != 1:
+            raise InvalidObjectError(
+                message="Exactly one of 'folder', 'snippet', or 'device' must be provided.",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": f"Invalid container for {service_name} '{data.get('name')}'"},
+            )
+
+        container = containers[0]
+        return (service_name, container, data[container], rulebase), desired_fields(service, data)
+
+    def _load(self, scopes: List[_Scope]) -> Dict[_Scope, Dict[str, Any]]:
+        """List every scope once, concurrently, indexing the objects by name."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            listings = dict(zip(scopes, executor.map(self._list, scopes)))
+        return {
+            scope: {obj.name: obj for obj in objects if getattr(obj, "name", None)}
+            for scope, objects in listings.items()
+        }
+
+    def _list(self, scope: _Scope) -> List[Any]:
+        """List the objects of one scope."""
+        service_name, container, value, rulebase = scope
+        service = getattr(self.api_client, service_name)
+        return list_container(service, {container: value}, rulebase)
+
+    def _compare(
+        self,
+        scope: _Scope,
+        desired: Dict[str, Any],
+        existing: Any,
+    ) -> Optional[PlannedChange]:
+        """Return the change that turns existing into desired, or None if they match."""
+        service_name, container, value, rulebase = scope
+        if existing is None:
+            return PlannedChange(
+                action=CREATE,
+                service=service_name,
+                name=desired["name"],
+                container={container: value},
+                rulebase=rulebase,
+                data=desired,
+            )
+
+        changes = changed_fields(desired, existing)
+        if not changes:
+            return None
+
+        service = getattr(self.api_client, service_name)
+        return PlannedChange(
+            action=UPDATE,
+            service=service_name,
+            name=desired["name"],
+            container={container: value},
+            rulebase=rulebase,
+            object_id=str(existing.id),
+            changes=changes,
+            data=update_payload(service, existing, changes),
+        )
+
+    @staticmethod
+    def _delete(scope: _Scope, existing: Any) -> PlannedChange:
+        """Return the change that deletes an object absent from the desired state."""
+        service_name, container, value, rulebase = scope
+        return PlannedChange(
+            action=DELETE,
+            service=service_name,
+            name=existing.name,
+            container={container: value},
+            rulebase=rulebase,
+            object_id=str(existing.id),
+            # Keep the content so deletes can be ordered by their references
+            data=existing.model_dump(mode="json", exclude_none=True),
+        )
+
+
+def desired_fields(service, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate desired object data with a service's create model.
+
+    Args:
+        service: A service instance, e.g. client.address.
+        data: The desired object.
+
+    Returns:
+        Dict[str, Any]: The fields the data sets, normalized to JSON-compatible values.
+
+    Raises:
+        InvalidObjectError: If the data does not validate.
+
+    """
+    try:
+        model = create_model(service)(**data)
+    except ValueError as e:
+        raise InvalidObjectError(
+            message=f"Invalid {type(service).__name__} object '{data.get('name')}'",
+            error_code="E003",
+            http_status_code=400,
+            details={"error": str(e)},
+        )
+    return model.model_dump(mode="json", exclude_unset=True)
+
+
+def changed_fields(desired: Dict[str, Any], existing: Any) -> Dict[str, Dict[str, Any]]:
+    """Compare desired fields with an existing response model.
+
+    Only fields present in desired are compared; ids, containers, and volatile
+    fields never count as a difference.
+
+    Args:
+        desired: Output of desired_fields().
+        existing: The existing object's response model.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Differences as {field: {"from": current, "to": desired}}.
+
+    """
+    current = existing.model_dump(mode="json")
+    return {
+        key: {"from": current.get(key), "to": wanted}
+        for key, wanted in desired.items()
+        if key not in _UNCOMPARED and current.get(key) != wanted
+    }
+
+
+def update_payload(
+    service,
+    existing: Any,
+    changes: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Build update data: the existing object with the changed fields overlaid.
+
+    Args:
+        service: A service instance, e.g. client.address.
+        existing: The existing object's response model.
+        changes: Output of changed_fields().
+
+    Returns:
+        Dict[str, Any]: Data accepted by the service's update model, including the id.
+
+    """
+    allowed = update_model(service).model_fields
+    payload = {
+        key: item
+        for key, item in existing.model_dump(mode="json", exclude_none=True).items()
+        if key in allowed and key not in VOLATILE_FIELDS
+    }
+    payload.update({key: diff["to"] for key, diff in changes.items()})
+    payload["id"] = str(existing.id)
+    return payload
+
+
+def list_container(service, container: Dict[str, str], rulebase: Optional[str] = None) -> List[Any]:
+    """List the objects that live directly in one container.
+
+    Args:
+        service: A service instance, e.g. client.address.
+        container: The container, e.g. {"folder": "Texas"}.
+        rulebase: Rulebase ("pre" or "post") for rule services.
+
+    Returns:
+        List[Any]: The service's response models.
+
+    """
+    kwargs: Dict[str, Any] = {**container, **rulebase_kwargs(service.list, rulebase)}
+    if "exact_match" in inspect.signature(service.list).parameters:
+        kwargs["exact_match"] = True
+    return service.list(**kwargs)
+
+
+def load_desired_state(source: Union[str, Path, Dict[str, Any]]) -> DesiredState:
+    """Load a desired-state document.
+
+    Args:
+        source: A mapping, or the path of a JSON or YAML file. YAML requires PyYAML.
+
+    Returns:
+        DesiredState: Desired objects keyed by service name.
+
+    Raises:
+        InvalidObjectError: If the document is not a mapping of service names to lists.
+        ImportError: If a YAML file is given and PyYAML is not installed.
+
+    """
+    if isinstance(source, dict):
+        document: Any = source
+    else:
+        path = Path(source)
+        text = path.read_text()
+        if path.suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError(
+                    "PyYAML is required to load YAML desired state: pip install pyyaml"
+                )
+            document = yaml.safe_load(text) or {}
+        else:
+            document = json.loads(text)
+
+    if not isinstance(document, dict) or not all(
+        isinstance(objects, list) for objects in document.values()
+    ):
+        raise InvalidObjectError(
+            message="Desired state must map service names to lists of objects",
+            error_code="E003",
+            http_status_code=400,
+            details={"error": "Invalid desired state document"},
+        )
+    return _validated(document.items())
+
+
+def _validated(items: Iterable[Tuple[str, List[Any]]]) -> DesiredState:
+    """Check that every desired object is a mapping with a name."""
+    state: DesiredState = {}
+    for service_name, objects in items:
+        for obj in objects:
+            if not isinstance(obj, dict) or not obj.get("name"):
+                raise InvalidObjectError(
+                    message=f"Every desired {service_name} object needs a name",
+                    error_code="E003",
+                    http_status_code=400,
+                    details={"error": "Invalid desired state document"},
+                )
+        state[service_name] = list(objects)
+    return state
@@ -0,0 +1,320 @@
+"""Pre-flight reference checking for Strata Cloud Manager SDK.
+
+Resolves the names that rules and groups refer to against a local index of the
+target containers and their ancestor folders, so dangling references are reported
+for a whole batch before anything is pushed.
+"""
+
+# scm/sync/preflight.py
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import ipaddress
+import logging
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError
+from scm.sync.plan import CONTAINER_FIELDS, DesiredState, desired_fields, list_container
+
+logger = logging.getLogger(__name__)
+
+# Reference kinds, and the services whose objects a reference of that kind may name
+KIND_SERVICES: Dict[str, Tuple[str, ...]] = {
+    "address": ("address", "address_group", "external_dynamic_list", "region"),
+    "service": ("service", "service_group"),
+    "tag": ("tag",),
+    "zone": ("security_zone",),
+    "profile_group": (),  # no SDK service; names come from the known argument
+}
+
+# Names every container resolves without an object
+PREDEFINED: Dict[str, Set[str]] = {
+    "address": {"any"},
+    "service": {"any", "application-default", "service-http", "service-https"},
+    "tag": set(),
+    "zone": {"any"},
+    "profile_group": {"best-practice"},
+}
+
+_RULE_REFERENCES = {
+    "from_": "zone",
+    "to_": "zone",
+    "source": "address",
+    "destination": "address",
+    "service": "service",
+    "tag": "tag",
+}
+
+# Reference fields per service; dotted paths reach into nested settings
+REFERENCES: Dict[str, Dict[str, str]] = {
+    "security_rule": {**_RULE_REFERENCES, "profile_setting.group": "profile_group"},
+    "nat_rule": {
+        **_RULE_REFERENCES,
+        "source_translation": "address",
+        "destination_translation.translated_address": "address",
+    },
+    "address_group": {"static": "address", "dynamic.filter": "tag", "tag": "tag"},
+    "service_group": {"members": "service", "tag": "tag"},
+    "address": {"tag": "tag"},
+    "service": {"tag": "tag"},
+}
+
+_QUOTED = re.compile(r"'([^']+)'|\"([^\"]+)\"")
+_COUNTRY = re.compile(r"^[A-Z]{2}$")
+_TRANSLATED = ("translated_address", "fallback_address")
+
+
+@dataclass
+class DanglingReference:
+    """A name that resolves to no object in the referring object's scope.
+
+    Attributes:
+        service: Service of the referring object, e.g. "security_rule".
+        name: Name of the referring object.
+        container: The referring object's container, e.g. {"folder": "Texas"}.
+        field: Field holding the reference, e.g. "source".
+        kind: Kind of object referenced: address, service, tag, zone, or profile_group.
+        reference: The name that did not resolve.
+
+    """
+
+    service: str
+    name: str
+    container: Dict[str, str]
+    field: str
+    kind: str
+    reference: str
+
+
+@dataclass
+class PreflightReport:
+    """Outcome of a pre-flight check.
+
+    Attributes:
+        dangling: Every unresolved reference, in input order.
+        invalid: Objects that failed model validation, as (service, index, error).
+        checked: Number of objects checked.
+        listings: Number of list() calls made to build the index.
+
+    """
+
+    dangling: List[DanglingReference] = field(default_factory=list)
+    invalid: List[Tuple[str, int, InvalidObjectError]] = field(default_factory=list)
+    checked: int = 0
+    listings: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every object validated and every reference resolved."""
+        return not self.dangling and not self.invalid
+
+    def by_object(self) -> Dict[Tuple[str, str], List[DanglingReference]]:
+        """Group the dangling references by (service, name) of the referring object."""
+        grouped: Dict[Tuple[str, str], List[DanglingReference]] = {}
+        for dangling in self.dangling:
+            grouped.setdefault((dangling.service, dangling.name), []).append(dangling)
+        return grouped
+
+    def raise_for_errors(self) -> None:
+        """Raise InvalidObjectError listing the problems, if there are any."""
+        if self.ok:
+            return
+        raise InvalidObjectError(
+            message=(
+                f"Pre-flight check failed: {len(self.dangling)} dangling references, "
+                f"{len(self.invalid)} invalid objects"
+            ),
+            error_code="E003",
+            http_status_code=400,
+            details={
+                "dangling": [
+                    f"{d.service} '{d.name}' {d.field}: {d.kind} '{d.reference}'"
+                    for d in self.dangling
+                ],
+                "invalid": [
+                    f"{service}[{index}]: {error.message}" for service, index, error in self.invalid
+                ],
+            },
+        )
+
+
+class ReferenceChecker:
+    """Check the references of a batch of objects before it is pushed.
+
+    check() takes a desired-state mapping (the format Planner.plan() accepts) and
+    validates every object with its service's create model. It then collects the
+    names in the reference fields of security rules, NAT rules, address groups,
+    service groups, addresses, and services (see REFERENCES). Literal IP
+    addresses, ranges, country codes, and predefined names are not references.
+
+    Each reference must name an object in the referring object's container or in
+    one of its ancestor folders, or an object of the same batch in one of those
+    scopes. The index is built from one exact-match list() per service and scope,
+    concurrently, only for the kinds of objects the batch refers to; the folder
+    tree comes from one folder list(). Every reference is then resolved locally.
+
+    Args:
+        api_client: The Scm client.
+        max_workers: Maximum concurrent listings (default: 8).
+        known: Extra names that always resolve, by kind, e.g. custom profile groups
+            {"profile_group": ["strict"]}, which no SDK service lists.
+
+    """
+
+    def __init__(
+        self,
+        api_client,
+        max_workers: int = 8,
+        known: Optional[Dict[str, Iterable[str]]] = None,
+    ):
+        """Initialize the checker."""
+        self.api_client = api_client
+        self.max_workers = max_workers
+        self.known = {kind: set(PREDEFINED[kind]) for kind in KIND_SERVICES}
+        for kind, names in (known or {}).items():
+            self.known.setdefault(kind, set()).update(names)
+        self._parents: Optional[Dict[str, str]] = None
+
+    def check(self, batch: DesiredState) -> PreflightReport:
+        """Resolve every reference of a batch against the target containers.
+
+        Args:
+            batch: Objects by unified client service name; each names its container.
+
+        Returns:
+            PreflightReport: The dangling references and invalid objects.
+
+        """
+        report = PreflightReport()
+        objects: List[Tuple[str, Dict[str, Any], Dict[str, str]]] = []
+        for service_name, items in batch.items():
+            service = getattr(self.api_client, service_name)
+            for index, item in enumerate(items):
+                item = {k: v for k, v in item.items() if k != "rulebase"}
+                try:
+                    fields = desired_fields(service, item)
+                except InvalidObjectError as e:
+                    report.invalid.append((service_name, index, e))
+                    continue
+                container = {k: item[k] for k in CONTAINER_FIELDS if item.get(k)}
+                objects.append((service_name, fields, container))
+        report.checked = len(objects)
+
+        references = [
+            (service_name, fields, container, list(self._references(service_name, fields)))
+            for service_name, fields, container in objects
+        ]
+        if self._parents is None and any("folder" in container for *_, container in objects):
+            self._parents = {folder.name: folder.parent for folder in self.api_client.folder.list()}
+            report.listings += 1
+        kinds = {kind for *_, refs in references for _, kind, _ in refs}
+        scopes = {scope for _, _, container, _ in references for scope in self._scopes(container)}
+        index = self._index(kinds, scopes, report)
+
+        # Objects of the batch resolve like existing ones in their container
+        for service_name, fields, container in objects:
+            scope = tuple(sorted(container.items()))
+            for kind, services in KIND_SERVICES.items():
+                if service_name in services:
+                    index.setdefault((kind, scope), set()).add(fields["name"])
+
+        for service_name, fields, container, refs in references:
+            visible = self._scopes(container)
+            for field_name, kind, reference in refs:
+                if reference in self.known.get(kind, ()):
+                    continue
+                if any(reference in index.get((kind, scope), ()) for scope in visible):
+                    continue
+                report.dangling.append(
+                    DanglingReference(
+                        service_name, fields["name"], container, field_name, kind, reference
+                    )
+                )
+        logger.info(
+            f"Pre-flight checked {report.checked} objects with {report.listings} listings: "
+            f"{len(report.dangling)} dangling references"
+        )
+        return report
+
+    def _index(
+        self,
+        kinds: Set[str],
+        scopes: Set[Tuple[Tuple[str, str], ...]],
+        report: PreflightReport,
+    ) -> Dict[Tuple[str, Any], Set[str]]:
+        """List the objects each referenced kind may name, once per service and scope."""
+        jobs = [
+            (kind, service_name, scope)
+            for kind in sorted(kinds)
+            for service_name in KIND_SERVICES[kind]
+            for scope in scopes
+        ]
+
+        def load(job):
+            _, service_name, scope = job
+            return list_container(getattr(self.api_client, service_name), dict(scope))
+
+        index: Dict[Tuple[str, Any], Set[str]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for (kind, _, scope), found in zip(jobs, executor.map(load, jobs)):
+                index.setdefault((kind, scope), set()).update(obj.name for obj in found)
+        report.listings += len(jobs)
+        return index
+
+    def _scopes(self, container: Dict[str, str]) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+        """Return a container and its ancestor folders, nearest first, as hashable scopes."""
+        if "folder" not in container:
+            return (tuple(sorted(container.items())),)
+        chain: List[str] = []
+        folder = container["folder"]
+        while folder and folder not in chain:
+            chain.append(folder)
+            folder = (self._parents or {}).get(folder)
+        return tuple((("folder", name),) for name in chain)
+
+    @staticmethod
+    def _references(service_name: str, fields: Dict[str, Any]) -> Iterator[Tuple[str, str, str]]:
+        """Yield (field, kind, name) for every reference in an object's fields."""
+        for path, kind in REFERENCES.get(service_name, {}).items():
+            value: Any = fields
+            for part in path.split("."):
+                value = value.get(part) if isinstance(value, dict) else None
+            if path == "dynamic.filter":
+                names: Iterable[str] = (
+                    m.group(1) or m.group(2) for m in _QUOTED.finditer(value or "")
+                )
+            elif path == "source_translation":
+                names = _translated(value)
+            elif isinstance(value, str):
+                names = [value]
+            else:
+                names = value or []
+            for name in names:
+                if kind == "address" and _is_literal(name):
+                    continue
+                yield path, kind, name
+
+
+def _translated(value: Any) -> Iterator[str]:
+    """Yield the address names inside a NAT source translation."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in _TRANSLATED:
+                yield from [item] if isinstance(item, str) else item or []
+            else:
+                yield from _translated(item)
+
+
+def _is_literal(value: str) -> bool:
+    """Whether an address reference is a literal rather than an object name."""
+    if _COUNTRY.match(value):
+        return True
+    for part in value.split("-", 1) if value.count("-") == 1 else [value]:
+        try:
+            ipaddress.ip_network(part, strict=False)
+        except ValueError:
+            return False
+    return True
@@ -0,0 +1,187 @@
+"""Minimal-move rule reordering for Strata Cloud Manager SDK.
+
+Computes the fewest single-rule moves that turn the current order of a rulebase
+into a desired order, and issues them through a rule service's move() method.
+"""
+
+# scm/sync/reorder.py
+
+# Standard library imports
+from bisect import bisect_left
+from dataclasses import dataclass
+import logging
+from typing import Dict, List, Optional, Sequence, Set
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError
+from scm.sync.bulk import rulebase_kwargs
+from scm.sync.plan import list_container
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RuleMove:
+    """One move of a reorder plan.
+
+    Attributes:
+        rule_id: Id of the rule to move.
+        name: Name of the rule to move.
+        destination: "before", "after", or "top".
+        destination_rule: Id of the anchor rule for "before" and "after".
+        destination_name: Name of the anchor rule for "before" and "after".
+
+    """
+
+    rule_id: str
+    name: str
+    destination: str
+    destination_rule: Optional[str] = None
+    destination_name: Optional[str] = None
+
+    def move_data(self, rulebase: str) -> Dict[str, str]:
+        """Return the data accepted by a rule service's move() method."""
+        data = {"destination": self.destination, "rulebase": rulebase}
+        if self.destination_rule is not None:
+            data["destination_rule"] = self.destination_rule
+        return data
+
+
+def longest_increasing_subsequence(sequence: Sequence[int]) -> List[int]:
+    """Return the indexes of one longest strictly increasing subsequence.
+
+    Runs in O(n log n) time with patience sorting.
+
+    Args:
+        sequence: The values.
+
+    Returns:
+        List[int]: Indexes into sequence, in increasing order.
+
+    """
+    tails: List[int] = []  # tails[k]: value ending the best subsequence of length k + 1
+    tail_indexes: List[int] = []
+    previous: List[Optional[int]] = [None] * len(sequence)
+    for index, value in enumerate(sequence):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indexes.append(index)
+        else:
+            tails[length] = value
+            tail_indexes[length] = index
+        previous[index] = tail_indexes[length - 1] if length else None
+
+    result: List[int] = []
+    cursor = tail_indexes[-1] if tail_indexes else None
+    while cursor is not None:
+        result.append(cursor)
+        cursor = previous[cursor]
+    return result[::-1]
+
+
+def plan_moves(
+    current: Sequence[str],
+    desired: Sequence[str],
+    ids: Optional[Dict[str, str]] = None,
+) -> List[RuleMove]:
+    """Compute the fewest single-rule moves that turn current into desired.
+
+    Rules on a longest increasing subsequence of current (ranked by desired
+    position) are already in the right relative order and stay put. Every other
+    rule is moved, in desired order, right after its desired predecessor, which
+    is in its final relative position by then. The first desired rule, if it
+    has to move, goes before the first rule that stays, or to the top.
+
+    Args:
+        current: Rule names in their current order.
+        desired: The same rule names in the desired order.
+        ids: Rule ids by name, used for the moves (default: the names).
+
+    Returns:
+        List[RuleMove]: The moves, to be issued in order.
+
+    Raises:
+        InvalidObjectError: If desired is not a permutation of current.
+
+    """
+    if len(set(desired)) != len(desired) or set(desired) != set(current):
+        missing = sorted(set(current) - set(desired))
+        unknown = sorted(set(desired) - set(current))
+        raise InvalidObjectError(
+            message="desired_order must list every rule of the rulebase exactly once",
+            error_code="E003",
+            http_status_code=400,
+            details={"missing": missing, "unknown": unknown},
+        )
+
+    ids = ids or {name: name for name in current}
+    rank = {name: position for position, name in enumerate(desired)}
+    ranks = [rank[name] for name in current]
+    stable: Set[str] = {current[i] for i in longest_increasing_subsequence(ranks)}
+    first_stable = next((name for name in desired if name in stable), None)
+
+    moves = []
+    for position, name in enumerate(desired):
+        if name in stable:
+            continue
+        if position > 0:
+            anchor = desired[position - 1]
+            moves.append(RuleMove(ids[name], name, "after", ids[anchor], anchor))
+        elif first_stable is not None:
+            moves.append(RuleMove(ids[name], name, "before", ids[first_stable], first_stable))
+        else:
+            moves.append(RuleMove(ids[name], name, "top"))
+    return moves
+
+
+def reorder_rules(
+    service,
+    folder: str,
+    rulebase: str,
+    desired_order: Sequence[str],
+    dry_run: bool = False,
+) -> List[RuleMove]:
+    """Reorder the rules of a folder's rulebase with the fewest move() calls.
+
+    The current order is read with one list() call. desired_order lists every rule
+    of the folder's rulebase exactly once, by name or id.
+
+    Args:
+        service: A rule service with a move() method, e.g. client.security_rule.
+        folder: Folder whose rules are reordered.
+        rulebase: Rulebase ("pre" or "post").
+        desired_order: Rule names or ids in the desired order.
+        dry_run: Compute the moves without issuing them.
+
+    Returns:
+        List[RuleMove]: The moves issued (or that would be issued).
+
+    Raises:
+        InvalidObjectError: If the service cannot list one rulebase on its own, or if
+            desired_order is not a permutation of the current rules.
+
+    """
+    if not rulebase_kwargs(service.list, rulebase):
+        # Without a rulebase filter the listing mixes pre- and post-rules, and the
+        # positions computed from it would be wrong
+        raise InvalidObjectError(
+            message=f"{type(service).__name__}.list() cannot filter by rulebase",
+            error_code="E003",
+            http_status_code=400,
+            details={"error": "Rules of this service cannot be listed per rulebase"},
+        )
+    rules = list_container(service, {"folder": folder}, rulebase)
+    names = [rule.name for rule in rules]
+    ids = {rule.name: str(rule.id) for rule in rules}
+    by_id = {str(rule.id): rule.name for rule in rules}
+    desired = [by_id.get(str(item), item) for item in desired_order]
+
+    moves = plan_moves(names, desired, ids)
+    logger.info(
+        f"Reordering {len(names)} rules in {folder}/{rulebase} with {len(moves)} moves"
+    )
+    if not dry_run:
+        for move in moves:
+            service.move(move.rule_id, move.move_data(rulebase))
+    return moves
@@ -0,0 +1,484 @@
+"""Batch transactions with a rollback journal for Strata Cloud Manager SDK.
+
+Queues creates, updates, and deletes, records the pre-image of every object they
+touch, and applies them through the bulk engine. If any operation fails, the applied
+ones are compensated in reverse dependency order. Every step is appended to a journal
+file, so a process that crashes mid-batch can finish the rollback later.
+"""
+
+# scm/sync/transaction.py
+
+# Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import uuid
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError, NotFoundError, TransactionError
+from scm.sync.bulk import (
+    CREATE,
+    DELETE,
+    SUCCEEDED,
+    UPDATE,
+    BulkEngine,
+    BulkOperation,
+    BulkReport,
+    BulkResult,
+    create_model,
+    rulebase_kwargs,
+    update_model,
+)
+from scm.sync.plan import CONTAINER_FIELDS, list_container
+from scm.utils.fingerprint import VOLATILE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_VERSION = 1
+
+# Journal states
+PENDING = "pending"
+APPLYING = "applying"
+COMMITTED = "committed"
+ROLLING_BACK = "rolling_back"
+ROLLED_BACK = "rolled_back"
+
+
+class Journal:
+    """Append-only JSON-lines record of a transaction.
+
+    The first line holds the operations and the pre-images of the objects they
+    touch. Every later line is one event: an operation started, completed, or
+    failed, a compensation completed, or the transaction changed state. Lines are
+    flushed as they are written; a torn last line left by a crash is ignored.
+
+    Args:
+        path: Location of the journal file.
+
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the journal."""
+        self.path = Path(path)
+        self.state = PENDING
+        self.operations: List[Dict[str, Any]] = []
+        self.pre_images: Dict[int, Dict[str, Any]] = {}
+        self.started: Set[int] = set()
+        self.completed: Dict[int, Optional[str]] = {}
+        self.failed: Set[int] = set()
+        self.compensated: Set[int] = set()
+        self._lock = threading.Lock()
+        self._file = None
+
+    def begin(self, operations: List[BulkOperation], pre_images: Dict[int, Dict[str, Any]]):
+        """Create the journal file with the header line."""
+        self.operations = [_serialize(operation) for operation in operations]
+        self.pre_images = dict(pre_images)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "x", encoding="utf-8")
+        header = {
+            "version": JOURNAL_VERSION,
+            "operations": self.operations,
+            "pre_images": {str(index): image for index, image in self.pre_images.items()},
+        }
+        self._file.write(json.dumps(header, default=str) + "\n")
+        self._file.flush()
+
+    def record(self, event: str, index: Optional[int] = None, **fields: Any) -> None:
+        """Append an event and apply it to the in-memory state."""
+        entry = {"event": event, **fields}
+        if index is not None:
+            entry["index"] = index
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            self._apply(entry)
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self, remove: bool = False) -> None:
+        """Close the journal file, deleting it if remove is set."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if remove:
+            self.path.unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Journal":
+        """Read a journal file left behind by an earlier process.
+
+        Raises:
+            InvalidObjectError: If the file is not a transaction journal.
+
+        """
+        journal = cls(path)
+        with open(journal.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # torn write at the point of a crash
+        if not entries or entries[0].get("version") != JOURNAL_VERSION:
+            raise InvalidObjectError(
+                message=f"{path} is not a transaction journal",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Missing or unsupported journal header"},
+            )
+        journal.operations = entries[0]["operations"]
+        journal.pre_images = {int(k): v for k, v in entries[0]["pre_images"].items()}
+        journal.state = APPLYING
+        for entry in entries[1:]:
+            journal._apply(entry)
+        journal._file = open(journal.path, "a", encoding="utf-8")
+        return journal
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        event = entry["event"]
+        index = entry.get("index")
+        if event == "state":
+            self.state = entry["state"]
+        elif event == "started":
+            self.started.add(index)
+        elif event == "completed":
+            self.completed[index] = entry.get("id")
+        elif event == "failed":
+            self.failed.add(index)
+        elif event == "compensated":
+            self.compensated.add(index)
+
+
+class Transaction:
+    """Apply a batch of changes as a unit, rolling back the applied part on failure.
+
+    Operations are queued with create(), update(), delete(), or add() and sent by
+    commit(), which a ``with`` block calls on a clean exit. Before anything is
+    sent, the current state of every object being updated or deleted is recorded:
+    one list() per service, container, and rulebase for operations whose data names
+    a container, and one get() for the rest. The batch then runs through the
+    BulkEngine, concurrently and in dependency order.
+
+    If an operation fails, each applied operation is compensated: created objects
+    are deleted, updated objects are restored to their pre-image, and deleted
+    objects are created again from theirs (with a new id). Compensations run through
+    the same engine, so they go in reverse dependency order. Every step is appended
+    to the journal file; if the process dies, recover() finishes the rollback.
+    The journal is removed once the transaction commits or is fully rolled back.
+
+    Args:
+        api_client: The Scm client.
+        journal_path: Journal file location (default: a new file in the temp directory).
+        max_workers: Maximum concurrent requests (default: 8).
+
+    """
+
+    def __init__(
+        self,
+        api_client,
+        journal_path: Optional[Union[str, Path]] = None,
+        max_workers: int = 8,
+    ):
+        """Initialize the transaction."""
+        if journal_path is None:
+            journal_path = Path(tempfile.gettempdir()) / f"scm-transaction-{uuid.uuid4()}.jsonl"
+        self.api_client = api_client
+        self.engine = BulkEngine(api_client, max_workers=max_workers)
+        self.journal = Journal(journal_path)
+        self.operations: List[BulkOperation] = []
+        self.report: Optional[BulkReport] = None
+        self.rollback_report: Optional[BulkReport] = None
+
+    @property
+    def journal_path(self) -> Path:
+        """Location of the journal file."""
+        return self.journal.path
+
+    def add(self, operation: BulkOperation) -> int:
+        """Queue an operation, returning its index in the batch."""
+        if self.journal.state != PENDING:
+            raise InvalidObjectError(
+                message="Operations cannot be added to a transaction that has run",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": f"Transaction is {self.journal.state}"},
+            )
+        self.operations.append(operation)
+        return len(self.operations) - 1
+
+    def create(self, service: str, data: Dict[str, Any], rulebase: Optional[str] = None) -> int:
+        """Queue a create of data through client.<service>."""
+        return self.add(BulkOperation(CREATE, service, data, rulebase=rulebase))
+
+    def update(self, service: str, data: Dict[str, Any], rulebase: Optional[str] = None) -> int:
+        """Queue an update; data must include the object's id."""
+        return self.add(BulkOperation(UPDATE, service, data, rulebase=rulebase))
+
+    def delete(
+        self,
+        service: str,
+        object_id: str,
+        rulebase: Optional[str] = None,
+        **container: str,
+    ) -> int:
+        """Queue a delete; naming the container lets its pre-image be listed in bulk."""
+        data = {"id": str(object_id), **container}
+        return self.add(BulkOperation(DELETE, service, data, rulebase=rulebase))
+
+    def commit(self) -> BulkReport:
+        """Record pre-images, run the batch, and roll back if any operation fails.
+
+        Returns:
+            BulkReport: The outcome of every operation.
+
+        Raises:
+            TransactionError: If an operation failed. The applied operations have
+                been compensated; error.report holds the batch outcome and
+                error.rollback the compensations. If a compensation failed too, the
+                journal is kept so the rollback can be retried with recover().
+
+        """
+        if not self.operations:
+            self.journal.state = COMMITTED
+            self.report = BulkReport(results=[])
+            return self.report
+
+        pre_images = self._fetch_pre_images()
+        for index, image in pre_images.items():
+            operation = self.operations[index]
+            if operation.action == DELETE:
+                # the deleted object's content refines the delete ordering
+                operation.data = {**image, **operation.fields}
+
+        self.journal.begin(self.operations, pre_images)
+        self.journal.record("state", state=APPLYING)
+        logger.info(f"Transaction applying {len(self.operations)} operations")
+        self.report = self.engine.run(
+            self.operations,
+            on_start=lambda index, _: self.journal.record("started", index),
+            on_result=self._record_result,
+        )
+
+        if self.report.ok:
+            self.journal.record("state", state=COMMITTED)
+            self.journal.close(remove=True)
+            return self.report
+
+        failed = self.report.failed[0].operation
+        self.rollback_report = _roll_back(self.api_client, self.journal, self.engine)
+        raise TransactionError(
+            message=(
+                f"Transaction failed at {failed.action} {failed.service} "
+                f"'{failed.name or failed.target_id}', rolled back"
+            ),
+            report=self.report,
+            rollback=self.rollback_report,
+            error_code="E003",
+            details={
+                "summary": self.report.summary(),
+                "rolled_back": self.journal.state == ROLLED_BACK,
+                "journal": str(self.journal.path),
+            },
+        )
+
+    @classmethod
+    def recover(
+        cls,
+        api_client,
+        journal_path: Union[str, Path],
+        max_workers: int = 8,
+    ) -> Optional[BulkReport]:
+        """Finish the rollback of a transaction whose process died mid-batch.
+
+        Operations that started but were never recorded as finished may or may not
+        have reached the API. Their effects are checked before compensating: a
+        create is looked up by name, and a delete by id.
+
+        Args:
+            api_client: The Scm client.
+            journal_path: The journal left behind.
+            max_workers: Maximum concurrent requests (default: 8).
+
+        Returns:
+            Optional[BulkReport]: The compensations run, or None if the transaction
+                had committed and there was nothing to undo.
+
+        Raises:
+            InvalidObjectError: If the file is not a transaction journal.
+
+        """
+        journal = Journal.load(journal_path)
+        if journal.state in (COMMITTED, ROLLED_BACK):
+            journal.close(remove=True)
+            return None
+        logger.info(f"Recovering transaction from {journal.path}")
+        return _roll_back(api_client, journal, BulkEngine(api_client, max_workers=max_workers))
+
+    def __enter__(self) -> "Transaction":
+        """Return the transaction to queue operations on."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Commit on a clean exit; discard the queue if the block raised."""
+        if exc_type is None:
+            self.commit()
+
+    def _record_result(self, result: BulkResult) -> None:
+        if result.status == SUCCEEDED:
+            created = result.operation.action == CREATE
+            object_id = getattr(result.result, "id", None) if created else None
+            self.journal.record("completed", result.index, id=object_id)
+        elif result.index in self.journal.started:
+            self.journal.record("failed", result.index)
+
+    def _fetch_pre_images(self) -> Dict[int, Dict[str, Any]]:
+        """Fetch the current state of every object being updated or deleted."""
+        listed: Dict[Tuple[str, Tuple[Tuple[str, str], ...], Optional[str]], List[int]] = {}
+        single: List[int] = []
+        for index, operation in enumerate(self.operations):
+            if operation.action == CREATE:
+                continue
+            container = _container(operation.fields)
+            if container:
+                key = (operation.service, tuple(sorted(container.items())), operation.rulebase)
+                listed.setdefault(key, []).append(index)
+            else:
+                single.append(index)
+
+        def list_group(key):
+            service, container, rulebase = key
+            found = list_container(getattr(self.api_client, service), dict(container), rulebase)
+            return {str(obj.id): obj for obj in found}
+
+        def get_one(index):
+            operation = self.operations[index]
+            service = getattr(self.api_client, operation.service)
+            return service.get(
+                operation.target_id, **rulebase_kwargs(service.get, operation.rulebase)
+            )
+
+        pre_images: Dict[int, Dict[str, Any]] = {}
+        missing = []
+        with ThreadPoolExecutor(max_workers=self.engine.max_workers) as executor:
+            listings = dict(zip(listed, executor.map(list_group, listed)))
+            for key, indexes in listed.items():
+                for index in indexes:
+                    found = listings[key].get(self.operations[index].target_id)
+                    if found is None:
+                        missing.append(index)
+                    else:
+                        pre_images[index] = _image(found)
+            for index, found in zip(single, executor.map(get_one, single)):
+                pre_images[index] = _image(found)
+
+        if missing:
+            raise InvalidObjectError(
+                message="Objects to update or delete were not found in their containers",
+                error_code="E003",
+                http_status_code=400,
+                details={"missing": [self.operations[i].target_id for i in missing]},
+            )
+        return pre_images
+
+
+def _roll_back(api_client, journal: Journal, engine: BulkEngine) -> BulkReport:
+    """Compensate every applied, not yet compensated operation of a journal."""
+    journal.record("state", state=ROLLING_BACK)
+    compensations: List[BulkOperation] = []
+    origins: List[int] = []
+    for index, entry in enumerate(journal.operations):
+        if index in journal.compensated or index in journal.failed:
+            continue
+        if index not in journal.completed and index not in journal.started:
+            continue
+        compensation = _compensation(api_client, journal, index, entry)
+        if compensation is None:
+            journal.record("compensated", index)
+        else:
+            compensations.append(compensation)
+            origins.append(index)
+
+    def on_result(result: BulkResult) -> None:
+        if result.status == SUCCEEDED:
+            journal.record("compensated", origins[result.index])
+
+    report = engine.run(compensations, on_result=on_result)
+    if report.ok:
+        journal.record("state", state=ROLLED_BACK)
+        journal.close(remove=True)
+        logger.info(f"Transaction rolled back {len(compensations)} operations")
+    else:
+        journal.close()
+        logger.error(
+            f"Transaction rollback incomplete, {len(report.failed)} compensations failed; "
+            f"journal kept at {journal.path}"
+        )
+    return report
+
+
+def _compensation(
+    api_client,
+    journal: Journal,
+    index: int,
+    entry: Dict[str, Any],
+) -> Optional[BulkOperation]:
+    """Build the operation that undoes one journaled operation, if it took effect."""
+    action, service_name, data = entry["action"], entry["service"], entry["data"]
+    rulebase = entry.get("rulebase")
+    service = getattr(api_client, service_name)
+    certain = index in journal.completed
+
+    if action == CREATE:
+        object_id = journal.completed.get(index)
+        if object_id is None:
+            try:
+                found = service.fetch(
+                    name=data["name"],
+                    **_container(data),
+                    **rulebase_kwargs(service.fetch, rulebase),
+                )
+            except NotFoundError:
+                return None  # the create never reached the API
+            object_id = str(found.id)
+        return BulkOperation(DELETE, service_name, data, object_id=object_id, rulebase=rulebase)
+
+    image = journal.pre_images[index]
+    if action == UPDATE:
+        allowed = update_model(service).model_fields
+        restore = {k: v for k, v in image.items() if k in allowed and k not in VOLATILE_FIELDS}
+        restore["id"] = image["id"]
+        return BulkOperation(UPDATE, service_name, restore, rulebase=rulebase)
+
+    if not certain:
+        try:
+            service.get(image["id"], **rulebase_kwargs(service.get, rulebase))
+            return None  # the delete never reached the API
+        except NotFoundError:
+            pass
+    allowed = create_model(service).model_fields
+    recreate = {k: v for k, v in image.items() if k in allowed and k not in VOLATILE_FIELDS}
+    return BulkOperation(CREATE, service_name, recreate, rulebase=rulebase)
+
+
+def _serialize(operation: BulkOperation) -> Dict[str, Any]:
+    return {
+        "action": operation.action,
+        "service": operation.service,
+        "data": json.loads(json.dumps(operation.fields, default=str)),
+        "object_id": operation.target_id,
+        "rulebase": operation.rulebase,
+    }
+
+
+def _image(obj: Any) -> Dict[str, Any]:
+    return obj.model_dump(mode="json", exclude_none=True)
+
+
+def _container(data: Dict[str, Any]) -> Dict[str, str]:
+    return {key: data[key] for key in CONTAINER_FIELDS if data.get(key)}
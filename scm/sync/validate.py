@@ -0,0 +1,219 @@
+"""Parallel pre-validation of bulk imports for Strata Cloud Manager SDK.
+
+Validates large batches of object data against a create or update model in a pool
+of worker processes, before any request is sent.
+"""
+
+# scm/sync/validate.py
+
+# Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+# External libraries
+from pydantic import BaseModel, ValidationError
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError
+
+DEFAULT_CHUNK_SIZE = 2000
+
+_ChunkResult = Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[int, List[Dict[str, Any]]]]]
+
+
+@dataclass
+class ValidationIssue:
+    """Validation errors of one input item.
+
+    Attributes:
+        index: Position of the item in the input.
+        errors: Pydantic error dictionaries (type, loc, msg, input).
+
+    """
+
+    index: int
+    errors: List[Dict[str, Any]]
+
+    @property
+    def message(self) -> str:
+        """The errors as one line, e.g. "ip_netmask: String should match pattern ..."."""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or '<root>'}: {error['msg']}"
+            for error in self.errors
+        )
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of a bulk validation.
+
+    Attributes:
+        payloads: Validated payloads by input index, for the items that passed.
+        errors: One issue per item that failed, in input order.
+        total: Number of items validated.
+        workers: Number of worker processes used (1 when validated inline).
+        elapsed: Seconds spent validating.
+
+    """
+
+    payloads: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    errors: List[ValidationIssue] = field(default_factory=list)
+    total: int = 0
+    workers: int = 1
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every item validated."""
+        return not self.errors
+
+    @property
+    def valid(self) -> List[Dict[str, Any]]:
+        """The validated payloads, in input order."""
+        return [self.payloads[index] for index in sorted(self.payloads)]
+
+    def raise_for_errors(self) -> None:
+        """Raise InvalidObjectError describing the first failures, if any item failed."""
+        if self.errors:
+            raise InvalidObjectError(
+                message=f"{len(self.errors)} of {self.total} items failed validation",
+                error_code="E003",
+                http_status_code=400,
+                details={"errors": {issue.index: issue.message for issue in self.errors[:20]}},
+            )
+
+
+def validate_many(
+    model: Type[BaseModel],
+    items: Iterable[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    by_alias: bool = False,
+) -> ValidationReport:
+    """Validate many items against a model, in parallel worker processes.
+
+    The input is split into chunks of chunk_size items, and each chunk is validated
+    in a ProcessPoolExecutor. Inputs no larger than one chunk, or max_workers=1,
+    are validated in the calling process, since starting workers would cost more
+    than it saves. Each payload is the model's JSON-mode dump of the fields the
+    item set, ready for the service's create() or update().
+
+    Args:
+        model: The pydantic model, e.g. AddressCreateModel. It must be importable
+            by the worker processes, i.e. defined at module level.
+        items: The object data.
+        max_workers: Number of worker processes (default: os.cpu_count()).
+        chunk_size: Items per chunk sent to a worker.
+        by_alias: Dump payloads by alias (e.g. "from" instead of "from_").
+
+    Returns:
+        ValidationReport: The payloads and the errors, keyed by input index.
+
+    Raises:
+        InvalidObjectError: If max_workers or chunk_size is less than 1.
+
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1 or chunk_size < 1:
+        raise InvalidObjectError(
+            message="max_workers and chunk_size must be at least 1",
+            error_code="E003",
+            http_status_code=400,
+            details={"error": "Invalid validation settings"},
+        )
+
+    started = time.monotonic()
+    items = list(items)
+    chunks = []
+    for start in range(0, len(items), chunk_size):
+        end = start + chunk_size
+        chunks.append((start, items[start:end]))
+    workers = min(max_workers, len(chunks))
+
+    if workers <= 1:
+        workers = 1
+        outcomes = [_validate_chunk(model, start, chunk, by_alias) for start, chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(
+                executor.map(
+                    _validate_chunk,
+                    [model] * len(chunks),
+                    [start for start, _ in chunks],
+                    [chunk for _, chunk in chunks],
+                    [by_alias] * len(chunks),
+                )
+            )
+
+    report = ValidationReport(total=len(items), workers=workers)
+    for payloads, errors in outcomes:
+        report.payloads.update(payloads)
+        report.errors.extend(ValidationIssue(index, details) for index, details in errors)
+    report.elapsed = time.monotonic() - started
+    return report
+
+
+def benchmark_validation(
+    model: Type[BaseModel],
+    items: Sequence[Dict[str, Any]],
+    worker_counts: Optional[Sequence[int]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Dict[str, float]]:
+    """Measure validation throughput for several worker counts.
+
+    Args:
+        model: The pydantic model.
+        items: The object data.
+        worker_counts: Worker counts to try (default: 1, 2, 4, ... up to the core count).
+        chunk_size: Items per chunk sent to a worker.
+
+    Returns:
+        List[Dict[str, float]]: Per worker count, the workers, seconds, items per
+            second, and speedup over the first count.
+
+    """
+    if worker_counts is None:
+        cores = os.cpu_count() or 1
+        worker_counts = sorted({min(2**power, cores) for power in range(cores.bit_length() + 1)})
+
+    results = []
+    for workers in worker_counts:
+        report = validate_many(model, items, max_workers=workers, chunk_size=chunk_size)
+        seconds = max(report.elapsed, 1e-9)
+        results.append(
+            {
+                "workers": workers,
+                "seconds": seconds,
+                "items_per_second": len(items) / seconds,
+                "speedup": results[0]["seconds"] / seconds if results else 1.0,
+            }
+        )
+    return results
+
+
+def _validate_chunk(
+    model: Type[BaseModel],
+    start: int,
+    chunk: List[Dict[str, Any]],
+    by_alias: bool,
+) -> _ChunkResult:
+    """Validate one chunk; runs in a worker process, so it returns picklable data only."""
+    payloads = []
+    errors = []
+    for offset, item in enumerate(chunk):
+        try:
+            instance = model.model_validate(item)
+        except ValidationError as e:
+            errors.append((start + offset, e.errors(include_url=False, include_context=False)))
+        else:
+            payloads.append(
+                (
+                    start + offset,
+                    instance.model_dump(mode="json", exclude_unset=True, by_alias=by_alias),
+                )
+            )
+    return payloads, errors
@@ -0,0 +1,393 @@
+"""Change-detection watcher for Strata Cloud Manager SDK.
+
+Periodically lists selected services and containers and emits object-level
+created/updated/deleted events by comparing per-object content fingerprints.
+"""
+
+# scm/sync/watcher.py
+
+# Standard library imports
+from collections import Counter
+from dataclasses import dataclass, field
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Local SDK imports
+from scm.exceptions import InvalidObjectError
+from scm.utils.fingerprint import fingerprint
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+@dataclass
+class WatchTarget:
+    """A service and container to watch.
+
+    Attributes:
+        service: Unified client attribute of the service, e.g. "address" or "security_rule".
+        folder: Folder to watch.
+        snippet: Snippet to watch.
+        device: Device to watch.
+        params: Extra query parameters for the listing, e.g. {"position": "pre"} for rules.
+
+    Exactly one of folder, snippet, or device must be provided.
+
+    """
+
+    service: str
+    folder: Optional[str] = None
+    snippet: Optional[str] = None
+    device: Optional[str] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Validate that exactly one container is set."""
+        if len(self.container) != 1:
+            raise InvalidObjectError(
+                message="Exactly one of 'folder', 'snippet', or 'device' must be provided.",
+                error_code="E003",
+                http_status_code=400,
+                details={"error": "Invalid container parameters"},
+            )
+
+    @property
+    def container(self) -> Dict[str, str]:
+        """The container query parameter of this target."""
+        return {
+            k: v
+            for k, v in {
+                "folder": self.folder,
+                "snippet": self.snippet,
+                "device": self.device,
+            }.items()
+            if v is not None
+        }
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the target, used in snapshots."""
+        container_key, container_value = next(iter(self.container.items()))
+        extra = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.service}:{container_key}={container_value}" + (f":{extra}" if extra else "")
+
+
+@dataclass
+class ChangeEvent:
+    """An object-level change detected by the Watcher.
+
+    Attributes:
+        kind: One of "created", "updated", or "deleted".
+        target: The watched service and container the object belongs to.
+        object_id: The object's id.
+        name: The object's name, if it has one.
+        fingerprint: Content fingerprint after the change (None for deletions).
+        previous_fingerprint: Content fingerprint before the change (None for creations).
+        data: The object as returned by the API (None for deletions).
+
+    """
+
+    kind: str
+    target: WatchTarget
+    object_id: str
+    name: Optional[str]
+    fingerprint: Optional[str]
+    previous_fingerprint: Optional[str]
+    data: Optional[Dict[str, Any]] = None
+
+
+# Per-target state: object id -> (name, fingerprint)
+_State = Dict[str, Tuple[Optional[str], str]]
+
+# Validators (ETag, Last-Modified) a page was served with, or None if it had none
+_Validators = Optional[Tuple[Optional[str], Optional[str]]]
+
+
+class Watcher:
+    """Poll services and containers for changes and emit object-level events.
+
+    Each target is listed with raw paginated GET requests, and every object is
+    reduced to a content fingerprint; only fingerprints and the validators of each
+    page are kept between syncs, never the pages themselves.
+    Targets are polled on a shared interval with their start times spread evenly
+    across it, so API usage stays flat instead of bursting once per interval.
+
+    With the client's conditional_requests enabled, a sync whose pages all come back
+    with the validators of the previous sync (typically as 304 Not Modified) is
+    recognised and skipped without hashing anything. With
+    skip_untouched=True, a target is also skipped when the job history (list_jobs)
+    shows no job since its last sync that could have touched its container. Jobs are
+    only recorded for commits and pushes, so this setting suits watching pushed
+    configuration rather than uncommitted candidate edits.
+
+    Args:
+        api_client: The Scm client.
+        targets: Services and containers to watch.
+        interval: Seconds between two syncs of the same target (default: 300).
+        exact_match: Ignore objects inherited from other containers (default: True).
+        skip_untouched: Skip targets the job history shows as untouched (default: False).
+        emit_initial: Emit "created" events for objects found by the first sync of a
+            target that has no snapshot (default: False, the first sync is a silent baseline).
+        snapshot: State previously returned by snapshot(), to resume change detection.
+        clock: Monotonic time source, overridable for tests.
+
+    """
+
+    JOB_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        api_client,
+        targets: List[WatchTarget],
+        interval: float = 300.0,
+        exact_match: bool = True,
+        skip_untouched: bool = False,
+        emit_initial: bool = False,
+        snapshot: Optional[Dict[str, Dict[str, List[Optional[str]]]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the watcher and spread the first sync of each target across one interval."""
+        self.api_client = api_client
+        self.targets = list(targets)
+        self.interval = interval
+        self.exact_match = exact_match
+        self.skip_untouched = skip_untouched
+        self.emit_initial = emit_initial
+        self.logger = logging.getLogger(__name__)
+        self.stats: Counter = Counter()
+
+        self._clock = clock
+        self._callbacks: List[Callable[[ChangeEvent], None]] = []
+        self._stopped = threading.Event()
+        self._state: Dict[str, _State] = {}
+        self._validators: Dict[str, List[_Validators]] = {}
+        self._job_markers: Dict[str, Optional[str]] = {}
+
+        for key, objects in (snapshot or {}).items():
+            self._state[key] = {
+                object_id: (name, object_fingerprint)
+                for object_id, (name, object_fingerprint) in objects.items()
+            }
+
+        start = self._clock()
+        step = interval / len(self.targets) if self.targets else 0
+        self._due = {target.key: start + index * step for index, target in enumerate(self.targets)}
+
+    def on_change(self, callback: Callable[[ChangeEvent], None]) -> Callable[[ChangeEvent], None]:
+        """Register a callback invoked for every event; usable as a decorator."""
+        self._callbacks.append(callback)
+        return callback
+
+    def snapshot(self) -> Dict[str, Dict[str, List[Optional[str]]]]:
+        """Return the JSON-serializable fingerprint state of every synced target."""
+        return {
+            key: {object_id: [name, value] for object_id, (name, value) in objects.items()}
+            for key, objects in self._state.items()
+        }
+
+    def poll(self, force: bool = False) -> List[ChangeEvent]:
+        """Sync every target that is due (or all targets when force is True).
+
+        Returns:
+            List[ChangeEvent]: Events from all targets synced by this call.
+
+        """
+        now = self._clock()
+        due = [t for t in self.targets if force or self._due[t.key] <= now]
+        if not due:
+            return []
+
+        jobs = None
+        if self.skip_untouched and any(t.key in self._job_markers for t in due):
+            jobs = self.api_client.list_jobs(limit=self.JOB_PAGE_SIZE).data
+
+        events: List[ChangeEvent] = []
+        for target in due:
+            self._due[target.key] = max(self._due[target.key] + self.interval, now)
+            if jobs is not None and not self._touched(target, jobs):
+                self.stats["skipped_untouched"] += 1
+                continue
+            events.extend(self.sync(target, jobs=jobs))
+        return events
+
+    def sync(self, target: WatchTarget, jobs: Optional[List[Any]] = None) -> List[ChangeEvent]:
+        """List one target now, update its state, and emit its events.
+
+        Args:
+            target: The target to sync.
+            jobs: Job list to record as already seen, when the caller fetched one.
+
+        Returns:
+            List[ChangeEvent]: The changes found since the previous sync.
+
+        """
+        if self.skip_untouched and jobs is None:
+            # Read jobs before listing, so a job ending in between is seen again next poll
+            jobs = self.api_client.list_jobs(limit=self.JOB_PAGE_SIZE).data
+        pages, validators = self._list_pages(target)
+        self.stats["syncs"] += 1
+        if self.skip_untouched:
+            self._job_markers[target.key] = self._newest_job_id(jobs)
+
+        previous_validators = self._validators.get(target.key)
+        self._validators[target.key] = validators
+        if previous_validators == validators and None not in validators:
+            # Every page came with the validators of the previous sync, nothing changed
+            self.stats["skipped_not_modified"] += 1
+            return []
+
+        container_key, container_value = next(iter(target.container.items()))
+        current: _State = {}
+        objects: Dict[str, Dict[str, Any]] = {}
+        for page in pages:
+            for item in page.get("data", []):
+                if self.exact_match and item.get(container_key, container_value) != container_value:
+                    continue
+                object_id = str(item.get("id", item.get("name")))
+                current[object_id] = (item.get("name"), fingerprint(item))
+                objects[object_id] = item
+
+        previous = self._state.get(target.key)
+        self._state[target.key] = current
+        if previous is None and not self.emit_initial:
+            return []
+
+        events = self._diff(target, previous or {}, current, objects)
+        for event in events:
+            self._emit(event)
+        return events
+
+    def events(self) -> Iterator[ChangeEvent]:
+        """Yield events as they are detected until stop() is called."""
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            yield from self.poll()
+            if not self._due:
+                return
+            self._stopped.wait(max(0.0, min(self._due.values()) - self._clock()))
+
+    def run(self) -> None:
+        """Poll until stop() is called, delivering events to callbacks only."""
+        for _ in self.events():
+            pass
+
+    def stop(self) -> None:
+        """Stop events() and run() after the current poll."""
+        self._stopped.set()
+
+    def _list_pages(
+        self,
+        target: WatchTarget,
+    ) -> Tuple[List[Dict[str, Any]], List[_Validators]]:
+        """Fetch every page of the target's listing as raw response bodies and validators."""
+        service = getattr(self.api_client, target.service)
+        limit = getattr(service, "max_limit", 200)
+        offset = 0
+        pages = []
+        validators = []
+        while True:
+            params = {**target.container, **target.params, "limit": limit, "offset": offset}
+            response = self.api_client.get(service.ENDPOINT, params=params)
+            if not isinstance(response, dict) or not isinstance(response.get("data"), list):
+                raise InvalidObjectError(
+                    message="Invalid response format: expected a 'data' list",
+                    error_code="E003",
+                    http_status_code=500,
+                    details={"error": "Response is not a listing"},
+                )
+            pages.append(response)
+            validators.append(self._page_validators(service.ENDPOINT, params, response))
+            if len(response["data"]) < limit:
+                return pages, validators
+            offset += limit
+
+    def _page_validators(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        page: Dict[str, Any],
+    ) -> _Validators:
+        """Return the validators the client stored for page, if page is the body they describe."""
+        lookup = getattr(self.api_client, "conditional_entry", None)
+        entry = lookup(endpoint, params) if callable(lookup) else None
+        if entry is None or entry.body is not page:
+            return None
+        return entry.etag, entry.last_modified
+
+    @staticmethod
+    def _diff(
+        target: WatchTarget,
+        previous: _State,
+        current: _State,
+        objects: Dict[str, Dict[str, Any]],
+    ) -> List[ChangeEvent]:
+        """Compare two fingerprint states of one target."""
+        events = []
+        for object_id, (name, value) in current.items():
+            before = previous.get(object_id)
+            if before is None:
+                events.append(
+                    ChangeEvent(CREATED, target, object_id, name, value, None, objects[object_id])
+                )
+            elif before[1] != value:
+                events.append(
+                    ChangeEvent(
+                        UPDATED, target, object_id, name, value, before[1], objects[object_id]
+                    )
+                )
+        for object_id, (name, value) in previous.items():
+            if object_id not in current:
+                events.append(ChangeEvent(DELETED, target, object_id, name, None, value))
+        return events
+
+    def _emit(self, event: ChangeEvent) -> None:
+        """Deliver an event to every callback, logging callback failures."""
+        self.stats[event.kind] += 1
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                self.logger.error(
+                    f"Watcher callback failed for {event.kind} {event.object_id}: {e}"
+                )
+
+    @staticmethod
+    def _job_sort_key(job_id: Optional[str]) -> Tuple[int, str]:
+        """Order job ids numerically where possible."""
+        if job_id is None:
+            return -1, ""
+        return (int(job_id), job_id) if job_id.isdigit() else (-1, job_id)
+
+    def _newest_job_id(self, jobs: List[Any]) -> Optional[str]:
+        """Return the newest job id in a job list."""
+        if not jobs:
+            return None
+        return max((job.id for job in jobs), key=self._job_sort_key)
+
+    def _touched(self, target: WatchTarget, jobs: List[Any]) -> bool:
+        """Decide from the job history whether target's container may have changed.
+
+        A container counts as touched when a job newer than its last sync mentions it,
+        or mentions none of the watched containers and so cannot be attributed. When
+        the job page does not reach back to the last sync, the target is touched.
+        """
+        if target.key not in self._job_markers:
+            return True
+        marker = self._job_sort_key(self._job_markers[target.key])
+        new_jobs = [job for job in jobs if self._job_sort_key(job.id) > marker]
+        if not new_jobs:
+            return False
+        if len(new_jobs) == len(jobs) >= self.JOB_PAGE_SIZE:
+            return True
+
+        container_value = next(iter(target.container.values()))
+        watched = {value for t in self.targets for value in t.container.values()}
+        for job in new_jobs:
+            text = f"{job.description} {job.summary} {job.device_name}"
+            named = {value for value in watched if value in text}
+            if not named or container_value in named:
+                return True
+        return False
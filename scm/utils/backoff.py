@@ -0,0 +1,49 @@
+# scm/utils/backoff.py
+
+"""Exponential backoff with jitter for polling loops."""
+
+from dataclasses import dataclass
+import random
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Polling intervals that start short and grow exponentially up to a ceiling.
+
+    The n-th delay is initial * factor**n, capped at maximum, then shortened by a
+    random fraction of up to jitter, so that many pollers started together drift
+    apart instead of hitting the API in lockstep.
+
+    Args:
+        initial: First delay in seconds (default: 0.5).
+        maximum: Longest delay in seconds (default: 10.0).
+        factor: Growth factor between consecutive delays (default: 2.0).
+        jitter: Largest fraction of a delay removed at random, from 0 to 1 (default: 0.2).
+
+    """
+
+    initial: float = 0.5
+    maximum: float = 10.0
+    factor: float = 2.0
+    jitter: float = 0.2
+
+    def __post_init__(self):
+        """Validate the settings."""
+        if self.initial <= 0 or self.maximum < self.initial or self.factor < 1:
+            raise ValueError("Backoff needs 0 < initial <= maximum and factor >= 1")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("Backoff jitter must be between 0 and 1")
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay in seconds before poll number attempt + 1 (attempt counts from 0)."""
+        # Cap the exponent so large attempt numbers cannot overflow
+        base = min(self.maximum, self.initial * self.factor ** min(attempt, 64))
+        return base * (1 - self.jitter * random.random())
+
+    def delays(self) -> Iterator[float]:
+        """Yield the delays of consecutive polls, indefinitely."""
+        attempt = 0
+        while True:
+            yield self.delay(attempt)
+            attempt += 1
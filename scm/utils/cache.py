@@ -0,0 +1,157 @@
+# scm/utils/cache.py
+
+"""Small in-memory caches used by the SCM client."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed time-to-live.
+
+    Expired entries are dropped lazily on access. When the cache is full the
+    oldest entry is evicted to make room for a new one.
+
+    Args:
+        ttl: Lifetime of each entry in seconds. A value of 0 or less disables the cache.
+        maxsize: Maximum number of live entries to keep (default: 10000).
+        clock: Monotonic time source, overridable for tests.
+
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty cache with the given ttl and size bound."""
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.ttl > 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the live value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key for ttl seconds."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # dicts keep insertion order, so the first key is the oldest
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (self._clock() + self.ttl, value)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every entry whose key satisfies predicate.
+
+        Returns:
+            int: Number of entries removed.
+
+        """
+        with self._lock:
+            doomed = [key for key in self._data if predicate(key)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including not-yet-purged expired ones."""
+        return len(self._data)
+
+
+class ConditionalEntry:
+    """Validators and decoded body remembered for one GET request."""
+
+    __slots__ = ("etag", "last_modified", "body")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], body: Any):
+        """Store the validators the server sent alongside the decoded body."""
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+
+    def headers(self) -> Dict[str, str]:
+        """Return the conditional request headers that replay these validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """Thread-safe, size-bounded store of ConditionalEntry objects.
+
+    Entries are kept in least-recently-used order; the least recently used
+    entry is evicted when the store is full.
+
+    Args:
+        maxsize: Maximum number of entries to keep (default: 1000).
+
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        """Initialize an empty store."""
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, ConditionalEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ConditionalEntry]:
+        """Return the entry for key and mark it as recently used."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self._data[key] = entry
+            return entry
+
+    def set(self, key: Hashable, entry: ConditionalEntry) -> None:
+        """Store entry under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = entry
+
+    def discard(self, key: Hashable) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return len(self._data)
@@ -0,0 +1,140 @@
+# scm/utils/fingerprint.py
+
+"""Content fingerprints for cheap change detection of SCM objects."""
+
+from functools import cached_property
+import hashlib
+import json
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, Mapping, Optional, Union
+
+from pydantic import BaseModel
+
+# Fields that change without the object's configuration changing
+VOLATILE_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "created_time",
+        "created_ts",
+        "last_modified",
+        "last_update",
+        "updated_time",
+        "updated_ts",
+        "uptime",
+    }
+)
+
+
+def canonical_json(
+    obj: Union[BaseModel, Mapping[str, Any]],
+    exclude: Optional[Iterable[str]] = None,
+) -> bytes:
+    """Serialize obj to canonical JSON bytes.
+
+    Models are dumped in JSON mode by field name, including defaults; raw dictionaries
+    are taken as given. Keys are then sorted at every level, separators carry no
+    whitespace, and top-level keys that are None or listed in exclude are dropped, so
+    equal content serializes identically regardless of key order. A raw dictionary
+    and a model built from it only match when the dictionary uses field names (not
+    aliases) and holds every field the model sets.
+
+    Args:
+        obj: A pydantic model or a raw dictionary as returned by the API.
+        exclude: Top-level field names to leave out (default: VOLATILE_FIELDS).
+
+    Returns:
+        bytes: The canonical UTF-8 encoded JSON document.
+
+    """
+    excluded = VOLATILE_FIELDS if exclude is None else frozenset(exclude)
+    if isinstance(obj, BaseModel):
+        data = obj.model_dump(mode="json", exclude_none=True)
+    else:
+        data = obj
+    content = {k: v for k, v in data.items() if v is not None and k not in excluded}
+    return json.dumps(
+        content,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+
+
+def fingerprint(
+    obj: Union[BaseModel, Mapping[str, Any]],
+    exclude: Optional[Iterable[str]] = None,
+) -> str:
+    """Return a stable content hash of a model or raw dictionary.
+
+    Two objects have the same fingerprint exactly when their canonical JSON
+    (see canonical_json) is identical.
+
+    Args:
+        obj: A pydantic model or a raw dictionary as returned by the API.
+        exclude: Top-level field names to ignore (default: VOLATILE_FIELDS).
+
+    Returns:
+        str: A 32 character hexadecimal BLAKE2b digest.
+
+    """
+    return hashlib.blake2b(canonical_json(obj, exclude), digest_size=16).hexdigest()
+
+
+def fingerprints(
+    objects: Iterable[Union[BaseModel, Mapping[str, Any]]],
+    key: str = "id",
+) -> Dict[str, str]:
+    """Map each object's key field to its fingerprint, for snapshots and diffs.
+
+    Models that carry a cached fingerprint (FingerprintMixin) reuse it.
+
+    Args:
+        objects: Models or raw dictionaries to fingerprint.
+        key: Field identifying each object (default: "id").
+
+    Returns:
+        Dict[str, str]: Fingerprints keyed by str(object[key]).
+
+    """
+    index = {}
+    for obj in objects:
+        if isinstance(obj, BaseModel):
+            identity = getattr(obj, key)
+            value = obj.fingerprint if isinstance(obj, FingerprintMixin) else fingerprint(obj)
+        else:
+            identity = obj[key]
+            value = fingerprint(obj)
+        index[str(identity)] = value
+    return index
+
+
+class FingerprintMixin:
+    """Give a pydantic model a lazily computed, cached content fingerprint.
+
+    The fingerprint is computed on first access and cached on the instance.
+    Assigning a field or copying the model discards the cached value. Subclasses
+    may override __fingerprint_exclude__ to ignore additional volatile fields.
+    """
+
+    __fingerprint_exclude__: ClassVar[FrozenSet[str]] = VOLATILE_FIELDS
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable content hash of this object, ignoring volatile fields."""
+        exclude = type(self).__fingerprint_exclude__
+        return fingerprint(self, exclude=exclude)  # type: ignore[arg-type]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Discard the cached fingerprint before assigning an attribute."""
+        self.__dict__.pop("fingerprint", None)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Discard the cached fingerprint before deleting an attribute."""
+        self.__dict__.pop("fingerprint", None)
+        super().__delattr__(name)
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False):
+        """Copy the model without carrying over the cached fingerprint."""
+        copied = super().model_copy(update=update, deep=deep)  # type: ignore[misc]
+        copied.__dict__.pop("fingerprint", None)
+        return copied
@@ -0,0 +1,199 @@
+# scm/utils/radix.py
+
+"""Path-compressed binary radix trie for longest-prefix-match lookups."""
+
+import ipaddress
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar, Union
+
+V = TypeVar("V")
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class _Node:
+    """A trie node: a prefix, the value stored at it (if any), and two children."""
+
+    __slots__ = ("key", "length", "value", "children")
+
+    def __init__(self, key: int, length: int, value: Any = None):
+        self.key = key
+        self.length = length
+        self.value = value
+        self.children: List[Optional["_Node"]] = [None, None]
+
+
+class RadixTrie(Generic[V]):
+    """Map IP prefixes of one address family to values, with longest-prefix match.
+
+    Nodes exist only where a prefix is stored or where two stored prefixes
+    branch, so a lookup visits at most one node per branching bit rather than
+    one per address bit:
+
+        trie = RadixTrie(4)
+        trie["10.0.0.0/8"] = "core"
+        trie["10.1.0.0/16"] = "branch"
+        trie.longest_match("10.1.2.3")  # (IPv4Network('10.1.0.0/16'), 'branch')
+
+    Args:
+        version: IP version, 4 or 6.
+
+    """
+
+    def __init__(self, version: int = 4):
+        """Initialize an empty trie."""
+        if version not in (4, 6):
+            raise ValueError(f"IP version must be 4 or 6, not {version}")
+        self.version = version
+        self.bits = 32 if version == 4 else 128
+        self._network_class = ipaddress.IPv4Network if version == 4 else ipaddress.IPv6Network
+        self._root: Optional[_Node] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of prefixes stored."""
+        return self._size
+
+    def __setitem__(self, prefix: Union[str, Network], value: V) -> None:
+        """Store value at prefix, replacing any value already there."""
+        key, length = self._prefix(prefix)
+        node = self._find(key, length, create=True)
+        if node.value is None:
+            self._size += 1
+        node.value = value
+
+    def __getitem__(self, prefix: Union[str, Network]) -> V:
+        """Return the value stored at exactly prefix."""
+        value = self.get(prefix)
+        if value is None:
+            raise KeyError(prefix)
+        return value
+
+    def __contains__(self, prefix: Union[str, Network]) -> bool:
+        """Return whether a value is stored at exactly prefix."""
+        return self.get(prefix) is not None
+
+    def get(self, prefix: Union[str, Network], default: Optional[V] = None) -> Optional[V]:
+        """Return the value stored at exactly prefix, or default."""
+        key, length = self._prefix(prefix)
+        node = self._find(key, length, create=False)
+        return default if node is None or node.value is None else node.value
+
+    def longest_match(self, address: Union[str, int, Any]) -> Optional[Tuple[Network, V]]:
+        """Return the most specific stored prefix containing address, with its value.
+
+        Args:
+            address: An IP address of the trie's version, as a string, an
+                ipaddress object or an integer.
+
+        Returns:
+            The (prefix, value) pair, or None if no stored prefix contains address.
+
+        """
+        node = self._longest(self._address(address))
+        return None if node is None else (self._network(node), node.value)
+
+    def matches(self, address: Union[str, int, Any]) -> List[Tuple[Network, V]]:
+        """Return every stored prefix containing address, least specific first."""
+        found = []
+        bits = self.bits
+        target = self._address(address)
+        node = self._root
+        while node is not None:
+            if node.length and (target ^ node.key) >> (bits - node.length):
+                break
+            if node.value is not None:
+                found.append((self._network(node), node.value))
+            if node.length == bits:
+                break
+            node = node.children[(target >> (bits - 1 - node.length)) & 1]
+        return found
+
+    def items(self) -> Iterator[Tuple[Network, V]]:
+        """Yield every stored (prefix, value) pair, in address order, shorter first."""
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.value is not None:
+                yield self._network(node), node.value
+            for child in reversed(node.children):
+                if child is not None:
+                    stack.append(child)
+
+    def __iter__(self) -> Iterator[Network]:
+        """Iterate over the stored prefixes."""
+        return (prefix for prefix, _ in self.items())
+
+    def _longest(self, target: int) -> Optional[_Node]:
+        """Walk toward target, keeping the last node holding a value."""
+        bits = self.bits
+        best = None
+        node = self._root
+        while node is not None:
+            if node.length and (target ^ node.key) >> (bits - node.length):
+                break
+            if node.value is not None:
+                best = node
+            if node.length == bits:
+                break
+            node = node.children[(target >> (bits - 1 - node.length)) & 1]
+        return best
+
+    def _find(self, key: int, length: int, create: bool) -> Optional[_Node]:
+        """Return the node for exactly key/length, inserting it if create is set."""
+        bits = self.bits
+        parent: Optional[_Node] = None
+        branch = 0
+        node = self._root
+        while node is not None:
+            difference = key ^ node.key
+            first = bits - difference.bit_length() if difference else bits
+            common = min(first, length, node.length)
+            if common < node.length:
+                # key leaves node's prefix before its end: split above node
+                if not create:
+                    return None
+                if common == length:
+                    new = _Node(key, length)
+                else:
+                    new = _Node(key >> (bits - common) << (bits - common) if common else 0, common)
+                    leaf = _Node(key, length)
+                    new.children[(key >> (bits - 1 - common)) & 1] = leaf
+                new.children[(node.key >> (bits - 1 - common)) & 1] = node
+                self._link(parent, branch, new)
+                return new if common == length else leaf
+            if node.length == length:
+                return node
+            parent, branch = node, (key >> (bits - 1 - node.length)) & 1
+            node = node.children[branch]
+        if not create:
+            return None
+        new = _Node(key, length)
+        self._link(parent, branch, new)
+        return new
+
+    def _link(self, parent: Optional[_Node], branch: int, node: _Node) -> None:
+        """Attach node below parent on branch, or as the root."""
+        if parent is None:
+            self._root = node
+        else:
+            parent.children[branch] = node
+
+    def _prefix(self, prefix: Union[str, Network]) -> Tuple[int, int]:
+        """Convert a prefix to (network as an integer, prefix length)."""
+        network = ipaddress.ip_network(prefix, strict=False)
+        if network.version != self.version:
+            raise ValueError(f"{prefix} is not an IPv{self.version} prefix")
+        return int(network.network_address), network.prefixlen
+
+    def _address(self, address: Union[str, int, Any]) -> int:
+        """Convert an address to an integer, checking its version."""
+        if isinstance(address, int):
+            return address
+        parsed = ipaddress.ip_address(address)
+        if parsed.version != self.version:
+            raise ValueError(f"{address} is not an IPv{self.version} address")
+        return int(parsed)
+
+    def _network(self, node: _Node) -> Network:
+        """Return a node's prefix as an ipaddress network."""
+        return self._network_class((node.key, node.length))
@@ -0,0 +1,47 @@
+# scm/utils/ratelimit.py
+
+"""Token-bucket rate limiting for concurrent API calls."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Allow at most rate calls per second across threads, with short bursts.
+
+    A token bucket holding up to burst tokens, refilled at rate tokens per
+    second. acquire() takes a token, blocking until one is available.
+
+    Args:
+        rate: Calls allowed per second on average.
+        burst: Calls allowed back to back before the rate applies (default: 1).
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize a full bucket."""
+        if rate <= 0 or burst < 1:
+            raise ValueError("RateLimiter needs rate > 0 and burst >= 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, waiting for one if needed.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now; a negative balance queues later callers behind us
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+        if wait:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,124 @@
+# scm/utils/serialization.py
+
+"""JSON encoding and decoding fast paths for request and response bodies."""
+
+from dataclasses import dataclass
+import json
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+@dataclass(frozen=True)
+class JsonBody:
+    """A request body serialized straight from a pydantic model.
+
+    Passed as the json argument of Scm.request(), the model is encoded once with
+    model_dump_json() into the bytes that are sent, without building the
+    intermediate dictionary that model_dump() followed by json.dumps() needs.
+
+    Attributes:
+        model: The model to send.
+        exclude: Top-level fields to leave out, e.g. {"id"} for updates.
+        by_alias: Dump with field aliases (e.g. "from" instead of "from_").
+        exclude_unset: Leave out fields that were never set (default: True).
+
+    """
+
+    model: BaseModel
+    exclude: Optional[FrozenSet[str]] = None
+    by_alias: bool = False
+    exclude_unset: bool = True
+
+    @property
+    def name(self) -> Optional[str]:
+        """The model's name field, if it has one."""
+        return getattr(self.model, "name", None)
+
+    def encode(self) -> bytes:
+        """Return the model as UTF-8 encoded JSON."""
+        return self.model.model_dump_json(
+            exclude=set(self.exclude) if self.exclude else None,
+            by_alias=self.by_alias,
+            exclude_unset=self.exclude_unset,
+        ).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a JSON body to compact UTF-8 bytes, with orjson when it is installed.
+
+    Args:
+        obj: A JsonBody, a pydantic model, or JSON-compatible data.
+
+    Returns:
+        bytes: The encoded body.
+
+    """
+    if isinstance(obj, JsonBody):
+        return obj.encode()
+    if isinstance(obj, BaseModel):
+        return JsonBody(obj).encode()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """Decode a JSON body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def benchmark_serialization(
+    model: BaseModel,
+    repeat: int = 100,
+) -> Dict[str, Dict[str, float]]:
+    """Compare the default and fast paths for encoding and decoding one model.
+
+    The default request path is model_dump() followed by json.dumps() (what
+    requests does with json=); the fast path is JsonBody.encode(). Decoding
+    compares json.loads() with loads().
+
+    Args:
+        model: A representative, ideally large, payload model.
+        repeat: Iterations per measurement.
+
+    Returns:
+        Dict[str, Dict[str, float]]: For "encode" and "decode", the mean seconds per
+            call of the "default" and "fast" paths, and the "speedup" of fast over default.
+
+    """
+    content = JsonBody(model).encode()
+
+    def encode_default():
+        return json.dumps(model.model_dump(mode="json", exclude_unset=True)).encode("utf-8")
+
+    def timed(func: Callable[[], Any]) -> float:
+        timings: List[float] = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        return max(sum(timings) / len(timings), 1e-12)
+
+    results = {}
+    for step, default, fast in (
+        ("encode", encode_default, JsonBody(model).encode),
+        ("decode", lambda: json.loads(content), lambda: loads(content)),
+    ):
+        default_seconds, fast_seconds = timed(default), timed(fast)
+        results[step] = {
+            "default": default_seconds,
+            "fast": fast_seconds,
+            "speedup": default_seconds / fast_seconds,
+        }
+    return results
@@ -0,0 +1,81 @@
+# scm/utils/singleflight.py
+
+"""Duplicate call suppression for concurrent identical requests."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """An in-flight call whose outcome is shared with every waiter."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    The first caller for a key (the leader) runs the function. Callers that
+    arrive with the same key while it is still running block until it finishes
+    and receive the same result, or the same exception.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run fn for key unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call; equal keys share one execution.
+            fn: Zero-argument callable performing the work.
+
+        Returns:
+            Tuple[Any, bool]: The result and whether it was shared between several callers.
+                A shared result is the same object for every caller, so callers that may
+                mutate it should copy it first.
+
+        Raises:
+            BaseException: Whatever fn raised, for the leader and every waiter.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            call.done.set()
+        return call.result, shared
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._calls)
@@ -558,6 +558,50 @@ class TestNatRuleFetch(TestNatRuleBase):
         assert "Response is not a dictionary" in str(exc_info.value)
 
 
+class TestNatRuleMove(TestNatRuleBase):
+    """Tests for moving NAT Rule objects."""
+
+    def test_move_to_top(self):
+        """Test moving a rule to the top."""
+        source_rule = "123e4567-e89b-12d3-a456-426655440000"
+        move_data = {"destination": "top", "rulebase": "pre"}
+
+        self.mock_scm.post.return_value = None
+        self.client.move(source_rule, move_data)
+
+        self.mock_scm.post.assert_called_once_with(
+            f"/config/network/v1/nat-rules/{source_rule}:move",
+            json=move_data,
+        )
+
+    def test_move_after_rule(self):
+        """Test moving a rule after another rule."""
+        source_rule = "123e4567-e89b-12d3-a456-426655440000"
+        dest_rule_id = "987fcdeb-54ba-3210-9876-fedcba098765"
+        move_data = {
+            "destination": "after",
+            "rulebase": "post",
+            "destination_rule": dest_rule_id,
+        }
+
+        self.mock_scm.post.return_value = None
+        self.client.move(source_rule, move_data)
+
+        self.mock_scm.post.assert_called_once_with(
+            f"/config/network/v1/nat-rules/{source_rule}:move",
+            json=move_data,
+        )
+
+    def test_move_before_without_destination_rule(self):
+        """Test that before/after moves require a destination rule."""
+        with pytest.raises(ValidationError):
+            self.client.move(
+                "123e4567-e89b-12d3-a456-426655440000",
+                {"destination": "before", "rulebase": "pre"},
+            )
+        self.mock_scm.post.assert_not_called()
+
+
 class TestNatRuleApplyFilters:
     """Tests for NAT rule filter application."""
 
@@ -8,11 +8,16 @@ import pytest
 
 from scm.client import Scm
 from scm.config import BaseObject
+from scm.config.objects import Address
+from scm.exceptions import InvalidObjectError
 from scm.models.operations import (
     CandidatePushResponseModel,
     JobListResponse,
     JobStatusResponse,
 )
+from tests.utils.config_store import attach_config_store
+
+ADDRESSES = "/config/objects/v1/addresses"
 
 
 @pytest.mark.usefixtures("load_env")
@@ -38,6 +43,7 @@ class TestBaseObject:
         self.mock_scm.list_jobs = MagicMock()
         self.mock_scm.get_job_status = MagicMock()
         self.mock_scm.commit = MagicMock()
+        self.mock_scm.commit_async = MagicMock()
 
         self.test_object = self.MockConfigObject(self.mock_scm)
 
@@ -379,6 +385,19 @@ class TestBaseObject:
             timeout=600,
         )
 
+    def test_commit_async(self):
+        """Test that commit_async() proxies to the api_client."""
+        self.mock_scm.commit_async.return_value = "future"
+
+        assert self.test_object.commit_async(folders=["folder1"], description="Test") == "future"
+        self.mock_scm.commit_async.assert_called_with(
+            folders=["folder1"],
+            description="Test",
+            admin=None,
+            timeout=300,
+            on_progress=None,
+        )
+
     def test_docstring_uses_raises_section(self):
         """Ensure BaseObject docstring uses 'Raises:' not 'Error:' section heading."""
         doc = BaseObject.__doc__
@@ -393,3 +412,98 @@ class TestBaseObject:
         # Verify "Raises:" section heading exists
         has_raises = any(line.strip() == "Raises:" for line in lines)
         assert has_raises, "BaseObject docstring should have 'Raises:' section"
+
+
+class TestBaseObjectUpsert:
+    """Tests for name_index(), upsert(), and upsert_many()."""
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, mock_scm):
+        """Serve an Address service from an in-memory store with two addresses."""
+        self.store = attach_config_store(mock_scm)
+        self.store.add(ADDRESSES, name="web1", folder="Texas", ip_netmask="10.0.0.1/32")
+        self.store.add(ADDRESSES, name="web2", folder="Texas", ip_netmask="10.0.0.2/32")
+        self.address = Address(mock_scm)
+
+    def test_name_index_lists_once(self):
+        """The index is built with one listing and reused until refreshed."""
+        index = self.address.name_index(folder="Texas")
+        assert set(index) == {"web1", "web2"}
+        assert self.address.name_index(folder="Texas") is index
+        assert self.store.calls == {"get": 1}
+
+        self.address.name_index(folder="Texas", refresh=True)
+        assert self.store.calls == {"get": 2}
+
+    def test_name_index_requires_one_container(self):
+        """Exactly one container must be given."""
+        with pytest.raises(InvalidObjectError):
+            self.address.name_index()
+
+    def test_upsert_unchanged_sends_nothing(self):
+        """An object that already matches costs no request beyond the index."""
+        result = self.address.upsert(
+            {"name": "web1", "folder": "Texas", "ip_netmask": "10.0.0.1/32"}
+        )
+        assert result.name == "web1"
+        assert self.store.calls == {"get": 1}
+
+    def test_upsert_updates_changed_object(self):
+        """A changed object is updated with a single PUT."""
+        result = self.address.upsert(
+            {"name": "web1", "folder": "Texas", "ip_netmask": "10.0.0.11/32"}
+        )
+        assert str(result.ip_netmask) == "10.0.0.11/32"
+        assert self.store.calls == {"get": 1, "put": 1}
+        assert self.store.find(ADDRESSES, "web1")["ip_netmask"] == "10.0.0.11/32"
+
+    def test_upsert_creates_missing_object(self):
+        """A missing object is created with a single POST and added to the index."""
+        data = {"name": "web3", "folder": "Texas", "ip_netmask": "10.0.0.3/32"}
+        self.address.upsert(data)
+        self.address.upsert(data)
+
+        assert self.store.calls == {"get": 1, "post": 1}
+        assert "web3" in self.address.name_index(folder="Texas")
+
+    def test_upsert_recovers_from_stale_index(self):
+        """A name conflict on create falls back to fetch and update."""
+        self.address.name_index(folder="Texas")
+        self.store.add(ADDRESSES, name="web3", folder="Texas", ip_netmask="10.0.0.3/32")
+
+        result = self.address.upsert(
+            {"name": "web3", "folder": "Texas", "ip_netmask": "10.0.0.33/32"}
+        )
+
+        assert str(result.ip_netmask) == "10.0.0.33/32"
+        assert self.store.calls == {"get": 2, "post": 1, "put": 1}
+
+    def test_upsert_many(self):
+        """One listing per container, then only the necessary writes."""
+        items = [
+            {"name": "web1", "folder": "Texas", "ip_netmask": "10.0.0.1/32"},
+            {"name": "web2", "folder": "Texas", "ip_netmask": "10.0.0.22/32"},
+            {"name": "web3", "folder": "Texas", "ip_netmask": "10.0.0.3/32"},
+            {"name": "ohio1", "folder": "Ohio", "ip_netmask": "10.1.0.1/32"},
+        ]
+        results = self.address.upsert_many(items, max_workers=4)
+
+        assert [r.name for r in results] == ["web1", "web2", "web3", "ohio1"]
+        assert self.store.calls == {"get": 2, "put": 1, "post": 2}
+
+    def test_upsert_passes_rulebase(self, mock_scm):
+        """Rule services list and write in the requested rulebase."""
+        rule = {
+            "name": "allow-web",
+            "folder": "Texas",
+            "from_": ["trust"],
+            "to_": ["untrust"],
+            "source": ["any"],
+            "destination": ["any"],
+            "action": "allow",
+        }
+        mock_scm.security_rule.upsert(rule, rulebase="post")
+
+        list_call, post_call = mock_scm.get.call_args, mock_scm.post.call_args
+        assert list_call.kwargs["params"]["position"] == "post"
+        assert post_call.kwargs["params"] == {"position": "post"}
@@ -0,0 +1,157 @@
+"""Tests for the commit scheduler."""
+
+import time
+
+import pytest
+
+from scm.exceptions import APIError
+from scm.models.operations import (
+    CandidatePushRequestModel,
+    CandidatePushResponseModel,
+    JobListItem,
+)
+from scm.operations.commit_scheduler import CommitScheduler, merge_push_requests
+from scm.operations.jobs import CommitFuture, CommitResult
+
+
+def _request(folders, description="change", admin=("admin@example.com",)):
+    return CandidatePushRequestModel(folders=folders, description=description, admin=list(admin))
+
+
+class FakeClient:
+    """A client whose pushes run until the test finishes them."""
+
+    def __init__(self, fail=False):
+        """Start without pushes; with fail, every push request is rejected."""
+        self.fail = fail
+        self.pushes = []
+
+    def candidate_push_request(self, folders, description, admin=None):
+        """Validate a request the way the client does."""
+        return _request(folders, description, admin or ["admin@example.com"])
+
+    def commit_async(self, folders, description, admin=None, timeout=300):
+        """Record a push and return its pending future."""
+        if self.fail:
+            raise APIError("push rejected")
+        job_id = str(len(self.pushes) + 1)
+        future = CommitFuture(CandidatePushResponseModel(success=True, job_id=job_id, message=""))
+        self.pushes.append(({"folders": folders, "description": description}, future))
+        return future
+
+    def finish(self, index):
+        """End a push successfully."""
+        _, future = self.pushes[index]
+        job = JobListItem(
+            id=future.job_id,
+            job_result="2",
+            job_status="2",
+            job_type="53",
+            parent_id="0",
+            percent="100",
+            result_str="OK",
+            start_ts="2024-11-30T10:00:00",
+            status_str="FIN",
+            type_str="CommitAndPush",
+            uname="admin@example.com",
+        )
+        future.set_result(CommitResult(future.response, job))
+
+    def wait_for_pushes(self, count):
+        """Block until count pushes have been made."""
+        deadline = time.monotonic() + 5
+        while len(self.pushes) < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert len(self.pushes) == count
+
+
+class TestMergePushRequests:
+    """Tests for merging push requests."""
+
+    def test_union_of_folders_and_descriptions(self):
+        """Folders and descriptions are combined once each, in first-seen order."""
+        merged = merge_push_requests(
+            [
+                _request(["Texas", "Austin"], "add web servers"),
+                _request(["Austin", "Dallas"], "add web servers"),
+                _request(["Texas"], "tighten rules", admin=["all"]),
+            ]
+        )
+
+        assert merged.folders == ["Texas", "Austin", "Dallas"]
+        assert merged.description == "add web servers; tighten rules"
+        assert merged.admin == ["all"]
+
+    def test_long_descriptions_are_cut(self):
+        """The merged description never exceeds the push limit."""
+        merged = merge_push_requests([_request(["Texas"], f"{i}" * 100) for i in range(5)])
+        assert len(merged.description) == 255
+        assert merged.description.endswith("...")
+
+
+class TestCommitScheduler:
+    """Tests for coalescing commit requests into pushes."""
+
+    def test_burst_is_merged_into_one_push(self):
+        """Requests within the window share one push and learn its job id."""
+        client = FakeClient()
+
+        with CommitScheduler(client, window=0.05) as scheduler:
+            futures = [
+                scheduler.submit(["Texas"], "add hosts", caller="ci-1"),
+                scheduler.submit(["Texas", "Austin"], "add rules", caller="ci-2"),
+                scheduler.submit(["Dallas"], "add hosts"),
+            ]
+            client.wait_for_pushes(1)
+            client.finish(0)
+            batches = [future.result(timeout=5) for future in futures]
+
+        assert client.pushes[0][0] == {
+            "folders": ["Texas", "Austin", "Dallas"],
+            "description": "add hosts; add rules",
+        }
+        assert batches[0] is batches[1] is batches[2]
+        assert batches[0].callers == ["ci-1", "ci-2", "request-3"]
+        assert batches[0].result.ok
+        assert scheduler.jobs() == {"1": ["ci-1", "ci-2", "request-3"]}
+
+    def test_holds_back_while_a_push_runs(self):
+        """Requests arriving during a push wait for it, then go out together."""
+        client = FakeClient()
+
+        with CommitScheduler(client, window=0.01, max_delay=0.02) as scheduler:
+            first = scheduler.submit(["Texas"], "one", caller="a")
+            client.wait_for_pushes(1)
+            later = [scheduler.submit(["Austin"], "two", caller="b")]
+            time.sleep(0.05)
+            later.append(scheduler.submit(["Dallas"], "three", caller="c"))
+            time.sleep(0.05)
+            assert len(client.pushes) == 1 and scheduler.pending == 2
+
+            client.finish(0)
+            assert first.result(timeout=5).job_id == "1"
+            client.wait_for_pushes(2)
+            client.finish(1)
+
+        assert [future.result(timeout=5).job_id for future in later] == ["2", "2"]
+        assert client.pushes[1][0]["folders"] == ["Austin", "Dallas"]
+        assert scheduler.jobs() == {"1": ["a"], "2": ["b", "c"]}
+
+    def test_close_flushes_and_failures_reach_callers(self):
+        """Closing pushes what is waiting; a failed push fails each of its callers."""
+        client = FakeClient(fail=True)
+        scheduler = CommitScheduler(client, window=60, max_delay=60)
+        future = scheduler.submit(["Texas"], "one")
+
+        scheduler.close()
+
+        with pytest.raises(APIError):
+            future.result(timeout=5)
+        assert scheduler.history[0].job_id is None
+        with pytest.raises(RuntimeError):
+            scheduler.submit(["Texas"], "two")
+
+    def test_invalid_settings(self):
+        """A window longer than the maximum delay is rejected."""
+        with pytest.raises(ValueError):
+            CommitScheduler(FakeClient(), window=10, max_delay=1)
@@ -0,0 +1,125 @@
+"""Tests for the fleet configuration backup."""
+
+import hashlib
+import json
+import os
+from types import SimpleNamespace
+
+from scm.exceptions import NotFoundError
+from scm.operations.config_backup import ConfigBackup
+from scm.operations.local_config import LocalConfig
+
+BASELINE = b"<config><shared/></config>"
+
+
+class FakeStream:
+    """A streamed download response."""
+
+    status_code = 200
+
+    def __init__(self, content):
+        """Serve content."""
+        self.content = content
+
+    def iter_content(self, chunk_size):
+        """Yield the body in chunks."""
+        for start in range(0, len(self.content), chunk_size):
+            end = start + chunk_size
+            yield self.content[start:end]
+
+    def close(self):
+        """Release the connection."""
+
+
+class FakeFleet:
+    """The local-config endpoints of a fleet of devices."""
+
+    def __init__(self, configs):
+        """Serve configs: device -> list of version contents, oldest first."""
+        self.configs = configs
+        self.downloads = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        """Serve version listings and downloads."""
+        device = params["device"]
+        if device not in self.configs:
+            raise NotFoundError(message=f"{device} not found")
+        contents = self.configs[device]
+        if endpoint.endswith("/versions"):
+            return [
+                {
+                    "id": number,
+                    "serial": device,
+                    "local_version": f"1.0.{number}",
+                    "timestamp": f"2025-01-{number:02d}T10:00:00Z",
+                    "xfmed_version": f"1.0.{number}-x",
+                    "md5": hashlib.md5(content).hexdigest(),
+                }
+                for number, content in enumerate(contents, start=1)
+            ]
+        self.downloads.append((device, params["version"]))
+        return FakeStream(contents[int(params["version"]) - 1])
+
+
+def _client(fleet):
+    return SimpleNamespace(local_config=LocalConfig(fleet))
+
+
+DEVICES = ["007951000000001", "007951000000002", "007951000000003"]
+
+
+class TestConfigBackup:
+    """Tests for backing up a fleet into a content-addressed store."""
+
+    def test_identical_configs_are_stored_once(self, tmp_path):
+        """Devices sharing a configuration share its blob; the manifest records the run."""
+        fleet = FakeFleet(
+            {
+                DEVICES[0]: [b"<old/>", BASELINE],
+                DEVICES[1]: [BASELINE],
+                DEVICES[2]: [b"<config><edge/></config>"],
+            }
+        )
+        backup = ConfigBackup(_client(fleet), tmp_path, max_workers=3)
+
+        manifest = backup.run(DEVICES)
+
+        assert sorted(fleet.downloads) == [(DEVICES[0], "2"), (DEVICES[1], "1"), (DEVICES[2], "1")]
+        outcomes = sorted(d.versions[0].outcome for d in manifest.devices[:2])
+        assert outcomes == ["duplicate", "new"]
+        assert manifest.summary() == {
+            "devices": 3, "failed": 0, "new": 2, "duplicate": 1, "stored": 0,
+        }
+        blobs = [name for _, _, names in os.walk(tmp_path / "blobs") for name in names]
+        assert len(blobs) == 2
+        with open(backup.lookup(DEVICES[1], "1"), "rb") as f:
+            assert f.read() == BASELINE
+        assert os.listdir(tmp_path / "tmp") == []
+
+        saved = json.loads(open(manifest.path).read())
+        assert saved["summary"] == manifest.summary()
+        assert [d["device"] for d in saved["devices"]] == DEVICES
+        assert all(d["list_seconds"] >= 0 and d["download_seconds"] >= 0 for d in saved["devices"])
+
+    def test_later_runs_download_only_new_versions(self, tmp_path):
+        """Versions in the index are not downloaded again, even by a new store instance."""
+        fleet = FakeFleet({DEVICES[0]: [BASELINE], DEVICES[1]: [b"<config><b/></config>"]})
+        ConfigBackup(_client(fleet), tmp_path).run(DEVICES[:2])
+        fleet.configs[DEVICES[1]].append(b"<config><b2/></config>")
+        fleet.downloads.clear()
+
+        manifest = ConfigBackup(_client(fleet), tmp_path).run(DEVICES[:2])
+
+        assert fleet.downloads == [(DEVICES[1], "2")]
+        assert manifest.summary()["stored"] == 1 and manifest.summary()["new"] == 1
+
+    def test_failures_and_all_versions(self, tmp_path):
+        """An unknown device is reported without stopping the others."""
+        fleet = FakeFleet({DEVICES[0]: [b"<a/>", b"<b/>", b"<a/>"]})
+
+        manifest = ConfigBackup(_client(fleet), tmp_path).run(DEVICES[:2], latest_only=False)
+
+        first, missing = manifest.devices
+        assert [v.outcome for v in first.versions] == ["new", "new", "duplicate"]
+        assert not missing.ok and "not found" in missing.error
+        assert manifest.summary()["failed"] == 1
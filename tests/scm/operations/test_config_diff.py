@@ -0,0 +1,162 @@
+"""Tests for the structural configuration diff."""
+
+from types import SimpleNamespace
+
+import scm.operations.config_diff as config_diff
+from scm.models.operations import LocalConfigVersionModel
+from scm.operations.config_diff import ConfigTree, diff_configs
+from scm.operations.local_config import LocalConfig
+
+VSYS = "/config/devices/entry[@name='localhost']/vsys/entry[@name='vsys1']"
+
+
+def _config(addresses, rules=("allow-web", "deny-all"), version="11.0.0", hostname="fw-1"):
+    address_xml = "".join(
+        f'<entry name="{name}"><ip-netmask>{ip}</ip-netmask>'
+        f"<tag><member>prod</member></tag></entry>"
+        for name, ip in addresses.items()
+    )
+    rule_xml = "".join(
+        f'<entry name="{name}" uuid="{n}"><action>allow</action></entry>'
+        for n, name in enumerate(rules)
+    )
+    return (
+        f'<config version="{version}"><devices><entry name="localhost">'
+        f"<deviceconfig><system><hostname>{hostname}</hostname></system></deviceconfig>"
+        f'<vsys><entry name="vsys1"><address>{address_xml}</address>'
+        f"<rulebase><security><rules>{rule_xml}</rules></security></rulebase>"
+        f"</entry></vsys></entry></devices></config>"
+    ).encode()
+
+
+ADDRESSES = {f"host-{n}": f"10.0.0.{n}/32" for n in range(50)}
+
+
+class TestConfigDiff:
+    """Tests for diffing configurations through their hash trees."""
+
+    def test_added_removed_modified_and_reordered(self):
+        """Changed entries are reported by xpath and grouped by entry."""
+        addresses = dict(ADDRESSES)
+        addresses["host-7"] = "192.0.2.7/32"
+        del addresses["host-9"]
+        addresses["web"] = "203.0.113.80/32"
+        new = _config(addresses, rules=("deny-all", "allow-web"), hostname="fw-2")
+
+        diff = diff_configs(_config(ADDRESSES), new)
+
+        changes = [(c.action, c.xpath, c.old, c.new) for c in diff]
+        assert changes == [
+            (
+                "modified",
+                "/config/devices/entry[@name='localhost']/deviceconfig/system/hostname",
+                "fw-1",
+                "fw-2",
+            ),
+            (
+                "modified",
+                f"{VSYS}/address/entry[@name='host-7']/ip-netmask",
+                "10.0.0.7/32",
+                "192.0.2.7/32",
+            ),
+            (
+                "added",
+                f"{VSYS}/address/entry[@name='web']",
+                None,
+                {"ip-netmask": "203.0.113.80/32", "tag": ["prod"]},
+            ),
+            (
+                "removed",
+                f"{VSYS}/address/entry[@name='host-9']",
+                {"ip-netmask": "10.0.0.9/32", "tag": ["prod"]},
+                None,
+            ),
+            (
+                "modified",
+                f"{VSYS}/rulebase/security/rules/entry[@name='deny-all']/@uuid",
+                "1",
+                "0",
+            ),
+            (
+                "modified",
+                f"{VSYS}/rulebase/security/rules/entry[@name='allow-web']/@uuid",
+                "0",
+                "1",
+            ),
+            (
+                "reordered",
+                f"{VSYS}/rulebase/security/rules",
+                ["allow-web", "deny-all"],
+                ["deny-all", "allow-web"],
+            ),
+        ]
+        assert diff.summary() == {"added": 1, "removed": 1, "modified": 4, "reordered": 1}
+        entries = {entry.xpath: entry.action for entry in diff.entries()}
+        assert entries[f"{VSYS}/address/entry[@name='web']"] == "added"
+        assert entries[f"{VSYS}/address/entry[@name='host-9']"] == "removed"
+        assert entries[f"{VSYS}/address/entry[@name='host-7']"] == "modified"
+        assert entries[VSYS] == "modified"
+        assert entries["/config/devices/entry[@name='localhost']"] == "modified"
+
+    def test_only_differing_subtrees_are_parsed(self, monkeypatch):
+        """Unchanged entries are compared by hash alone; formatting is not a change."""
+        old = _config(ADDRESSES)
+        addresses = dict(ADDRESSES, **{"host-3": "10.9.9.9/32"})
+        parsed = []
+        original = config_diff.fromstring
+
+        def counting(data):
+            parsed.append(data)
+            return original(data)
+
+        monkeypatch.setattr(config_diff, "fromstring", counting)
+        old_tree = ConfigTree.parse(old)
+
+        assert len(old_tree.diff(ConfigTree.parse(_config(addresses)))) == 1
+        assert len(parsed) == 2 and all(b"host-3" in data for data in parsed)
+        assert old_tree.digest == ConfigTree.parse(old).digest
+        assert len(diff_configs(old, old.replace(b"><", b">\n  <"))) == 0
+
+    def test_sources_attributes_and_self_closing_entries(self, tmp_path):
+        """Files, attributes and empty entries take part in the diff."""
+        old = tmp_path / "old.xml"
+        old.write_bytes(
+            b'<config version="10.2"><shared><tag><entry name="a"/><entry name="b"/></tag>'
+            b"</shared></config>"
+        )
+        new = b'<config version="11.0"><shared><tag><entry name="a"/></tag></shared></config>'
+
+        with open(old, "rb") as f:
+            diff = diff_configs(f, new)
+
+        assert [(c.action, c.xpath, c.old, c.new) for c in diff] == [
+            ("modified", "/config/@version", "10.2", "11.0"),
+            ("removed", "/config/shared/tag/entry[@name='b']", "", None),
+        ]
+        assert diff_configs(str(old), str(old)).changes == []
+
+
+class TestLocalConfigDiffVersions:
+    """Tests for diffing two versions of a device's configuration."""
+
+    def test_downloads_and_diffs_both_versions(self):
+        """Versions can be given as IDs or listed version models."""
+        versions = {"1": _config(ADDRESSES), "2": _config(ADDRESSES, hostname="fw-2")}
+        calls = []
+
+        def get(endpoint, params=None, **kwargs):
+            calls.append(params["version"])
+            return SimpleNamespace(content=versions[params["version"]])
+
+        listed = LocalConfigVersionModel(
+            id=2,
+            serial="007951000123456",
+            local_version="1.0.2",
+            timestamp="2025-01-02T10:00:00Z",
+            xfmed_version="1.0.2-x",
+        )
+
+        diff = LocalConfig(SimpleNamespace(get=get)).diff_versions("007951000123456", "1", listed)
+
+        assert calls == ["1", "2"]
+        assert [(c.old, c.new) for c in diff] == [("fw-1", "fw-2")]
@@ -0,0 +1,218 @@
+"""Tests for the streaming configuration parser."""
+
+import io
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from scm.models.network import NatRuleCreateModel
+from scm.models.objects import AddressCreateModel, ServiceCreateModel
+from scm.models.security import SecurityRuleCreateModel
+from scm.operations.config_parser import iter_config_records
+from scm.operations.local_config import LocalConfig
+
+CONFIG = b"""<config version="11.0.0">
+  <shared>
+    <address>
+      <entry name="dns-1">
+        <ip-netmask>10.0.0.53/32</ip-netmask>
+        <tag><member>infra</member></tag>
+      </entry>
+    </address>
+  </shared>
+  <devices>
+    <entry name="localhost.localdomain">
+      <network>
+        <interface><ethernet><entry name="ethernet1/1"><layer3><ipv6><address>
+          <entry name="2001:db8::1/64"/>
+        </address></ipv6></layer3></entry></ethernet></interface>
+      </network>
+      <vsys>
+        <entry name="vsys1">
+          <address>
+            <entry name="web"><fqdn>www.example.com</fqdn><description>yes</description></entry>
+            <entry name="broken"><description>no type</description></entry>
+          </address>
+          <address-group>
+            <entry name="servers">
+              <static><member>web</member><member>dns-1</member></static>
+            </entry>
+            <entry name="tagged"><dynamic><filter>'prod'</filter></dynamic></entry>
+          </address-group>
+          <service>
+            <entry name="tcp-8443">
+              <protocol><tcp>
+                <port>8443</port>
+                <override><yes><timeout>3600</timeout></yes></override>
+              </tcp></protocol>
+            </entry>
+            <entry name="udp-53">
+              <protocol><udp><port>53</port><override><no/></override></udp></protocol>
+            </entry>
+          </service>
+          <rulebase>
+            <security><rules>
+              <entry name="allow-web" uuid="1">
+                <from><member>trust</member></from><to><member>untrust</member></to>
+                <source><member>any</member></source>
+                <destination><member>web</member></destination>
+                <source-user><member>any</member></source-user>
+                <application><member>web-browsing</member></application>
+                <service><member>application-default</member></service>
+                <action>allow</action><log-end>yes</log-end><disabled>no</disabled>
+                <profile-setting><group><member>default</member></group></profile-setting>
+              </entry>
+            </rules></security>
+            <nat><rules>
+              <entry name="outbound">
+                <from><member>trust</member></from><to><member>untrust</member></to>
+                <source><member>any</member></source>
+                <destination><member>any</member></destination>
+                <service>any</service>
+                <source-translation><dynamic-ip-and-port><interface-address>
+                  <interface>ethernet1/1</interface>
+                </interface-address></dynamic-ip-and-port></source-translation>
+              </entry>
+              <entry name="inbound">
+                <from><member>untrust</member></from><to><member>untrust</member></to>
+                <source><member>any</member></source>
+                <destination><member>203.0.113.10</member></destination>
+                <service>any</service>
+                <destination-translation>
+                  <translated-address>10.0.0.10</translated-address>
+                  <translated-port>8443</translated-port>
+                </destination-translation>
+              </entry>
+            </rules></nat>
+          </rulebase>
+        </entry>
+      </vsys>
+    </entry>
+  </devices>
+</config>
+"""
+
+
+def _addresses(count):
+    entries = b"".join(
+        b'<entry name="host-%d"><ip-netmask>10.%d.%d.%d/32</ip-netmask>'
+        b"<description>host number %d</description></entry>"
+        % (n, n >> 16 & 255, n >> 8 & 255, n & 255, n)
+        for n in range(count)
+    )
+    return b"<config><shared><address>" + entries + b"</address></shared></config>"
+
+
+class TestIterConfigRecords:
+    """Tests for streaming typed records out of a configuration."""
+
+    def test_yields_typed_records_in_document_order(self):
+        """Objects and rules become their create models; other entries are ignored."""
+        records = list(iter_config_records(CONFIG))
+
+        assert [(r.kind, r.name, r.location) for r in records] == [
+            ("address", "dns-1", "shared"),
+            ("address", "web", "vsys1"),
+            ("address", "broken", "vsys1"),
+            ("address_group", "servers", "vsys1"),
+            ("address_group", "tagged", "vsys1"),
+            ("service", "tcp-8443", "vsys1"),
+            ("service", "udp-53", "vsys1"),
+            ("security_rule", "allow-web", "vsys1"),
+            ("nat_rule", "outbound", "vsys1"),
+            ("nat_rule", "inbound", "vsys1"),
+        ]
+        dns, web, broken, servers, tagged, tcp, udp, rule, outbound, inbound = records
+        assert isinstance(dns.model, AddressCreateModel)
+        assert dns.model.ip_netmask == "10.0.0.53/32" and dns.model.tag == ["infra"]
+        assert web.model.fqdn == "www.example.com" and web.model.description == "yes"
+        assert not broken.ok and "Exactly one of" in broken.error
+        assert servers.model.static == ["web", "dns-1"]
+        assert tagged.model.dynamic.filter == "'prod'"
+        assert isinstance(tcp.model, ServiceCreateModel)
+        assert tcp.model.protocol.tcp.port == "8443"
+        assert tcp.model.protocol.tcp.override.timeout == 3600
+        assert udp.model.protocol.udp.override is None
+        assert isinstance(rule.model, SecurityRuleCreateModel)
+        assert rule.model.from_ == ["trust"] and rule.model.action == "allow"
+        assert rule.model.log_end is True and rule.model.disabled is False
+        assert rule.model.profile_setting.group == ["default"]
+        assert isinstance(outbound.model, NatRuleCreateModel)
+        dynamic = outbound.model.source_translation.dynamic_ip_and_port
+        assert dynamic.interface_address.interface == "ethernet1/1"
+        assert inbound.model.destination_translation.translated_port == 8443
+        assert all(r.model.device == r.location for r in records if r.ok)
+
+    def test_kinds_device_and_sources(self, tmp_path):
+        """Kinds filter the records; paths and file objects parse like bytes."""
+        path = tmp_path / "running.xml"
+        path.write_bytes(CONFIG)
+
+        for source in (str(path), path, io.BytesIO(CONFIG)):
+            records = list(iter_config_records(source, kinds=["nat_rule"], device="fw-1"))
+            assert [r.name for r in records] == ["outbound", "inbound"]
+            assert {r.model.device for r in records} == {"fw-1"}
+        with pytest.raises(ValueError, match="Unknown kinds: route"):
+            list(iter_config_records(CONFIG, kinds=["route"]))
+
+    def test_panorama_rulebases(self):
+        """Device-group pre- and post-rulebase rules carry their rulebase."""
+        config = (
+            b'<config><devices><entry name="localhost"><device-group><entry name="branch">'
+            b"<pre-rulebase><security><rules><entry name=\"first\"><action>deny</action>"
+            b"</entry></rules></security></pre-rulebase>"
+            b"<post-rulebase><security><rules><entry name=\"last\"><action>deny</action>"
+            b"</entry></rules></security></post-rulebase>"
+            b"</entry></device-group></entry></devices></config>"
+        )
+
+        records = list(iter_config_records(config))
+
+        assert [(r.name, r.location, r.rulebase) for r in records] == [
+            ("first", "branch", "pre"),
+            ("last", "branch", "post"),
+        ]
+
+    def test_memory_stays_flat(self):
+        """Peak memory does not grow with the number of entries parsed."""
+        peaks = []
+        for count in (2000, 20000):
+            config = _addresses(count)
+            tracemalloc.start()
+            parsed = sum(1 for record in iter_config_records(config) if record.ok)
+            peaks.append(tracemalloc.get_traced_memory()[1] - len(config))
+            tracemalloc.stop()
+            assert parsed == count
+
+        assert peaks[1] < 2 * peaks[0] and peaks[1] < 1024 * 1024
+
+
+class TestLocalConfigIterRecords:
+    """Tests for parsing a configuration while it downloads."""
+
+    def test_parses_the_streamed_download(self):
+        """The raw response is parsed as it arrives and then closed."""
+        raw = io.BytesIO(CONFIG)
+        response = SimpleNamespace(raw=raw, closed=False)
+        response.close = lambda: setattr(response, "closed", True)
+        calls = []
+
+        def get(endpoint, params=None, **kwargs):
+            calls.append((endpoint, params, kwargs))
+            return response
+
+        records = LocalConfig(SimpleNamespace(get=get)).iter_records(
+            "007951000123456", "7", kinds=["address"]
+        )
+
+        assert [r.name for r in records] == ["dns-1", "web", "broken"]
+        assert response.closed
+        assert raw.decode_content is True
+        assert calls == [
+            (
+                "/operations/v1/local-config/download",
+                {"device": "007951000123456", "version": "7"},
+                {"raw_response": True, "stream": True},
+            )
+        ]
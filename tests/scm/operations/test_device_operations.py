@@ -1,11 +1,12 @@
 """Tests for DeviceOperations service."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 from pydantic import ValidationError
 import pytest
 
-from scm.exceptions import JobTimeoutError
+from scm.exceptions import APIError, JobTimeoutError
 from scm.models.operations.device_operations import (
     DeviceJobStatusModel,
     JobCreatedModel,
@@ -172,6 +173,22 @@ class TestDeviceOperations:
         assert mock_client.get.call_count == 2
         mock_sleep.assert_called_once_with(1)
 
+    @patch("scm.operations.device_operations.time.sleep")
+    def test_sync_mode_polls_adaptively_by_default(self, mock_sleep, device_ops, mock_client):
+        """Without a poll_interval, the first poll comes quickly and later ones back off."""
+        mock_client.post.return_value = {"job_id": "test-job-sync"}
+        running = {
+            "jobId": "test-job-sync", "progress": 50, "state": "in_progress",
+            "request": {"command": "test", "devices": ["007951000123456"]},
+            "results": [],
+        }
+        mock_client.get.side_effect = [running, running, running, {**running, "state": "complete"}]
+        result = device_ops.route_table(devices=["007951000123456"], sync=True)
+        assert result.state == "complete"
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert delays[0] <= 0.5 < delays[2] <= 10
+
     @patch("scm.operations.device_operations.time.sleep")
     @patch("scm.operations.device_operations.time.time")
     def test_sync_mode_timeout(self, mock_time, mock_sleep, device_ops, mock_client):
@@ -200,3 +217,101 @@ class TestDeviceOperations:
         result = device_ops.route_table(devices=["007951000123456"], sync=True)
         assert isinstance(result, DeviceJobStatusModel)
         assert result.state == "failed"
+
+
+class FakeDeviceApi:
+    """A device operations API whose jobs finish after a set number of polls."""
+
+    def __init__(self, polls=1, reject=(), missing=()):
+        """Jobs covering a rejected device fail to dispatch; missing devices get no result."""
+        self.polls = polls
+        self.reject = set(reject)
+        self.missing = set(missing)
+        self.jobs = {}
+        self.posts = []
+        self.lock = threading.Lock()
+
+    def post(self, endpoint, json):
+        """Create a job for a group of devices."""
+        with self.lock:
+            self.posts.append((endpoint, json["devices"]))
+            if self.reject & set(json["devices"]):
+                raise APIError("dispatch rejected")
+            job_id = f"job{len(self.posts)}"
+            polls = self.polls(json["devices"]) if callable(self.polls) else self.polls
+            self.jobs[job_id] = [json["devices"], polls]
+            return {"job_id": job_id}
+
+    def get(self, endpoint):
+        """Serve a job status, advancing the job by one poll."""
+        job_id = endpoint.rsplit("/", 1)[1]
+        with self.lock:
+            devices, polls = self.jobs[job_id]
+            self.jobs[job_id][1] = polls - 1
+        done = polls <= 1
+        return {
+            "jobId": job_id,
+            "progress": 100 if done else 50,
+            "state": "complete" if done else "in_progress",
+            "request": {"command": "test", "devices": devices},
+            "results": [
+                {
+                    "device": device, "state": "complete",
+                    "created_ts": "2026-03-02 19:00:04", "updated_ts": "2026-03-02 19:00:04",
+                    "details": {"msg": "Done.", "result": {"device": device}},
+                }
+                for device in devices
+                if done and device not in self.missing
+            ],
+        }
+
+
+class TestDeviceOperationsFleet:
+    """Tests for fleet-wide operations split into jobs of five devices."""
+
+    DEVICES = [f"0079510001234{i:02d}" for i in range(12)]
+
+    def test_devices_are_split_into_jobs_of_five(self):
+        """Every device gets a result; invalid and repeated serials are not dispatched."""
+        api = FakeDeviceApi(missing={self.DEVICES[3]})
+        ops = DeviceOperations(api)
+
+        results = list(
+            ops.route_table_fleet(self.DEVICES + [self.DEVICES[0], "invalid"], rate=100)
+        )
+
+        assert sorted(len(devices) for _, devices in api.posts) == [2, 5, 5]
+        assert {endpoint for endpoint, _ in api.posts} == {"/operations/v1/jobs/route-table"}
+        assert len(results) == 13
+        by_device = {result.device: result for result in results}
+        assert isinstance(by_device["invalid"].error, ValidationError)
+        assert isinstance(by_device[self.DEVICES[3]].error, APIError)
+        ok = [result for result in results if result.ok]
+        assert len(ok) == 11
+        assert all(result.result.details.result == {"device": result.device} for result in ok)
+
+    def test_results_arrive_in_completion_order(self):
+        """A job that finishes first is reported first, whatever its dispatch order."""
+        first = self.DEVICES[:5]
+        api = FakeDeviceApi(polls=lambda devices: 3 if devices == first else 1)
+        ops = DeviceOperations(api)
+
+        results = list(ops.fib_table_fleet(self.DEVICES[:10], rate=100))
+
+        assert [result.device for result in results] == self.DEVICES[5:10] + first
+        assert all(result.ok for result in results)
+
+    def test_failed_dispatches_and_timeouts_are_reported(self):
+        """A rejected dispatch and a job outliving the timeout fail only their devices."""
+        api = FakeDeviceApi(polls=10_000, reject={self.DEVICES[7]})
+        ops = DeviceOperations(api)
+
+        results = list(ops.device_rules_fleet(self.DEVICES[:10], timeout=0, rate=100))
+
+        states = {result.device: result.state for result in results}
+        assert [states[device] for device in self.DEVICES[:5]] == ["timeout"] * 5
+        assert [states[device] for device in self.DEVICES[5:10]] == ["error"] * 5
+        timed_out = next(result for result in results if result.state == "timeout")
+        assert isinstance(timed_out.error, JobTimeoutError)
+        assert timed_out.error.last_state == "in_progress"
+        assert not any(result.ok for result in results)
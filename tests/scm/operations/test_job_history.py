@@ -0,0 +1,109 @@
+"""Tests for the streaming job history."""
+
+from datetime import datetime, timedelta, timezone
+
+from scm.models.operations import JobListResponse
+from scm.operations.job_history import JobHistory
+
+START = datetime(2024, 11, 30, 10, 0, 0)
+
+
+def _job(number, parent="0", type_str="CommitAndPush", status="FIN"):
+    return {
+        "id": str(number),
+        "job_result": "2",
+        "job_status": "2",
+        "job_type": "53",
+        "parent_id": str(parent),
+        "percent": "100",
+        "result_str": "OK",
+        "start_ts": (START + timedelta(minutes=number)).isoformat(),
+        "status_str": status,
+        "type_str": type_str,
+        "uname": "admin@example.com",
+    }
+
+
+class FakeJobList:
+    """A job list served newest first, one page at a time."""
+
+    def __init__(self, jobs):
+        """Start with jobs, in any order."""
+        self.jobs = sorted(jobs, key=lambda job: int(job["id"]), reverse=True)
+        self.calls = []
+
+    def add(self, job):
+        """Add a job at the head of the list."""
+        self.jobs.insert(0, job)
+
+    def list_jobs(self, limit=100, offset=0):
+        """Serve one page."""
+        self.calls.append(offset)
+        end = offset + limit
+        page = self.jobs[offset:end]
+        return JobListResponse(data=page, total=len(self.jobs), limit=limit, offset=offset)
+
+
+def _history():
+    # 1-30 are pushes; 31-60 are their device jobs, two per push for pushes 1-15
+    jobs = [_job(n) for n in range(1, 31)]
+    jobs += [_job(30 + n, parent=(n + 1) // 2, type_str="CommitAll") for n in range(1, 31)]
+    api = FakeJobList(jobs)
+    return api, JobHistory(api, page_size=10)
+
+
+class TestJobHistory:
+    """Tests for paging through and indexing all jobs."""
+
+    def test_stream_pages_through_every_job(self):
+        """Streaming reads every page, not only the first, and indexes the jobs."""
+        api, history = _history()
+
+        ids = [job.id for job in history.stream()]
+
+        assert ids == [str(n) for n in range(60, 0, -1)]
+        assert api.calls == [0, 10, 20, 30, 40, 50]
+        assert len(history) == 60 and "42" in history
+        assert [job.id for job in history.children("1")] == ["32", "31"]
+
+    def test_stream_limit_stops_early(self):
+        """A limit stops paging once enough jobs have been read."""
+        api, history = _history()
+
+        assert len(list(history.stream(limit=15))) == 15
+        assert api.calls == [0, 10]
+        assert len(history) == 15
+
+    def test_find_combines_indexes_and_time_window(self):
+        """Type, status, parent and start-time criteria narrow the result together."""
+        api, history = _history()
+        api.jobs[0]["status_str"] = "ACT"
+        history.load()
+
+        assert len(history.find(type_str="CommitAndPush")) == 30
+        assert [job.id for job in history.find(status_str="ACT")] == ["60"]
+        window = history.find(
+            type_str="CommitAll",
+            since=START + timedelta(minutes=40),
+            until=(START + timedelta(minutes=45)).replace(tzinfo=timezone.utc),
+        )
+        assert [job.id for job in window] == ["45", "44", "43", "42", "41", "40"]
+        assert [job.id for job in history.find(parent_id="3", status_str="FIN")] == ["36", "35"]
+
+    def test_refresh_reads_only_new_pages(self):
+        """Refresh stops at the first page holding already indexed jobs and updates them."""
+        api, history = _history()
+        history.load()
+        api.jobs[0]["status_str"] = "FAIL"
+        for n in range(61, 74):
+            api.add(_job(n, parent=61 if n > 61 else 0))
+        api.calls.clear()
+
+        added = history.refresh()
+
+        assert [job.id for job in added] == [str(n) for n in range(73, 60, -1)]
+        assert api.calls == [0, 10]
+        assert len(history.children("61")) == 12
+        assert history.get("60").status_str == "FAIL"
+        assert history.find(status_str="FIN", since=START + timedelta(minutes=60)) != []
+        assert history.refresh() == []
@@ -0,0 +1,278 @@
+"""Tests for the multi-job watcher."""
+
+import asyncio
+from concurrent.futures import CancelledError, wait
+import threading
+import time
+
+import pytest
+
+from scm.exceptions import APIError, JobTimeoutError, NotFoundError
+from scm.models.operations import CandidatePushResponseModel, JobListResponse, JobStatusResponse
+from scm.operations.jobs import CommitResult, JobWatcher
+from scm.utils.backoff import Backoff
+
+FAST = Backoff(initial=0.005, maximum=0.02, jitter=0)
+
+
+def _job(job_id, status="ACT", result="PEND", percent="0", parent_id="0"):
+    return {
+        "id": job_id,
+        "job_result": "0",
+        "job_status": "1",
+        "job_type": "53",
+        "parent_id": parent_id,
+        "percent": percent,
+        "result_str": result,
+        "start_ts": "2024-11-30T10:00:00",
+        "status_str": status,
+        "type_str": "CommitAndPush",
+        "uname": "admin@example.com",
+    }
+
+
+class FakeJobs:
+    """An SCM jobs API whose jobs finish after a given number of polls."""
+
+    def __init__(self, total=0):
+        """Start with total unrelated finished jobs, listed newest first."""
+        self.jobs = [_job(f"old{i}", "FIN", "OK", "100") for i in range(total)]
+        self.finish_after = {}
+        self.list_calls = 0
+        self.status_calls = 0
+        self.lock = threading.Lock()
+
+    def submit(self, job_id, polls, result="OK", parent_id="0"):
+        """Add a running job that finishes on its polls-th listing."""
+        self.jobs.insert(0, _job(job_id, parent_id=parent_id))
+        self.finish_after[job_id] = (polls, result)
+
+    def list_jobs(self, limit=100, offset=0, parent_id=None):
+        """Serve one page, advancing every running job by one poll per first page."""
+        with self.lock:
+            self.list_calls += 1
+            if parent_id is not None:
+                children = []
+                start = offset
+                while start < len(self.jobs):
+                    end = start + limit
+                    children += [j for j in self.jobs[start:end] if j["parent_id"] == parent_id]
+                    start = end
+                return JobListResponse(
+                    data=children, total=len(children), limit=limit, offset=offset
+                )
+            if offset == 0:
+                self._advance()
+            end = offset + limit
+            page = self.jobs[offset:end]
+            return JobListResponse(data=page, total=len(self.jobs), limit=limit, offset=offset)
+
+    def get_job_status(self, job_id):
+        """Serve one job's status."""
+        with self.lock:
+            self.status_calls += 1
+            job = next((j for j in self.jobs if j["id"] == job_id), None)
+            if job is None:
+                raise NotFoundError(message=f"{job_id} not found")
+            return JobStatusResponse(
+                data=[
+                    {
+                        **job,
+                        "details": "",
+                        "insert_ts": job["start_ts"],
+                        "last_update": job["start_ts"],
+                        "owner": "cfgserv",
+                        "result_i": "2",
+                        "status_i": "2",
+                        "type_i": "53",
+                    }
+                ]
+            )
+
+    def _advance(self):
+        for job in self.jobs:
+            if job["id"] in self.finish_after and job["status_str"] != "FIN":
+                polls, result = self.finish_after[job["id"]]
+                polls -= 1
+                self.finish_after[job["id"]] = (polls, result)
+                job["percent"] = str(max(0, 100 - polls * 25))
+                if polls <= 0:
+                    job.update(status_str="FIN", result_str=result, percent="100")
+
+
+class TestJobWatcher:
+    """Tests for tracking many jobs with bulk status reads."""
+
+    def test_many_jobs_share_one_listing_per_poll(self):
+        """Fifty jobs cost one list_jobs() page per poll, not fifty status calls."""
+        api = FakeJobs(total=20)
+        for i in range(50):
+            api.submit(f"job{i}", polls=1 + i % 4, result="FAIL" if i == 7 else "OK")
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            results = watcher.wait([f"job{i}" for i in range(50)], timeout=5)
+
+        assert {job.status_str for job in results.values()} == {"FIN"}
+        assert results["job7"].result_str == "FAIL"
+        assert api.status_calls == 0
+        assert api.list_calls == watcher.stats["pages"] <= 4 + 1
+        assert watcher.watching == 0
+
+    def test_futures_resolve_as_each_job_finishes(self):
+        """Each job's future resolves on its own, and updates report progress."""
+        api = FakeJobs()
+        api.submit("quick", polls=1)
+        api.submit("slow", polls=3)
+        seen = []
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            quick = watcher.watch("quick")
+            slow = watcher.watch("slow", on_update=lambda job: seen.append(job.percent))
+            wait([quick], timeout=5)
+            assert quick.result().status_str == "FIN"
+            assert slow.result(timeout=5).percent == "100"
+
+        assert seen[-1] == "100"
+        assert seen == sorted(seen, key=int)
+
+    def test_jobs_beyond_the_listed_pages_are_looked_up(self):
+        """Jobs missing from the first pages fall back to get_job_status()."""
+        api = FakeJobs(total=30)
+        api.jobs.append(_job("ancient", "FIN", "OK", "100"))
+
+        with JobWatcher(api, backoff=FAST, page_size=10, max_pages=2) as watcher:
+            result = watcher.watch("ancient").result(timeout=5)
+
+        assert result.result_str == "OK"
+        assert api.status_calls == 1
+        assert watcher.stats["pages"] == 2
+
+    def test_timeout(self):
+        """A job still running at its deadline fails its future."""
+        api = FakeJobs()
+        api.submit("stuck", polls=10_000)
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            future = watcher.watch("stuck", timeout=0.05)
+            with pytest.raises(JobTimeoutError) as exc_info:
+                future.result(timeout=5)
+
+        assert exc_info.value.job_id == "stuck"
+        assert exc_info.value.last_state == "ACT"
+
+    def test_close_cancels_pending_jobs(self):
+        """Watching twice shares a future; closing cancels it and rejects new jobs."""
+        api = FakeJobs()
+        api.submit("stuck", polls=10_000)
+        watcher = JobWatcher(api, backoff=FAST)
+        future = watcher.watch("stuck")
+        assert watcher.watch("stuck") is future
+
+        watcher.close()
+
+        assert future.cancelled()
+        with pytest.raises(RuntimeError):
+            watcher.watch("other")
+
+
+def _push(job_id="100", success=True):
+    return CandidatePushResponseModel(
+        success=success, job_id=job_id if success else "", message=f"job {job_id}"
+    )
+
+
+class TestWatchCommit:
+    """Tests for tracking a commit and the child jobs of its push."""
+
+    def test_resolves_after_child_jobs(self):
+        """The future waits for every child job and reports progress for all of them."""
+        api = FakeJobs()
+        api.submit("100", polls=1)
+        api.submit("101", polls=2, parent_id="100")
+        api.submit("102", polls=4, result="FAIL", parent_id="100")
+        seen = []
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            future = watcher.watch_commit(_push(), timeout=5, on_progress=seen.append)
+            result = future.result(timeout=5)
+
+        assert isinstance(result, CommitResult)
+        assert result.job.id == "100"
+        assert sorted(child.id for child in result.children) == ["101", "102"]
+        assert not result.ok
+        assert future.progress == {"100": 100, "101": 100, "102": 100}
+        assert {job.id for job in seen} == {"100", "101", "102"}
+
+    def test_child_jobs_beyond_first_page(self):
+        """Child jobs listed after a full page of other jobs are still waited for."""
+        api = FakeJobs(total=3)
+        api.submit("100", polls=1)
+        for child_id in ("101", "102", "103"):
+            api.submit(child_id, polls=2, parent_id="100")
+        api.submit("200", polls=1)
+        api.submit("201", polls=1)
+
+        with JobWatcher(api, page_size=2, backoff=FAST) as watcher:
+            result = watcher.watch_commit(_push(), timeout=5).result(timeout=5)
+
+        assert sorted(child.id for child in result.children) == ["101", "102", "103"]
+
+    def test_child_listing_errors_fail_the_future(self):
+        """A child listing failing with a transport error fails the commit, off the poll thread."""
+        api = FakeJobs()
+        api.submit("100", polls=1)
+        threads = []
+
+        def list_jobs(limit=100, offset=0, parent_id=None):
+            if parent_id is None:
+                return FakeJobs.list_jobs(api, limit, offset)
+            threads.append(threading.current_thread().name)
+            raise ConnectionError("connection reset")
+
+        api.list_jobs = list_jobs
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            future = watcher.watch_commit(_push(), timeout=5)
+            with pytest.raises(ConnectionError):
+                future.result(timeout=5)
+
+        assert threads == ["scm-commit-children"]
+
+    def test_cancel_stops_monitoring(self):
+        """Cancelling the future drops its jobs from the watcher."""
+        api = FakeJobs()
+        api.submit("100", polls=10_000)
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            future = watcher.watch_commit(_push())
+            assert future.cancel()
+            with pytest.raises(CancelledError):
+                future.result(timeout=5)
+            deadline = time.monotonic() + 5
+            while watcher.watching and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert watcher.watching == 0
+
+    def test_rejected_push_and_timeout(self):
+        """A rejected push fails at once; a push outlasting its timeout fails later."""
+        api = FakeJobs()
+        api.submit("100", polls=10_000)
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            with pytest.raises(APIError):
+                watcher.watch_commit(_push(success=False)).result(timeout=5)
+            with pytest.raises(JobTimeoutError):
+                watcher.watch_commit(_push(), timeout=0.05).result(timeout=5)
+
+    def test_awaitable(self):
+        """The future can be awaited from asyncio code."""
+        api = FakeJobs()
+        api.submit("100", polls=2)
+
+        async def main(watcher):
+            return await watcher.watch_commit(_push(), timeout=5)
+
+        with JobWatcher(api, backoff=FAST) as watcher:
+            result = asyncio.run(main(watcher))
+
+        assert result.ok and result.children == []
@@ -1,9 +1,13 @@
 """Tests for LocalConfig operations service."""
 
+import hashlib
+import io
+import json
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from scm.exceptions import APIError, ChecksumMismatchError
 from scm.models.operations.local_config import LocalConfigVersionModel
 from scm.operations.local_config import LocalConfig
 
@@ -80,3 +84,154 @@ class TestLocalConfig:
             raw_response=True,
         )
         assert result == b"<config>xml content</config>"
+
+
+CONFIG = b"".join(b"<entry name='rule%05d'/>\n" % i for i in range(2000))
+
+
+class FakeDownload:
+    """A streamed download response serving CONFIG, honouring Range if asked to."""
+
+    def __init__(self, start=0, fail_after=None):
+        """Serve CONFIG from start; with fail_after, break after that many chunks."""
+        self.status_code = 206 if start else 200
+        self.start = start
+        self.fail_after = fail_after
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        """Yield the body in chunks."""
+        for count, i in enumerate(range(self.start, len(CONFIG), chunk_size)):
+            if self.fail_after is not None and count == self.fail_after:
+                raise ConnectionError("connection reset")
+            end = i + chunk_size
+            yield CONFIG[i:end]
+
+    def close(self):
+        """Release the connection."""
+        self.closed = True
+
+
+class FakeDownloadClient:
+    """A client serving config downloads; failures and Range support are configurable."""
+
+    def __init__(self, ranges=True):
+        """Serve ranges as 206 responses unless ranges is False."""
+        self.ranges = ranges
+        self.fail_after = None
+        self.calls = []
+        self.responses = []
+
+    def get(self, endpoint, params=None, **kwargs):
+        """Return a streamed response for the download endpoint."""
+        self.calls.append((endpoint, params, kwargs))
+        start = 0
+        header = kwargs.get("headers", {}).get("Range")
+        if header and self.ranges:
+            start = int(header.split("=")[1].rstrip("-"))
+            if start >= len(CONFIG):
+                raise APIError(
+                    "HTTP error occurred: 416 Range Not Satisfiable", http_status_code=416
+                )
+        response = FakeDownload(start, self.fail_after)
+        self.fail_after = None
+        self.responses.append(response)
+        return response
+
+
+class TestLocalConfigDownloadTo:
+    """Tests for streaming configuration downloads."""
+
+    DEVICE = "007951000123456"
+    MD5 = hashlib.md5(CONFIG).hexdigest()
+
+    def test_streams_to_a_file(self, tmp_path):
+        """The file is written chunk by chunk, hashed, and recorded beside it."""
+        client = FakeDownloadClient()
+        target = tmp_path / "running.xml"
+
+        result = LocalConfig(client).download_to(
+            self.DEVICE, "7", target, md5=self.MD5.upper(), chunk_size=1024
+        )
+
+        assert target.read_bytes() == CONFIG
+        assert result.size == len(CONFIG)
+        assert result.sha256 == hashlib.sha256(CONFIG).hexdigest()
+        assert result.md5 == self.MD5
+        assert not result.skipped and result.path == str(target)
+        assert not (tmp_path / "running.xml.part").exists()
+        meta = json.loads((tmp_path / "running.xml.meta.json").read_text())
+        assert meta["version"] == "7" and meta["sha256"] == result.sha256
+        endpoint, params, kwargs = client.calls[0]
+        assert endpoint == "/operations/v1/local-config/download"
+        assert params == {"device": self.DEVICE, "version": "7"}
+        assert kwargs == {"raw_response": True, "stream": True}
+        assert client.responses[0].closed
+
+    def test_skips_a_matching_local_copy(self, tmp_path):
+        """A file still matching its record is not downloaded again."""
+        client = FakeDownloadClient()
+        target = tmp_path / "running.xml"
+        service = LocalConfig(client)
+        service.download_to(self.DEVICE, "7", target)
+
+        assert service.download_to(self.DEVICE, "7", target, md5=self.MD5).skipped
+        assert len(client.calls) == 1
+
+        target.write_bytes(CONFIG[:-1] + b"!")
+        assert not service.download_to(self.DEVICE, "7", target).skipped
+        assert not service.download_to(self.DEVICE, "8", target).skipped
+        assert len(client.calls) == 3
+        assert target.read_bytes() == CONFIG
+
+    @pytest.mark.parametrize("ranges", [True, False])
+    def test_resumes_an_interrupted_download(self, tmp_path, ranges):
+        """A broken download continues from its .part file, or restarts without Range support."""
+        client = FakeDownloadClient(ranges=ranges)
+        client.fail_after = 3
+        target = tmp_path / "running.xml"
+        service = LocalConfig(client)
+
+        with pytest.raises(ConnectionError):
+            service.download_to(self.DEVICE, "7", target, chunk_size=1024)
+        assert (tmp_path / "running.xml.part").stat().st_size == 3072
+
+        result = service.download_to(self.DEVICE, "7", target, md5=self.MD5, chunk_size=1024)
+
+        assert client.calls[1][2]["headers"] == {"Range": "bytes=3072-"}
+        assert result.resumed_from == (3072 if ranges else 0)
+        assert target.read_bytes() == CONFIG
+        assert result.sha256 == hashlib.sha256(CONFIG).hexdigest()
+
+    def test_restarts_when_the_part_file_is_complete(self, tmp_path):
+        """A .part file holding the whole file, so the range is rejected, is downloaded again."""
+        client = FakeDownloadClient()
+        target = tmp_path / "running.xml"
+        (tmp_path / "running.xml.part").write_bytes(CONFIG)
+
+        result = LocalConfig(client).download_to(self.DEVICE, "7", target, md5=self.MD5)
+
+        assert client.calls[0][2]["headers"] == {"Range": f"bytes={len(CONFIG)}-"}
+        assert "headers" not in client.calls[1][2]
+        assert result.resumed_from == 0 and result.md5 == self.MD5
+        assert target.read_bytes() == CONFIG
+        assert not (tmp_path / "running.xml.part").exists()
+
+    def test_checksum_mismatch(self, tmp_path):
+        """Content not matching the expected MD5 is discarded."""
+        target = tmp_path / "running.xml"
+
+        with pytest.raises(ChecksumMismatchError) as exc_info:
+            LocalConfig(FakeDownloadClient()).download_to(self.DEVICE, "7", target, md5="0" * 32)
+
+        assert exc_info.value.actual == self.MD5
+        assert list(tmp_path.iterdir()) == []
+
+    def test_streams_to_a_file_like_sink(self):
+        """Any binary writer can receive the download."""
+        sink = io.BytesIO()
+
+        result = LocalConfig(FakeDownloadClient()).download_to(self.DEVICE, "7", sink)
+
+        assert sink.getvalue() == CONFIG
+        assert result.path is None and result.md5 == self.MD5
@@ -0,0 +1,224 @@
+"""Tests for the route and FIB table index."""
+
+from scm.models.operations.device_operations import (
+    DeviceJobDetailsModel,
+    DeviceJobRequestModel,
+    DeviceJobResultModel,
+    DeviceJobStatusModel,
+)
+from scm.operations.device_operations import DeviceResult
+from scm.operations.route_index import Route, RouteIndex, RouteTable, parse_routes
+
+ROUTE_TABLE = {
+    "entry": [
+        {
+            "virtual-router": "default",
+            "destination": "0.0.0.0/0",
+            "nexthop": "203.0.113.1",
+            "metric": "10",
+            "flags": "A S",
+            "interface": "ethernet1/1",
+            "route-table": "unicast",
+        },
+        {
+            "virtual-router": "default",
+            "destination": "10.0.0.0/8",
+            "nexthop": "10.0.0.1",
+            "metric": "0",
+            "flags": "A C",
+            "interface": "ethernet1/2",
+            "route-table": "unicast",
+        },
+        {
+            "virtual-router": "default",
+            "destination": "224.0.0.0/4",
+            "nexthop": "0.0.0.0",
+            "route-table": "multicast",
+        },
+        {
+            "virtual-router": "guest",
+            "destination": "2001:db8::/32",
+            "nexthop": "fe80::1",
+            "interface": "ethernet1/3",
+        },
+    ]
+}
+
+FIB_TABLE = {
+    "fibs": {
+        "entry": [
+            {
+                "vr": "default",
+                "entries": {
+                    "entry": [
+                        {"dst": "10.1.0.0/16", "nh": "10.0.0.2", "interface": "ethernet1/2"},
+                    ]
+                },
+            }
+        ]
+    }
+}
+
+ADVANCED_ROUTES = {
+    "default": {
+        "192.168.0.0/24": [
+            {
+                "prefix": "192.168.0.0/24",
+                "protocol": "bgp",
+                "metric": 0,
+                "nexthops": [
+                    {"ip": "10.0.0.5", "interfaceName": "ethernet1/2"},
+                    {"ip": "10.0.0.6", "interfaceName": "ethernet1/4"},
+                ],
+            }
+        ]
+    }
+}
+
+
+def _result(device, result, state="complete"):
+    return DeviceJobResultModel(
+        device=device,
+        state=state,
+        created_ts="2025-01-01T00:00:00Z",
+        updated_ts="2025-01-01T00:00:01Z",
+        details=DeviceJobDetailsModel(msg="ok", result=result),
+    )
+
+
+class TestParseRoutes:
+    """Tests for finding routes in device results."""
+
+    def test_route_and_fib_results(self):
+        """Legacy route and FIB records are found wherever they are nested."""
+        routes = list(parse_routes(ROUTE_TABLE)) + list(parse_routes(FIB_TABLE))
+
+        assert [(r.vr, r.prefix, r.nexthop, r.interface) for r in routes] == [
+            ("default", "0.0.0.0/0", "203.0.113.1", "ethernet1/1"),
+            ("default", "10.0.0.0/8", "10.0.0.1", "ethernet1/2"),
+            ("guest", "2001:db8::/32", "fe80::1", "ethernet1/3"),
+            ("default", "10.1.0.0/16", "10.0.0.2", "ethernet1/2"),
+        ]
+        assert routes[0].metric == "10" and routes[0].flags == "A S"
+        assert routes[0].attributes["route-table"] == "unicast"
+
+    def test_advanced_routing_results(self):
+        """Prefix-keyed records under a router name yield one route per next hop."""
+        routes = list(parse_routes(ADVANCED_ROUTES))
+
+        assert routes == [
+            Route("192.168.0.0/24", "default", "10.0.0.5", "ethernet1/2", "bgp", "0"),
+            Route("192.168.0.0/24", "default", "10.0.0.6", "ethernet1/4", "bgp", "0"),
+        ]
+        assert list(parse_routes({})) == []
+
+
+class TestRouteTable:
+    """Tests for one device's table."""
+
+    def test_lookups(self):
+        """Lookups return the longest matching prefix's routes, all of them for ECMP."""
+        table = RouteTable("fw-1")
+        for route in parse_routes(ROUTE_TABLE):
+            if route.vr == "default":
+                table.add(route)
+        for route in parse_routes(ADVANCED_ROUTES):
+            table.add(route)
+            table.add(route)
+
+        assert len(table) == 3
+        assert [r.prefix for r in table.lookup("10.9.9.9")] == ["10.0.0.0/8"]
+        assert [r.nexthop for r in table.lookup("192.168.0.20")] == ["10.0.0.5", "10.0.0.6"]
+        assert [r.prefix for r in table.matches("10.9.9.9")] == ["0.0.0.0/0", "10.0.0.0/8"]
+        assert table.lookup("2001:db8::1") == []
+        assert [r.prefix for r in table.get("10.0.0.0/8")] == ["10.0.0.0/8"]
+        found = table.lookup_many(["10.1.1.1", "8.8.8.8", "10.1.1.1"])
+        assert {address: routes[0].prefix for address, routes in found.items()} == {
+            "10.1.1.1": "10.0.0.0/8",
+            "8.8.8.8": "0.0.0.0/0",
+        }
+
+    def test_diff(self):
+        """Prefixes whose routes differ are reported; route order does not matter."""
+        old = RouteTable("fw-1")
+        new = RouteTable("fw-1")
+        for route in parse_routes(ROUTE_TABLE):
+            old.add(route)
+        routes = list(parse_routes(ROUTE_TABLE))
+        new.add(Route("10.0.0.0/8", "default", "10.0.0.9", "ethernet1/2", metric="0", flags="A C"))
+        for route in reversed(routes[:1] + routes[2:]):
+            new.add(route)
+        new.add(Route("172.16.0.0/12", "default", "10.0.0.1"))
+        reordered = RouteTable("fw-1")
+        for route in reversed(routes):
+            reordered.add(route)
+
+        changes = old.diff(new)
+
+        assert [(c.action, c.prefix) for c in changes] == [
+            ("changed", "10.0.0.0/8"),
+            ("added", "172.16.0.0/12"),
+        ]
+        assert changes[0].old[0].nexthop == "10.0.0.1"
+        assert changes[0].new[0].nexthop == "10.0.0.9"
+        assert old.diff(reordered) == []
+
+
+class TestRouteIndex:
+    """Tests for the index of many devices' tables."""
+
+    def test_add_results_and_lookup_across_devices(self):
+        """Completed results are indexed per device and virtual router."""
+        index = RouteIndex()
+        status = DeviceJobStatusModel(
+            jobId="1",
+            progress=100,
+            state="complete",
+            request=DeviceJobRequestModel(command="route-table", devices=["fw-2", "fw-3"]),
+            results=[_result("fw-2", ADVANCED_ROUTES), _result("fw-3", ROUTE_TABLE, "failed")],
+        )
+
+        count = index.add_results(
+            [
+                DeviceResult("fw-1", "1", "complete", _result("fw-1", ROUTE_TABLE)),
+                DeviceResult("fw-4", None, "error", error=ValueError("not connected")),
+                status,
+            ]
+        )
+
+        assert count == 5
+        assert index.devices == ["fw-1", "fw-2"]
+        assert [(t.device, t.vr) for t in index.tables()] == [
+            ("fw-1", "default"),
+            ("fw-1", "guest"),
+            ("fw-2", "default"),
+        ]
+        found = index.lookup("192.168.0.1")
+        assert {key: [r.nexthop for r in routes] for key, routes in found.items()} == {
+            ("fw-1", "default"): ["203.0.113.1"],
+            ("fw-2", "default"): ["10.0.0.5", "10.0.0.6"],
+        }
+        many = index.lookup_many(["2001:db8::1", "10.2.3.4"], devices=["fw-1"], vr="default")
+        assert many["2001:db8::1"] == {}
+        assert [r.prefix for r in many["10.2.3.4"][("fw-1", "default")]] == ["10.0.0.0/8"]
+
+    def test_diff_over_time(self):
+        """Changed, new and vanished tables are all reported."""
+        before = RouteIndex()
+        before.add("fw-1", ROUTE_TABLE)
+        after = RouteIndex()
+        after.add("fw-1", FIB_TABLE)
+        after.add("fw-2", ADVANCED_ROUTES)
+
+        changes = before.diff(after)
+
+        assert {key: [(c.action, c.prefix) for c in value] for key, value in changes.items()} == {
+            ("fw-1", "default"): [
+                ("removed", "0.0.0.0/0"),
+                ("removed", "10.0.0.0/8"),
+                ("added", "10.1.0.0/16"),
+            ],
+            ("fw-1", "guest"): [("removed", "2001:db8::/32")],
+            ("fw-2", "default"): [("added", "192.168.0.0/24")],
+        }
+        assert before.diff(before) == {}
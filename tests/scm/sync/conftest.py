@@ -0,0 +1,11 @@
+"""Fixtures for scm.sync tests."""
+
+import pytest
+
+from tests.utils.config_store import attach_config_store
+
+
+@pytest.fixture
+def store(mock_scm):
+    """Return a ConfigStore serving mock_scm's get, post, put, and delete calls."""
+    return attach_config_store(mock_scm)
@@ -0,0 +1,182 @@
+"""Tests for the write-behind update buffer."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from scm.exceptions import InvalidObjectError
+from scm.models.objects import (
+    AddressCreateModel,
+    AddressGroupUpdateModel,
+    AddressUpdateModel,
+)
+from scm.sync import WriteBuffer
+
+ADDRESSES = "/config/objects/v1/addresses"
+GROUPS = "/config/objects/v1/address-groups"
+
+
+def _seed_groups(store, count):
+    return [
+        store.add(GROUPS, name=f"group{i}", folder="Texas", static=["seed"])
+        for i in range(count)
+    ]
+
+
+def _add_members(client, update, groups, members):
+    """Add members one at a time to every group, sending each change through update."""
+    for group in groups:
+        current = client.address_group.get(group["id"])
+        for member in range(members):
+            current.static.append(f"host{member}")
+            update(AddressGroupUpdateModel(**current.model_dump(mode="json", exclude_none=True)))
+
+
+class TestWriteBuffer:
+    """Tests for coalescing and flushing buffered updates."""
+
+    GROUPS = 5
+    MEMBERS = 10
+
+    def test_net_effect_matches_serial_updates_with_fewer_puts(self, store):
+        """One PUT per object replaces one PUT per change, with the same end state."""
+        groups = _seed_groups(store, self.GROUPS)
+        seeds = [dict(group) for group in groups]
+        client = store.client
+        _add_members(client, client.address_group.update, groups, self.MEMBERS)
+        serial_state = {g["id"]: dict(store.objects[GROUPS][g["id"]]) for g in groups}
+        serial_puts = store.calls["put"]
+
+        for seed in seeds:
+            store.objects[GROUPS][seed["id"]] = dict(seed)
+        store.calls.clear()
+        with client.address_group.buffered(window=None) as buffer:
+            _add_members(client, buffer.update, groups, self.MEMBERS)
+            assert store.calls["put"] == 0
+
+        buffered_state = {g["id"]: dict(store.objects[GROUPS][g["id"]]) for g in groups}
+        assert buffered_state == serial_state
+        assert serial_puts == self.GROUPS * self.MEMBERS
+        assert store.calls["put"] == self.GROUPS
+        assert buffer.stats == {
+            "updates": self.GROUPS * self.MEMBERS,
+            "merged": self.GROUPS * (self.MEMBERS - 1),
+            "puts": self.GROUPS,
+        }
+
+    def test_only_the_last_update_is_sent(self, store):
+        """The last payload wins, as it would after the serial PUTs."""
+        address = store.add(ADDRESSES, name="web1", folder="Texas", ip_netmask="10.0.0.1/32")
+        buffer = store.client.address.buffered(window=None)
+        base = {"id": address["id"], "name": "web1", "ip_netmask": "10.0.0.1/32"}
+        buffer.update(AddressUpdateModel(**base, description="first"))
+        buffer.update(AddressUpdateModel(**base, tag=["web"]))
+        buffer.update(AddressUpdateModel(**{**base, "ip_netmask": "10.0.0.9/32"}))
+
+        results = buffer.flush()
+
+        stored = store.find(ADDRESSES, "web1")
+        assert stored["ip_netmask"] == "10.0.0.9/32"
+        assert "description" not in stored
+        assert "tag" not in stored
+        assert results[address["id"]].ip_netmask == "10.0.0.9/32"
+        assert store.calls["put"] == 1
+
+    def test_later_update_clears_a_field_set_earlier(self, store):
+        """A field the last update leaves out is cleared, buffered or not."""
+        address = store.add(ADDRESSES, name="web1", folder="Texas", ip_netmask="10.0.0.1/32")
+        first = AddressUpdateModel(
+            id=address["id"], name="web1", ip_netmask="10.0.0.1/32", description="temporary"
+        )
+        second = AddressUpdateModel(id=address["id"], name="web1", ip_netmask="10.0.0.2/32")
+        store.client.address.update(first)
+        store.client.address.update(second)
+        serial = dict(store.find(ADDRESSES, "web1"))
+
+        store.objects[ADDRESSES][address["id"]] = dict(address)
+        store.calls.clear()
+        with store.client.address.buffered(window=None) as buffer:
+            buffer.update(first)
+            buffer.update(second)
+
+        stored = store.find(ADDRESSES, "web1")
+        assert stored == serial
+        assert stored["ip_netmask"] == "10.0.0.2/32"
+        assert "description" not in stored
+        assert store.calls["put"] == 1
+        assert buffer.stats["merged"] == 1
+
+    def test_max_pending_triggers_a_flush(self, store):
+        """Reaching max_pending objects flushes everything pending."""
+        groups = _seed_groups(store, 3)
+        buffer = store.client.address_group.buffered(window=None, max_pending=2)
+        for group in groups:
+            buffer.update(AddressGroupUpdateModel(id=group["id"], name=group["name"], static=["x"]))
+
+        assert store.calls["put"] == 2
+        assert buffer.pending == 1
+        buffer.close()
+        assert store.calls["put"] == 3
+
+    def test_window_flushes_in_background(self, store):
+        """Pending updates are sent once the window has passed."""
+        group = _seed_groups(store, 1)[0]
+        buffer = store.client.address_group.buffered(window=0.05)
+        buffer.update(AddressGroupUpdateModel(id=group["id"], name="group0", static=["x"]))
+        buffer.update(AddressGroupUpdateModel(id=group["id"], name="group0", static=["x", "y"]))
+
+        deadline = time.monotonic() + 5
+        while buffer.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert buffer.pending == 0
+        assert store.find(GROUPS, "group0")["static"] == ["x", "y"]
+        assert store.calls["put"] == 1
+
+    def test_update_arguments_keep_updates_apart(self):
+        """Updates with different keyword arguments are sent separately."""
+        service = MagicMock()
+        buffer = WriteBuffer(service, window=None)
+        model = AddressGroupUpdateModel(
+            id="123e4567-e89b-12d3-a456-426655440000", name="g", static=["a"]
+        )
+        buffer.update(model, rulebase="pre")
+        buffer.update(model, rulebase="post")
+        buffer.flush()
+
+        assert [c.kwargs for c in service.update.call_args_list] == [
+            {"rulebase": "pre"},
+            {"rulebase": "post"},
+        ]
+
+    def test_errors_are_raised_after_every_update_is_attempted(self):
+        """A failed update does not stop the others from being sent."""
+        service = MagicMock()
+        service.update.side_effect = [InvalidObjectError(message="bad", error_code="E003"), "ok"]
+        buffer = WriteBuffer(service, window=None)
+        for object_id in (
+            "123e4567-e89b-12d3-a456-426655440000",
+            "123e4567-e89b-12d3-a456-426655440001",
+        ):
+            buffer.update(AddressGroupUpdateModel(id=object_id, name="g", static=["a"]))
+
+        with pytest.raises(InvalidObjectError):
+            buffer.flush()
+        assert service.update.call_count == 2
+        assert buffer.pending == 0
+
+    def test_invalid_use(self, store):
+        """Updates need an id, closed buffers take no updates, and settings are checked."""
+        buffer = store.client.address.buffered(window=None)
+        with pytest.raises(InvalidObjectError):
+            buffer.update(AddressCreateModel(name="web1", folder="Texas", fqdn="a.example.com"))
+        buffer.close()
+        with pytest.raises(InvalidObjectError):
+            buffer.update(
+                AddressUpdateModel(
+                    id="123e4567-e89b-12d3-a456-426655440000", name="a", fqdn="a.example.com"
+                )
+            )
+        with pytest.raises(InvalidObjectError):
+            WriteBuffer(MagicMock(), max_pending=0)
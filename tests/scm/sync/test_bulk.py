@@ -0,0 +1,284 @@
+"""Tests for the bulk create/update/delete engine."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import uuid
+
+import pytest
+
+from scm.exceptions import InvalidObjectError, ReferenceNotZeroError
+from scm.models.objects import AddressUpdateModel
+from scm.sync import BulkEngine, BulkOperation
+from scm.sync.bulk import update_model
+
+
+class RecordingService:
+    """Fake service that records the order of calls and can be told to fail."""
+
+    def __init__(self, name, log, lock, failures=()):
+        """Create a service called name writing into a shared log."""
+        self.name = name
+        self.log = log
+        self.lock = lock
+        self.failures = set(failures)
+
+    def _record(self, action, key):
+        with self.lock:
+            self.log.append((action, self.name, key))
+        if key in self.failures:
+            raise ReferenceNotZeroError(message=f"{key} is still referenced")
+        return SimpleNamespace(name=key)
+
+    def create(self, data):
+        """Record a create."""
+        return self._record("create", data["name"])
+
+    def delete(self, object_id, rulebase="pre"):
+        """Record a delete."""
+        return self._record("delete", object_id)
+
+
+def _client(failures=()):
+    log, lock = [], threading.Lock()
+    services = {
+        name: RecordingService(name, log, lock, failures)
+        for name in ("tag", "address", "address_group", "service", "security_rule")
+    }
+    return SimpleNamespace(**services), log
+
+
+def _position(log, action, service, key):
+    return log.index((action, service, key))
+
+
+class TestBulkOperation:
+    """Tests for BulkOperation validation and references."""
+
+    def test_rejects_unknown_action(self):
+        """Only create, update, and delete are accepted."""
+        with pytest.raises(InvalidObjectError):
+            BulkOperation("upsert", "address", {"name": "a"})
+
+    def test_update_and_delete_require_an_id(self):
+        """Updates and deletes must identify their object."""
+        with pytest.raises(InvalidObjectError):
+            BulkOperation("update", "address", {"name": "a"})
+        with pytest.raises(InvalidObjectError):
+            BulkOperation("delete", "address")
+        assert BulkOperation("delete", "address", object_id="123").target_id == "123"
+
+    def test_references(self):
+        """Reference fields resolve to (service, name) pairs, including dynamic filters."""
+        group = BulkOperation(
+            "create",
+            "address_group",
+            {"name": "g", "dynamic": {"filter": "'web' and 'prod'"}, "tag": ["t"]},
+        )
+        assert {("tag", "web"), ("tag", "prod"), ("tag", "t")} <= group.references()
+
+        rule = BulkOperation("create", "security_rule", {"name": "r", "source": ["g"]})
+        assert ("address_group", "g") in rule.references()
+        assert ("address", "g") in rule.references()
+
+
+class TestBulkEngine:
+    """Tests for dependency ordering, concurrency, and reporting."""
+
+    def test_layers_follow_references(self):
+        """Tags come before addresses, addresses before groups, groups before rules."""
+        operations = [
+            BulkOperation("create", "security_rule", {"name": "r1", "source": ["g1"]}),
+            BulkOperation("create", "address_group", {"name": "g1", "static": ["a1", "a2"]}),
+            BulkOperation("create", "address", {"name": "a1", "tag": ["t1"]}),
+            BulkOperation("create", "address", {"name": "a2"}),
+            BulkOperation("create", "tag", {"name": "t1"}),
+            BulkOperation("create", "service", {"name": "s1"}),
+        ]
+        engine = BulkEngine(_client()[0])
+        assert engine.plan(operations) == [[3, 4, 5], [2], [1], [0]]
+
+    def test_run_orders_writes_and_reports_every_item(self):
+        """Each operation runs after its dependencies and gets a result in input order."""
+        client, log = _client()
+        operations = [
+            BulkOperation("create", "address_group", {"name": "g1", "static": ["a1"]}),
+            BulkOperation("create", "address", {"name": "a1", "tag": ["t1"]}),
+            BulkOperation("create", "tag", {"name": "t1"}),
+        ]
+        report = BulkEngine(client).run(operations)
+
+        assert report.ok
+        assert [r.index for r in report] == [0, 1, 2]
+        assert [r.layer for r in report] == [2, 1, 0]
+        assert report.results[0].result.name == "g1"
+        assert (
+            _position(log, "create", "tag", "t1")
+            < _position(log, "create", "address", "a1")
+            < _position(log, "create", "address_group", "g1")
+        )
+
+    def test_deletes_run_last_in_reverse_order(self):
+        """Deletes follow all writes, rules first and tags last."""
+        client, log = _client()
+        operations = [
+            BulkOperation("delete", "tag", {"id": "tag-1", "name": "t1"}),
+            BulkOperation("delete", "address", {"id": "addr-1", "name": "a1"}),
+            BulkOperation("delete", "security_rule", {"id": "rule-1"}),
+            BulkOperation("delete", "address_group", {"id": "grp-1"}),
+            BulkOperation("create", "address", {"name": "a2"}),
+        ]
+        report = BulkEngine(client).run(operations)
+
+        assert report.ok
+        assert [action for action, _, _ in log] == ["create"] + ["delete"] * 4
+        order = [key for _, _, key in log[1:]]
+        assert order == ["rule-1", "grp-1", "addr-1", "tag-1"]
+
+    def test_nested_group_deletes_use_known_members(self):
+        """A group is deleted before a nested group it contains."""
+        operations = [
+            BulkOperation("delete", "address_group", {"id": "inner", "name": "inner"}),
+            BulkOperation(
+                "delete", "address_group", {"id": "outer", "name": "outer", "static": ["inner"]}
+            ),
+        ]
+        assert BulkEngine(_client()[0]).plan(operations) == [[1], [0]]
+
+    def test_failed_dependency_skips_dependants(self):
+        """Operations that depend on a failed one are skipped, independent ones still run."""
+        client, log = _client(failures={"t1"})
+        operations = [
+            BulkOperation("create", "tag", {"name": "t1"}),
+            BulkOperation("create", "address", {"name": "a1", "tag": ["t1"]}),
+            BulkOperation("create", "address_group", {"name": "g1", "static": ["a1"]}),
+            BulkOperation("create", "address", {"name": "a2"}),
+        ]
+        report = BulkEngine(client).run(operations)
+
+        assert report.summary() == {"succeeded": 1, "failed": 1, "skipped": 2}
+        assert isinstance(report.results[0].error, ReferenceNotZeroError)
+        assert "dependency create tag 't1' was failed" in report.results[1].error.message
+        assert "dependency create address 'a1' was skipped" in report.results[2].error.message
+        assert ("create", "address", "a1") not in log
+
+    def test_stop_on_error_skips_later_layers(self):
+        """With stop_on_error, a failing layer ends the batch."""
+        client, log = _client(failures={"t1"})
+        operations = [
+            BulkOperation("create", "tag", {"name": "t1"}),
+            BulkOperation("create", "tag", {"name": "t2"}),
+            BulkOperation("create", "address", {"name": "a1", "tag": ["t2"]}),
+        ]
+        report = BulkEngine(client, stop_on_error=True).run(operations)
+
+        assert [r.status for r in report] == ["failed", "succeeded", "skipped"]
+        assert len(log) == 2
+
+    def test_hooks_see_every_operation(self):
+        """on_start fires for sent operations, on_result for every outcome."""
+        client, _ = _client(failures={"t1"})
+        operations = [
+            BulkOperation("create", "tag", {"name": "t1"}),
+            BulkOperation("create", "address", {"name": "a1", "tag": ["t1"]}),
+        ]
+        started, finished = [], []
+        BulkEngine(client).run(
+            operations,
+            on_start=lambda index, operation: started.append(index),
+            on_result=lambda result: finished.append((result.index, result.status)),
+        )
+
+        assert started == [0]
+        assert finished == [(0, "failed"), (1, "skipped")]
+
+    def test_cycles_are_rejected(self):
+        """Groups that contain each other cannot be ordered."""
+        operations = [
+            BulkOperation("create", "address_group", {"name": "g1", "static": ["g2"]}),
+            BulkOperation("create", "address_group", {"name": "g2", "static": ["g1"]}),
+        ]
+        with pytest.raises(InvalidObjectError) as exc_info:
+            BulkEngine(_client()[0]).plan(operations)
+        assert exc_info.value.details["error"] == "Circular reference"
+
+    def test_layer_runs_concurrently_within_max_workers(self):
+        """Independent operations overlap, but never more than max_workers at a time."""
+        active, peak, lock = [0], [0], threading.Lock()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def create(data):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            barrier.wait()
+            with lock:
+                active[0] -= 1
+
+        client = SimpleNamespace(address=SimpleNamespace(create=create))
+        operations = [BulkOperation("create", "address", {"name": f"a{i}"}) for i in range(6)]
+        report = BulkEngine(client, max_workers=3).run(operations)
+
+        assert report.ok
+        assert peak[0] == 3
+
+    def test_invalid_max_workers(self):
+        """max_workers must be positive."""
+        with pytest.raises(InvalidObjectError):
+            BulkEngine(MagicMock(), max_workers=0)
+
+
+class TestBulkWithServices:
+    """Tests running operations through real service classes."""
+
+    def test_create_update_delete(self, mock_scm):
+        """Dictionaries become service calls with the right models and rulebase."""
+        address_id = str(uuid.uuid4())
+        rule_id = str(uuid.uuid4())
+        mock_scm.post = MagicMock(
+            return_value={
+                "id": address_id,
+                "name": "a1",
+                "ip_netmask": "10.0.0.1/32",
+                "folder": "Texas",
+            }
+        )
+        mock_scm.put = MagicMock(
+            return_value={
+                "id": address_id,
+                "name": "a1",
+                "ip_netmask": "10.0.0.2/32",
+                "folder": "Texas",
+            }
+        )
+        mock_scm.delete = MagicMock(return_value=None)
+
+        report = BulkEngine(mock_scm).run(
+            [
+                BulkOperation(
+                    "create",
+                    "address",
+                    {"name": "a1", "ip_netmask": "10.0.0.1/32", "folder": "Texas"},
+                ),
+                BulkOperation(
+                    "update",
+                    "address",
+                    {"id": address_id, "name": "a1", "ip_netmask": "10.0.0.2/32"},
+                ),
+                BulkOperation("delete", "security_rule", object_id=rule_id, rulebase="post"),
+            ]
+        )
+
+        assert report.ok, [r.error for r in report.failed]
+        assert report.results[0].result.ip_netmask == "10.0.0.1/32"
+        assert report.results[1].result.ip_netmask == "10.0.0.2/32"
+        assert mock_scm.put.call_args.kwargs["json"]["ip_netmask"] == "10.0.0.2/32"
+        mock_scm.delete.assert_called_once_with(
+            f"/config/security/v1/security-rules/{rule_id}", params={"position": "post"}
+        )
+
+    def test_update_model_resolution(self, mock_scm):
+        """The update model is taken from the service's update() signature."""
+        assert update_model(mock_scm.address) is AddressUpdateModel
+        with pytest.raises(InvalidObjectError):
+            update_model(SimpleNamespace(update=lambda data: data))
@@ -0,0 +1,123 @@
+"""Tests for pre-create name collision detection."""
+
+import pytest
+
+from scm.exceptions import NameNotUniqueError
+from scm.sync import CollisionChecker
+
+FOLDERS = "/config/setup/v1/folders"
+ADDRESSES = "/config/objects/v1/addresses"
+GROUPS = "/config/objects/v1/address-groups"
+TAGS = "/config/objects/v1/tags"
+
+
+@pytest.fixture
+def tree(store):
+    """All -> Texas -> Austin, and All -> Ohio."""
+    store.add(FOLDERS, name="All", parent="")
+    store.add(FOLDERS, name="Texas", parent="All")
+    store.add(FOLDERS, name="Austin", parent="Texas")
+    store.add(FOLDERS, name="Ohio", parent="All")
+    return store
+
+
+def _address(name, folder):
+    return {"name": name, "folder": folder, "ip_netmask": "10.0.0.1/32"}
+
+
+class TestCollisionChecker:
+    """Tests for finding names taken across a folder's line of descent."""
+
+    def test_flags_names_in_same_ancestor_and_descendant_folders(self, tree):
+        """Names held in the folder, above it, or below it collide; siblings do not."""
+        tree.add(ADDRESSES, name="web1", folder="Texas", ip_netmask="10.0.0.1/32")
+        tree.add(ADDRESSES, name="shared", folder="All", ip_netmask="10.0.0.2/32")
+        tree.add(GROUPS, name="austin-hosts", folder="Austin", static=["web1"])
+        tree.add(ADDRESSES, name="ohio1", folder="Ohio", ip_netmask="10.0.0.3/32")
+        batch = {
+            "address": [
+                _address("web1", "Texas"),
+                _address("shared", "Texas"),
+                _address("austin-hosts", "Texas"),
+                _address("ohio1", "Texas"),
+                _address("fresh", "Texas"),
+            ]
+        }
+
+        report = CollisionChecker(tree.client).check(batch)
+
+        found = [
+            (c.name, c.other_service, c.other_container, c.relation) for c in report.collisions
+        ]
+        assert found == [
+            ("web1", "address", {"folder": "Texas"}, "same"),
+            ("shared", "address", {"folder": "All"}, "ancestor"),
+            ("austin-hosts", "address_group", {"folder": "Austin"}, "descendant"),
+        ]
+        assert report.checked == 5
+
+    def test_namespaces_are_per_service_family(self, tree):
+        """A tag may share an address's name; an address group may not."""
+        tree.add(ADDRESSES, name="web", folder="Texas", ip_netmask="10.0.0.1/32")
+        batch = {
+            "tag": [{"name": "web", "folder": "Texas"}],
+            "address_group": [{"name": "web", "folder": "Austin", "static": ["x"]}],
+        }
+
+        report = CollisionChecker(tree.client).check(batch)
+
+        assert [(c.service, c.relation) for c in report.collisions] == [
+            ("address_group", "ancestor")
+        ]
+
+    def test_collisions_within_the_batch(self, tree):
+        """Two new objects in related folders collide with each other."""
+        batch = {
+            "address": [
+                _address("dup", "All"),
+                _address("dup", "Austin"),
+                _address("dup", "Ohio"),
+                _address("twice", "Texas"),
+                _address("twice", "Texas"),
+            ]
+        }
+
+        report = CollisionChecker(tree.client).check(batch)
+
+        found = [(c.name, c.container, c.other_container, c.relation) for c in report.collisions]
+        assert found == [
+            ("dup", {"folder": "Austin"}, {"folder": "All"}, "ancestor"),
+            ("dup", {"folder": "Ohio"}, {"folder": "All"}, "ancestor"),
+            ("twice", {"folder": "Texas"}, {"folder": "Texas"}, "same"),
+        ]
+        assert all(c.in_batch for c in report.collisions)
+
+    def test_rules_are_listed_in_both_rulebases(self, tree):
+        """Rule services are indexed from the pre and post rulebases."""
+        rule = {"name": "allow-web", "folder": "Texas", "action": "allow"}
+        report = CollisionChecker(tree.client).check({"security_rule": [rule]})
+
+        # folders + (Texas, All, Austin) x (pre, post)
+        assert report.listings == 1 + 3 * 2
+        assert report.ok
+
+    def test_one_pass_of_listings_for_a_large_batch(self, tree):
+        """The index costs one listing per service and related folder, not per object."""
+        batch = {"address": [_address(f"host{i}", "Texas") for i in range(200)]}
+        report = CollisionChecker(tree.client).check(batch)
+
+        # folders + (address, address_group, external_dynamic_list, region) x (Texas, All, Austin)
+        assert report.listings == 1 + 4 * 3
+        assert tree.calls["get"] == report.listings
+        assert tree.calls["post"] == 0
+
+    def test_raise_for_errors(self, tree):
+        """Collisions are raised together as NameNotUniqueError."""
+        tree.add(TAGS, name="prod", folder="All")
+        batch = {"tag": [{"name": "prod", "folder": "Texas"}, {"name": "prod", "folder": "Ohio"}]}
+        report = CollisionChecker(tree.client).check(batch)
+
+        with pytest.raises(NameNotUniqueError) as exc_info:
+            report.raise_for_errors()
+        assert len(exc_info.value.details["collisions"]) == 2
+        assert exc_info.value.http_status_code == 409
@@ -0,0 +1,213 @@
+"""Tests for the declarative plan/apply engine."""
+
+import json
+
+import pytest
+
+from scm.exceptions import InvalidObjectError, NameNotUniqueError
+from scm.models.objects import AddressUpdateModel
+from scm.sync import Plan, Planner
+from scm.sync.plan import load_desired_state
+
+ADDRESSES = "/config/objects/v1/addresses"
+TAGS = "/config/objects/v1/tags"
+
+
+def _address(name, value, folder="Texas", **extra):
+    return {"name": name, "folder": folder, "ip_netmask": value, **extra}
+
+
+@pytest.fixture
+def seeded(store):
+    """Seed two addresses and a tag in Texas, and an address in Ohio."""
+    store.add(TAGS, name="web", folder="Texas")
+    store.add(ADDRESSES, **_address("web1", "10.0.0.1/32", tag=["web"]))
+    store.add(ADDRESSES, **_address("web2", "10.0.0.2/32"))
+    store.add(ADDRESSES, **_address("ohio1", "10.1.0.1/32", folder="Ohio"))
+    return store
+
+
+class TestPlanner:
+    """Tests for computing and applying plans."""
+
+    def test_matching_state_plans_nothing(self, seeded):
+        """Objects that already match produce an empty plan."""
+        desired = {
+            "tag": [{"name": "web", "folder": "Texas"}],
+            "address": [
+                _address("web1", "10.0.0.1/32", tag=["web"]),
+                _address("web2", "10.0.0.2/32"),
+            ],
+        }
+        plan = Planner(seeded.client).plan(desired)
+
+        assert plan.empty
+        assert plan.summary() == {"create": 0, "update": 0, "delete": 0, "unchanged": 3}
+        assert seeded.calls == {"get": 2}
+
+    def test_creates_and_updates_only_changed_fields(self, seeded):
+        """New objects are created and changed objects record only their changed fields."""
+        desired = {
+            "address": [
+                _address("web1", "10.0.0.1/32", tag=["web"]),
+                _address("web2", "10.0.0.22/32", description="second web server"),
+                _address("web3", "10.0.0.3/32"),
+            ],
+        }
+        plan = Planner(seeded.client).plan(desired)
+
+        assert plan.summary() == {"create": 1, "update": 1, "delete": 0, "unchanged": 1}
+        update = next(c for c in plan if c.action == "update")
+        assert update.name == "web2"
+        assert update.changes == {
+            "ip_netmask": {"from": "10.0.0.2/32", "to": "10.0.0.22/32"},
+            "description": {"from": None, "to": "second web server"},
+        }
+        AddressUpdateModel(**update.data)
+
+    def test_plan_is_ordered_by_dependencies(self, store):
+        """Creates are listed in the order they will be applied."""
+        desired = {
+            "address_group": [{"name": "web", "folder": "Texas", "static": ["web1"]}],
+            "address": [_address("web1", "10.0.0.1/32", tag=["prod"])],
+            "tag": [{"name": "prod", "folder": "Texas"}],
+        }
+        plan = Planner(store.client).plan(desired)
+        assert [c.service for c in plan] == ["tag", "address", "address_group"]
+
+    def test_prune_deletes_unlisted_objects_in_listed_containers(self, seeded):
+        """Only containers named in the desired state are pruned."""
+        desired = {"address": [_address("web1", "10.0.0.1/32", tag=["web"])]}
+        plan = Planner(seeded.client, prune=True).plan(desired)
+
+        assert [(c.action, c.name) for c in plan] == [("delete", "web2")]
+        assert Planner(seeded.client).plan(desired).empty
+
+    def test_apply_converges(self, seeded):
+        """Applying a plan leaves nothing to change."""
+        desired = {
+            "address": [
+                _address("web1", "10.0.0.1/32", tag=["web"]),
+                _address("web2", "10.0.0.22/32"),
+                _address("web3", "10.0.0.3/32"),
+            ],
+        }
+        planner = Planner(seeded.client, prune=True)
+        report = planner.apply(planner.plan(desired))
+
+        assert report.ok, [r.error for r in report.failed]
+        assert seeded.find(ADDRESSES, "web2")["ip_netmask"] == "10.0.0.22/32"
+        assert seeded.find(ADDRESSES, "web3") is not None
+        assert planner.plan(desired).empty
+
+    def test_rules_are_planned_per_rulebase(self, store):
+        """Rule objects default to the pre rulebase and apply with it."""
+        desired = {
+            "security_rule": [
+                {
+                    "name": "allow-web",
+                    "folder": "Texas",
+                    "from_": ["trust"],
+                    "to_": ["untrust"],
+                    "source": ["any"],
+                    "destination": ["any"],
+                    "action": "allow",
+                }
+            ]
+        }
+        planner = Planner(store.client)
+        plan = planner.plan(desired)
+
+        assert plan.changes[0].rulebase == "pre"
+        report = planner.apply(plan)
+        assert report.ok, [r.error for r in report.failed]
+        assert store.client.post.call_args.kwargs["params"] == {"position": "pre"}
+
+    def test_plan_round_trips_through_json(self, seeded):
+        """Plans can be written out for review and applied later."""
+        desired = {"address": [_address("web2", "10.0.0.22/32"), _address("web9", "10.0.0.9/32")]}
+        planner = Planner(seeded.client)
+        plan = planner.plan(desired)
+
+        restored = Plan.from_json(plan.to_json(indent=2))
+
+        assert restored.to_dict() == plan.to_dict()
+        assert planner.apply(restored).ok
+
+    def test_invalid_desired_objects(self, store):
+        """Desired objects are validated with the service's create model."""
+        with pytest.raises(InvalidObjectError):
+            Planner(store.client).plan({"address": [{"name": "x", "ip_netmask": "10.0.0.1/32"}]})
+        with pytest.raises(InvalidObjectError):
+            Planner(store.client).plan(
+                {"address": [{"name": "x", "folder": "Texas", "ip_netmask": 5, "fqdn": "a.b"}]}
+            )
+
+
+class TestLoadDesiredState:
+    """Tests for loading desired-state documents."""
+
+    def test_yaml_and_json_files(self, tmp_path):
+        """YAML and JSON documents load to the same state."""
+        pytest.importorskip("yaml")
+        yaml_file = tmp_path / "state.yaml"
+        yaml_file.write_text("address:\n  - name: web1\n    folder: Texas\n")
+        json_file = tmp_path / "state.json"
+        json_file.write_text(json.dumps({"address": [{"name": "web1", "folder": "Texas"}]}))
+
+        assert load_desired_state(yaml_file) == load_desired_state(json_file)
+
+    def test_rejects_malformed_documents(self):
+        """Documents must map services to lists of named objects."""
+        with pytest.raises(InvalidObjectError):
+            load_desired_state({"address": {"name": "web1"}})
+        with pytest.raises(InvalidObjectError):
+            load_desired_state({"address": [{"folder": "Texas"}]})
+
+
+class TestPlanBenchmark:
+    """Call-count comparison of plan/apply against a naive per-object sync."""
+
+    OBJECTS = 200
+    CHANGED = 10
+    NEW = 10
+
+    def _desired(self):
+        desired = [
+            _address(f"host{i}", f"10.0.{i // 250}.{i % 250}/32")
+            for i in range(self.OBJECTS + self.NEW)
+        ]
+        for i in range(self.CHANGED):
+            desired[i]["description"] = "changed"
+        return desired
+
+    def _seed(self, store):
+        for i in range(self.OBJECTS):
+            store.add(ADDRESSES, **_address(f"host{i}", f"10.0.{i // 250}.{i % 250}/32"))
+
+    def test_plan_apply_versus_naive_sync(self, store):
+        """Planning costs one request per listing page; only changes cost more."""
+        self._seed(store)
+        desired = self._desired()
+
+        # Naive sync: create, and on a name conflict fetch, compare, and update
+        client = store.client
+        for obj in desired:
+            try:
+                client.address.create(obj)
+            except NameNotUniqueError:
+                existing = client.address.fetch(name=obj["name"], folder="Texas")
+                update = AddressUpdateModel(**{**existing.model_dump(exclude_none=True), **obj})
+                client.address.update(update)
+        naive_calls = store.total_calls
+
+        store.objects.clear()
+        store.calls.clear()
+        self._seed(store)
+        planner = Planner(client)
+        planner.apply(planner.plan({"address": desired}))
+        planned_calls = store.total_calls
+
+        assert naive_calls == self.NEW + 3 * self.OBJECTS
+        assert planned_calls == 1 + self.CHANGED + self.NEW
+        assert planned_calls * 20 < naive_calls
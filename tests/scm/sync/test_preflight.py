@@ -0,0 +1,158 @@
+"""Tests for pre-flight reference checking."""
+
+import pytest
+
+from scm.exceptions import InvalidObjectError
+from scm.sync import ReferenceChecker
+
+FOLDERS = "/config/setup/v1/folders"
+ADDRESSES = "/config/objects/v1/addresses"
+GROUPS = "/config/objects/v1/address-groups"
+SERVICES = "/config/objects/v1/services"
+TAGS = "/config/objects/v1/tags"
+ZONES = "/config/network/v1/zones"
+
+
+def _rule(name, folder="Texas", **fields):
+    return {
+        "name": name,
+        "folder": folder,
+        "from_": ["trust"],
+        "to_": ["untrust"],
+        "source": ["any"],
+        "destination": ["any"],
+        "action": "allow",
+        **fields,
+    }
+
+
+@pytest.fixture
+def seeded(store):
+    """Texas under All; zones and a service in All, addresses and a tag in Texas."""
+    store.add(FOLDERS, name="All", parent="")
+    store.add(FOLDERS, name="Texas", parent="All")
+    store.add(FOLDERS, name="Ohio", parent="All")
+    for zone in ("trust", "untrust"):
+        store.add(ZONES, name=zone, folder="All")
+    store.add(SERVICES, name="tcp-8080", folder="All", protocol={"tcp": {"port": "8080"}})
+    store.add(TAGS, name="web", folder="Texas")
+    store.add(ADDRESSES, name="web1", folder="Texas", ip_netmask="10.0.0.1/32")
+    store.add(ADDRESSES, name="ohio1", folder="Ohio", ip_netmask="10.1.0.1/32")
+    store.add(GROUPS, name="webs", folder="Texas", static=["web1"])
+    return store
+
+
+class TestReferenceChecker:
+    """Tests for resolving batch references against containers and ancestors."""
+
+    def test_resolves_container_and_ancestor_objects(self, seeded):
+        """Objects in the container or an ancestor folder, literals, and predefined names pass."""
+        batch = {
+            "security_rule": [
+                _rule(
+                    "allow-web",
+                    source=["web1", "10.9.0.0/16", "10.0.0.1-10.0.0.9", "US"],
+                    destination=["webs"],
+                    service=["tcp-8080", "application-default"],
+                    tag=["web"],
+                    profile_setting={"group": ["best-practice"]},
+                )
+            ]
+        }
+        report = ReferenceChecker(seeded.client).check(batch)
+
+        assert report.ok, report.dangling
+        assert report.checked == 1
+
+    def test_reports_every_dangling_reference(self, seeded):
+        """Missing names are reported per field, including those in other folders."""
+        batch = {
+            "security_rule": [
+                _rule(
+                    "allow-db",
+                    to_=["dmz"],
+                    source=["ohio1"],
+                    destination=["db1"],
+                    service=["tcp-5432"],
+                    profile_setting={"group": ["strict"]},
+                )
+            ],
+            "address_group": [
+                {
+                    "name": "dyn",
+                    "folder": "Texas",
+                    "dynamic": {"filter": "'web' and 'prod'"},
+                }
+            ],
+            "service_group": [{"name": "db", "folder": "Texas", "members": ["tcp-5432"]}],
+        }
+        report = ReferenceChecker(seeded.client).check(batch)
+
+        found = {(d.service, d.field, d.reference) for d in report.dangling}
+        assert found == {
+            ("security_rule", "to_", "dmz"),
+            ("security_rule", "source", "ohio1"),
+            ("security_rule", "destination", "db1"),
+            ("security_rule", "service", "tcp-5432"),
+            ("security_rule", "profile_setting.group", "strict"),
+            ("address_group", "dynamic.filter", "prod"),
+            ("service_group", "members", "tcp-5432"),
+        }
+        assert len(report.by_object()[("security_rule", "allow-db")]) == 5
+        with pytest.raises(InvalidObjectError) as exc_info:
+            report.raise_for_errors()
+        assert len(exc_info.value.details["dangling"]) == 7
+
+    def test_batch_objects_satisfy_references(self, seeded):
+        """Objects created by the same batch count as existing in their container."""
+        batch = {
+            "address": [{"name": "db1", "folder": "Texas", "ip_netmask": "10.0.0.5/32"}],
+            "address_group": [{"name": "dbs", "folder": "Texas", "static": ["db1"]}],
+            "security_rule": [_rule("allow-db", destination=["dbs"])],
+            "tag": [{"name": "ohio-only", "folder": "Ohio"}],
+        }
+        assert ReferenceChecker(seeded.client).check(batch).ok
+
+        batch["address"][0]["tag"] = ["ohio-only"]
+        report = ReferenceChecker(seeded.client).check(batch)
+        assert [d.reference for d in report.dangling] == ["ohio-only"]
+
+    def test_nat_translations_and_known_names(self, seeded):
+        """NAT translated addresses are references; known names always resolve."""
+        batch = {
+            "nat_rule": [
+                {
+                    "name": "snat",
+                    "folder": "Texas",
+                    "source_translation": {
+                        "dynamic_ip_and_port": {"translated_address": ["web1", "pool1"]}
+                    },
+                    "destination_translation": {"translated_address": "192.0.2.10"},
+                }
+            ]
+        }
+        report = ReferenceChecker(seeded.client).check(batch)
+        assert [(d.field, d.reference) for d in report.dangling] == [
+            ("source_translation", "pool1")
+        ]
+
+        checker = ReferenceChecker(seeded.client, known={"address": ["pool1"]})
+        assert checker.check(batch).ok
+
+    def test_one_listing_per_service_and_scope(self, seeded):
+        """The index costs one folder listing plus one listing per service and scope."""
+        batch = {"security_rule": [_rule(f"r{i}", source=[f"host{i}"]) for i in range(50)]}
+        report = ReferenceChecker(seeded.client).check(batch)
+
+        # zones (1 service) + addresses (4 services), each in Texas and All
+        assert report.listings == 1 + 2 * (1 + 4)
+        assert seeded.calls["get"] == report.listings
+        assert len(report.dangling) == 50
+
+    def test_invalid_objects_are_reported(self, seeded):
+        """Objects that fail validation are reported instead of checked."""
+        batch = {"address": [{"name": "bad", "folder": "Texas"}]}
+        report = ReferenceChecker(seeded.client).check(batch)
+
+        assert not report.ok
+        assert [(service, index) for service, index, _ in report.invalid] == [("address", 0)]
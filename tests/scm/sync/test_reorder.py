@@ -0,0 +1,151 @@
+"""Tests for minimal-move rule reordering."""
+
+import random
+
+import pytest
+
+from scm.exceptions import InvalidObjectError
+from scm.sync.reorder import (
+    RuleMove,
+    longest_increasing_subsequence,
+    plan_moves,
+    reorder_rules,
+)
+
+RULE_SERVICES = {
+    "security_rule": "/config/security/v1/security-rules",
+    "nat_rule": "/config/network/v1/nat-rules",
+    "decryption_rule": "/config/security/v1/decryption-rules",
+    "authentication_rule": "/config/identity/v1/authentication-rules",
+    "app_override_rule": "/config/security/v1/app-override-rules",
+}
+QOS_RULES = "/config/network/v1/qos-policy-rules"
+
+
+def _lis_length(sequence):
+    best = [1] * len(sequence)
+    for i in range(len(sequence)):
+        for j in range(i):
+            if sequence[j] < sequence[i]:
+                best[i] = max(best[i], best[j] + 1)
+    return max(best, default=0)
+
+
+def _apply(order, moves):
+    order = list(order)
+    for move in moves:
+        order.remove(move.name)
+        if move.destination == "top":
+            order.insert(0, move.name)
+        else:
+            anchor = order.index(move.destination_name)
+            order.insert(anchor + (move.destination == "after"), move.name)
+    return order
+
+
+class TestLongestIncreasingSubsequence:
+    """Tests for the patience-sort LIS."""
+
+    def test_known_sequence(self):
+        """Indexes of one longest strictly increasing run are returned."""
+        sequence = [3, 1, 4, 1, 5, 9, 2, 6]
+        indexes = longest_increasing_subsequence(sequence)
+        values = [sequence[i] for i in indexes]
+
+        assert len(indexes) == 4
+        assert values == sorted(set(values))
+        assert indexes == sorted(indexes)
+
+    def test_matches_quadratic_reference(self):
+        """Lengths agree with the O(n^2) dynamic programme."""
+        rng = random.Random(7)
+        for _ in range(200):
+            sequence = [rng.randrange(30) for _ in range(rng.randrange(25))]
+            assert len(longest_increasing_subsequence(sequence)) == _lis_length(sequence)
+
+
+class TestPlanMoves:
+    """Tests for computing minimal move plans."""
+
+    def test_same_order_needs_no_moves(self):
+        """Rules already in order are left alone."""
+        assert plan_moves(["a", "b", "c"], ["a", "b", "c"]) == []
+
+    def test_single_rule_to_top(self):
+        """Moving the last rule first is one move before the first rule that stays."""
+        moves = plan_moves(["a", "b", "c"], ["c", "a", "b"], {"a": "1", "b": "2", "c": "3"})
+        assert moves == [RuleMove("3", "c", "before", "1", "a")]
+        assert moves[0].move_data("pre") == {
+            "destination": "before",
+            "rulebase": "pre",
+            "destination_rule": "1",
+        }
+
+    def test_random_permutations_are_minimal(self):
+        """Applying the moves yields the desired order in n - LIS moves."""
+        rng = random.Random(11)
+        for size in (1, 2, 5, 20, 60):
+            current = [f"rule-{i}" for i in range(size)]
+            for _ in range(20):
+                desired = rng.sample(current, size)
+                moves = plan_moves(current, desired)
+                rank = {name: i for i, name in enumerate(desired)}
+
+                assert _apply(current, moves) == desired
+                assert len(moves) == size - _lis_length([rank[n] for n in current])
+
+    def test_rejects_non_permutations(self):
+        """Every rule must be listed exactly once."""
+        with pytest.raises(InvalidObjectError) as exc_info:
+            plan_moves(["a", "b", "c"], ["a", "b", "d"])
+        assert exc_info.value.details == {"missing": ["c"], "unknown": ["d"]}
+        with pytest.raises(InvalidObjectError):
+            plan_moves(["a", "b"], ["a", "b", "b"])
+
+
+class TestReorder:
+    """Tests for the reorder() method of rule services."""
+
+    @pytest.mark.parametrize("service_name", sorted(RULE_SERVICES))
+    def test_reorder_converges(self, store, service_name):
+        """One listing and n - LIS moves produce the desired order."""
+        endpoint = RULE_SERVICES[service_name]
+        for name in ("a", "b", "c", "d", "e"):
+            store.add(endpoint, name=name, folder="Texas")
+        service = getattr(store.client, service_name)
+
+        moves = service.reorder("Texas", "pre", ["b", "c", "a", "e", "d"])
+
+        assert [rule["name"] for rule in store.objects[endpoint].values()] == list("bcaed")
+        assert len(moves) == 2
+        assert store.calls == {"get": 1, "post": 2}
+        assert store.client.post.call_args.kwargs["json"]["rulebase"] == "pre"
+
+    def test_dry_run_and_ids(self, store):
+        """Rules can be named by id, and a dry run issues no moves."""
+        endpoint = RULE_SERVICES["security_rule"]
+        rules = [store.add(endpoint, name=name, folder="Texas") for name in ("a", "b", "c")]
+
+        moves = store.client.security_rule.reorder(
+            "Texas", "post", [rules[2]["id"], "a", "b"], dry_run=True
+        )
+
+        assert moves == [RuleMove(rules[2]["id"], "c", "before", rules[0]["id"], "a")]
+        assert store.calls == {"get": 1}
+
+    def test_unknown_rules_are_rejected(self, store):
+        """Desired orders must cover exactly the folder's rules."""
+        store.add(RULE_SERVICES["security_rule"], name="a", folder="Texas")
+        with pytest.raises(InvalidObjectError):
+            store.client.security_rule.reorder("Texas", "pre", ["a", "b"])
+        assert "post" not in store.calls
+
+    def test_services_without_a_rulebase_filter_are_rejected(self, store):
+        """QoS rules cannot be listed per rulebase, so their order cannot be planned."""
+        for name in ("a", "b"):
+            store.add(QOS_RULES, name=name, folder="Texas", action={})
+
+        assert not hasattr(store.client.qos_rule, "reorder")
+        with pytest.raises(InvalidObjectError):
+            reorder_rules(store.client.qos_rule, "Texas", "pre", ["b", "a"])
+        assert store.calls == {}
@@ -0,0 +1,184 @@
+"""Tests for batch transactions and their rollback journal."""
+
+import json
+
+import pytest
+
+from scm.exceptions import InvalidObjectError, TransactionError
+from scm.sync import Transaction
+from scm.sync.transaction import Journal
+
+ADDRESSES = "/config/objects/v1/addresses"
+GROUPS = "/config/objects/v1/address-groups"
+TAGS = "/config/objects/v1/tags"
+
+
+class Crash(BaseException):
+    """Stands in for the process dying mid-batch."""
+
+
+def _address(name, value, folder="Texas", **extra):
+    return {"name": name, "folder": folder, "ip_netmask": value, **extra}
+
+
+@pytest.fixture
+def seeded(store):
+    """Seed a tag and two addresses in Texas."""
+    store.add(TAGS, name="web", folder="Texas")
+    store.add(ADDRESSES, **_address("web1", "10.0.0.1/32"))
+    store.add(ADDRESSES, **_address("web2", "10.0.0.2/32"))
+    return store
+
+
+def _fail_on(store, name, exception=None, after=False):
+    """Make the store's post fail (or crash after succeeding) for the object called name."""
+    post = store.client.post.side_effect
+
+    def failing_post(path, json=None, params=None):
+        if json and json.get("name") == name:
+            if after:
+                post(path, json=json, params=params)
+                raise exception
+            raise exception or InvalidObjectError(message=f"{name} rejected", error_code="E003")
+        return post(path, json=json, params=params)
+
+    store.client.post.side_effect = failing_post
+
+
+def _queue_changes(txn, store):
+    """Queue an update, a create, a delete, and a create that depends on the first create."""
+    web1, web2 = store.find(ADDRESSES, "web1"), store.find(ADDRESSES, "web2")
+    txn.update("address", {"id": web1["id"], "name": "web1", "ip_netmask": "10.9.9.1/32"})
+    txn.create("address", _address("web3", "10.0.0.3/32", tag=["web"]))
+    txn.delete("address", web2["id"], folder="Texas")
+    txn.create("address_group", {"name": "webs", "folder": "Texas", "static": ["web3"]})
+
+
+class TestTransaction:
+    """Tests for committing and rolling back transactions."""
+
+    def test_commit_applies_everything_and_removes_journal(self, seeded, tmp_path):
+        """A clean batch is applied and leaves no journal behind."""
+        journal = tmp_path / "txn.jsonl"
+        with seeded.client.transaction(journal_path=journal) as txn:
+            _queue_changes(txn, seeded)
+
+        assert txn.report.ok
+        assert seeded.find(ADDRESSES, "web1")["ip_netmask"] == "10.9.9.1/32"
+        assert seeded.find(ADDRESSES, "web2") is None
+        assert seeded.find(GROUPS, "webs")["static"] == ["web3"]
+        assert not journal.exists()
+
+    def test_pre_images_are_listed_per_container(self, seeded, tmp_path):
+        """Objects in a named container cost one listing; the others one get each."""
+        txn = Transaction(seeded.client, journal_path=tmp_path / "txn.jsonl")
+        for name in ("web1", "web2"):
+            txn.delete("address", seeded.find(ADDRESSES, name)["id"], folder="Texas")
+        txn.update("tag", {"id": seeded.find(TAGS, "web")["id"], "name": "web", "color": "Red"})
+        txn.commit()
+
+        assert seeded.calls == {"get": 2, "delete": 2, "put": 1}
+
+    def test_failure_rolls_back_applied_operations(self, seeded, tmp_path):
+        """Creates are deleted, updates restored, and deletes recreated."""
+        journal = tmp_path / "txn.jsonl"
+        _fail_on(seeded, "webs")
+
+        with pytest.raises(TransactionError) as exc_info:
+            with seeded.client.transaction(journal_path=journal) as txn:
+                _queue_changes(txn, seeded)
+
+        error = exc_info.value
+        assert error.report.summary() == {"succeeded": 3, "failed": 1, "skipped": 0}
+        assert error.rollback.ok
+        assert error.details["rolled_back"] is True
+        assert seeded.find(ADDRESSES, "web1")["ip_netmask"] == "10.0.0.1/32"
+        assert seeded.find(ADDRESSES, "web2")["ip_netmask"] == "10.0.0.2/32"
+        assert seeded.find(ADDRESSES, "web3") is None
+        assert seeded.find(GROUPS, "webs") is None
+        assert not journal.exists()
+
+    def test_failed_compensation_keeps_journal(self, seeded, tmp_path):
+        """If a compensation fails, the journal stays so the rollback can be retried."""
+        journal = tmp_path / "txn.jsonl"
+        _fail_on(seeded, "webs")
+        seeded.client.delete.side_effect = InvalidObjectError(message="locked", error_code="E003")
+
+        with pytest.raises(TransactionError) as exc_info:
+            with seeded.client.transaction(journal_path=journal) as txn:
+                txn.create("address", _address("web3", "10.0.0.3/32"))
+                txn.create("address_group", {"name": "webs", "folder": "Texas", "static": ["web3"]})
+
+        assert exc_info.value.details["rolled_back"] is False
+        assert journal.exists()
+
+        seeded.client.delete.side_effect = seeded.delete
+        assert Transaction.recover(seeded.client, journal).ok
+        assert seeded.find(ADDRESSES, "web3") is None
+        assert not journal.exists()
+
+    def test_recover_after_crash(self, seeded, tmp_path):
+        """A crashed batch is rolled back from its journal, including unrecorded writes."""
+        journal = tmp_path / "txn.jsonl"
+        _fail_on(seeded, "web3", Crash(), after=True)
+        txn = Transaction(seeded.client, journal_path=journal, max_workers=1)
+        _queue_changes(txn, seeded)
+
+        with pytest.raises(Crash):
+            txn.commit()
+        txn.journal.close()
+        assert seeded.find(ADDRESSES, "web3") is not None
+        assert seeded.find(ADDRESSES, "web1")["ip_netmask"] == "10.9.9.1/32"
+
+        report = Transaction.recover(seeded.client, journal)
+
+        assert report.ok
+        assert seeded.find(ADDRESSES, "web1")["ip_netmask"] == "10.0.0.1/32"
+        assert seeded.find(ADDRESSES, "web2") is not None
+        assert seeded.find(ADDRESSES, "web3") is None
+        assert not journal.exists()
+
+    def test_recover_ignores_torn_lines_and_committed_journals(self, seeded, tmp_path):
+        """A torn final line is ignored, and committed journals need no rollback."""
+        journal = tmp_path / "txn.jsonl"
+        header = {"version": 1, "operations": [], "pre_images": {}}
+        events = [{"event": "state", "state": "committed"}]
+        journal.write_text(
+            "\n".join(json.dumps(e) for e in [header, *events]) + '\n{"event": "sta'
+        )
+
+        assert Journal.load(journal).state == "committed"
+        assert Transaction.recover(seeded.client, journal) is None
+        assert not journal.exists()
+
+        journal.write_text("not a journal\n")
+        with pytest.raises(InvalidObjectError):
+            Transaction.recover(seeded.client, journal)
+
+    def test_exception_in_block_sends_nothing(self, seeded, tmp_path):
+        """Leaving the block with an error discards the queued operations."""
+        with pytest.raises(RuntimeError):
+            with seeded.client.transaction(journal_path=tmp_path / "txn.jsonl") as txn:
+                txn.create("address", _address("web3", "10.0.0.3/32"))
+                raise RuntimeError("changed my mind")
+
+        assert seeded.total_calls == 0
+
+    def test_missing_objects_abort_before_any_write(self, seeded, tmp_path):
+        """Updates and deletes of unknown objects are rejected up front."""
+        txn = Transaction(seeded.client, journal_path=tmp_path / "txn.jsonl")
+        txn.create("address", _address("web3", "10.0.0.3/32"))
+        txn.delete("address", "00000000-0000-0000-0000-000000000000", folder="Texas")
+
+        with pytest.raises(InvalidObjectError) as exc_info:
+            txn.commit()
+        assert exc_info.value.details["missing"] == ["00000000-0000-0000-0000-000000000000"]
+        assert seeded.calls == {"get": 1}
+
+    def test_no_operations_after_commit(self, seeded, tmp_path):
+        """A transaction runs once."""
+        txn = Transaction(seeded.client, journal_path=tmp_path / "txn.jsonl")
+        txn.create("address", _address("web3", "10.0.0.3/32"))
+        txn.commit()
+        with pytest.raises(InvalidObjectError):
+            txn.create("address", _address("web4", "10.0.0.4/32"))
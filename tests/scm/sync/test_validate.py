@@ -0,0 +1,98 @@
+"""Tests for parallel bulk pre-validation."""
+
+import pytest
+
+from scm.exceptions import InvalidObjectError
+from scm.models.objects import AddressCreateModel
+from scm.models.security import SecurityRuleCreateModel
+from scm.sync.validate import benchmark_validation, validate_many
+
+
+def _addresses(count):
+    return [
+        {"name": f"host{i}", "folder": "Texas", "ip_netmask": f"10.0.{i // 250}.{i % 250}/32"}
+        for i in range(count)
+    ]
+
+
+def _with_errors(count):
+    items = _addresses(count)
+    items[3]["ip_netmask"] = 5
+    items[17] = {"name": "no-address", "folder": "Texas"}
+    items[40]["name"] = "bad name!"
+    return items
+
+
+class TestValidateMany:
+    """Tests for validate_many()."""
+
+    def test_errors_are_keyed_by_input_index(self):
+        """Valid items become payloads, invalid ones issues, both by input index."""
+        report = validate_many(AddressCreateModel, _with_errors(50), max_workers=1)
+
+        assert not report.ok
+        assert [issue.index for issue in report.errors] == [3, 17, 40]
+        assert report.errors[0].errors[0]["loc"] == ("ip_netmask",)
+        assert "ip_netmask" in report.errors[0].message
+        assert len(report.payloads) == 47
+        assert report.payloads[0] == {
+            "name": "host0",
+            "folder": "Texas",
+            "ip_netmask": "10.0.0.0/32",
+        }
+        assert [p["name"] for p in report.valid][:4] == ["host0", "host1", "host2", "host4"]
+
+    def test_worker_processes_match_inline_validation(self):
+        """Chunks validated in worker processes give the same report as inline validation."""
+        items = _with_errors(500)
+        inline = validate_many(AddressCreateModel, items, max_workers=1)
+        parallel = validate_many(AddressCreateModel, items, max_workers=2, chunk_size=100)
+
+        assert parallel.workers == 2
+        assert inline.workers == 1
+        assert parallel.payloads == inline.payloads
+        assert parallel.errors == inline.errors
+
+    def test_small_inputs_stay_in_process(self):
+        """An input that fits in one chunk is validated without starting workers."""
+        report = validate_many(AddressCreateModel, _addresses(10), max_workers=4)
+        assert report.ok
+        assert report.workers == 1
+        assert validate_many(AddressCreateModel, []).total == 0
+
+    def test_payloads_by_alias(self):
+        """Rule payloads can be dumped with their API field names."""
+        rule = {"name": "allow-web", "folder": "Texas", "from_": ["trust"], "action": "allow"}
+        report = validate_many(SecurityRuleCreateModel, [rule], by_alias=True)
+        assert report.payloads[0]["from"] == ["trust"]
+
+    def test_raise_for_errors(self):
+        """Failures can be turned into an InvalidObjectError."""
+        validate_many(AddressCreateModel, _addresses(5)).raise_for_errors()
+        report = validate_many(AddressCreateModel, _with_errors(50), max_workers=1)
+        with pytest.raises(InvalidObjectError) as exc_info:
+            report.raise_for_errors()
+        assert set(exc_info.value.details["errors"]) == {3, 17, 40}
+
+    def test_invalid_settings(self):
+        """Chunk size and worker count must be positive."""
+        with pytest.raises(InvalidObjectError):
+            validate_many(AddressCreateModel, [], chunk_size=0)
+        with pytest.raises(InvalidObjectError):
+            validate_many(AddressCreateModel, [], max_workers=-1)
+        with pytest.raises(InvalidObjectError):
+            validate_many(AddressCreateModel, [], max_workers=0)
+
+
+class TestBenchmarkValidation:
+    """Tests for the throughput benchmark."""
+
+    def test_reports_each_worker_count(self):
+        """Every worker count gets its timing and speedup relative to the first."""
+        results = benchmark_validation(
+            AddressCreateModel, _addresses(400), worker_counts=[1, 2], chunk_size=100
+        )
+
+        assert [r["workers"] for r in results] == [1, 2]
+        assert results[0]["speedup"] == 1.0
+        assert all(r["items_per_second"] > 0 for r in results)
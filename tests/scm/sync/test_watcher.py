@@ -0,0 +1,323 @@
+"""Tests for the change-detection Watcher."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from scm.exceptions import InvalidObjectError
+from scm.models.operations import JobListItem
+from scm.sync import ChangeEvent, Watcher, WatchTarget
+from scm.utils.cache import ConditionalEntry
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class FakeApi:
+    """Minimal stand-in for Scm serving raw paginated listings."""
+
+    def __init__(self, max_limit=2):
+        """Create empty collections for addresses and tags."""
+        self.address = SimpleNamespace(ENDPOINT="/addresses", max_limit=max_limit)
+        self.tag = SimpleNamespace(ENDPOINT="/tags", max_limit=max_limit)
+        self.objects = {"/addresses": [], "/tags": []}
+        self.jobs = []
+        self.get = MagicMock(side_effect=self._get)
+        self.list_jobs = MagicMock(
+            side_effect=lambda limit=100: SimpleNamespace(data=list(self.jobs))
+        )
+
+    def _get(self, endpoint, params):
+        items = [
+            item
+            for item in self.objects[endpoint]
+            if item.get("folder") == params.get("folder") or item.get("folder") == "Shared"
+        ]
+        offset, limit = params["offset"], params["limit"]
+        end = offset + limit
+        return {"data": items[offset:end], "limit": limit, "offset": offset}
+
+    def add_job(self, job_id, description=""):
+        """Append a job to the job history."""
+        self.jobs.append(
+            JobListItem(
+                id=str(job_id),
+                job_result="2",
+                job_status="2",
+                job_type="53",
+                parent_id="0",
+                result_str="OK",
+                start_ts="2026-01-01 00:00:00",
+                status_str="FIN",
+                type_str="CommitAndPush",
+                uname="admin@example.com",
+                description=description,
+            )
+        )
+
+
+def _address(object_id, name, value, folder="Texas"):
+    return {"id": object_id, "name": name, "folder": folder, "ip_netmask": value}
+
+
+@pytest.fixture
+def api():
+    """Return a fake API with three Texas addresses and one inherited Shared address."""
+    api = FakeApi()
+    api.objects["/addresses"] = [
+        _address("1", "web", "10.0.0.1/32"),
+        _address("2", "db", "10.0.0.2/32"),
+        _address("3", "app", "10.0.0.3/32"),
+        _address("9", "shared", "10.9.9.9/32", folder="Shared"),
+    ]
+    return api
+
+
+class TestWatchTarget:
+    """Tests for WatchTarget."""
+
+    def test_requires_exactly_one_container(self):
+        """Targets need exactly one container."""
+        with pytest.raises(InvalidObjectError):
+            WatchTarget("address")
+        with pytest.raises(InvalidObjectError):
+            WatchTarget("address", folder="Texas", snippet="s")
+
+    def test_key_includes_params(self):
+        """Extra params distinguish otherwise identical targets."""
+        target = WatchTarget("security_rule", folder="Texas", params={"position": "pre"})
+        assert target.key == "security_rule:folder=Texas:position=pre"
+
+
+class TestWatcherSync:
+    """Tests for change detection."""
+
+    def test_first_sync_is_a_silent_baseline(self, api):
+        """The first sync records state without emitting events."""
+        watcher = Watcher(api, [WatchTarget("address", folder="Texas")])
+        assert watcher.sync(watcher.targets[0]) == []
+        assert set(watcher.snapshot()["address:folder=Texas"]) == {"1", "2", "3"}
+
+    def test_emit_initial(self, api):
+        """emit_initial reports every object found by the first sync."""
+        watcher = Watcher(api, [WatchTarget("address", folder="Texas")], emit_initial=True)
+        events = watcher.sync(watcher.targets[0])
+        assert sorted(e.object_id for e in events) == ["1", "2", "3"]
+        assert {e.kind for e in events} == {"created"}
+
+    def test_created_updated_deleted(self, api):
+        """Changes between syncs become object-level events."""
+        target = WatchTarget("address", folder="Texas")
+        watcher = Watcher(api, [target])
+        received = []
+        watcher.on_change(received.append)
+        watcher.sync(target)
+
+        api.objects["/addresses"][0]["ip_netmask"] = "10.0.0.10/32"
+        del api.objects["/addresses"][1]
+        api.objects["/addresses"].append(_address("4", "cache", "10.0.0.4/32"))
+        api.objects["/addresses"][2]["last_update"] = "volatile change only"
+        events = watcher.sync(target)
+
+        kinds = {(e.kind, e.object_id) for e in events}
+        assert kinds == {("updated", "1"), ("deleted", "2"), ("created", "4")}
+        assert received == events
+        updated = next(e for e in events if e.kind == "updated")
+        assert updated.name == "web"
+        assert updated.data["ip_netmask"] == "10.0.0.10/32"
+        assert updated.fingerprint != updated.previous_fingerprint
+        assert watcher.stats["updated"] == 1
+
+    def test_exact_match_can_be_disabled(self, api):
+        """Inherited objects are only tracked when exact_match is False."""
+        watcher = Watcher(api, [WatchTarget("address", folder="Texas")], exact_match=False)
+        watcher.sync(watcher.targets[0])
+        assert "9" in watcher.snapshot()["address:folder=Texas"]
+
+    def test_snapshot_resumes_change_detection(self, api):
+        """A watcher built from a snapshot diffs its first sync against it."""
+        target = WatchTarget("address", folder="Texas")
+        first = Watcher(api, [target])
+        first.sync(target)
+        snapshot = first.snapshot()
+
+        api.objects["/addresses"][0]["description"] = "changed"
+        second = Watcher(api, [target], snapshot=snapshot)
+        events = second.sync(target)
+
+        assert [(e.kind, e.object_id) for e in events] == [("updated", "1")]
+
+    def test_not_modified_pages_are_skipped(self, api):
+        """When every page comes back with unchanged validators, the sync is skipped."""
+        entries = {}
+        versions = {}
+
+        def cached_get(endpoint, params):
+            offset = params["offset"]
+            if offset not in entries:
+                etag = f'"{offset}-{versions.get(offset, 1)}"'
+                entries[offset] = ConditionalEntry(etag, None, api._get(endpoint, params))
+            return entries[offset].body
+
+        api.get.side_effect = cached_get
+        api.conditional_entry = lambda endpoint, params: entries.get(params["offset"])
+        target = WatchTarget("address", folder="Texas")
+        watcher = Watcher(api, [target])
+        watcher.sync(target)
+
+        assert watcher.sync(target) == []
+        assert watcher.stats["skipped_not_modified"] == 1
+        # Only the validators of each page are kept, not the pages
+        assert watcher._validators[target.key] == [
+            ('"0-1"', None),
+            ('"2-1"', None),
+            ('"4-1"', None),
+        ]
+
+        api.objects["/addresses"][0]["ip_netmask"] = "10.1.1.1/32"
+        versions[0] = 2
+        del entries[0]
+        assert [(e.kind, e.object_id) for e in watcher.sync(target)] == [("updated", "1")]
+        assert watcher.stats["skipped_not_modified"] == 1
+
+    def test_pages_without_validators_are_always_hashed(self, api):
+        """Without conditional requests, every sync compares fingerprints."""
+        target = WatchTarget("address", folder="Texas")
+        watcher = Watcher(api, [target])
+        watcher.sync(target)
+
+        assert watcher.sync(target) == []
+        assert watcher.stats["skipped_not_modified"] == 0
+        assert watcher._validators[target.key] == [None, None, None]
+
+    def test_callback_errors_are_logged(self, api):
+        """A failing callback does not stop delivery to the others."""
+        target = WatchTarget("address", folder="Texas")
+        watcher = Watcher(api, [target], emit_initial=True)
+        received = []
+        watcher.on_change(MagicMock(side_effect=RuntimeError("boom")))
+        watcher.on_change(received.append)
+        watcher.sync(target)
+        assert len(received) == 3
+
+
+class TestWatcherScheduling:
+    """Tests for spreading polls and skipping untouched containers."""
+
+    def test_targets_are_spread_across_the_interval(self, api):
+        """Each poll only syncs the targets that are due."""
+        clock = FakeClock()
+        targets = [WatchTarget("address", folder="Texas"), WatchTarget("tag", folder="Texas")]
+        watcher = Watcher(api, targets, interval=60, clock=clock)
+
+        watcher.poll()
+        assert {c.args[0] for c in api.get.call_args_list} == {"/addresses"}
+
+        api.get.reset_mock()
+        clock.now = 29.0
+        watcher.poll()
+        assert api.get.call_count == 0
+
+        clock.now = 30.0
+        watcher.poll()
+        assert {c.args[0] for c in api.get.call_args_list} == {"/tags"}
+
+        api.get.reset_mock()
+        clock.now = 60.0
+        watcher.poll()
+        assert {c.args[0] for c in api.get.call_args_list} == {"/addresses"}
+
+    def test_force_polls_everything(self, api):
+        """force=True syncs every target regardless of schedule."""
+        targets = [WatchTarget("address", folder="Texas"), WatchTarget("tag", folder="Texas")]
+        watcher = Watcher(api, targets, clock=FakeClock())
+        watcher.poll(force=True)
+        assert watcher.stats["syncs"] == 2
+
+    def test_skip_untouched_without_new_jobs(self, api):
+        """Targets are skipped when no job ran since their last sync."""
+        api.add_job(10)
+        target = WatchTarget("address", folder="Texas")
+        watcher = Watcher(api, [target], skip_untouched=True, clock=FakeClock())
+        watcher.poll(force=True)
+        api.get.reset_mock()
+
+        watcher.poll(force=True)
+
+        assert api.get.call_count == 0
+        assert watcher.stats["skipped_untouched"] == 1
+
+    def test_job_ending_during_a_sync_is_not_marked_seen(self, api):
+        """A job that ends after the listing was read makes the next poll sync again."""
+        api.add_job(10)
+        target = WatchTarget("address", folder="Texas")
+        watcher = Watcher(api, [target], skip_untouched=True, clock=FakeClock())
+        listed = api.get.side_effect
+
+        def get_then_push(endpoint, params):
+            response = listed(endpoint, params)
+            if len(api.jobs) == 1:
+                api.objects["/addresses"][0] = _address("1", "web", "10.0.0.100/32")
+                api.add_job(11, description="push Texas")
+            return response
+
+        api.get.side_effect = get_then_push
+        watcher.poll(force=True)
+        api.get.side_effect = listed
+
+        events = watcher.poll(force=True)
+
+        assert [(e.kind, e.name) for e in events] == [("updated", "web")]
+        assert watcher.stats["skipped_untouched"] == 0
+
+    def test_jobs_naming_other_containers_do_not_touch(self, api):
+        """A new job that only names another watched container leaves this one untouched."""
+        api.add_job(10)
+        texas = WatchTarget("address", folder="Texas")
+        ohio = WatchTarget("address", folder="Ohio")
+        watcher = Watcher(api, [texas, ohio], skip_untouched=True, clock=FakeClock())
+        watcher.poll(force=True)
+        api.add_job(11, description="push Ohio")
+        api.get.reset_mock()
+
+        watcher.poll(force=True)
+
+        assert {c.kwargs["params"]["folder"] for c in api.get.call_args_list} == {"Ohio"}
+
+    def test_unattributable_jobs_touch_everything(self, api):
+        """A new job naming no watched container counts as touching all of them."""
+        api.add_job(10)
+        watcher = Watcher(
+            api,
+            [WatchTarget("address", folder="Texas"), WatchTarget("address", folder="Ohio")],
+            skip_untouched=True,
+            clock=FakeClock(),
+        )
+        watcher.poll(force=True)
+        api.add_job(11, description="nightly push")
+
+        watcher.poll(force=True)
+
+        assert watcher.stats["syncs"] == 4
+
+    def test_events_generator_stops(self, api):
+        """events() yields detected changes and ends after stop()."""
+        target = WatchTarget("address", folder="Texas")
+        watcher = Watcher(api, [target], interval=0, emit_initial=True)
+        seen = []
+        for event in watcher.events():
+            assert isinstance(event, ChangeEvent)
+            seen.append(event)
+            if len(seen) == 3:
+                watcher.stop()
+        assert len(seen) == 3
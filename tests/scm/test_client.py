@@ -20,10 +20,12 @@ from scm.exceptions import (
     ServerError,
 )
 from scm.models.operations import (
+    CandidatePushRequestModel,
     CandidatePushResponseModel,
     JobListResponse,
     JobStatusResponse,
 )
+from scm.utils.cache import TTLCache
 from tests.utils import raise_mock_http_error
 
 
@@ -777,6 +779,37 @@ class TestClientJobMethods(TestClientBase):
         assert result.data[0].parent_id == "parent1"
         assert result.total == 1  # Total should be updated for filtered results
 
+    def test_list_jobs_with_parent_filter_reads_every_page(self):
+        """Children beyond the first page are found with parent_id."""
+        jobs = [
+            {
+                "id": str(n),
+                "parent_id": "parent1" if n % 2 else "0",
+                "job_result": "2",
+                "job_status": "2",
+                "job_type": "53",
+                "result_str": "OK",
+                "start_ts": "2024-11-30T10:00:00",
+                "status_str": "FIN",
+                "type_str": "CommitAndPush",
+                "uname": "test@example.com",
+            }
+            for n in range(1, 8)
+        ]
+
+        def get(endpoint, params):
+            start = params["offset"]
+            end = start + params["limit"]
+            page = jobs[start:end]
+            return {"data": page, "total": len(jobs), **params}
+
+        with patch.object(self.client, "get", side_effect=get) as mock_get:
+            result = self.client.list_jobs(limit=3, parent_id="parent1")
+
+        assert [job.id for job in result.data] == ["1", "3", "5", "7"]
+        assert result.total == 4
+        assert [call.kwargs["params"]["offset"] for call in mock_get.call_args_list] == [0, 3, 6]
+
     def test_get_job_status(self):
         """Test getting status of a specific job."""
         mock_response = {
@@ -924,6 +957,31 @@ class TestClientJobMethods(TestClientBase):
 
                 assert mock_sleep.call_count > 0
 
+    def test_wait_for_job_adaptive_polling(self):
+        """Without a poll_interval, waits start short and back off."""
+        statuses = [MagicMock(data=[MagicMock(status_str="ACT")]) for _ in range(4)]
+        statuses.append(MagicMock(data=[MagicMock(status_str="FIN")]))
+
+        with patch.object(self.client, "get_job_status", side_effect=statuses):
+            with patch("time.sleep") as mock_sleep:
+                result = self.client.wait_for_job("test_job", timeout=300)
+
+        assert result is statuses[-1]
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 4
+        assert delays[0] <= 0.5
+        assert delays[-1] > delays[0]
+        assert all(delay <= 10 for delay in delays)
+
+    def test_wait_for_jobs_uses_the_shared_watcher(self):
+        """wait_for_jobs() delegates to one JobWatcher per client."""
+        watcher = self.client.job_watcher
+        assert self.client.job_watcher is watcher
+
+        with patch.object(watcher, "wait", return_value={"a": "done"}) as mock_wait:
+            assert self.client.wait_for_jobs(["a"], timeout=60) == {"a": "done"}
+        mock_wait.assert_called_once_with(["a"], timeout=60)
+
 
 class TestClientCommitMethods(TestClientBase):
     """Tests for client commit methods."""
@@ -1019,6 +1077,35 @@ class TestClientCommitMethods(TestClientBase):
             verify=ANY,
         )
 
+    def test_candidate_push_request(self):
+        """candidate_push_request() validates without sending, defaulting admin to client_id."""
+        self.client.oauth_client.auth_request.client_id = "test@example.com"
+
+        request = self.client.candidate_push_request(folders=["folder1"], description="Test")
+
+        assert isinstance(request, CandidatePushRequestModel)
+        assert request.admin == ["test@example.com"]
+        self.session.request.assert_not_called()
+
+    def test_commit_async(self):
+        """commit_async() posts the push and hands the response to the shared watcher."""
+        self.session.request.return_value.json.return_value = {
+            "success": True,
+            "job_id": "1586",
+            "message": "CommitAndPush job enqueued with jobid 1586",
+        }
+
+        with patch.object(self.client.job_watcher, "watch_commit", return_value="future") as watch:
+            result = self.client.commit_async(
+                folders=["folder1"], description="Test commit", admin=["admin@example.com"]
+            )
+
+        assert result == "future"
+        response = watch.call_args.args[0]
+        assert isinstance(response, CandidatePushResponseModel)
+        assert response.job_id == "1586"
+        assert watch.call_args.kwargs == {"timeout": 300, "on_progress": None}
+
     def test_commit_with_sync(self):
         """Test commit with sync enabled."""
         # Mock the client_id to return a string
@@ -1338,3 +1425,213 @@ class TestBearerTokenRedaction:
                 assert "oauth_token_xyz" not in msg, (
                     f"OAuth bearer token leaked in log: {msg}"
                 )
+
+
+class TestClientFetchMissCache(TestClientBase):
+    """Tests for remembering name lookups that found nothing."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, setup_method):
+        """Enable the fetch miss cache on the shared client."""
+        self.client.fetch_miss_cache = TTLCache(ttl=60)
+
+    @staticmethod
+    def _json_response(payload):
+        response = MagicMock()
+        response.raise_for_status.return_value = None
+        response.content = b"{}"
+        response.json.return_value = payload
+        return response
+
+    def test_disabled_by_default(self):
+        """A fresh client does not remember misses."""
+        client = Scm(access_token="dummy")
+        assert client.fetch_miss_cache.enabled is False
+
+    def test_404_miss_is_replayed_without_request(self):
+        """A 404 name lookup is answered locally the second time."""
+        self.session.request.side_effect = raise_mock_http_error(
+            status_code=404,
+            error_code="API_I00013",
+            message="Object not present",
+            error_type="Object Not Present",
+        )
+        params = {"folder": "Texas", "name": "missing"}
+
+        for _ in range(3):
+            with pytest.raises(ObjectNotPresentError) as exc_info:
+                self.client.get("/config/objects/v1/addresses", params=params)
+            assert exc_info.value.http_status_code == 404
+
+        assert self.session.request.call_count == 1
+        assert self.client.request_stats["fetch_miss_hits"] == 2
+
+    def test_empty_data_miss_is_replayed_as_copy(self):
+        """An empty data listing for a name lookup is replayed as an independent copy."""
+        self.session.request.return_value = self._json_response({"data": [], "total": 0})
+        params = {"folder": "Texas", "name": "missing"}
+
+        first = self.client.get("/config/objects/v1/schedules", params=params)
+        first["data"].append("mutated")
+        second = self.client.get("/config/objects/v1/schedules", params=params)
+
+        assert second == {"data": [], "total": 0}
+        assert self.session.request.call_count == 1
+
+    def test_hits_are_not_cached(self):
+        """Successful lookups always go to the API."""
+        self.session.request.return_value = self._json_response({"id": "1", "name": "web"})
+        params = {"folder": "Texas", "name": "web"}
+
+        self.client.get("/config/objects/v1/addresses", params=params)
+        self.client.get("/config/objects/v1/addresses", params=params)
+
+        assert self.session.request.call_count == 2
+
+    def test_requests_without_name_are_not_cached(self):
+        """Listings without a name filter are never treated as misses."""
+        self.session.request.return_value = self._json_response({"data": []})
+
+        self.client.get("/config/objects/v1/addresses", params={"folder": "Texas"})
+        self.client.get("/config/objects/v1/addresses", params={"folder": "Texas"})
+
+        assert self.session.request.call_count == 2
+
+    def test_create_forgets_matching_miss(self):
+        """Creating the missing name on the same endpoint forgets the miss."""
+        endpoint = "/config/objects/v1/addresses"
+        self.session.request.return_value = self._json_response({"data": []})
+        self.client.get(endpoint, params={"folder": "Texas", "name": "web"})
+        self.client.get(endpoint, params={"folder": "Texas", "name": "db"})
+        assert len(self.client.fetch_miss_cache) == 2
+
+        self.session.request.return_value = self._json_response({"id": "1", "name": "web"})
+        self.client.post(endpoint, json={"name": "web", "folder": "Texas"})
+
+        assert len(self.client.fetch_miss_cache) == 1
+        self.client.get(endpoint, params={"folder": "Texas", "name": "web"})
+        assert self.session.request.call_count == 4
+
+    def test_update_of_member_forgets_miss(self):
+        """A PUT to a member of the collection forgets misses for the new name."""
+        endpoint = "/config/objects/v1/tags"
+        self.session.request.return_value = self._json_response({"data": []})
+        self.client.get(endpoint, params={"folder": "Texas", "name": "prod"})
+
+        self.session.request.return_value = self._json_response({"id": "1", "name": "prod"})
+        self.client.put(f"{endpoint}/1", json={"name": "prod"})
+
+        assert len(self.client.fetch_miss_cache) == 0
+
+    def test_write_to_other_endpoint_keeps_miss(self):
+        """Writes to unrelated endpoints leave remembered misses alone."""
+        self.session.request.return_value = self._json_response({"data": []})
+        self.client.get("/config/objects/v1/tags", params={"folder": "Texas", "name": "prod"})
+
+        self.session.request.return_value = self._json_response({"id": "1", "name": "prod"})
+        self.client.post("/config/objects/v1/tags-extra", json={"name": "prod"})
+
+        assert len(self.client.fetch_miss_cache) == 1
+
+    def test_miss_expires_after_ttl(self):
+        """Misses older than the ttl are looked up again."""
+        now = [0.0]
+        self.client.fetch_miss_cache = TTLCache(ttl=5, clock=lambda: now[0])
+        self.session.request.return_value = self._json_response({"data": []})
+        params = {"folder": "Texas", "name": "missing"}
+
+        self.client.get("/config/objects/v1/addresses", params=params)
+        now[0] = 10.0
+        self.client.get("/config/objects/v1/addresses", params=params)
+
+        assert self.session.request.call_count == 2
+
+
+class TestClientRequestCoalescing(TestClientBase):
+    """Tests for sharing identical in-flight GET requests."""
+
+    def _blocking_response(self, waiters):
+        """Return a session.request side effect that waits for followers before answering."""
+        import time
+
+        def side_effect(*args, **kwargs):
+            deadline = time.monotonic() + 5
+            while waiters and time.monotonic() < deadline:
+                calls = list(self.client._in_flight._calls.values())
+                if calls and calls[0].waiters >= waiters:
+                    break
+                time.sleep(0.001)
+            response = MagicMock()
+            response.raise_for_status.return_value = None
+            response.content = b"{}"
+            response.json.return_value = {"data": [{"name": "shared"}]}
+            return response
+
+        return side_effect
+
+    def _run_concurrently(self, calls):
+        """Start the first call, then the rest once it is in flight; return results in order."""
+        import threading
+        import time
+
+        results = [None] * len(calls)
+
+        def runner(index, fn):
+            results[index] = fn()
+
+        threads = [threading.Thread(target=runner, args=(i, fn)) for i, fn in enumerate(calls)]
+        threads[0].start()
+        while self.client._in_flight.in_flight == 0:
+            time.sleep(0.001)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_gets_share_one_request(self):
+        """Concurrent identical GETs make one HTTP request and get independent copies."""
+        self.session.request.side_effect = self._blocking_response(waiters=3)
+        params = {"folder": "Texas", "name": "shared"}
+
+        results = self._run_concurrently(
+            [lambda: self.client.get("/config/objects/v1/tags", params=dict(params))] * 4
+        )
+
+        assert self.session.request.call_count == 1
+        assert self.client.request_stats["coalesced"] == 3
+        assert all(result == {"data": [{"name": "shared"}]} for result in results)
+        assert len({id(result) for result in results}) == 4
+
+    def test_different_params_are_not_shared(self):
+        """GETs with different params are sent separately."""
+        import threading
+
+        self.session.request.side_effect = self._blocking_response(waiters=0)
+
+        threads = [
+            threading.Thread(
+                target=self.client.get,
+                args=("/config/objects/v1/tags",),
+                kwargs={"params": {"folder": folder}},
+            )
+            for folder in ("A", "B")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert self.session.request.call_count == 2
+        assert self.client.request_stats["coalesced"] == 0
+
+    def test_coalescing_can_be_disabled(self):
+        """With coalesce_requests=False every GET is sent."""
+        self.client.coalesce_requests = False
+        self.session.request.side_effect = self._blocking_response(waiters=0)
+
+        self.client.get("/config/objects/v1/tags")
+        self.client.get("/config/objects/v1/tags")
+
+        assert self.session.request.call_count == 2
+        assert self.client._in_flight.in_flight == 0
@@ -0,0 +1,166 @@
+# tests/scm/test_conditional_requests.py
+
+"""Tests for conditional GET support against a local stand-in server."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+import pytest
+
+from scm.client import Scm
+
+
+class StandInState:
+    """Resources served by the stand-in server and a log of what it answered."""
+
+    def __init__(self):
+        """Start with one ETag resource and one Last-Modified resource."""
+        self.version = 1
+        self.listing = {"data": [{"id": "1", "name": "web"}], "total": 1}
+        self.last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        self.log = []
+
+    def etag(self):
+        """Return the current strong validator of the listing."""
+        return f'"v{self.version}"'
+
+
+def make_handler(state):
+    """Build a request handler class implementing 304 semantics."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002
+            pass
+
+        def _send_json(self, body, headers):
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _send_not_modified(self):
+            self.send_response(304)
+            self.end_headers()
+
+        def do_GET(self):  # noqa: N802
+            path = self.path.split("?", 1)[0]
+            if path == "/etag":
+                if self.headers.get("If-None-Match") == state.etag():
+                    state.log.append(304)
+                    return self._send_not_modified()
+                state.log.append(200)
+                return self._send_json(state.listing, {"ETag": state.etag()})
+            if path == "/last-modified":
+                if self.headers.get("If-Modified-Since") == state.last_modified:
+                    state.log.append(304)
+                    return self._send_not_modified()
+                state.log.append(200)
+                return self._send_json(state.listing, {"Last-Modified": state.last_modified})
+            state.log.append(200)
+            return self._send_json(state.listing, {})
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in():
+    """Run the stand-in server on an ephemeral port for one test."""
+    state = StandInState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _client(state, **kwargs):
+    return Scm(access_token="dummy", api_base_url=state.base_url, **kwargs)
+
+
+class TestConditionalRequests:
+    """Conditional GET behaviour of Scm.request."""
+
+    def test_etag_revalidation_serves_cached_body(self, stand_in):
+        """A matching ETag yields 304 and the previously decoded body."""
+        client = _client(stand_in, conditional_requests=True)
+
+        first = client.get("/etag", params={"folder": "Texas"})
+        second = client.get("/etag", params={"folder": "Texas"})
+
+        assert stand_in.log == [200, 304]
+        assert second is first
+        assert second == stand_in.listing
+        assert client.request_stats["not_modified"] == 1
+
+    def test_changed_resource_is_downloaded_again(self, stand_in):
+        """A new ETag on the server results in a full response and a new cached body."""
+        client = _client(stand_in, conditional_requests=True)
+        client.get("/etag")
+
+        stand_in.version = 2
+        stand_in.listing = {"data": [], "total": 0}
+        changed = client.get("/etag")
+        again = client.get("/etag")
+
+        assert stand_in.log == [200, 200, 304]
+        assert changed == {"data": [], "total": 0}
+        assert again is changed
+
+    def test_conditional_entry_describes_the_served_body(self, stand_in):
+        """The remembered entry holds the validators and the very body returned."""
+        client = _client(stand_in, conditional_requests=True)
+        assert client.conditional_entry("/etag", {"folder": "Texas"}) is None
+
+        first = client.get("/etag", params={"folder": "Texas"})
+        entry = client.conditional_entry("/etag", {"folder": "Texas"})
+
+        assert (entry.etag, entry.last_modified) == ('"v1"', None)
+        assert entry.body is first
+        assert client.conditional_entry("/etag") is None
+
+    def test_last_modified_revalidation(self, stand_in):
+        """Last-Modified validators are replayed with If-Modified-Since."""
+        client = _client(stand_in, conditional_requests=True)
+
+        client.get("/last-modified")
+        client.get("/last-modified")
+
+        assert stand_in.log == [200, 304]
+
+    def test_validators_are_kept_per_params(self, stand_in):
+        """Different params are cached separately."""
+        client = _client(stand_in, conditional_requests=True)
+
+        client.get("/etag", params={"folder": "A"})
+        client.get("/etag", params={"folder": "B"})
+        client.get("/etag", params={"folder": "A"})
+
+        assert stand_in.log == [200, 200, 304]
+        assert len(client.conditional_cache) == 2
+
+    def test_responses_without_validators_are_not_cached(self, stand_in):
+        """Responses without ETag or Last-Modified are always fetched in full."""
+        client = _client(stand_in, conditional_requests=True)
+
+        client.get("/plain")
+        client.get("/plain")
+
+        assert stand_in.log == [200, 200]
+        assert len(client.conditional_cache) == 0
+
+    def test_disabled_by_default(self, stand_in):
+        """Without conditional_requests every GET downloads the full body."""
+        client = _client(stand_in)
+
+        first = client.get("/etag")
+        second = client.get("/etag")
+
+        assert stand_in.log == [200, 200]
+        assert second is not first
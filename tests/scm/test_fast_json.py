@@ -0,0 +1,124 @@
+# tests/scm/test_fast_json.py
+
+"""Tests for the fast JSON request and response path against a local stand-in server."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+import pytest
+
+from scm.client import Scm
+from scm.config.objects import AddressGroup
+from scm.models.objects import AddressGroupUpdateModel
+from scm.utils.serialization import JsonBody
+
+
+class Recorder:
+    """Requests received by the stand-in server."""
+
+    def __init__(self):
+        """Start with an empty log."""
+        self.requests = []
+
+
+def make_handler(recorder):
+    """Build a handler that records each body and echoes it back with an id."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002
+            pass
+
+        def _echo(self):
+            length = int(self.headers.get("Content-Length", 0))
+            raw = self.rfile.read(length)
+            recorder.requests.append(
+                {
+                    "method": self.command,
+                    "path": self.path,
+                    "content_type": self.headers.get("Content-Type"),
+                    "body": raw,
+                }
+            )
+            echoed = {
+                "id": "123e4567-e89b-12d3-a456-426655440000",
+                "folder": "Texas",
+                **json.loads(raw),
+            }
+            payload = json.dumps(echoed).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_POST = _echo  # noqa: N815
+        do_PUT = _echo  # noqa: N815
+
+    return Handler
+
+
+@pytest.fixture
+def stand_in():
+    """Run the stand-in server on an ephemeral port for one test."""
+    recorder = Recorder()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(recorder))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    recorder.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield recorder
+    server.shutdown()
+    server.server_close()
+
+
+def _client(recorder, **kwargs):
+    return Scm(access_token="dummy", api_base_url=recorder.base_url, **kwargs)
+
+
+class TestFastJson:
+    """Request body encoding and response decoding of Scm.request."""
+
+    def test_services_send_models_straight_to_json(self, stand_in):
+        """With fast_json, a service's model is sent as bytes with the same content."""
+        members = [f"host{i}" for i in range(2000)]
+        group = {"name": "big", "folder": "Texas", "static": members}
+        plain = AddressGroup(_client(stand_in)).create(group)
+        fast_client = _client(stand_in, fast_json=True)
+        fast = AddressGroup(fast_client).create(group)
+
+        default_request, fast_request = stand_in.requests
+        assert json.loads(fast_request["body"]) == json.loads(default_request["body"])
+        assert fast_request["content_type"] == "application/json"
+        assert fast.static == plain.static == members
+
+        AddressGroup(fast_client).update(
+            AddressGroupUpdateModel(id=str(fast.id), name="big", static=["only"])
+        )
+        assert json.loads(stand_in.requests[-1]["body"]) == {"name": "big", "static": ["only"]}
+
+    def test_json_body_is_accepted_without_fast_json(self, stand_in):
+        """A JsonBody is always encoded by the client; dictionaries are left to requests."""
+        client = _client(stand_in)
+        group = AddressGroupUpdateModel(
+            id="123e4567-e89b-12d3-a456-426655440000", name="g", static=["a"]
+        )
+
+        response = client.put("/groups/1", json=JsonBody(group, exclude=frozenset({"id"})))
+        client.post("/groups", json={"name": "h", "static": ["b"]})
+
+        assert json.loads(stand_in.requests[0]["body"]) == {"name": "g", "static": ["a"]}
+        assert stand_in.requests[0]["content_type"] == "application/json"
+        assert response["static"] == ["a"]
+        assert json.loads(stand_in.requests[1]["body"]) == {"name": "h", "static": ["b"]}
+
+    def test_writes_with_json_body_forget_fetch_misses(self, stand_in):
+        """A JsonBody write forgets the remembered misses for its name."""
+        client = _client(stand_in, fetch_miss_ttl=60)
+        client.fetch_miss_cache.set(("/groups", (("name", "g"),)), ("body", {"data": []}))
+        group = AddressGroupUpdateModel(
+            id="123e4567-e89b-12d3-a456-426655440000", name="g", static=["a"]
+        )
+
+        client.post("/groups", json=JsonBody(group))
+
+        assert client.fetch_miss_cache.get(("/groups", (("name", "g"),))) is None
@@ -0,0 +1 @@
+"""Tests for scm.utils."""
@@ -0,0 +1,33 @@
+"""Tests for scm.utils.backoff."""
+
+from itertools import islice
+
+import pytest
+
+from scm.utils.backoff import Backoff
+
+
+class TestBackoff:
+    """Tests for exponential backoff with jitter."""
+
+    def test_grows_to_the_ceiling(self):
+        """Without jitter, delays double from initial up to maximum."""
+        backoff = Backoff(initial=0.5, maximum=5, factor=2, jitter=0)
+        assert list(islice(backoff.delays(), 6)) == [0.5, 1, 2, 4, 5, 5]
+        assert backoff.delay(10_000) == 5
+
+    def test_jitter_only_shortens(self):
+        """Jittered delays stay within the jitter fraction below the base delay."""
+        backoff = Backoff(initial=1, maximum=8, jitter=0.5)
+        delays = [backoff.delay(3) for _ in range(200)]
+        assert all(4 <= d <= 8 for d in delays)
+        assert len(set(delays)) > 1
+
+    @pytest.mark.parametrize(
+        "settings",
+        [{"initial": 0}, {"initial": 2, "maximum": 1}, {"factor": 0.5}, {"jitter": 1.5}],
+    )
+    def test_invalid_settings(self, settings):
+        """Non-positive, inverted or out-of-range settings are rejected."""
+        with pytest.raises(ValueError):
+            Backoff(**settings)
@@ -0,0 +1,57 @@
+"""Tests for scm.utils.cache."""
+
+from scm.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current fake time."""
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_set_and_expiry(self):
+        """Entries are returned until their ttl elapses."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled_cache_stores_nothing(self):
+        """A ttl of zero disables storage."""
+        cache = TTLCache(ttl=0)
+        cache.set("a", 1)
+        assert cache.enabled is False
+        assert cache.get("a", "default") == "default"
+
+    def test_maxsize_evicts_oldest(self):
+        """The oldest entry is evicted when the cache is full."""
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_discard_where_and_clear(self):
+        """Entries can be removed selectively or all at once."""
+        cache = TTLCache(ttl=10)
+        for key in ("x1", "x2", "y1"):
+            cache.set(key, key)
+        assert cache.discard_where(lambda key: key.startswith("x")) == 2
+        cache.discard("missing")
+        assert cache.get("y1") == "y1"
+        cache.clear()
+        assert len(cache) == 0
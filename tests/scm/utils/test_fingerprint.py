@@ -0,0 +1,100 @@
+"""Tests for scm.utils.fingerprint."""
+
+from uuid import uuid4
+
+import pytest
+
+from scm.models.objects import AddressResponseModel, TagResponseModel
+from scm.models.security import SecurityRuleResponseModel
+from scm.utils.fingerprint import (
+    VOLATILE_FIELDS,
+    FingerprintMixin,
+    canonical_json,
+    fingerprint,
+    fingerprints,
+)
+
+
+@pytest.fixture
+def address_data():
+    """Return a raw address object as the API would send it."""
+    return {
+        "id": str(uuid4()),
+        "name": "web",
+        "folder": "Texas",
+        "ip_netmask": "10.0.0.1/32",
+        "tag": ["prod", "web"],
+    }
+
+
+class TestFingerprint:
+    """Tests for the fingerprint helpers."""
+
+    def test_canonical_json_is_key_order_independent(self):
+        """Key order and None values do not affect the canonical form."""
+        first = canonical_json({"b": 1, "a": {"y": 2, "x": 1}, "c": None})
+        second = canonical_json({"a": {"x": 1, "y": 2}, "b": 1})
+        assert first == second == b'{"a":{"x":1,"y":2},"b":1}'
+
+    def test_volatile_fields_are_ignored(self, address_data):
+        """Volatile metadata does not change the fingerprint."""
+        touched = dict(address_data, last_update="2026-01-01T00:00:00Z")
+        assert "last_update" in VOLATILE_FIELDS
+        assert fingerprint(touched) == fingerprint(address_data)
+
+    def test_custom_exclude(self, address_data):
+        """Callers can choose which fields to ignore."""
+        other = dict(address_data, id=str(uuid4()))
+        assert fingerprint(other) != fingerprint(address_data)
+        assert fingerprint(other, exclude={"id"}) == fingerprint(address_data, exclude={"id"})
+
+    def test_model_and_raw_dict_agree(self, address_data):
+        """A model and a raw dict holding exactly its fields share a fingerprint."""
+        model = AddressResponseModel(**address_data)
+        assert model.fingerprint == fingerprint(address_data)
+
+    def test_content_change_changes_fingerprint(self, address_data):
+        """Changing any configuration field changes the fingerprint."""
+        changed = dict(address_data, tag=["web", "prod"])
+        assert fingerprint(changed) != fingerprint(address_data)
+
+    def test_fingerprints_index(self, address_data):
+        """Fingerprints can be indexed by id for snapshots."""
+        model = AddressResponseModel(**address_data)
+        index = fingerprints([model, dict(address_data, id="raw", name="db")])
+        assert index[address_data["id"]] == model.fingerprint
+        assert set(index) == {address_data["id"], "raw"}
+
+
+class TestFingerprintMixin:
+    """Tests for the cached fingerprint on response models."""
+
+    def test_response_models_carry_fingerprints(self):
+        """Every response model exposes the mixin."""
+        assert issubclass(AddressResponseModel, FingerprintMixin)
+        assert issubclass(TagResponseModel, FingerprintMixin)
+        assert issubclass(SecurityRuleResponseModel, FingerprintMixin)
+
+    def test_fingerprint_is_cached_and_not_a_field(self, address_data):
+        """The fingerprint is computed once and never dumped."""
+        model = AddressResponseModel(**address_data)
+        assert "fingerprint" not in model.__dict__
+        value = model.fingerprint
+        assert model.__dict__["fingerprint"] == value
+        assert "fingerprint" not in model.model_dump()
+        assert model == AddressResponseModel(**address_data)
+
+    def test_assignment_invalidates_cache(self, address_data):
+        """Assigning a field recomputes the fingerprint."""
+        model = AddressResponseModel(**address_data)
+        before = model.fingerprint
+        model.description = "changed"
+        assert model.fingerprint != before
+
+    def test_model_copy_invalidates_cache(self, address_data):
+        """Copies with updates do not inherit a stale fingerprint."""
+        model = AddressResponseModel(**address_data)
+        before = model.fingerprint
+        copied = model.model_copy(update={"description": "changed"})
+        assert copied.fingerprint != before
+        assert model.fingerprint == before
@@ -0,0 +1,107 @@
+"""Tests for scm.utils.radix."""
+
+import ipaddress
+import random
+
+import pytest
+
+from scm.utils.radix import RadixTrie
+
+
+def _brute_force(prefixes, address):
+    """Longest stored prefix containing address, by scanning every prefix."""
+    containing = [network for network in prefixes if address in network]
+    return max(containing, key=lambda network: network.prefixlen, default=None)
+
+
+class TestRadixTrie:
+    """Tests for RadixTrie."""
+
+    def test_exact_access(self):
+        """Values are stored, replaced and read at exact prefixes."""
+        trie = RadixTrie(4)
+        trie["10.0.0.0/8"] = "a"
+        trie["10.1.0.0/16"] = "b"
+        trie["10.1.0.0/16"] = "c"
+        trie["10.1.2.3/8"] = "d"  # host bits are ignored
+
+        assert len(trie) == 2
+        assert trie["10.0.0.0/8"] == "d"
+        assert trie.get(ipaddress.ip_network("10.1.0.0/16")) == "c"
+        assert "10.0.0.0/9" not in trie
+        assert trie.get("10.0.0.0/9", "none") == "none"
+        with pytest.raises(KeyError):
+            trie["192.168.0.0/16"]
+
+    def test_longest_match_and_matches(self):
+        """Lookups return the most specific prefix, or every containing one."""
+        trie = RadixTrie(4)
+        for prefix in ("0.0.0.0/0", "10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.2.0.0/16"):
+            trie[prefix] = prefix
+
+        assert trie.longest_match("10.1.2.3") == (
+            ipaddress.ip_network("10.1.2.0/24"),
+            "10.1.2.0/24",
+        )
+        assert trie.longest_match("10.1.3.1")[1] == "10.1.0.0/16"
+        assert trie.longest_match(int(ipaddress.ip_address("10.3.0.1")))[1] == "10.0.0.0/8"
+        assert trie.longest_match("8.8.8.8")[1] == "0.0.0.0/0"
+        assert [value for _, value in trie.matches("10.1.2.3")] == [
+            "0.0.0.0/0",
+            "10.0.0.0/8",
+            "10.1.0.0/16",
+            "10.1.2.0/24",
+        ]
+        assert RadixTrie(4).longest_match("10.0.0.1") is None
+
+    def test_items_in_address_order(self):
+        """Iteration yields prefixes by address, shorter prefixes first."""
+        trie = RadixTrie(6)
+        for prefix in ("2001:db8:1::/48", "2001:db8::/32", "::/0", "2001:db8::1/128"):
+            trie[prefix] = True
+
+        assert [str(network) for network in trie] == [
+            "::/0",
+            "2001:db8::/32",
+            "2001:db8::1/128",
+            "2001:db8:1::/48",
+        ]
+        assert all(isinstance(network, ipaddress.IPv6Network) for network in trie)
+
+    def test_version_is_checked(self):
+        """Prefixes and addresses of the other family are rejected."""
+        with pytest.raises(ValueError):
+            RadixTrie(5)
+        trie = RadixTrie(4)
+        with pytest.raises(ValueError):
+            trie["2001:db8::/32"] = 1
+        with pytest.raises(ValueError):
+            trie.longest_match("2001:db8::1")
+
+    @pytest.mark.parametrize("version", [4, 6])
+    def test_matches_brute_force(self, version):
+        """Random prefixes and addresses agree with a linear scan."""
+        rng = random.Random(version)
+        bits = 32 if version == 4 else 128
+        network_class = ipaddress.IPv4Network if version == 4 else ipaddress.IPv6Network
+        address_class = ipaddress.IPv4Address if version == 4 else ipaddress.IPv6Address
+        # Few distinct leading bits so that prefixes nest and branch often
+        prefixes = set()
+        while len(prefixes) < 300:
+            length = rng.randint(0, bits)
+            low = rng.getrandbits(bits - 8) & rng.getrandbits(bits - 8)
+            key = rng.getrandbits(3) << (bits - 3) | low
+            prefixes.add(network_class((key >> (bits - length) << (bits - length), length)))
+        trie = RadixTrie(version)
+        for network in prefixes:
+            trie[network] = network
+
+        assert len(trie) == len(prefixes)
+        assert list(trie) == sorted(prefixes, key=lambda n: (int(n.network_address), n.prefixlen))
+        candidates = sorted(prefixes)
+        for _ in range(2000):
+            base = int(rng.choice(candidates).network_address)
+            address = address_class((base + rng.getrandbits(12)) % 2**bits)
+            expected = _brute_force(prefixes, address)
+            match = trie.longest_match(address)
+            assert (match and match[0]) == expected
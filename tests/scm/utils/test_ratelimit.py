@@ -0,0 +1,40 @@
+"""Tests for scm.utils.ratelimit."""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import pytest
+
+from scm.utils.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for token-bucket rate limiting."""
+
+    def test_burst_then_rate(self):
+        """A full bucket lets burst calls through, then calls are spaced by the rate."""
+        limiter = RateLimiter(rate=50, burst=2)
+
+        start = time.monotonic()
+        waits = [limiter.acquire() for _ in range(6)]
+        elapsed = time.monotonic() - start
+
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+        assert elapsed >= 4 / 50 * 0.9
+
+    def test_shared_across_threads(self):
+        """Threads acquiring together are queued behind each other."""
+        limiter = RateLimiter(rate=100)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: limiter.acquire(), range(11)))
+
+        assert time.monotonic() - start >= 10 / 100 * 0.9
+
+    @pytest.mark.parametrize("settings", [{"rate": 0}, {"rate": 1, "burst": 0}])
+    def test_invalid_settings(self, settings):
+        """A non-positive rate or an empty bucket is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(**settings)
@@ -0,0 +1,74 @@
+"""Tests for scm.utils.serialization."""
+
+import json
+
+import pytest
+
+from scm.models.mobile_agent import AgentProfilesCreateModel
+from scm.models.objects import AddressGroupCreateModel, AddressGroupUpdateModel
+from scm.utils import serialization
+from scm.utils.serialization import JsonBody, benchmark_serialization, dumps, loads
+
+
+@pytest.fixture
+def large_group():
+    """Return an address group with many static members."""
+    return AddressGroupCreateModel(
+        name="big", folder="Texas", static=[f"host{i}" for i in range(4000)]
+    )
+
+
+class TestJsonBody:
+    """Tests for encoding models straight to JSON bytes."""
+
+    def test_matches_the_dictionary_path(self, large_group):
+        """The bytes decode to what model_dump() followed by json.dumps() sends."""
+        body = JsonBody(large_group)
+        assert json.loads(body.encode()) == large_group.model_dump(exclude_unset=True)
+        assert body.name == "big"
+
+    def test_exclude_and_aliases(self):
+        """Excluded fields are left out and aliases are used when requested."""
+        update = AddressGroupUpdateModel(
+            id="123e4567-e89b-12d3-a456-426655440000", name="g", static=["a"]
+        )
+        assert json.loads(JsonBody(update, exclude=frozenset({"id"})).encode()) == {
+            "name": "g",
+            "static": ["a"],
+        }
+
+        profile = AgentProfilesCreateModel(name="p", folder="Mobile Users")
+        aliased = json.loads(JsonBody(profile, by_alias=True).encode())
+        assert aliased == profile.model_dump(mode="json", exclude_unset=True, by_alias=True)
+
+
+class TestDumpsLoads:
+    """Tests for the body encoder and decoder."""
+
+    def test_round_trip(self, large_group):
+        """Dictionaries, models and JsonBody values all encode to compact JSON."""
+        data = {"name": "web", "tag": ["a", "b"], "note": "café"}
+        assert loads(dumps(data)) == data
+        assert b" " not in dumps(data)
+        assert dumps(large_group) == JsonBody(large_group).encode()
+        assert loads('{"a": 1}') == {"a": 1}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Without orjson the standard library does the same job."""
+        monkeypatch.setattr(serialization, "orjson", None)
+        data = {"name": "web", "note": "café"}
+        assert dumps(data) == '{"name":"web","note":"café"}'.encode()
+        assert loads(dumps(data)) == data
+
+
+class TestBenchmarkSerialization:
+    """Tests for the serialization benchmark."""
+
+    def test_reports_both_steps(self, large_group):
+        """Encode and decode timings are reported with the speedup of the fast path."""
+        results = benchmark_serialization(large_group, repeat=3)
+
+        assert set(results) == {"encode", "decode"}
+        for timings in results.values():
+            assert timings["default"] > 0 and timings["fast"] > 0
+            assert timings["speedup"] == timings["default"] / timings["fast"]
@@ -0,0 +1,82 @@
+"""Tests for scm.utils.singleflight."""
+
+import threading
+import time
+
+import pytest
+
+from scm.utils.singleflight import SingleFlight
+
+
+def _wait_for_waiters(flight, key, count, timeout=5.0):
+    """Block until count callers are waiting on key."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        call = flight._calls.get(key)
+        if call is not None and call.waiters >= count:
+            return
+        time.sleep(0.001)
+    raise AssertionError("waiters never arrived")
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_sequential_calls_are_not_shared(self):
+        """Calls that do not overlap each run the function."""
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == (1, False)
+        assert flight.do("k", lambda: 2) == (2, False)
+        assert flight.in_flight == 0
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Overlapping callers with the same key share the leader's result."""
+        flight = SingleFlight()
+        executions = []
+        results = []
+
+        def work():
+            executions.append(1)
+            _wait_for_waiters(flight, "k", 3)
+            return {"value": 42}
+
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("k", work))) for _ in range(4)
+        ]
+        threads[0].start()
+        while flight.in_flight == 0:
+            time.sleep(0.001)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(executions) == 1
+        assert [shared for _, shared in results] == [True] * 4
+        assert all(result is results[0][0] for result, _ in results)
+
+    def test_errors_propagate_to_waiters(self):
+        """Waiters receive the exception raised by the leader."""
+        flight = SingleFlight()
+        errors = []
+
+        def work():
+            _wait_for_waiters(flight, "k", 1)
+            raise ValueError("boom")
+
+        def call():
+            with pytest.raises(ValueError):
+                flight.do("k", work)
+            errors.append(True)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        while flight.in_flight == 0:
+            time.sleep(0.001)
+        follower = threading.Thread(target=call)
+        follower.start()
+        leader.join()
+        follower.join()
+
+        assert errors == [True, True]
+        assert flight.in_flight == 0
@@ -0,0 +1,119 @@
+# tests/utils/config_store.py
+
+"""In-memory stand-in for the SCM config API."""
+
+from collections import Counter
+import threading
+from unittest.mock import MagicMock
+import uuid
+
+from scm.exceptions import NameNotUniqueError, ObjectNotPresentError
+
+
+class ConfigStore:
+    """In-memory stand-in for the SCM config API, wired into a client's HTTP verbs.
+
+    Objects are kept per endpoint; listings honour folder/snippet/device, limit and
+    offset, fetches honour name, and every call is counted per method.
+    """
+
+    def __init__(self):
+        """Create an empty store."""
+        self.objects = {}
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, endpoint, **fields):
+        """Insert an object directly, returning it with a generated id."""
+        obj = {"id": str(uuid.uuid4()), **fields}
+        self.objects.setdefault(endpoint, {})[obj["id"]] = obj
+        return obj
+
+    def find(self, endpoint, name):
+        """Return the stored object called name, or None."""
+        return next((o for o in self.objects.get(endpoint, {}).values() if o["name"] == name), None)
+
+    def _count(self, method):
+        with self._lock:
+            self.calls[method] += 1
+
+    def _split(self, path):
+        for endpoint in self.objects:
+            if path.startswith(endpoint + "/"):
+                start = len(endpoint) + 1
+                return endpoint, path[start:]
+        return path, None
+
+    def get(self, path, params=None):
+        """Serve a listing, a fetch by name, or a get by id."""
+        self._count("get")
+        params = params or {}
+        endpoint, object_id = self._split(path)
+        if object_id is not None:
+            return dict(self.objects[endpoint][object_id])
+        container = {k: v for k, v in params.items() if k in ("folder", "snippet", "device")}
+        items = [
+            dict(o)
+            for o in self.objects.get(endpoint, {}).values()
+            if all(o.get(k) == v for k, v in container.items())
+        ]
+        if "name" in params:
+            match = next((o for o in items if o["name"] == params["name"]), None)
+            if match is None:
+                raise ObjectNotPresentError(message=f"{params['name']} not found")
+            return match
+        offset, limit = params.get("offset", 0), params.get("limit", 200)
+        end = offset + limit
+        return {"data": items[offset:end], "limit": limit, "offset": offset}
+
+    def post(self, path, json=None, params=None):
+        """Create an object, rejecting duplicate names, or move a rule."""
+        self._count("post")
+        if path.endswith(":move"):
+            return self._move(*self._split(path[: -len(":move")]), json)
+        if self.find(path, json["name"]) is not None:
+            raise NameNotUniqueError(message=f"{json['name']} already exists")
+        return self.add(path, **json)
+
+    def _move(self, endpoint, object_id, data):
+        with self._lock:
+            order = list(self.objects[endpoint])
+            order.remove(object_id)
+            destination = data["destination"]
+            if destination == "top":
+                order.insert(0, object_id)
+            elif destination == "bottom":
+                order.append(object_id)
+            else:
+                anchor = order.index(data["destination_rule"])
+                order.insert(anchor + (destination == "after"), object_id)
+            self.objects[endpoint] = {key: self.objects[endpoint][key] for key in order}
+
+    def put(self, path, json=None, params=None):
+        """Replace an object."""
+        self._count("put")
+        endpoint, object_id = self._split(path)
+        stored = self.objects[endpoint][object_id]
+        stored.clear()
+        stored.update({"id": object_id, **json})
+        return dict(stored)
+
+    def delete(self, path, params=None):
+        """Delete an object."""
+        self._count("delete")
+        endpoint, object_id = self._split(path)
+        del self.objects[endpoint][object_id]
+
+    @property
+    def total_calls(self):
+        """Number of API calls made."""
+        return sum(self.calls.values())
+
+
+def attach_config_store(client):
+    """Serve client's get, post, put, and delete calls from a new ConfigStore."""
+    store = ConfigStore()
+    for method in ("get", "post", "put", "delete"):
+        setattr(client, method, MagicMock(side_effect=getattr(store, method)))
+    store.client = client
+    return store